@@ -0,0 +1,80 @@
+"""Compare the interval index engines on the same synthetic workload.
+
+For every engine registered in dynetworkx.classes.intervalindex, reports the throughput of bulk loading
+(add_from), single edge insertion (add), slicing and single edge removal (remove).
+
+Usage (from the repository root):
+PYTHONPATH=. python benchmarks/bench_intervalindex.py [number_of_edges] [number_of_queries] [max_duration]
+"""
+import random
+import sys
+import time
+
+from dynetworkx.classes.intervalindex import INTERVAL_INDEXES, interval_index
+
+
+def make_edges(n, max_duration, rng):
+    edges = []
+    for i in range(n):
+        begin = rng.randint(0, 10 * n)
+        edges.append((i, i + 1, begin, begin + rng.randint(0, max_duration)))
+    return edges
+
+
+def rate(count, seconds):
+    return "{:>12,.0f}/s".format(count / seconds) if seconds > 0 else "{:>14}".format("inf")
+
+
+def bench(engine, bulk, single, queries):
+    index = interval_index(engine)
+
+    start = time.perf_counter()
+    index.add_from(bulk)
+    bulk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for edge in single:
+        index.add(edge)
+    index[0:1]  # engines that build lazily do it on the first query
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    returned = 0
+    for begin, end in queries:
+        returned += len(index[begin:end])
+    slice_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for edge in single:
+        index.remove(edge)
+    index[0:1]
+    remove_time = time.perf_counter() - start
+
+    return (rate(len(bulk), bulk_time), rate(len(single), add_time), rate(len(queries), slice_time),
+            rate(len(single), remove_time), returned)
+
+
+def main(n=200000, number_of_queries=2000, max_duration=100):
+    rng = random.Random(0)
+    edges = make_edges(n, max_duration, rng)
+    bulk, single = edges[:n - n // 10], edges[n - n // 10:]
+    queries = []
+    for _ in range(number_of_queries):
+        begin = rng.randint(0, 10 * n)
+        queries.append((begin, begin + rng.randint(0, 1000)))
+
+    print("{} edges ({} bulk, {} single), {} slices, intervals up to {} long".format(
+        n, len(bulk), len(single), number_of_queries, max_duration))
+    print("{:<14}{:>16}{:>16}{:>16}{:>16}{:>16}".format("engine", "add_from", "add", "slice", "remove",
+                                                        "edges sliced"))
+    for engine in sorted(INTERVAL_INDEXES):
+        try:
+            results = bench(engine, bulk, single, queries)
+        except ImportError as e:
+            print("{:<14}skipped: {}".format(engine, e))
+            continue
+        print("{:<14}{:>16}{:>16}{:>16}{:>16}{:>16}".format(engine, *results))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
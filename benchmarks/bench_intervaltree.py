@@ -0,0 +1,61 @@
+"""Benchmark wide IntervalTree slices against the previous recursive traversal and the static index.
+
+Usage (from the repository root): PYTHONPATH=. python benchmarks/bench_intervaltree.py [number_of_edges]
+"""
+import random
+import sys
+import time
+
+from dynetworkx.classes.intervaltree import IntervalTree
+from dynetworkx.classes.staticintervalindex import StaticIntervalIndex
+
+
+def recursive_query(node, begin, end):
+    if node.left and node.left.max >= begin:
+        yield from recursive_query(node.left, begin, end)
+
+    if node.inInterval(begin, end):
+        yield node
+
+    if node.right and node.low <= end and node.right.max >= begin:
+        yield from recursive_query(node.right, begin, end)
+
+
+def recursive_slice(tree, begin, end):
+    for node in recursive_query(tree.root, begin, end):
+        yield from node.getEdges()
+
+
+def timeit(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(n=2000000):
+    rng = random.Random(0)
+    edges = []
+    for i in range(n):
+        begin = rng.randint(0, 10 * n)
+        edges.append((i, i + 1, begin, begin + rng.randint(1, 100)))
+
+    tree = IntervalTree()
+    tree.add_from(edges)
+    index = StaticIntervalIndex()
+    index.add_from(edges)
+
+    for fraction in (0.1, 0.5, 1.0):
+        begin, end = 0, int(10 * n * fraction)
+        old, old_edges = timeit(lambda: list(recursive_slice(tree, begin, end)))
+        new, new_edges = timeit(lambda: tree[begin:end])
+        static, static_edges = timeit(lambda: index[begin:end])
+        assert len(old_edges) == len(new_edges) == len(static_edges)
+        print("{:>9} edges  recursive {:.3f}s  iterative {:.3f}s ({:.2f}x)  static {:.3f}s ({:.2f}x)".format(
+            len(new_edges), old, new, old / new, static, old / static))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
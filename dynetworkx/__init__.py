@@ -1,5 +1,7 @@
 import dynetworkx.classes
 import dynetworkx.algorithms
+import dynetworkx.readwrite
 
 from dynetworkx.classes import *
 from dynetworkx.algorithms import *
+from dynetworkx.readwrite import *
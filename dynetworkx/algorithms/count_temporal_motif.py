@@ -2,7 +2,6 @@ from networkx import Graph
 import random
 import itertools
 import dynetworkx as dnx
-import pandas as pd
 from collections import OrderedDict
 
 
@@ -185,6 +184,8 @@ def count_temporal_motif(G, sequence, delta):
         nodes += list(key)
     nodes = sorted(list(set(nodes))) # sorts and gets rid of duplicates
 
+    import pandas as pd # only needed for the dataframe, so importing dynetworkx does not load pandas
+
     # creates dataframe where columns = nodes, row indices = position number, and value = number of times each node is at each position
     nppp = pd.DataFrame(index=nodes, columns=motif) # creates the dataframe
 
@@ -4,3 +4,5 @@ from .snapshotgraph import SnapshotGraph
 from .intervaldigraph import IntervalDiGraph
 from .impulsedigraph import ImpulseDiGraph
 from .snapshotdigraph import SnapshotDiGraph
+from .intervalindex import register_interval_index
+from .coalesce import coalesce_intervals
@@ -0,0 +1,106 @@
+"""Coalescing of interval records into continuous intervals.
+
+Contact data often comes as many short records of a pair of nodes, one per observation, which stand for a
+single longer contact. `coalesce_intervals` merges the records of every pair of nodes that overlap or are
+separated by at most a grace period, and returns every merged interval once, ready to be bulk loaded with
+`add_edges_from`.
+
+For every pair of nodes and edge data, the intervals merged so far are kept sorted by begin, separated by
+gaps larger than the grace period. A record is merged in place into the intervals within grace of it, which
+are found by binary search. Records ordered by begin always fall after the last interval of their pair, so
+they cost O(1) each and a whole input O(n); records in any order cost O(log k) for a pair with k intervals.
+"""
+from bisect import bisect_right
+from networkx.exception import NetworkXError
+
+__all__ = ['coalesce_intervals']
+
+
+def coalesce_intervals(records, grace=0, directed=False):
+    """Merge the records of every pair of nodes which are within grace of each other into continuous intervals.
+
+    Parameters
+    ----------
+    records : iterable of tuples
+        Records given as 4-tuples (u, v, begin, end) or 5-tuples (u, v, begin, end, d) where d
+        is a dictionary containing edge data, as for `IntervalGraph.add_edges_from`.
+        They can be in any order.
+    grace : int or float, optional (default= 0)
+        Largest gap between two records of a pair that are merged, that is between the end of
+        one and the begin of the other. With the default, records are merged if they overlap or
+        if one begins where the other ends.
+    directed : bool, optional (default= False)
+        If True, records from u to v and records from v to u are not merged.
+
+    Returns
+    -------
+    intervals : list of 5-tuples
+        Merged intervals (u, v, begin, end, d), where u, v and d are those of the first record of
+        the interval. They are ordered by begin if the records are.
+
+    Raises
+    ------
+    NetworkXError
+        If a record is not a 4-tuple or a 5-tuple.
+
+    Notes
+    -----
+    Only records with equal edge data are merged; a record with no edge data has the empty dict.
+
+    Examples
+    --------
+    >>> records = [(1, 2, 0, 5), (2, 1, 6, 8), (1, 2, 20, 25), (1, 2, 4, 7, {'weight': 2})]
+    >>> dnx.coalesce_intervals(records, grace=1)
+    [(1, 2, 0, 8, {}), (1, 2, 20, 25, {}), (1, 2, 4, 7, {'weight': 2})]
+
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from(dnx.coalesce_intervals(records, grace=1))
+    """
+
+    states = {}  # pair of nodes -> list of [edge data, begins, intervals] of the pair, one per distinct edge data
+    intervals = []  # intervals in order of creation, as lists [u, v, begin, end, d, position in this list]
+
+    for record in records:
+        if len(record) == 4:
+            u, v, begin, end = record
+            data = {}
+        elif len(record) == 5:
+            u, v, begin, end, data = record
+        else:
+            raise NetworkXError("Record {0} must be a 4-tuple or 5-tuple.".format(record))
+
+        pair = (u, v)
+        if not directed and pair not in states and (v, u) in states:
+            pair = (v, u)
+        groups = states.setdefault(pair, [])
+        for group in groups:
+            if group[0] == data:
+                break
+        else:
+            group = [data, [], []]
+            groups.append(group)
+        begins, runs = group[1], group[2]
+
+        # runs of the pair are disjoint and more than grace apart, so the record can only be merged with the run
+        # before it and with the consecutive runs beginning within grace of its end
+        i = len(begins) if not begins or begin >= begins[-1] else bisect_right(begins, begin)
+        low = i - 1 if i > 0 and begin - runs[i - 1][3] <= grace else i
+        high = i
+        while high < len(runs) and runs[high][2] - end <= grace:
+            high += 1
+
+        if low == high:
+            run = [u, v, begin, end, data, len(intervals)]
+            intervals.append(run)
+            begins.insert(i, begin)
+            runs.insert(i, run)
+            continue
+
+        run = runs[low]
+        run[2], run[3] = min(run[2], begin), max(run[3], end, runs[high - 1][3])
+        for merged in runs[low + 1:high]:
+            intervals[merged[5]] = None
+        del begins[low + 1:high], runs[low + 1:high]
+        begins[low] = run[2]
+
+    return [tuple(run[:5]) for run in intervals if run is not None]
@@ -1,15 +1,17 @@
-import re
-
 from dynetworkx.classes.impulsegraph import ImpulseGraph
+from dynetworkx.classes.intervalgraph import _count_degrees, _impulse_degree_changes, _edge_columns, \
+    _add_edge_rows, _gc_paused
 from networkx.classes.digraph import DiGraph
 from networkx.classes.multidigraph import MultiDiGraph
 
 from networkx.exception import NetworkXError
+from dynetworkx.classes.queryplanner import QueryPlanner
+from dynetworkx.classes.reportviews import ImpulseEdgeView
 from sortedcontainers import SortedDict
 import random
+import warnings
 import math
 from timeit import default_timer as timer
-from sklearn.linear_model import LinearRegression
 from itertools import product
 
 
@@ -134,11 +136,16 @@ class ImpulseDiGraph(ImpulseGraph):
         self._node = {}
         self._pred = {}  # out
         self._succ = {}  # in
+        self._planner = QueryPlanner(directed=True, impulse=True, threshold=None)  # statistics used to plan compound queries
         self._model = None
         self.edgeid = 0
 
         self.graph.update(attr)
 
+    def is_directed(self):
+        """Return True, the ImpulseDiGraph is directed."""
+        return True
+
     def add_node(self, node_for_adding, **attr):
         """Add a single node `node_for_adding` and update node attributes.
 
@@ -232,7 +239,10 @@ class ImpulseDiGraph(ImpulseGraph):
         >>> G.add_edge(1, 3, 9, weight=7, capacity=15, length=342.7)
         """
 
-        self.tree.setdefault(t, set()).add((u, v))
+        edges = self.tree.setdefault(t, set())
+        if (u, v) not in edges:
+            edges.add((u, v))
+            self._planner.add((u, v, t))
 
         self._node.setdefault(u, {})
         self._node.setdefault(v, {})
@@ -277,6 +287,57 @@ class ImpulseDiGraph(ImpulseGraph):
                 raise NetworkXError("Edge tuple {0} must be a 3-tuple.".format(e))
             self.add_edge(e[0], e[1], e[2], **attr)
 
+    def add_edges_from_arrays(self, u, v, t, **attr):
+        """Add the edges given as columns, the i-th edge being (u[i], v[i], t[i]).
+
+        Parameters
+        ----------
+        u, v : array_like
+            Source and target nodes of the edges. Nodes must be hashable (and not None)
+            Python objects; numpy scalars are converted to Python ones.
+        t : array_like
+            Numeric timestamps of the edges.
+        attr : keyword arguments, optional
+            Edge data, either as an array_like with one value per edge
+            or as a single value given to every edge.
+
+        Raises
+        ------
+        NetworkXError
+            If the columns do not have the same length, or if the timestamps
+            are not numeric or NaN.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Notes
+        -----
+        Edges given twice or already in the graph are added once, and their
+        data is updated.
+
+        The columns are checked at once, the adjacency is updated once per pair of
+        nodes and the timestamps and query statistics are updated from the whole
+        batch, which makes large batches several times faster to add than with
+        add_edges_from.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edges_from_arrays(np.array([1, 2]), np.array([2, 4]), np.array([10, 11]))
+        >>> G.add_edges_from_arrays([3, 1], [4, 4], [19, 3], weight=[2, 5], label='WN2898')
+        """
+
+        with _gc_paused():
+            u, v, (t,), datadicts = _edge_columns("ImpulseDiGraph", u, v, (t,), attr)
+            iedges = list(zip(u.tolist(), v.tolist(), t.tolist()))
+            iedges, rows, nodes, sources, targets = _add_edge_rows(self._node, self._pred, self._succ, True, u, v,
+                                                                   iedges, datadicts)
+
+            self._tree_add_from(iedges)
+            self._planner.add_many(nodes, sources, targets, t[rows])
+
     def has_edge(self, u, v, begin=None, end=None, inclusive=(True, True)):
         """Return True if there exists an edge between u and v
         in the impulse graph, during the given interval.
@@ -318,21 +379,6 @@ class ImpulseDiGraph(ImpulseGraph):
                 return True
         return False
 
-    def generate_predictive_model(self, training_size=250):
-        """Trains linear regression model used to predict faster ordering of compound slices.
-
-        Parameters
-        ----------
-        trainingSize : int
-            Number of samples to generate.
-        """
-        X, y = self.__generate_training_data(training_size)
-
-        model = LinearRegression()
-        model.fit(X, y)
-
-        self._model = model
-
     def __edges_node_first(self, u_list, v_list, begin, end):
         if not isinstance(u_list, list):
             u_list = [u_list]
@@ -358,14 +404,14 @@ class ImpulseDiGraph(ImpulseGraph):
                     continue
                 iedges.update([iv for u in self._succ[v] for iv in self._succ[v][u]])
 
-            # If interval is none, return
-            if begin is None and end is None:
-                return iedges
+        # If interval is none, return
+        if begin is None and end is None:
+            return iedges
 
-            # Interval filtering
-            if begin is not None and end is not None and begin > end:
-                raise NetworkXError("ImpulseDiGraph: interval end must be bigger than or equal to begin: "
-                                    "begin: {}, end: {}.".format(begin, end))
+        # Interval filtering
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("ImpulseDiGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
 
         return [iv for iv in iedges if ImpulseDiGraph.__overlaps_or_contains(iv, begin, end)]
 
@@ -373,7 +419,9 @@ class ImpulseDiGraph(ImpulseGraph):
         if begin is not None and end is not None and begin > end:
             raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
-        return [(u, v, t) for t in self.tree.irange(begin, end, inclusive=(True, False))for u, v in self.tree[t]]
+        # an interval with begin equal to end is the single timestamp begin, as in the node-first queries
+        point = begin is not None and begin == end
+        return [(u, v, t) for t in self.tree.irange(begin, end, inclusive=(True, point)) for u, v in self.tree[t]]
 
     def edges(self, u=None, v=None, begin=None, end=None, inclusive=(True, True), data=False, default=None):
         """Returns a list of tuples of the ImpulseDiGraph edges.
@@ -476,31 +524,20 @@ class ImpulseDiGraph(ImpulseGraph):
         elif u == [None] and v == [None]:
             iedges = self.__edges_interval_first(begin, end)
 
-        # Compound
-        elif (u != [None] or v != [None]) and (begin is not None or end is not None) and self._model is not None:
-            if u == [None]:
-                nodes = v
-            elif v == [None]:
-                nodes = u
+        # Compound; the planner estimates from the statistics of the graph whether filtering the edges in
+        # the interval by node is cheaper than filtering the edges of the nodes by interval. The interval
+        # is searched without its end, so queries at a single timestamp are always answered node first.
+        elif (begin is not None or end is not None) and begin != end:
+            if self._model is None:
+                interval_first = self._planner.interval_first(u, v, begin, end)
             else:
-                nodes = set(*u).union(set(*v))
-
-            node_percent = len(nodes) / self.number_of_nodes()
-
-            graph_begin, graph_end = self.interval()
-            if begin is None:
-                begin = graph_begin
-            if end is None:
-                end = graph_end
+                interval_first = self.__model_interval_first(u, v, begin, end)
 
-            interval_percent = (end - begin) / (graph_end - graph_begin)
-
-            node_time, interval_time = self._model.predict((node_percent, interval_percent))[0]
-
-            if node_time < interval_time:
-                iedges = self.__edges_node_first(u, v, begin, end)
+            if interval_first:
+                node_filter = self._planner.edge_filter(u, v)
+                iedges = [e for e in self.__edges_interval_first(begin, end) if node_filter(e)]
             else:
-                iedges = [e for e in self.__edges_interval_first(begin, end) if e[0] in nodes or e[1] in nodes]
+                iedges = self.__edges_node_first(u, v, begin, end)
 
         # Node First
         else:
@@ -566,11 +603,27 @@ class ImpulseDiGraph(ImpulseGraph):
     def generate_predictive_model(self, training_size=250):
         """Trains linear regression model used to predict faster ordering of compound slices.
 
+        .. deprecated::
+            Compound slices are planned from degree and timestamp statistics that the graph keeps
+            up to date, without training. A trained model takes precedence over these statistics.
+
         Parameters
         ----------
         trainingSize : int
             Number of samples to generate.
+
+        Notes
+        -----
+        Requires scikit-learn, which is installed with the `predict` extra: `pip install dynetworkx[predict]`.
         """
+        warnings.warn("generate_predictive_model is deprecated, compound slices are planned from graph "
+                      "statistics without training.", DeprecationWarning, stacklevel=2)
+        try:
+            from sklearn.linear_model import LinearRegression
+        except ImportError:
+            raise ImportError("generate_predictive_model requires scikit-learn, which can be installed with "
+                              "`pip install dynetworkx[predict]`.")
+
         X, y = self.__generate_training_data(training_size)
 
         model = LinearRegression()
@@ -578,6 +631,60 @@ class ImpulseDiGraph(ImpulseGraph):
 
         self._model = model
 
+    def __model_interval_first(self, u_list, v_list, begin, end):
+        # returns True if the model trained by generate_predictive_model predicts a compound query to be
+        # faster interval first
+        nodes = (set(u_list) | set(v_list)) - {None}
+        node_percent = len(nodes) / self.number_of_nodes()
+
+        graph_begin, graph_end = self.interval()
+        begin = graph_begin if begin is None else begin
+        end = graph_end if end is None else end
+        interval_percent = (end - begin) / (graph_end - graph_begin)
+
+        node_time, interval_time = self._model.predict([(node_percent, interval_percent)])[0]
+        return interval_time <= node_time
+
+
+    def edge_view(self, begin=None, end=None, u=None, v=None):
+        """Returns a lazy, read-only set-like view of the ImpulseDiGraph edges.
+
+        Unlike `edges`, the view does not collect the edges: it is iterated from the
+        sorted timestamps of the impulse graph, `len` counts the edges of every timestamp, and `in` looks an edge
+        up in the adjacency. Set operations between views, or with other sets, return sets.
+        The view reflects later changes of the impulse graph.
+
+        Parameters
+        ----------
+        begin: int or float, optional  (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edges appearing in the impulse graph.
+        end: int or float, optional  (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edges appearing in the impulse graph.
+            Must be bigger than or equal to begin.
+        u, v : nodes or lists of nodes, optional (default=None)
+            Node constraints, as in `edges`.
+
+        Returns
+        -------
+        ImpulseEdgeView
+
+        See Also
+        --------
+        edges
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> view = G.edge_view(begin=11, end=19)
+        >>> len(view)
+        2
+        >>> (2, 4, 15) in view
+        True
+        >>> sorted(view & G.edge_view(u=2))
+        [(2, 4, 11), (2, 4, 15)]
+        """
+        return ImpulseEdgeView(self, begin, end, u, v, directed=True)
 
     def remove_edge(self, u, v, begin=None, end=None, inclusive=(True, True)):
         """Remove the edge between u and v in the impulse graph,
@@ -641,6 +748,66 @@ class ImpulseDiGraph(ImpulseGraph):
         if len(self._succ[v]) == 0:
             self._succ.pop(v, None)
 
+    def truncate(self, begin=None, end=None, inclusive=(True, True)):
+        """Remove every edge with a timestamp outside of the interval (begin, end).
+
+        Keeps exactly the edges returned by `edges(begin=begin, end=end, inclusive=inclusive)` and
+        removes the others in bulk from both ends of the timestamp index, together with the nodes
+        that are left without edges.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+        end : int or float, optional (default= end of the entire impulse graph)
+            Must be bigger than or equal to begin.
+        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+
+        Returns
+        -------
+        List of the removed edges, as (u, v, t) tuples.
+
+        Raises
+        ------
+        NetworkXError
+            If `end` is smaller than `begin`.
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> G.truncate(11, 15)
+        [(1, 2, 10), (6, 4, 19)]
+        >>> G.edges()
+        [(2, 4, 15), (2, 4, 11)]
+        """
+
+        return super().truncate(begin, end, inclusive)
+
+    def _forget_iedges(self, iedges):
+        # removes edges that were already removed from the tree from the adjacency, then drops the emptied
+        # neighbor dicts and the nodes left without any in or out edge
+        pairs = set()
+        for iedge in iedges:
+            u, v = iedge[0], iedge[1]
+            self._pred[u][v].pop(iedge, None)
+            self._succ[v][u].pop(iedge, None)
+            self._planner.remove(iedge)
+            pairs.add((u, v))
+
+        for u, v in pairs:
+            if u in self._pred and v in self._pred[u] and len(self._pred[u][v]) == 0:
+                del self._pred[u][v]
+                del self._succ[v][u]
+
+        for u, v in pairs:
+            if u in self._pred and len(self._pred[u]) == 0:
+                del self._pred[u]
+            if v in self._succ and len(self._succ[v]) == 0:
+                del self._succ[v]
+            for n in (u, v):
+                if n not in self._pred and n not in self._succ:
+                    self._node.pop(n, None)
+
     def degree(self, node=None, begin=None, end=None, delta=False, inclusive=(True, True)):
         """Return the sum of in and out degree of a specified node between time begin and end.
 
@@ -654,7 +821,8 @@ class ImpulseDiGraph(ImpulseGraph):
             Non-inclusive ending time of the edge appearing in the impulse graph.
         delta : boolean, optional (default= False)
             Returns list of 2-tuples, first element is the timestamp, second is the node of changing degree.
-        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
 
         Returns
         -------
@@ -677,13 +845,9 @@ class ImpulseDiGraph(ImpulseGraph):
         [(3, 1), (8, 1)]
         """
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end, inclusive=inclusive):
-                n += 1
-                l += self.degree(node, begin=begin, end=end, inclusive=inclusive)
-            return l / n
+        if node is None:
+            degrees = self.degrees(begin=begin, end=end, inclusive=inclusive)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -719,7 +883,8 @@ class ImpulseDiGraph(ImpulseGraph):
             Non-inclusive ending time of the edge appearing in the impulse graph.
         delta : boolean, optional (default= False)
             Returns list of 2-tuples, first element is the timestamp, second is the node of changing degree.
-        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
 
         Returns
         -------
@@ -742,13 +907,9 @@ class ImpulseDiGraph(ImpulseGraph):
         [(3, 1)]
         """
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end, inclusive=inclusive):
-                n += 1
-                l += self.in_degree(node, begin=begin, end=end, inclusive=inclusive)
-            return l / n
+        if node is None:
+            degrees = self.in_degrees(begin=begin, end=end, inclusive=inclusive)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -786,7 +947,8 @@ class ImpulseDiGraph(ImpulseGraph):
             Non-inclusive ending time of the edge appearing in the impulse graph.
         delta : boolean, optional (default= False)
             Returns list of 2-tuples, first element is the timestamp, second is the node of changing degree.
-        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
 
         Returns
         -------
@@ -809,13 +971,9 @@ class ImpulseDiGraph(ImpulseGraph):
         [(8, 1)]
         """
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end, inclusive=inclusive):
-                n += 1
-                l += self.in_degree(node, begin=begin, end=end, inclusive=inclusive)
-            return l / n
+        if node is None:
+            degrees = self.out_degrees(begin=begin, end=end, inclusive=inclusive)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -835,6 +993,111 @@ class ImpulseDiGraph(ImpulseGraph):
 
         return output
 
+    def degrees(self, begin=None, end=None, delta=False, inclusive=(True, True)):
+        """Return the degree of every node between time begin and end.
+
+        All degrees are computed in a single pass over the edges in the interval, instead of two
+        edge queries per node.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edge appearing in the impulse graph.
+        end : int or float, optional (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edge appearing in the impulse graph.
+        delta : boolean, optional (default= False)
+            If True, return for every node a list of 2-tuples, the first element being a timestamp and the
+            second the number of edges of the node at that timestamp, in order of time.
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
+
+        Returns
+        -------
+        Dict of the degree of every node present in the interval, as given by `degree(node, begin, end)`.
+        If neither begin nor end is given, every node of the graph is present.
+
+        See Also
+        --------
+        in_degrees
+        out_degrees
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edge(1, 2, 3)
+        >>> G.add_edge(2, 3, 8)
+        >>> G.degrees()
+        {1: 1, 2: 2, 3: 1}
+        >>> G.degrees(begin=4, delta=True)
+        {2: [(8, 1)], 3: [(8, 1)]}
+        """
+        return self.__degrees(begin, end, delta, inclusive, sources=True, targets=True)
+
+    def in_degrees(self, begin=None, end=None, delta=False, inclusive=(True, True)):
+        """Return the in-degree of every node between time begin and end.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edge appearing in the impulse graph.
+        end : int or float, optional (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edge appearing in the impulse graph.
+        delta : boolean, optional (default= False)
+            If True, return for every node a list of 2-tuples, the first element being a timestamp and the
+            second the number of in edges of the node at that timestamp, in order of time.
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
+
+        Returns
+        -------
+        Dict of the in-degree of every node present in the interval, as given by `in_degree(node, begin, end)`.
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edge(1, 2, 3)
+        >>> G.add_edge(2, 3, 8)
+        >>> G.in_degrees()
+        {1: 0, 2: 1, 3: 1}
+        """
+        return self.__degrees(begin, end, delta, inclusive, sources=False, targets=True)
+
+    def out_degrees(self, begin=None, end=None, delta=False, inclusive=(True, True)):
+        """Return the out-degree of every node between time begin and end.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edge appearing in the impulse graph.
+        end : int or float, optional (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edge appearing in the impulse graph.
+        delta : boolean, optional (default= False)
+            If True, return for every node a list of 2-tuples, the first element being a timestamp and the
+            second the number of out edges of the node at that timestamp, in order of time.
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
+
+        Returns
+        -------
+        Dict of the out-degree of every node present in the interval, as given by `out_degree(node, begin, end)`.
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseDiGraph()
+        >>> G.add_edge(1, 2, 3)
+        >>> G.add_edge(2, 3, 8)
+        >>> G.out_degrees()
+        {1: 1, 2: 1, 3: 0}
+        """
+        return self.__degrees(begin, end, delta, inclusive, sources=True, targets=False)
+
+    def __degrees(self, begin, end, delta, inclusive, sources, targets):
+        nodes = self._node if begin is None and end is None else ()
+        edges = list(self.__search_tree(begin, end, inclusive=(True, False)))
+        if delta:
+            return _impulse_degree_changes(edges, nodes, sources, targets, directed=True)
+        return _count_degrees(edges, nodes, sources, targets, directed=True)
+
     def to_networkx_graph(self, begin=None, end=None, inclusive=(True, False), multigraph=False, edge_data=False,
                           edge_timestamp_data=False, node_data=False):
         """Return a networkx Graph or MultiGraph which includes all the nodes and
@@ -900,8 +1163,13 @@ class ImpulseDiGraph(ImpulseGraph):
         >>> list(M.edges(data=True))
         [(1, 2, {'timestamp': 10}), (2, 4, {'timestamp': 11})]
         """
-        iedges = self.__search_tree(begin, end, inclusive=inclusive)
+        return self._subgraph_from_iedges(self.__search_tree(begin, end, inclusive=inclusive), multigraph=multigraph,
+                                          edge_data=edge_data, edge_timestamp_data=edge_timestamp_data,
+                                          node_data=node_data)
 
+    def _subgraph_from_iedges(self, iedges, multigraph=False, edge_data=False, edge_timestamp_data=False,
+                              node_data=False):
+        """Return a networkx DiGraph or MultiDiGraph of the given edges, as returned by `to_subgraph`."""
         if multigraph:
             G = MultiDiGraph()
         else:
@@ -917,7 +1185,6 @@ class ImpulseDiGraph(ImpulseGraph):
             G.add_edges_from((iedge[0], iedge[1], {'timestamp': iedge[2]})
                              for iedge in iedges)
         else:
-
             G.add_edges_from((iedge[0], iedge[1]) for iedge in iedges)
 
         if node_data:
@@ -942,6 +1209,9 @@ class ImpulseDiGraph(ImpulseGraph):
             del self._succ[iedge[1]][iedge[0]][iedge]
         except:
             return
+        self._planner.remove(iedge)
+        if len(self.tree[iedge[2]]) == 0:
+            del self.tree[iedge[2]]
 
     def __validate_interval(self, begin=None, end=None):
         """Returns validated begin and end.
@@ -1032,7 +1302,8 @@ class ImpulseDiGraph(ImpulseGraph):
         return (begin < iv[2] < end and iv[2]) or iv[2] == begin
 
     @staticmethod
-    def load_from_txt(path, delimiter=" ", nodetype=int, timestamptype=float, order=('u', 'v', 't'), predict=False, comments="#"):
+    def load_from_txt(path, delimiter=" ", nodetype=int, timestamptype=float, order=('u', 'v', 't'), predict=False, comments="#",
+                      processes=1):
         """Read impulse graph in from path.
            Timestamps must be integers or floats.
            Nodes can be any hashable objects.
@@ -1062,6 +1333,14 @@ class ImpulseDiGraph(ImpulseGraph):
         delimiter : string, optional
            Separator for node labels.  The default is whitespace. Cannot be =.
 
+        processes : int or None, optional (default= 1)
+           Number of processes parsing the file. None uses a process per CPU.
+           The file is split into chunks at line boundaries, which are parsed
+           in parallel and loaded into the graph in bulk. The graph is the same
+           whatever the number of processes. `nodetype` and `timestamptype` are sent
+           to the processes by pickling, so lambdas and local functions make
+           the file parse in a single process.
+
         Returns
         -------
         G: ImpulseGraph
@@ -1091,51 +1370,10 @@ class ImpulseDiGraph(ImpulseGraph):
         if len(order) != 3 or 'u' not in order or 'v' not in order or 't' not in order:
             raise ValueError("Order must be a 3-tuple containing strings 'u', 'v', and 't'.")
 
-        with open(path, 'r') as file:
-            for line in file:
-                p = line.find(comments)
-                if p >= 0:
-                    line = line[:p]
-                if not len(line):
-                    continue
+        from dynetworkx.readwrite.text import _read_impulse_txt  # readwrite imports the classes
+        _read_impulse_txt(G, path, delimiter, nodetype, timestamptype, order, comments, processes, collapse=True)
 
-                line = re.split(delimiter+'+', line.strip())
-
-                u = line[order.index('u')]
-                v = line[order.index('v')]
-                t = line[order.index('t')]
-
-                edgedata = {}
-                for data in line[3:]:
-                    key, value = data.split('=')
-
-                    try:
-                        value = float(value)
-                    except:
-                        pass
-                    edgedata[key] = value
-
-                if nodetype is not int:
-                    try:
-                        u = nodetype(u)
-                        v = nodetype(v)
-                    except:
-                        raise TypeError("Failed to convert node to {0}".format(nodetype))
-                else:
-                    try:
-                        u = int(u)
-                        v = int(v)
-                    except:
-                        pass
-
-                try:
-                    t = timestamptype(t)
-                except:
-                    raise TypeError("Failed to convert interval time to {}".format(timestamptype))
-
-                G.add_edge(u, v, t, **edgedata)
-
-            if predict is True:
-                G.generate_predictive_model()
+        if predict is True:
+            G.generate_predictive_model()
 
         return G
@@ -3,11 +3,16 @@ from networkx.classes.graph import Graph
 from networkx.exception import NetworkXError
 from networkx.classes.multigraph import MultiGraph
 from networkx.classes.reportviews import NodeDataView
+from dynetworkx.classes.intervalgraph import _window_degrees, _count_degrees, _impulse_degree_changes, \
+    _sparse_snapshots, _edge_columns, _add_edge_rows, _gc_paused
+from dynetworkx.classes.queryplanner import QueryPlanner
+from dynetworkx.classes.reportviews import ImpulseEdgeView
 from sortedcontainers import SortedDict
 import random
+import warnings
 import math
+import numpy as np
 from timeit import default_timer as timer
-from sklearn.linear_model import LinearRegression
 from itertools import product
 
 
@@ -131,6 +136,7 @@ class ImpulseGraph(object):
         self.graph = {}  # dictionary for graph attributes
         self._node = {}
         self._adj = {}
+        self._planner = QueryPlanner(impulse=True, threshold=None)  # statistics used to plan compound queries
         self._model = None
 
         self.graph.update(attr)
@@ -198,6 +204,10 @@ class ImpulseGraph(object):
 
         return n in self._node
 
+    def is_directed(self):
+        """Return False, the ImpulseGraph is undirected."""
+        return False
+
     def interval(self):
         """Return a 2-tuple as (begin, end) interval of the entire
          impulse graph.
@@ -500,6 +510,8 @@ class ImpulseGraph(object):
             return
 
         if begin is None and end is None:
+            for edge in [iv for nbr in self._adj.get(n, {}).values() for iv in nbr]:
+                self.__remove_iedge(edge)
             self._adj.pop(n, None)
             for v in self._adj:
                 if n in self._adj[v]:
@@ -569,7 +581,10 @@ class ImpulseGraph(object):
         >>> G.add_edge(1, 3, 9, weight=7, capacity=15, length=342.7)
         """
 
-        self.tree.setdefault(t, set()).add((u, v))
+        edges = self.tree.setdefault(t, set())
+        if (u, v) not in edges:
+            edges.add((u, v))
+            self._planner.add((u, v, t))
 
         self._node.setdefault(u, {})
         self._node.setdefault(v, {})
@@ -614,6 +629,70 @@ class ImpulseGraph(object):
                 raise NetworkXError("Edge tuple {0} must be a 3-tuple.".format(e))
             self.add_edge(e[0], e[1], e[2], **attr)
 
+    def _tree_add_from(self, iedges):
+        # groups new edges by timestamp, so that the timestamps not yet in the tree are inserted at once
+        groups = {}
+        for iedge in iedges:
+            groups.setdefault(iedge[2], set()).add((iedge[0], iedge[1]))
+        new = {}
+        for t, pairs in groups.items():
+            if t in self.tree:
+                self.tree[t].update(pairs)
+            else:
+                new[t] = pairs
+        self.tree.update(new)
+
+    def add_edges_from_arrays(self, u, v, t, **attr):
+        """Add the edges given as columns, the i-th edge being (u[i], v[i], t[i]).
+
+        Parameters
+        ----------
+        u, v : array_like
+            Nodes of the edges. Nodes must be hashable (and not None)
+            Python objects; numpy scalars are converted to Python ones.
+        t : array_like
+            Numeric timestamps of the edges.
+        attr : keyword arguments, optional
+            Edge data, either as an array_like with one value per edge
+            or as a single value given to every edge.
+
+        Raises
+        ------
+        NetworkXError
+            If the columns do not have the same length, or if the timestamps
+            are not numeric or NaN.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Notes
+        -----
+        Edges given twice or already in the graph are added once, and their
+        data is updated.
+
+        The columns are checked at once, the adjacency is updated once per pair of
+        nodes and the timestamps and query statistics are updated from the whole
+        batch, which makes large batches several times faster to add than with
+        add_edges_from.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from_arrays(np.array([1, 2]), np.array([2, 4]), np.array([10, 11]))
+        >>> G.add_edges_from_arrays([3, 1], [4, 4], [19, 3], weight=[2, 5], label='WN2898')
+        """
+
+        with _gc_paused():
+            u, v, (t,), datadicts = _edge_columns("ImpulseGraph", u, v, (t,), attr)
+            iedges = list(zip(u.tolist(), v.tolist(), t.tolist()))
+            iedges, rows, nodes, sources, targets = _add_edge_rows(self._node, self._adj, self._adj, False, u, v,
+                                                                   iedges, datadicts)
+
+            self._tree_add_from(iedges)
+            self._planner.add_many(nodes, sources, targets, t[rows])
+
     def has_edge(self, u, v, begin=None, end=None, inclusive=(True, False)):
         """Return True if there exists an edge between u and v
         in the impulse graph, during the given interval.
@@ -703,11 +782,27 @@ class ImpulseGraph(object):
     def generate_predictive_model(self, training_size=250):
         """Trains linear regression model used to predict faster ordering of compound slices.
 
+        .. deprecated::
+            Compound slices are planned from degree and timestamp statistics that the graph keeps
+            up to date, without training. A trained model takes precedence over these statistics.
+
         Parameters
         ----------
         trainingSize : int
             Number of samples to generate.
+
+        Notes
+        -----
+        Requires scikit-learn, which is installed with the `predict` extra: `pip install dynetworkx[predict]`.
         """
+        warnings.warn("generate_predictive_model is deprecated, compound slices are planned from graph "
+                      "statistics without training.", DeprecationWarning, stacklevel=2)
+        try:
+            from sklearn.linear_model import LinearRegression
+        except ImportError:
+            raise ImportError("generate_predictive_model requires scikit-learn, which can be installed with "
+                              "`pip install dynetworkx[predict]`.")
+
         X, y = self.__generate_training_data(training_size)
 
         model = LinearRegression()
@@ -715,6 +810,20 @@ class ImpulseGraph(object):
 
         self._model = model
 
+    def __model_interval_first(self, u_list, v_list, begin, end):
+        # returns True if the model trained by generate_predictive_model predicts a compound query to be
+        # faster interval first
+        nodes = (set(u_list) | set(v_list)) - {None}
+        node_percent = len(nodes) / self.number_of_nodes()
+
+        graph_begin, graph_end = self.interval()
+        begin = graph_begin if begin is None else begin
+        end = graph_end if end is None else end
+        interval_percent = (end - begin) / (graph_end - graph_begin)
+
+        node_time, interval_time = self._model.predict([(node_percent, interval_percent)])[0]
+        return interval_time <= node_time
+
     def __edges_node_first(self, u_list, v_list, begin, end):
         # Node filtering
         iedges = set()
@@ -736,14 +845,14 @@ class ImpulseGraph(object):
                     continue
                 iedges.update([iv for u in self._adj[v] for iv in self._adj[v][u]])
 
-            # If interval is none, return
-            if begin is None and end is None:
-                return iedges
+        # If interval is none, return
+        if begin is None and end is None:
+            return iedges
 
-            # Interval filtering
-            if begin is not None and end is not None and begin > end:
-                raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
-                                    "begin: {}, end: {}.".format(begin, end))
+        # Interval filtering
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
 
         return [iv for iv in iedges if ImpulseGraph.__overlaps_or_contains(iv, begin, end)]
 
@@ -751,7 +860,9 @@ class ImpulseGraph(object):
         if begin is not None and end is not None and begin > end:
             raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
-        return [(u, v, t) for t in self.tree.irange(begin, end, inclusive=(True, False)) for u, v in self.tree[t]]
+        # an interval with begin equal to end is the single timestamp begin, as in the node-first queries
+        point = begin is not None and begin == end
+        return [(u, v, t) for t in self.tree.irange(begin, end, inclusive=(True, point)) for u, v in self.tree[t]]
 
     def edges(self, u=None, v=None, begin=None, end=None, inclusive=(True, False), data=False, default=None):
         """Returns a list of Interval objects of the ImpulseGraph edges.
@@ -854,31 +965,20 @@ class ImpulseGraph(object):
         elif u == [None] and v == [None]:
             iedges = self.__edges_interval_first(begin, end)
 
-        # Compound
-        elif (u != [None] or v != [None]) and (begin is not None or end is not None) and self._model is not None:
-            if u == [None]:
-                nodes = v
-            elif v == [None]:
-                nodes = u
+        # Compound; the planner estimates from the statistics of the graph whether filtering the edges in
+        # the interval by node is cheaper than filtering the edges of the nodes by interval. The interval
+        # is searched without its end, so queries at a single timestamp are always answered node first.
+        elif (begin is not None or end is not None) and begin != end:
+            if self._model is None:
+                interval_first = self._planner.interval_first(u, v, begin, end)
             else:
-                nodes = set(*u).union(set(*v))
-
-            node_percent = len(nodes) / self.number_of_nodes()
+                interval_first = self.__model_interval_first(u, v, begin, end)
 
-            graph_begin, graph_end = self.interval()
-            if begin is None:
-                begin = graph_begin
-            if end is None:
-                end = graph_end
-
-            interval_percent = (end - begin) / (graph_end - graph_begin)
-
-            node_time, interval_time = self._model.predict([(node_percent, interval_percent)])[0]
-
-            if node_time < interval_time:
-                iedges = self.__edges_node_first(u, v, begin, end)
+            if interval_first:
+                node_filter = self._planner.edge_filter(u, v)
+                iedges = [e for e in self.__edges_interval_first(begin, end) if node_filter(e)]
             else:
-                iedges = [e for e in self.__edges_interval_first(begin, end) if e[0] in nodes or e[1] in nodes]
+                iedges = self.__edges_node_first(u, v, begin, end)
 
         # Node First
         else:
@@ -894,6 +994,151 @@ class ImpulseGraph(object):
         return [(iv, self._adj[iv[0]][iv[1]][iv][data]) if data in self._adj[iv[0]][iv[1]][iv] else (iv, default) for iv
                 in iedges]
 
+    def edge_view(self, begin=None, end=None, u=None, v=None):
+        """Returns a lazy, read-only set-like view of the ImpulseGraph edges.
+
+        Unlike `edges`, the view does not collect the edges: it is iterated from the
+        sorted timestamps of the impulse graph, `len` counts the edges of every timestamp, and `in` looks an edge
+        up in the adjacency. Set operations between views, or with other sets, return sets.
+        The view reflects later changes of the impulse graph.
+
+        Parameters
+        ----------
+        begin: int or float, optional  (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edges appearing in the impulse graph.
+        end: int or float, optional  (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edges appearing in the impulse graph.
+            Must be bigger than or equal to begin.
+        u, v : nodes or lists of nodes, optional (default=None)
+            Node constraints, as in `edges`.
+
+        Returns
+        -------
+        ImpulseEdgeView
+
+        See Also
+        --------
+        edges
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> view = G.edge_view(begin=11, end=19)
+        >>> len(view)
+        2
+        >>> (2, 4, 15) in view
+        True
+        >>> sorted(view & G.edge_view(u=2))
+        [(2, 4, 11), (2, 4, 15)]
+        """
+        return ImpulseEdgeView(self, begin, end, u, v)
+
+    def edges_many(self, windows):
+        """Return the edges in each of the given intervals, in compressed sparse row format.
+
+        An edge at t is in the interval [begin, end) if begin <= t < end, or if t == begin == end.
+
+        Parameters
+        ----------
+        windows : array_like of shape (k, 2)
+            Intervals (begin, end), with numeric timestamps. An unbounded side is given as -inf or inf.
+
+        Returns
+        -------
+        offsets : numpy array of length k + 1
+            The edges in windows[i] are given by edge_ids[offsets[i]:offsets[i + 1]], ordered by timestamp.
+        edge_ids : numpy array
+            Indices into `edges`.
+        edges : list
+            Edges (u, v, t) in any of the given windows.
+
+        Notes
+        -----
+        The timestamps of every window are a range of the sorted timestamps of the impulse graph,
+        found with binary searches done for all windows at once. Only the edges at timestamps in
+        some window are collected.
+
+        See Also
+        --------
+        degree_many
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19)])
+        >>> offsets, edge_ids, edges = G.edges_many([(0, 10), (10, 12), (19, 19)])
+        >>> offsets
+        array([0, 0, 2, 3])
+        >>> [edges[i] for i in edge_ids[offsets[1]:offsets[2]]]
+        [(1, 2, 10), (2, 4, 11)]
+        """
+        windows = np.asarray(windows).reshape(-1, 2)
+        begins, ends = windows[:, 0], windows[:, 1]
+        if np.any(begins > ends):
+            raise NetworkXError("ImpulseGraph: interval end must be bigger than or equal to begin: "
+                                "windows: {}.".format(windows[begins > ends].tolist()))
+
+        # the timestamps of every window are a range of positions in the sorted timestamps
+        lo = np.fromiter((self.tree.bisect_left(begin) for begin in begins.tolist()), dtype=np.intp,
+                         count=len(windows))
+        hi = np.fromiter((self.tree.bisect_left(end) if end > begin else self.tree.bisect_right(begin)
+                          for begin, end in windows.tolist()), dtype=np.intp, count=len(windows))
+        counts = np.maximum(hi - lo, 0)
+        owners = np.repeat(np.arange(len(windows)), counts)
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - lo, counts)
+
+        # only the edges at timestamps in some window are collected, in timestamp order, reading the sorted
+        # timestamps run by run
+        touched, positions = np.unique(positions, return_inverse=True)
+        runs = np.flatnonzero(np.diff(touched) != 1) + 1
+        edges = []
+        sizes = []
+        for run in np.split(touched, runs) if len(touched) > 0 else []:
+            for t in self.tree.islice(int(run[0]), int(run[-1]) + 1):
+                pairs = self.tree[t]
+                edges.extend((u, v, t) for u, v in pairs)
+                sizes.append(len(pairs))
+        sizes = np.array(sizes, dtype=np.intp)
+        starts = np.cumsum(sizes) - sizes
+
+        # the edges of every window are the edges of its timestamps
+        edge_counts = sizes[positions]
+        offsets = np.zeros(len(windows) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(owners, weights=edge_counts, minlength=len(windows)).astype(np.intp), out=offsets[1:])
+        edge_ids = np.arange(offsets[-1]) - np.repeat(np.cumsum(edge_counts) - edge_counts - starts[positions],
+                                                      edge_counts)
+        return offsets, edge_ids.astype(np.intp), edges
+
+    def degree_many(self, nodes, windows):
+        """Return the degree of each of the given nodes in each of the given intervals.
+
+        Parameters
+        ----------
+        nodes : list of nodes
+        windows : array_like of shape (k, 2)
+            Intervals (begin, end), as in `edges_many`.
+
+        Returns
+        -------
+        degrees : numpy array of shape (len(nodes), k)
+            degrees[i, j] is the number of edges of nodes[i] in windows[j].
+
+        See Also
+        --------
+        edges_many
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19)])
+        >>> G.degree_many([2, 4], [(0, 11), (10, 20)])
+        array([[1, 2],
+               [0, 2]])
+        """
+        offsets, edge_ids, edges = self.edges_many(windows)
+        return _window_degrees(nodes, offsets, edge_ids, edges, self.is_directed())
+
     def remove_edge(self, u, v, begin=None, end=None, inclusive=(True, False)):
         """Remove the edge between u and v in the impulse graph,
         during the given interval.
@@ -956,6 +1201,122 @@ class ImpulseGraph(object):
         if len(self._adj[v]) == 0:
             self._adj.pop(v, None)
 
+    def evict_before(self, t):
+        """Remove every edge with a timestamp before t.
+
+        Removes the edges in bulk from the front of the timestamp index, together with the nodes
+        that are left without edges. Useful to bound the memory of long-running processes that
+        keep adding new edges.
+
+        Parameters
+        ----------
+        t : int or float
+            Time before which edges are evicted.
+
+        Returns
+        -------
+        List of the removed edges, as (u, v, t) tuples.
+
+        See Also
+        --------
+        truncate : remove every edge outside of an interval
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> G.evict_before(15)
+        [(1, 2, 10), (2, 4, 11)]
+        >>> G.edges()
+        [(2, 4, 15), (6, 4, 19)]
+        """
+
+        iedges = self._pop_timestamps(0, self.tree.bisect_left(t))
+        self._forget_iedges(iedges)
+        return iedges
+
+    def truncate(self, begin=None, end=None, inclusive=(True, False)):
+        """Remove every edge with a timestamp outside of the interval (begin, end).
+
+        Keeps exactly the edges returned by `edges(begin=begin, end=end, inclusive=inclusive)` and
+        removes the others in bulk from both ends of the timestamp index, together with the nodes
+        that are left without edges.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+        end : int or float, optional (default= end of the entire impulse graph)
+            Must be bigger than or equal to begin.
+        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+
+        Returns
+        -------
+        List of the removed edges, as (u, v, t) tuples.
+
+        Raises
+        ------
+        NetworkXError
+            If `end` is smaller than `begin`.
+
+        See Also
+        --------
+        evict_before : remove every edge with a timestamp before a given time
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> G.truncate(11, 19)
+        [(1, 2, 10), (6, 4, 19)]
+        >>> G.edges()
+        [(2, 4, 11), (2, 4, 15)]
+        """
+
+        begin, end = self.__validate_interval(begin, end)
+        # like edges, an empty interval keeps the edges at begin
+        if begin is not None and begin == end:
+            inclusive = (True, True)
+
+        iedges = []
+        if end is not None:
+            start = self.tree.bisect_right(end) if inclusive[1] else self.tree.bisect_left(end)
+            iedges = self._pop_timestamps(start, len(self.tree))
+        if begin is not None:
+            stop = self.tree.bisect_left(begin) if inclusive[0] else self.tree.bisect_right(begin)
+            iedges = self._pop_timestamps(0, stop) + iedges
+
+        self._forget_iedges(iedges)
+        return iedges
+
+    def _pop_timestamps(self, start, stop):
+        # removes the timestamps at positions [start, stop) of the tree and returns their edges
+        iedges = []
+        for t in list(self.tree.islice(start, stop)):
+            iedges.extend((u, v, t) for u, v in self.tree.pop(t))
+        return iedges
+
+    def _forget_iedges(self, iedges):
+        # removes edges that were already removed from the tree from the adjacency, then drops the emptied
+        # neighbor dicts and the nodes left without any edge
+        pairs = set()
+        for iedge in iedges:
+            u, v = iedge[0], iedge[1]
+            self._adj[u][v].pop(iedge, None)
+            self._adj[v][u].pop(iedge, None)
+            self._planner.remove(iedge)
+            pairs.add((u, v))
+
+        for u, v in pairs:
+            if u in self._adj and v in self._adj[u] and len(self._adj[u][v]) == 0:
+                del self._adj[u][v]
+                self._adj[v].pop(u, None)
+
+        for u, v in pairs:
+            for n in (u, v):
+                if n in self._adj and len(self._adj[n]) == 0:
+                    del self._adj[n]
+                    self._node.pop(n, None)
+
     def degree(self, node=None, begin=None, end=None, delta=False, inclusive=(True, False)):
         """Return the degree of a specified node between time begin and end.
 
@@ -969,7 +1330,8 @@ class ImpulseGraph(object):
             Non-inclusive ending time of the edge appearing in the impulse graph.
         delta : boolean, optional (default= False)
             Returns list of 2-tuples, first element is the timestamp, second is the node of changing degree.
-        inclusive : 2-tuple boolean that determines inclusivity of begin and end
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
 
         Returns
         -------
@@ -994,13 +1356,9 @@ class ImpulseGraph(object):
         if end is None:
             inclusive = (inclusive[0], True)
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end, inclusive=inclusive):
-                n += 1
-                l += self.degree(node, begin=begin, end=end, inclusive=inclusive)
-            return l / n
+        if node is None:
+            degrees = self.degrees(begin=begin, end=end, inclusive=inclusive)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -1020,6 +1378,52 @@ class ImpulseGraph(object):
 
         return output
 
+    def degrees(self, begin=None, end=None, delta=False, inclusive=(True, False)):
+        """Return the degree of every node between time begin and end.
+
+        All degrees are computed in a single pass over the edges in the interval, instead of one
+        edge query per node.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire impulse graph)
+            Inclusive beginning time of the edge appearing in the impulse graph.
+        end : int or float, optional (default= end of the entire impulse graph)
+            Non-inclusive ending time of the edge appearing in the impulse graph.
+        delta : boolean, optional (default= False)
+            If True, return for every node a list of 2-tuples, the first element being a timestamp and the
+            second the number of edges of the node at that timestamp, in order of time.
+        inclusive : 2-tuple boolean, not used
+            Like in `edges`, an edge at time t is counted if begin <= t < end, or if t == begin == end.
+
+        Returns
+        -------
+        Dict of the degree of every node present in the interval, as given by `degree(node, begin, end)`.
+        If neither begin nor end is given, every node of the graph is present.
+
+        See Also
+        --------
+        degree
+        degree_many
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edge(1, 2, 3)
+        >>> G.add_edge(2, 3, 8)
+        >>> G.degrees()
+        {1: 1, 2: 2, 3: 1}
+        >>> G.degrees(end=8)
+        {1: 1, 2: 1}
+        >>> G.degrees(delta=True)
+        {1: [(3, 1)], 2: [(3, 1), (8, 1)], 3: [(8, 1)]}
+        """
+        nodes = self._node if begin is None and end is None else ()
+        edges = list(self.__search_tree(begin, end))
+        if delta:
+            return _impulse_degree_changes(edges, nodes)
+        return _count_degrees(edges, nodes)
+
     def __remove_iedge(self, iedge):
         """Remove the interval edge from the impulse graph.
 
@@ -1036,7 +1440,9 @@ class ImpulseGraph(object):
             del self._adj[iedge[1]][iedge[0]][iedge]
         except:
             return
-        print(self._adj)
+        self._planner.remove(iedge)
+        if len(self.tree[iedge[2]]) == 0:
+            del self.tree[iedge[2]]
 
     def __validate_interval(self, begin=None, end=None):
         """Returns validated begin and end.
@@ -1170,15 +1576,20 @@ class ImpulseGraph(object):
         >>> list(M.edges(data=True))
         [(1, 2, {'timestamp': 10}), (2, 4, {'timestamp': 11})]
         """
-        iedges = self.__search_tree(begin, end, inclusive=inclusive)
+        return self._subgraph_from_iedges(self.__search_tree(begin, end, inclusive=inclusive), multigraph=multigraph,
+                                          edge_data=edge_data, edge_timestamp_data=edge_timestamp_data,
+                                          node_data=node_data)
 
+    def _subgraph_from_iedges(self, iedges, multigraph=False, edge_data=False, edge_timestamp_data=False,
+                              node_data=False):
+        """Return a networkx Graph or MultiGraph of the given edges, as returned by `to_subgraph`."""
         if multigraph:
             G = MultiGraph()
         else:
             G = Graph()
 
         if edge_data and edge_timestamp_data:
-            G.add_edges_from((iedge[0], iedge[1], dict(self._adj[iedge[0]][iedge], timestamp=iedge[2]))
+            G.add_edges_from((iedge[0], iedge[1], dict(self._adj[iedge[0]][iedge[1]][iedge], timestamp=iedge[2]))
                              for iedge in iedges)
         elif edge_data:
             G.add_edges_from((iedge[0], iedge[1], self._adj[iedge[0]][iedge[1]][iedge])
@@ -1187,7 +1598,6 @@ class ImpulseGraph(object):
             G.add_edges_from((iedge[0], iedge[1], {'timestamp': iedge[2]})
                              for iedge in iedges)
         else:
-
             G.add_edges_from((iedge[0], iedge[1]) for iedge in iedges)
 
         if node_data:
@@ -1225,6 +1635,7 @@ class ImpulseGraph(object):
         See Also
         --------
         to_subgraph : subgraph based on an interval
+        iter_snapshots : iterator over the snapshots of the impulse graph
         to_snapshotgraph : snapshotgraph based on impulse graph
 
         Notes
@@ -1264,6 +1675,71 @@ class ImpulseGraph(object):
         [(6, 4, {'timestamp': 19})]
         """
 
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        snapshots = list(self.__sweep_snapshots(begin, length_of_snapshots, number_of_snapshots,
+                                                multigraph=multigraph, edge_data=edge_data,
+                                                edge_timestamp_data=edge_timestamp_data, node_data=node_data))
+        if return_length:
+            return snapshots, length_of_snapshots
+
+        return snapshots
+
+    def iter_snapshots(self, number_of_snapshots=False, length_of_snapshots=False, multigraph=False, edge_data=False,
+                       edge_timestamp_data=False, node_data=False):
+        """Return an iterator over networkx Graph or MultiGraph objects as snapshots
+        of the impulse graph in consecutive order.
+
+        Yields the same snapshots as `to_snapshots`, one at a time, so that only the snapshot being
+        processed is kept in memory.
+
+        Parameters
+        ----------
+        number_of_snapshots : integer
+            Number of snapshots to divide the impulse graph into.
+            Must be bigger than 2.
+        length_of_snapshots : integer or float
+            Length of snapshots to divide the impulse graph into.
+            Must be bigger than 1.
+        multigraph : bool, optional (default= False)
+            If True, networkx MultiGraphs will be yielded. If False, networkx Graphs.
+        edge_data: bool, optional (default= False)
+            If True, edges will keep their attributes.
+        edge_timestamp_data : bool, optional (default= False)
+            If True, each edge's attribute will also include its timestamp data.
+            If `edge_data= True` and there already exist edge attributes named timestamp
+            it will be overwritten.
+        node_data : bool, optional (default= False)
+            if True, each node's attributes will be included.
+
+        See Also
+        --------
+        to_snapshots : list of snapshots of the impulse graph
+
+        Notes
+        -----
+        The timestamps of the graph are walked once in order, each one being assigned to the snapshot
+        it falls in.
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> for g in G.iter_snapshots(3):
+        ...     print(g.number_of_edges())
+        2
+        1
+        1
+        """
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        return self.__sweep_snapshots(begin, length_of_snapshots, number_of_snapshots, multigraph=multigraph,
+                                      edge_data=edge_data, edge_timestamp_data=edge_timestamp_data,
+                                      node_data=node_data)
+
+    def _snapshot_windows(self, number_of_snapshots, length_of_snapshots):
+        """Validate the arguments of `to_snapshots` and return the beginning, the length and the
+        number of the snapshots."""
         if type(number_of_snapshots) is bool and type(length_of_snapshots) is bool:
             raise NetworkXError("IntervalGraph: either number of snapshots or length of snapshots must be given.")
 
@@ -1287,20 +1763,89 @@ class ImpulseGraph(object):
         if length_of_snapshots is False:
             length_of_snapshots = (end - begin) / number_of_snapshots
 
-        snapshots = []
-        inclusive = (True, False)
+        return begin, length_of_snapshots, number_of_snapshots
+
+    def __sweep_snapshots(self, begin, length_of_snapshots, number_of_snapshots, **kwargs):
+        # every timestamp falls in a single snapshot: the sorted timestamps are read once, from the beginning of
+        # the first snapshot on
+        timestamps = self.tree.irange(begin)
+        t = next(timestamps, None)
+
         for i in range(number_of_snapshots):
-            if i == number_of_snapshots - 1:
-                inclusive = (True, True)
-            snapshots.append(
-                self.to_subgraph(begin + length_of_snapshots * i,
-                                 begin + length_of_snapshots * (i + 1), inclusive=inclusive,
-                                 multigraph=multigraph, edge_data=edge_data, edge_timestamp_data=edge_timestamp_data,
-                                 node_data=node_data))
-        if return_length:
-            return snapshots, length_of_snapshots
+            # the last snapshot includes the end of the graph, even if rounding puts its end just before it
+            snapshot_end = begin + length_of_snapshots * (i + 1) if i < number_of_snapshots - 1 else float("inf")
 
-        return snapshots
+            snapshot = []
+            while t is not None and t < snapshot_end:
+                snapshot.extend((u, v, t) for u, v in self.tree[t])
+                t = next(timestamps, None)
+
+            yield self._subgraph_from_iedges(snapshot, **kwargs)
+
+    def to_sparse_snapshots(self, number_of_snapshots=False, length_of_snapshots=False, weight=None, nodelist=None,
+                            format='csr'):
+        """Return the adjacency matrices of the snapshots of the impulse graph in consecutive order.
+
+        The snapshots are the ones of `to_snapshots`, but their scipy sparse adjacency matrices are
+        built directly from the timestamp index, without creating networkx graphs.
+
+        Parameters
+        ----------
+        number_of_snapshots : integer
+            Number of snapshots to divide the impulse graph into.
+            Must be bigger than 2.
+        length_of_snapshots : integer or float
+            Length of snapshots to divide the impulse graph into.
+            Must be bigger than 1.
+        weight : None or 'count', optional (default= None)
+            If None, an entry is 1 if the snapshot has an edge between its two nodes.
+            If 'count', an entry is the number of edges between its two nodes in the snapshot.
+        nodelist : list, optional (default= G.nodes())
+            The rows and columns are ordered according to the nodes in nodelist, the same in every
+            snapshot. Edges of nodes that are not in nodelist are left out.
+        format : 'csr' or 'coo', optional (default= 'csr')
+            If 'csr', a list of scipy CSR matrices is returned, one per snapshot.
+            If 'coo', a single sparse tensor of shape (number of snapshots, n, n) is returned, in
+            coordinate format.
+
+        Returns
+        -------
+        List of scipy.sparse.csr_matrix, or, if format='coo', a 3-tuple (coords, data, shape), where
+        coords is an array of shape (3, nnz) holding the snapshot, row and column of each of the data
+        entries, sorted in that order.
+
+        See Also
+        --------
+        to_snapshots : list of networkx snapshots of the impulse graph
+        edges_many : edges in each of a list of intervals
+
+        Examples
+        --------
+        >>> G = dnx.ImpulseGraph()
+        >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+        >>> S = G.to_sparse_snapshots(2, weight='count')
+        >>> S[0].toarray()
+        array([[0, 1, 0, 0],
+               [1, 0, 1, 0],
+               [0, 1, 0, 0],
+               [0, 0, 0, 0]])
+        """
+        if weight not in (None, 'count'):
+            raise NetworkXError("ImpulseGraph: weight must be None or 'count'. {0} was passed.".format(weight))
+        if format not in ('csr', 'coo'):
+            raise NetworkXError("ImpulseGraph: format must be 'csr' or 'coo'. {0} was passed.".format(format))
+
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        # same windows as the snapshot sweep, the last one including every remaining timestamp
+        begins = begin + length_of_snapshots * np.arange(number_of_snapshots)
+        ends = np.append(begin + length_of_snapshots * np.arange(1, number_of_snapshots), float("inf"))
+        offsets, edge_ids, edges = self.edges_many(np.column_stack((begins, ends)))
+
+        values = np.ones(len(edge_ids), dtype=np.intp) if weight == 'count' else None
+        if nodelist is None:
+            nodelist = list(self._node)
+        return _sparse_snapshots(offsets, edge_ids, edges, nodelist, self.is_directed(), values, format)
 
     def to_snapshot_graph(self, multigraph=False, edge_data=False, edge_timestamp_data=False, node_data=False):
         """
@@ -1424,7 +1969,8 @@ class ImpulseGraph(object):
         return G
 
     @staticmethod
-    def load_from_txt(path, delimiter=" ", nodetype=int, timestamptype=float, order=('u', 'v', 't'), predict=False, comments="#"):
+    def load_from_txt(path, delimiter=" ", nodetype=int, timestamptype=float, order=('u', 'v', 't'), predict=False, comments="#",
+                      processes=1):
         """Read impulse graph in from path.
            Timestamps must be integers or floats.
            Nodes can be any hashable objects.
@@ -1454,6 +2000,14 @@ class ImpulseGraph(object):
         delimiter : string, optional
            Separator for node labels.  The default is whitespace. Cannot be =.
 
+        processes : int or None, optional (default= 1)
+           Number of processes parsing the file. None uses a process per CPU.
+           The file is split into chunks at line boundaries, which are parsed
+           in parallel and loaded into the graph in bulk. The graph is the same
+           whatever the number of processes. `nodetype` and `timestamptype` are sent
+           to the processes by pickling, so lambdas and local functions make
+           the file parse in a single process.
+
         Returns
         -------
         G: ImpulseGraph
@@ -1483,49 +2037,8 @@ class ImpulseGraph(object):
         if len(order) != 3 or 'u' not in order or 'v' not in order or 't' not in order:
             raise ValueError("Order must be a 3-tuple containing strings 'u', 'v', and 't'.")
 
-        with open(path, 'r') as file:
-            for line in file:
-                p = line.find(comments)
-                if p >= 0:
-                    line = line[:p]
-                if not len(line):
-                    continue
-
-                line = line.rstrip().split(delimiter)
-
-                u = line[order.index('u')]
-                v = line[order.index('v')]
-                t = line[order.index('t')]
-
-                edgedata = {}
-                for data in line[3:]:
-                    key, value = data.split('=')
-
-                    try:
-                        value = float(value)
-                    except:
-                        pass
-                    edgedata[key] = value
-
-                if nodetype is not int:
-                    try:
-                        u = nodetype(u)
-                        v = nodetype(v)
-                    except:
-                        raise TypeError("Failed to convert node to {0}".format(nodetype))
-                else:
-                    try:
-                        u = int(u)
-                        v = int(v)
-                    except:
-                        pass
-
-                try:
-                    t = timestamptype(t)
-                except:
-                    raise TypeError("Failed to convert interval time to {}".format(timestamptype))
-
-                G.add_edge(u, v, t, **edgedata)
+        from dynetworkx.readwrite.text import _read_impulse_txt  # readwrite imports the classes
+        _read_impulse_txt(G, path, delimiter, nodetype, timestamptype, order, comments, processes)
 
         if predict is True:
             G.generate_predictive_model()
@@ -1564,3 +2077,36 @@ class ImpulseGraph(object):
                 line += '\n'
 
                 file.write(line)
+
+    def save(self, path, index=True):
+        """Write impulse graph to the directory path in a columnar binary format, to be read with `load`.
+           Nodes are stored once in a node table, and edges as columns of node positions,
+           timestamps and attribute values, in NumPy .npy files.
+
+        Parameters
+        ----------
+        path : string
+           Directory to write to. It is created if it does not exist.
+
+        index : bool, optional (default= True)
+           If True, also write the index layout: the edges of every node as arrays, and for
+           interval graphs the running max of the interval ends, so that the saved graph can be
+           queried by binary search without being loaded.
+
+        Raises
+        ------
+        NetworkXError
+            If the graph attributes or the attribute names are not JSON serializable.
+
+        See Also
+        --------
+        load : read a graph saved with save
+        save_to_txt : write the graph to a text edge list
+
+        Examples
+        --------
+        >>> G.save("my_dygraph")
+        >>> H = dnx.load("my_dygraph")
+        """
+        from dynetworkx.readwrite.binary import _save  # readwrite imports the classes
+        _save(self, path, index)
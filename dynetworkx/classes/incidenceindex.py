@@ -0,0 +1,118 @@
+"""Per-node and per-node-pair interval indexes kept next to the adjacency of interval graphs.
+
+Answering `G.edges(u=n, begin=b, end=e)` from the adjacency alone means filtering every edge
+incident to n. `IncidenceIndex` keeps an `IntervalTree` over the edges of a node, or of a pair of
+nodes, so that such queries cost O(log d + k) for a node with d edges, k of which match. Trees are
+only built for keys with many edges, the first time they are queried by time, and are then kept up
+to date as edges are added and removed.
+"""
+import sys
+from dynetworkx.classes.intervaltree import IntervalTree, overlaps
+
+__all__ = ['IncidenceIndex']
+
+
+class IncidenceIndex:
+    """Interval trees over the edges incident to nodes, and over the edges between pairs of nodes.
+
+    Parameters
+    ----------
+    directed : bool, optional (default=False)
+        If False, the edges of a node are the edges with the node at either end, and the pairs
+        (u, v) and (v, u) share their edges. If True, the edges of a node are its out edges, the
+        edges of a target are its in edges, and pairs are ordered.
+    threshold : int, optional (default=128)
+        Smallest number of edges of a key for it to get a tree. Smaller keys are filtered linearly.
+    """
+
+    def __init__(self, directed=False, threshold=128):
+        self.directed = directed
+        self.threshold = threshold
+        self.nodes = {}
+        self.targets = {}
+        self.pairs = {}
+
+    def _update(self, edge, method):
+        u, v = edge[0], edge[1]
+        spaces = [(self.nodes, u), (self.pairs, (u, v))]
+        if self.directed:
+            spaces.append((self.targets, v))
+        elif v != u:
+            spaces.append((self.nodes, v))
+
+        for trees, key in spaces:
+            tree = trees.get(key)
+            if tree is not None:
+                getattr(tree, method)(edge)
+                if tree.number_of_edges == 0:
+                    # the key lost all of its edges; the tree is built again if it gets many of them back
+                    del trees[key]
+                    if trees is self.pairs and not self.directed:
+                        trees.pop((v, u), None)
+
+    def add(self, edge):
+        self._update(edge, 'add')
+
+    def add_from(self, edges):
+        if len(self.nodes) > 0 or len(self.targets) > 0 or len(self.pairs) > 0:
+            for edge in edges:
+                self._update(edge, 'add')
+
+    def remove(self, edge):
+        self._update(edge, 'remove')
+
+    def _query(self, trees, key, edges, begin, end, aliases=()):
+        # edges is a function returning all the edges of key, only called when key has no tree
+        if begin is None and end is None:
+            return list(edges())
+
+        tree = trees.get(key)
+        if tree is None:
+            candidates = list(edges())
+            if len(candidates) < self.threshold:
+                return [edge for edge in candidates if overlaps(edge, begin, end)]
+
+            tree = IntervalTree()
+            tree.add_from(candidates)
+            trees[key] = tree
+            for alias in aliases:
+                trees[alias] = tree
+
+        # with infinite bounds for the open sides, the overlap test of the tree is the one of overlaps
+        nodes = tree.query(tree.root, float("-inf") if begin is None else begin,
+                           float("inf") if end is None else end)
+        result = []
+        for node in nodes:
+            if type(node.edges) is list:
+                result.extend(node.edges)
+            else:
+                result.append(node.edges)
+        return result
+
+    def node_edges(self, n, edges, begin=None, end=None):
+        """Edges of node n matching the interval, ordered by interval if n has a tree.
+
+        `edges` is a function returning all the edges of n, called when n has no tree.
+        """
+        return self._query(self.nodes, n, edges, begin, end)
+
+    def target_edges(self, n, edges, begin=None, end=None):
+        """In edges of node n matching the interval, in a directed index."""
+        return self._query(self.targets, n, edges, begin, end)
+
+    def pair_edges(self, u, v, edges, begin=None, end=None):
+        """Edges between u and v matching the interval."""
+        aliases = () if self.directed else ((v, u),)
+        return self._query(self.pairs, (u, v), edges, begin, end, aliases)
+
+    def memory_usage(self):
+        # approximate number of bytes used by the trees; the edge tuples are shared with the graph
+        size = sys.getsizeof(self)
+        seen = set()
+        for trees in (self.nodes, self.targets, self.pairs):
+            size += sys.getsizeof(trees)
+            for tree in trees.values():
+                if id(tree) not in seen:
+                    seen.add(id(tree))
+                    size += tree.memory_usage()
+        return size
@@ -1,23 +1,38 @@
-from dynetworkx.classes.intervalgraph import IntervalGraph
+from dynetworkx.classes.intervalgraph import IntervalGraph, GraphVersion, _count_degrees, _interval_degree_changes, \
+    _edge_columns, _add_edge_rows, _gc_paused
+from dynetworkx.classes.intervalindex import interval_index
+from dynetworkx.classes.intervaltree import overlaps
+from dynetworkx.classes.incidenceindex import IncidenceIndex
+from dynetworkx.classes.lifespanindex import LifespanIndex
+from dynetworkx.classes.queryplanner import QueryPlanner
+from dynetworkx.classes.reportviews import IntervalEdgeView
 from networkx.classes.digraph import DiGraph
 from networkx.classes.multidigraph import MultiDiGraph
 
 from networkx.exception import NetworkXError
-from dynetworkx.classes.intervaltree import IntervalTree
 from sortedcontainers import SortedDict
 import random
+import warnings
 import math
+import weakref
 from timeit import default_timer as timer
-from sklearn.linear_model import LinearRegression
 from itertools import product
 
 class IntervalDiGraph(IntervalGraph):
 
-    def __init__(self, **attr):
+    def __init__(self, index='avl', **attr):
         """Initialize an interval graph with edges, name, or graph attributes.
 
         Parameters
         ----------
+        index : string, class or interval index, optional (default='avl')
+            Interval index used to store the edges: the name of a registered engine ('avl', 'static',
+            'centered', 'sorted' or 'intervaltree'), or a class or empty instance implementing the
+            interval index protocol. 'avl' is a balanced interval tree that is cheap to update one edge
+            at a time. 'static' keeps the intervals in sorted NumPy arrays, which is much faster to query
+            but is rebuilt lazily after the graph is mutated; use it for graphs that are built once and
+            queried many times. See `dynetworkx.classes.intervalindex` for the protocol and all engines.
+
         attr : keyword arguments, optional (default= no attributes)
             Attributes to add to graph as key=value pairs.
 
@@ -27,16 +42,31 @@ class IntervalDiGraph(IntervalGraph):
         >>> G = dnx.IntervalDiGraph(name='my graph')
         >>> G.graph
         {'name': 'my graph'}
+        >>> G = dnx.IntervalDiGraph(index='static')
         """
-        self.tree = IntervalTree()
+        self.tree = interval_index(index)
         self.graph = {}  # dictionary for graph attributes
         self._node = {}
         self._pred = {}  # out
         self._succ = {}  # in
+        self._incidence = IncidenceIndex(directed=True)  # interval trees over the edges of nodes with many edges
+        self._lifespans = LifespanIndex()  # sorted activity of nodes, to tell whether they are present in an interval
+        self._planner = QueryPlanner(directed=True)  # cardinality statistics used to plan compound edge queries
         self._model = None
+        self._versions = weakref.WeakSet()  # versions whose adjacency is not built yet
 
         self.graph.update(attr)
 
+    def is_directed(self):
+        """Return True, the IntervalDiGraph is directed."""
+        return True
+
+    def _incident_iedges(self, n):
+        # every out edge and in edge of node n
+        for adj in (self._pred, self._succ):
+            for iedges in adj.get(n, {}).values():
+                yield from iedges
+
     def add_node(self, node_for_adding, **attr):
         """Add a single node `node_for_adding` and update node attributes.
 
@@ -153,6 +183,9 @@ class IntervalDiGraph(IntervalGraph):
             raise NetworkXError("IntervalDiGraph: edge duration must be strictly bigger than zero {0}.".format(iedge))
 
         self._pred[u][v][iedge] = self._succ[v][u][iedge] = attr
+        self._incidence.add(iedge)
+        self._lifespans.add(iedge)
+        self._planner.add(iedge)
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add all the edges in ebunch_to_add.
@@ -161,7 +194,8 @@ class IntervalDiGraph(IntervalGraph):
         ----------
         ebunch_to_add : container of edges
             Each edge given in the container will be added to the
-            interval graph. The edges must be given as as 4-tuples (u, v, being, end).
+            interval graph. The edges must be given as as 4-tuples (u, v, being, end)
+            or 5-tuples (u, v, begin, end, d) where d is a dictionary containing edge data.
             Both begin and end must be orderable and the same type across all edges.
         attr : keyword arguments, optional
             Edge data (or labels or objects) can be assigned using
@@ -176,6 +210,10 @@ class IntervalDiGraph(IntervalGraph):
         Adding the same edge (with the same interval) twice has no effect
         but any edge data will be updated when each duplicate edge is added.
 
+        New edges are handed to the interval tree in a single batch, which builds
+        a balanced tree bottom-up instead of inserting edges one by one
+        when the batch is large compared to the existing tree.
+
         Examples
         --------
         >>> G = dnx.IntervalDiGraph()
@@ -185,13 +223,93 @@ class IntervalDiGraph(IntervalGraph):
 
         >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)], weight=3)
         >>> G.add_edges_from([(3, 4, 2, 19), (1, 4, 1, 3)], label='WN2898')
+        >>> G.add_edges_from([(3, 4, 2, 19, {'weight': 2})])
         """
 
+        iedges = []
         for e in ebunch_to_add:
-            if len(e) != 4:
-                raise NetworkXError("Edge tuple {0} must be a 4-tuple.".format(e))
+            if len(e) == 4:
+                u, v, begin, end = e
+                dd = {}
+            elif len(e) == 5:
+                u, v, begin, end, dd = e
+            else:
+                raise NetworkXError("Edge tuple {0} must be a 4-tuple or 5-tuple.".format(e))
+
+            iedge = (u, v, begin, end)
+            datadict = dict(attr)
+            datadict.update(dd)
+
+            if u in self._pred and v in self._pred[u] and iedge in self._pred[u][v]:
+                self._pred[u][v][iedge].update(datadict)
+                continue
+
+            self._pred.setdefault(u, {}).setdefault(v, {})
+            self._succ.setdefault(v, {}).setdefault(u, {})
+            self._node.setdefault(u, {})
+            self._node.setdefault(v, {})
+
+            self._pred[u][v][iedge] = self._succ[v][u][iedge] = datadict
+            iedges.append(iedge)
+
+        self.tree.add_from(iedges)
+        self._incidence.add_from(iedges)
+        self._lifespans.add_from(iedges)
+        self._planner.add_from(iedges)
+
+    def add_edges_from_arrays(self, u, v, begin, end, **attr):
+        """Add the edges given as columns, the i-th edge being (u[i], v[i], begin[i], end[i]).
+
+        Parameters
+        ----------
+        u, v : array_like
+            Source and target nodes of the edges. Nodes must be hashable (and not None)
+            Python objects; numpy scalars are converted to Python ones.
+        begin, end : array_like
+            Numeric timestamps of the edges, of the same dtype.
+            Every end must be bigger than or equal to its begin.
+        attr : keyword arguments, optional
+            Edge data, either as an array_like with one value per edge
+            or as a single value given to every edge.
+
+        Raises
+        ------
+        NetworkXError
+            If the columns do not have the same length, if the timestamps are not numeric,
+            NaN or of different dtypes, or if an edge ends before it begins.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Notes
+        -----
+        The result is the same as add_edges_from with the same edges, including
+        for edges given twice or already in the graph, whose data is updated.
 
-            self.add_edge(e[0], e[1], e[2], e[3], **attr)
+        The columns are checked at once, the adjacency is updated once per pair of
+        nodes and the interval tree and query statistics are built from the whole
+        batch, which makes large batches several times faster to add than with
+        add_edges_from.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from_arrays(np.array([1, 2]), np.array([2, 4]), np.array([3, 1]), np.array([10, 11]))
+        >>> G.add_edges_from_arrays([3, 1], [4, 4], [2, 1], [19, 3], weight=[2, 5], label='WN2898')
+        """
+
+        with _gc_paused():
+            u, v, (begin, end), datadicts = _edge_columns("IntervalDiGraph", u, v, (begin, end), attr)
+            iedges = list(zip(u.tolist(), v.tolist(), begin.tolist(), end.tolist()))
+            iedges, rows, nodes, sources, targets = _add_edge_rows(self._node, self._pred, self._succ, True, u, v,
+                                                                   iedges, datadicts)
+
+            self.tree.add_from(iedges)
+            self._incidence.add_from(iedges)
+            self._lifespans.add_from(iedges)
+            self._planner.add_many(nodes, sources, targets, begin[rows], end[rows])
 
     def has_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Return True if there exists an edge between u and v
@@ -264,47 +382,45 @@ class IntervalDiGraph(IntervalGraph):
                                 "begin: {}, end: {}.".format(begin, end))
 
         for iv in self._pred[u][v]:
-            if self.__overlaps_or_contains(iv, begin, end):
+            if overlaps(iv, begin, end):
                 return True
         return False
 
     def __edges_node_first(self, u_list, v_list, begin, end):
-        # Node filtering
-        iedges = set()
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
+
+        # Node filtering; the out edges of u, the in edges of v and the edges from u to v are filtered by interval
+        # by the incidence index, which only scans them linearly when there are few of them
+        iedges = []
         for u, v in product(u_list, v_list):
             if u is None and v is None:
-                iedges.update([iv for u in self._pred for v in self._pred[u] for iv in self._pred[u][v]])
+                all_iedges = set(iv for u in self._pred for v in self._pred[u] for iv in self._pred[u][v])
+                iedges.extend(iv for iv in all_iedges if overlaps(iv, begin, end))
             elif u is not None and v is not None:
-                if u not in self._pred:
-                    continue
-                if v not in self._pred[u]:
+                if u not in self._pred or v not in self._pred[u]:
                     continue
-                iedges.update(self._pred[u][v])
+                iedges.extend(self._incidence.pair_edges(u, v, self._pred[u][v].keys, begin, end))
             elif u is not None:
                 if u not in self._pred:
                     continue
-                iedges.update([iv for v in self._pred[u] for iv in self._pred[u][v]])
+                iedges.extend(self._incidence.node_edges(u, lambda: (iv for nbr in self._pred[u].values() for iv in nbr),
+                                                         begin, end))
             else:
                 if v not in self._succ:
                     continue
-                iedges.update([iv for u in self._succ[v] for iv in self._succ[v][u]])
+                iedges.extend(self._incidence.target_edges(v, lambda: (iv for nbr in self._succ[v].values() for iv in nbr),
+                                                           begin, end))
 
-            # If interval is none, return
-            if begin is None and end is None:
-                return iedges
-
-            # Interval filtering
-            if begin is not None and end is not None and begin > end:
-                raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
-                                    "begin: {}, end: {}.".format(begin, end))
-
-        return [iv for iv in iedges if IntervalDiGraph.__overlaps_or_contains(iv, begin, end)]
+        # edges matched by several nodes are only returned once
+        return iedges if len(u_list) * len(v_list) == 1 else list(dict.fromkeys(iedges))
 
     def __edges_interval_first(self, begin, end):
         if begin is not None and end is not None and begin > end:
             raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
-        return self.tree[begin:end]
+        return self._iedges(begin, end)
 
     def edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
         """Returns a list of Interval objects of the IntervalDiGraph edges.
@@ -411,31 +527,19 @@ class IntervalDiGraph(IntervalGraph):
         elif u == [None] and v == [None]:
             iedges = self.__edges_interval_first(begin, end)
 
-        # Compound
-        elif (u != [None] or v != [None]) and (begin is not None or end is not None) and self._model is not None:
-            if u == [None]:
-                nodes = v
-            elif v == [None]:
-                nodes = u
+        # Compound; the planner estimates from the statistics of the graph whether filtering the edges in
+        # the interval by node is cheaper than filtering the edges of the nodes by interval
+        elif begin is not None or end is not None:
+            if self._model is None:
+                interval_first = self._planner.interval_first(u, v, begin, end)
             else:
-                nodes = set(*u).union(set(*v))
-
-            node_percent = len(nodes) / self.number_of_nodes()
-
-            graph_begin, graph_end = self.interval()
-            if begin is None:
-                begin = graph_begin
-            if end is None:
-                end = graph_end
-
-            interval_percent = (end - begin) / (graph_end - graph_begin)
+                interval_first = self.__model_interval_first(u, v, begin, end)
 
-            node_time, interval_time = self._model.predict((node_percent, interval_percent))[0]
-
-            if node_time < interval_time:
-                iedges = self.__edges_node_first(u, v, begin, end)
+            if interval_first:
+                node_filter = self._planner.edge_filter(u, v)
+                iedges = [e for e in self.__edges_interval_first(begin, end) if node_filter(e)]
             else:
-                iedges = [e for e in self.__edges_interval_first(begin, end) if e[0] in nodes or e[1] in nodes]
+                iedges = self.__edges_node_first(u, v, begin, end)
 
         # Node First
         else:
@@ -501,11 +605,27 @@ class IntervalDiGraph(IntervalGraph):
     def generate_predictive_model(self, training_size=250):
         """Trains linear regression model used to predict faster ordering of compound slices.
 
+        .. deprecated::
+            Compound slices are planned from degree and timestamp statistics that the graph keeps
+            up to date, without training. A trained model takes precedence over these statistics.
+
         Parameters
         ----------
         trainingSize : int
             Number of samples to generate.
+
+        Notes
+        -----
+        Requires scikit-learn, which is installed with the `predict` extra: `pip install dynetworkx[predict]`.
         """
+        warnings.warn("generate_predictive_model is deprecated, compound slices are planned from graph "
+                      "statistics without training.", DeprecationWarning, stacklevel=2)
+        try:
+            from sklearn.linear_model import LinearRegression
+        except ImportError:
+            raise ImportError("generate_predictive_model requires scikit-learn, which can be installed with "
+                              "`pip install dynetworkx[predict]`.")
+
         X, y = self.__generate_training_data(training_size)
 
         model = LinearRegression()
@@ -513,6 +633,60 @@ class IntervalDiGraph(IntervalGraph):
 
         self._model = model
 
+    def __model_interval_first(self, u_list, v_list, begin, end):
+        # returns True if the model trained by generate_predictive_model predicts a compound query to be
+        # faster interval first
+        nodes = (set(u_list) | set(v_list)) - {None}
+        node_percent = len(nodes) / self.number_of_nodes()
+
+        graph_begin, graph_end = self.interval()
+        begin = graph_begin if begin is None else begin
+        end = graph_end if end is None else end
+        interval_percent = (end - begin) / (graph_end - graph_begin)
+
+        node_time, interval_time = self._model.predict([(node_percent, interval_percent)])[0]
+        return interval_time <= node_time
+
+    def edge_view(self, begin=None, end=None, u=None, v=None):
+        """Returns a lazy, read-only set-like view of the IntervalDiGraph edges.
+
+        Unlike `edges`, the view does not collect the edges: it is iterated from the
+        interval index, `len` counts the edges with the interval index, and `in` looks an edge
+        up in the adjacency. Set operations between views, or with other sets, return sets.
+        The view reflects later changes of the interval graph.
+
+        Parameters
+        ----------
+        begin: int or float, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges appearing in the interval graph.
+        end: int or float, optional  (default= end of the entire interval graph)
+            Non-inclusive ending time of the edges appearing in the interval graph.
+            Must be bigger than or equal to begin.
+        u, v : nodes or lists of nodes, optional (default=None)
+            Node constraints, as in `edges`.
+
+        Returns
+        -------
+        IntervalEdgeView
+
+        See Also
+        --------
+        edges
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> view = G.edge_view(begin=10, end=12)
+        >>> len(view)
+        2
+        >>> (2, 4, 8, 15) in view
+        True
+        >>> sorted(view & G.edge_view(u=2))
+        [(2, 4, 1, 11), (2, 4, 8, 15)]
+        """
+        return IntervalEdgeView(self, begin, end, u, v, directed=True)
+
     def remove_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Remove the edge between u and v in the interval graph,
         during the given interval.
@@ -575,8 +749,8 @@ class IntervalDiGraph(IntervalGraph):
             if begin is None or end is None:
                 raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
 
-            iedge = self.edges(u, v, begin, end)
-            if iedge is not None:
+            iedge = (u, v, begin, end)
+            if iedge in self._pred[u][v]:
                 self.__remove_iedge(iedge)
             return
 
@@ -593,9 +767,7 @@ class IntervalDiGraph(IntervalGraph):
                 raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
 
-            for iv in self._pred[u][v]:
-                if IntervalDiGraph.__overlaps_or_contains(iv, begin, end):
-                    iedges_to_remove.append(iv)
+            iedges_to_remove = self._incidence.pair_edges(u, v, self._pred[u][v].keys, begin, end)
 
         # removing found iedges
         for iv in iedges_to_remove:
@@ -650,12 +822,8 @@ class IntervalDiGraph(IntervalGraph):
 
         # no specified node, return mean degree
         if node is None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end):
-                n += 1
-                l += self.degree(node, begin=begin, end=end)
-            return l / n
+            degrees = self.degrees(begin=begin, end=end)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta is False:
@@ -735,13 +903,9 @@ class IntervalDiGraph(IntervalGraph):
         """
 
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end):
-                n += 1
-                l += self.in_degree(node, begin=begin, end=end)
-            return l / n
+        if node is None:
+            degrees = self.in_degrees(begin=begin, end=end)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -813,13 +977,9 @@ class IntervalDiGraph(IntervalGraph):
         """
 
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end):
-                n += 1
-                l += self.out_degree(node, begin=begin, end=end)
-            return l / n
+        if node is None:
+            degrees = self.out_degrees(begin=begin, end=end)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -849,11 +1009,126 @@ class IntervalDiGraph(IntervalGraph):
                 # iterate through SortedDict, only advancing current degree if edge was not counted on init
                 if time[0] != begin:
                     current_degree += time[1]
-                    print(time, begin, edge, current_degree)
                 output.append((time[0], current_degree))
 
         return sorted(output)
 
+    def degrees(self, begin=None, end=None, delta=False):
+        """Return the degree of every node between time begin and end.
+
+        All degrees are computed in a single pass over the edges in the interval, instead of two
+        edge queries per node.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edge appearing in the interval graph.
+        end : int or float, optional (default= end of the entire interval graph)
+            Non-inclusive ending time of the edge appearing in the interval graph.
+        delta : bool, optional (default= False)
+            If True, return the degree changes of every node instead of its degree.
+
+        Returns
+        -------
+        Dict of the degree of every node present in the interval, as given by `degree(node, begin, end)`.
+        If delta is True, dict of the list of degree changes of every node, as given by
+        `degree(node, begin, end, delta=True)`.
+        If neither begin nor end is given, every node of the graph is present.
+
+        See Also
+        --------
+        in_degrees
+        out_degrees
+
+        Examples
+        --------
+        >>> G = IntervalDiGraph()
+        >>> G.add_edge(1, 2, 3, 5)
+        >>> G.add_edge(2, 3, 8, 11)
+        >>> G.degrees()
+        {1: 1, 2: 2, 3: 1}
+        >>> G.degrees(end=8, delta=True)
+        {1: [(3, 1), (5, 0)], 2: [(3, 1), (5, 0)]}
+        """
+        return self.__degrees(begin, end, delta, sources=True, targets=True)
+
+    def in_degrees(self, begin=None, end=None, delta=False):
+        """Return the in-degree of every node between time begin and end.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edge appearing in the interval graph.
+        end : int or float, optional (default= end of the entire interval graph)
+            Non-inclusive ending time of the edge appearing in the interval graph.
+        delta : bool, optional (default= False)
+            If True, return the in-degree changes of every node instead of its in-degree.
+
+        Returns
+        -------
+        Dict of the in-degree of every node present in the interval, as given by `in_degree(node, begin, end)`.
+        If delta is True, dict of the list of in-degree changes of every node, as given by
+        `in_degree(node, begin, end, delta=True)`.
+
+        Examples
+        --------
+        >>> G = IntervalDiGraph()
+        >>> G.add_edge(1, 2, 3, 5)
+        >>> G.add_edge(2, 3, 8, 11)
+        >>> G.in_degrees(begin=4)
+        {1: 0, 2: 1, 3: 1}
+        """
+        return self.__degrees(begin, end, delta, sources=False, targets=True)
+
+    def out_degrees(self, begin=None, end=None, delta=False):
+        """Return the out-degree of every node between time begin and end.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edge appearing in the interval graph.
+        end : int or float, optional (default= end of the entire interval graph)
+            Non-inclusive ending time of the edge appearing in the interval graph.
+        delta : bool, optional (default= False)
+            If True, return the out-degree changes of every node instead of its out-degree.
+
+        Returns
+        -------
+        Dict of the out-degree of every node present in the interval, as given by `out_degree(node, begin, end)`.
+        If delta is True, dict of the list of out-degree changes of every node, as given by
+        `out_degree(node, begin, end, delta=True)`.
+
+        Examples
+        --------
+        >>> G = IntervalDiGraph()
+        >>> G.add_edge(1, 2, 3, 5)
+        >>> G.add_edge(2, 3, 8, 11)
+        >>> G.out_degrees(begin=4)
+        {1: 1, 2: 1, 3: 0}
+        """
+        return self.__degrees(begin, end, delta, sources=True, targets=False)
+
+    def __degrees(self, begin, end, delta, sources, targets):
+        nodes = self._node if begin is None and end is None else ()
+        if not delta:
+            return _count_degrees(self.edges(begin=begin, end=end), nodes, sources, targets, directed=True)
+
+        # the nodes of the interval, some of which may have no edge left once it is bounded by the graph
+        if not nodes:
+            nodes = _count_degrees(self.edges(begin=begin, end=end))
+        if begin is None:
+            begin = self.tree.begin
+        if end is None:
+            end = self.tree.end
+        if begin is None or begin > end:
+            # empty graph, or an interval ending before the first edge
+            return {n: [] for n in nodes}
+        at_begin = _count_degrees(self.edges(begin=begin, end=begin), (), sources, targets, directed=True)
+        changes = _interval_degree_changes(self.edges(begin=begin, end=end), at_begin, begin, end, nodes, sources,
+                                           targets, directed=True)
+        # like the degree changes of a single node, sorted by time and degree
+        return {n: sorted(series) for n, series in changes.items()}
+
     def to_networkx_graph(self, begin, end, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False):
         """Return a networkx DiGraph or MultiDiGraph which includes all the nodes and
         edges which have overlapping intervals with the given interval.
@@ -920,25 +1195,29 @@ class IntervalDiGraph(IntervalGraph):
         if begin and end and begin > end:
             raise NetworkXError("IntervalDiGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
-        iedges = self.tree[begin:end]
+        return self._subgraph_from_iedges(self.tree[begin:end], multigraph=multigraph, edge_data=edge_data,
+                                          edge_interval_data=edge_interval_data, node_data=node_data)
 
+    def _subgraph_from_iedges(self, iedges, multigraph=False, edge_data=False, edge_interval_data=False,
+                              node_data=False):
+        """Return a networkx DiGraph or MultiDiGraph of the given edges, as returned by `to_subgraph`."""
         if multigraph:
             G = MultiDiGraph()
         else:
             G = DiGraph()
 
         if edge_data and edge_interval_data:
-            G.add_edges_from((iedge.data[0], iedge.data[1],
-                              dict(self._pred[iedge.data[0]][iedge], begin=iedge.begin, end=iedge.end))
+            G.add_edges_from((iedge[0], iedge[1],
+                              dict(self._pred[iedge[0]][iedge[1]][iedge], begin=iedge[2], end=iedge[3]))
                              for iedge in iedges)
         elif edge_data:
-            G.add_edges_from((iedge.data[0], iedge.data[1], self._pred[iedge.data[0]][iedge].copy())
+            G.add_edges_from((iedge[0], iedge[1], self._pred[iedge[0]][iedge[1]][iedge].copy())
                              for iedge in iedges)
         elif edge_interval_data:
-            G.add_edges_from((iedge.data[0], iedge.data[1], {'begin': iedge.begin, 'end': iedge.end})
+            G.add_edges_from((iedge[0], iedge[1], {'begin': iedge[2], 'end': iedge[3]})
                              for iedge in iedges)
         else:
-            G.add_edges_from((iedge.data[0], iedge.data[1]) for iedge in iedges)
+            G.add_edges_from((iedge[0], iedge[1]) for iedge in iedges)
 
         # include node attributes
         if node_data:
@@ -946,6 +1225,155 @@ class IntervalDiGraph(IntervalGraph):
 
         return G
 
+    def _forget_iedges(self, iedges):
+        # removes edges that were already removed from the tree from the adjacency, then drops the emptied
+        # neighbor dicts and the nodes left without any in or out edge
+        self._materialize_versions()
+        pairs = set()
+        for iedge in iedges:
+            u, v = iedge[0], iedge[1]
+            self._pred[u][v].pop(iedge, None)
+            self._succ[v][u].pop(iedge, None)
+            self._incidence.remove(iedge)
+            self._lifespans.remove(iedge)
+            self._planner.remove(iedge)
+            pairs.add((u, v))
+
+        for u, v in pairs:
+            if u in self._pred and v in self._pred[u] and len(self._pred[u][v]) == 0:
+                del self._pred[u][v]
+                del self._succ[v][u]
+
+        for u, v in pairs:
+            if u in self._pred and len(self._pred[u]) == 0:
+                del self._pred[u]
+            if v in self._succ and len(self._succ[v]) == 0:
+                del self._succ[v]
+            for n in (u, v):
+                if n not in self._pred and n not in self._succ:
+                    self._node.pop(n, None)
+
+    def snapshot_version(self):
+        """Returns a read-only version of the interval graph as it is now.
+
+        Taking a version is cheap: the version shares the nodes of the interval tree with
+        the graph, which then copies the tree nodes it updates instead of modifying them
+        (path copying), so the graph can keep changing while the version is being read.
+        See `IntervalGraph.snapshot_version` for details.
+
+        Returns
+        -------
+        Read-only interval directed graph, with `frozen` set to True.
+
+        Raises
+        ------
+        NetworkXError
+            If the interval index of the graph does not support snapshots. Only the default
+            'avl' index does.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> H = G.snapshot_version()
+        >>> G.remove_edge(1, 2)
+        >>> H.edges()
+        [(1, 2, 3, 10), (2, 4, 1, 11)]
+        """
+
+        if not hasattr(self.tree, 'snapshot'):
+            raise NetworkXError("The interval index {} does not support snapshots.".format(type(self.tree).__name__))
+        return IntervalDiGraphVersion(self)
+
+    def _version_adjacency(self, graph):
+        # adjacency of the edges in the tree of this version, with the attribute dicts of the same edges in graph
+        pred = {n: {} for n in self._node if n in graph._pred}
+        succ = {n: {} for n in self._node if n in graph._succ}
+        for iedge in self.tree.slice(None, None):
+            u, v = iedge[0], iedge[1]
+            attr = graph._pred[u][v][iedge]
+            pred.setdefault(u, {}).setdefault(v, {})[iedge] = attr
+            succ.setdefault(v, {}).setdefault(u, {})[iedge] = attr
+        return {'_pred': pred, '_succ': succ}
+
+    def _adjacency_dicts(self):
+        return [self._pred, self._succ]
+
+    @staticmethod
+    def load_from_txt(path, delimiter=" ", nodetype=int, intervaltype=float, order=('u', 'v', 'begin', 'end'),
+                      merge=(False, 0), predict=False, comments="#", processes=1):
+        """Read interval directed graph in from path.
+           Both interval times must be integers or floats.
+           Nodes can be any hashable objects.
+           Edge Attributes can be assigned with in the following format: Key=Value
+
+        Parameters
+        ----------
+        path : string or file
+           Filename to read.
+
+        nodetype : Python type, optional (default= int)
+           Convert nodes to this type.
+
+        intervaltype : Python type, optional (default= float)
+        Convert interval begin and end to this type.
+        This must be an orderable type, ideally int or float. Other orderable types have not been fully tested.
+
+        order : Python 4-tuple, optional (default= ('u', 'v', 'begin', 'end'))
+        This may be a 4-tuple containing strings 'u', 'v', 'begin', and 'end'. 'u' specifies the source node,
+        'v' the target node, 'begin' the interval start time, and 'end' the interval end time.
+        This may be a 4-tuple containing strings 'u', 'v', 'begin' or 'end', and duration.
+        Duration must be positive number greater than or equal to 1, must be in last position of tuple.
+
+        merge : 2-tuple, optional (default= (False, 0))
+        Attempt to merge discrete edge timestamps into continuous edges with specified grace period.
+        Lines from the same source to the same target with the same edge data are merged if they overlap
+        or if the gap between them is at most the grace period. See coalesce_intervals for more information.
+
+        predict : bool, optional (default= False)
+        If true, calls generate_predictive_model, after graph is created.
+
+        comments : string, optional
+           Marker for comment lines
+
+        delimiter : string, optional
+           Separator for node labels.  The default is whitespace. Cannot be =.
+
+        processes : int or None, optional (default= 1)
+           Number of processes parsing the file. None uses a process per CPU.
+           The file is split into chunks at line boundaries, which are parsed
+           in parallel and loaded into the graph in bulk. The graph is the same
+           whatever the number of processes. `nodetype` and `intervaltype` are sent
+           to the processes by pickling, so lambdas and local functions make
+           the file parse in a single process.
+
+        Returns
+        -------
+        G: IntervalDiGraph
+            The graph corresponding to the lines in edge list.
+
+        Examples
+        --------
+        >>> G=dnx.IntervalDiGraph.load_from_txt("my_dygraph.txt", processes=8)
+        """
+
+        G = IntervalDiGraph()
+
+        if delimiter == '=':
+            raise ValueError("Delimiter cannot be =.")
+
+        if len(order) != 4 or 'u' not in order or 'v' not in order or ('begin' not in order and 'end' not in order):
+            raise ValueError("Order must be a 4-tuple containing strings 'u', 'v', 'begin', and 'end' OR 'u', 'v', "
+                             "'begin' or 'end', and duration.")
+
+        from dynetworkx.readwrite.text import _read_interval_txt  # readwrite imports the classes
+        _read_interval_txt(G, path, delimiter, nodetype, intervaltype, order, merge, comments, processes)
+
+        if predict is True:
+            G.generate_predictive_model()
+
+        return G
+
     def __remove_iedge(self, iedge):
         """Remove the interval edge from the interval graph.
 
@@ -963,28 +1391,14 @@ class IntervalDiGraph(IntervalGraph):
         >>> iedge = (1, 2, 3, 10)
         >>> G.__remove_iedge(iedge)
         """
+        self._materialize_versions()
         self.tree.remove(iedge)
-        self._pred[iedge[0]][iedge[1]].pop(iedge, None)
+        if self._pred[iedge[0]][iedge[1]].pop(iedge, None) is not None:
+            self._incidence.remove(iedge)
+            self._lifespans.remove(iedge)
+            self._planner.remove(iedge)
         self._succ[iedge[1]][iedge[0]].pop(iedge, None)
 
-    @staticmethod
-    def __overlaps_or_contains(iv, begin, end):
-        """Returns True if interval `iv` overlaps with begin and end.
 
-       Parameters
-       ----------
-       iv: Interval
-       begin: int or float
-            Inclusive beginning time of the node appearing in the interval graph.
-        end: int or float
-            Non-inclusive ending time of the node appearing in the interval graph.
-            Must be bigger than or equal begin.
-       """
-        # need to check for iv.contains(begin) in case begin == end
-        if begin is None and end is None:
-            return True
-        if begin is None:
-            return iv[2] < end
-        if end is None:
-            return iv[3] > begin
-        return (iv[2] < end and iv[3] > begin) or iv[2] == begin
+class IntervalDiGraphVersion(GraphVersion, IntervalDiGraph):
+    """Read-only version of an interval directed graph, returned by `IntervalDiGraph.snapshot_version`."""
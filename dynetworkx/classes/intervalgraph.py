@@ -1,15 +1,304 @@
 import dynetworkx as dnx
 from networkx.classes.graph import Graph
 from networkx.exception import NetworkXError
-from dynetworkx.classes.intervaltree import IntervalTree
+from dynetworkx.classes.intervalindex import interval_index
+from dynetworkx.classes.intervaltree import overlaps
+from dynetworkx.classes.staticintervalindex import StaticIntervalIndex
+from dynetworkx.classes.incidenceindex import IncidenceIndex
+from dynetworkx.classes.lifespanindex import LifespanIndex
+from dynetworkx.classes.queryplanner import QueryPlanner
+from dynetworkx.classes.reportviews import IntervalEdgeView
+from dynetworkx.classes.snapshotbuilder import SnapshotBuilder
 from networkx.classes.multigraph import MultiGraph
 from networkx.classes.reportviews import NodeDataView
-from sortedcontainers import SortedList, SortedDict
+from sortedcontainers import SortedDict
+import heapq
 import random
+import warnings
 import math
+import sys
+import threading
+import weakref
+import gc
+import numpy as np
+from contextlib import contextmanager
 from timeit import default_timer as timer
-from sklearn.linear_model import LinearRegression
-from itertools import product
+from itertools import product, groupby
+
+
+def _adjacency_memory_usage(adj, seen):
+    # returns the approximate number of bytes used by an adjacency dict-of-dict-of-dict and by the edge tuples and
+    # attribute dicts it holds, counting objects shared between entries (listed in seen) only once
+    size = sys.getsizeof(adj)
+    edge_size = 0
+    for nbrs in adj.values():
+        size += sys.getsizeof(nbrs)
+        for iedges in nbrs.values():
+            size += sys.getsizeof(iedges)
+            for iedge, attr in iedges.items():
+                if id(iedge) not in seen:
+                    seen.add(id(iedge))
+                    edge_size += sys.getsizeof(iedge)
+                if id(attr) not in seen:
+                    seen.add(id(attr))
+                    size += sys.getsizeof(attr)
+    return size, edge_size
+
+
+def _window_degrees(nodes, offsets, edge_ids, edges, directed):
+    # degrees of nodes in every window of a compressed sparse row result of edges_many, as a (nodes, windows)
+    # array; a self-loop counts twice in a directed graph, as an in and an out edge, and once otherwise
+    index = {n: i for i, n in enumerate(nodes)}
+    sources = np.array([index.get(edge[0], -1) for edge in edges], dtype=np.intp)
+    targets = np.array([index.get(edge[1], -1) for edge in edges], dtype=np.intp)
+    if not directed:
+        targets[targets == sources] = -1
+
+    windows = len(offsets) - 1
+    owners = np.repeat(np.arange(windows), np.diff(offsets))
+    degrees = np.zeros(len(nodes) * windows, dtype=np.intp)
+    for ends in (sources[edge_ids], targets[edge_ids]):
+        cells = ends * windows + owners
+        degrees += np.bincount(cells[ends >= 0], minlength=len(nodes) * windows)
+    return degrees.reshape(len(nodes), windows)
+
+
+def _edge_ends(edges, sources=True, targets=True, directed=False):
+    # (node, edge) for every end of every edge counted by a degree: the source and/or the target of the edge. A
+    # self-loop counts twice in a directed graph, as an in and an out edge, and once otherwise
+    for edge in edges:
+        if sources:
+            yield edge[0], edge
+        if targets and (directed or not sources or edge[1] != edge[0]):
+            yield edge[1], edge
+
+
+def _count_degrees(edges, nodes=(), sources=True, targets=True, directed=False):
+    # degree of every node of the given edges, and of the given nodes, in a single pass over the edges
+    degrees = dict.fromkeys(nodes, 0)
+    for edge in edges:
+        degrees.setdefault(edge[0], 0)
+        degrees.setdefault(edge[1], 0)
+    for n, _ in _edge_ends(edges, sources, targets, directed):
+        degrees[n] += 1
+    return degrees
+
+
+def _interval_degree_changes(edges, at_begin, begin, end, nodes=(), sources=True, targets=True, directed=False):
+    # degree change series of every node, as returned by degree(node, delta=True), from the edges overlapping
+    # [begin, end) and the degrees at begin
+    events = {n: [] for n in nodes}
+    for edge in edges:
+        events.setdefault(edge[0], [])
+        events.setdefault(edge[1], [])
+    for n, edge in _edge_ends(edges, sources, targets, directed):
+        if edge[2] >= begin:
+            events[n].append((edge[2], 1))
+        if edge[3] < end:
+            events[n].append((edge[3], -1))
+
+    changes = {}
+    for n, node_events in events.items():
+        degree = at_begin.get(n, 0)
+        changes[n] = []
+        # ends before begins at the same time, and only changes after begin advance the degree counted at begin
+        for time, change in sorted(node_events):
+            if time != begin:
+                degree += change
+            changes[n].append((time, degree))
+    return changes
+
+
+def _impulse_degree_changes(edges, nodes=(), sources=True, targets=True, directed=False):
+    # number of edges of every node at each of its timestamps, in order of time
+    counts = {n: {} for n in nodes}
+    for edge in edges:
+        counts.setdefault(edge[0], {})
+        counts.setdefault(edge[1], {})
+    for n, edge in _edge_ends(edges, sources, targets, directed):
+        counts[n][edge[2]] = counts[n].get(edge[2], 0) + 1
+    return {n: sorted(times.items()) for n, times in counts.items()}
+
+
+def _sparse_snapshots(offsets, edge_ids, edges, nodelist, directed, values=None, format='csr'):
+    # adjacency matrices of every window of a compressed sparse row result of edges_many, with rows and columns in
+    # the order of nodelist. Entries sum the values of the edges of a pair of nodes, one per edge in a window, or
+    # are 1 if values is None. Undirected edges are entered on both sides of the diagonal, self-loops once.
+    index = {n: i for i, n in enumerate(nodelist)}
+    n = len(nodelist)
+    windows = len(offsets) - 1
+    sources = np.array([index.get(edge[0], -1) for edge in edges], dtype=np.intp)
+    targets = np.array([index.get(edge[1], -1) for edge in edges], dtype=np.intp)
+
+    times = np.repeat(np.arange(windows), np.diff(offsets))
+    rows = sources[edge_ids]
+    cols = targets[edge_ids]
+    data = np.ones(len(edge_ids), dtype=np.intp) if values is None else np.asarray(values)
+    # edges of nodes outside of nodelist are left out
+    keep = (rows >= 0) & (cols >= 0)
+    times, rows, cols, data = times[keep], rows[keep], cols[keep], data[keep]
+    if not directed:
+        mirror = rows != cols
+        times = np.concatenate((times, times[mirror]))
+        rows, cols = np.concatenate((rows, cols[mirror])), np.concatenate((cols, rows[mirror]))
+        data = np.concatenate((data, data[mirror]))
+
+    # entries of the same window and pair of nodes are summed, in (time, row, col) order
+    order = np.lexsort((cols, rows, times))
+    times, rows, cols, data = times[order], rows[order], cols[order], data[order]
+    if len(order) > 0:
+        first = np.flatnonzero(np.concatenate(([True], (np.diff(times) != 0) | (np.diff(rows) != 0) |
+                                               (np.diff(cols) != 0))))
+        data = np.ones(len(first), dtype=np.intp) if values is None else np.add.reduceat(data, first)
+        times, rows, cols = times[first], rows[first], cols[first]
+
+    if format == 'coo':
+        return np.vstack((times, rows, cols)), data, (windows, n, n)
+
+    import scipy.sparse # only needed for the matrices, so importing dynetworkx does not load scipy
+    bounds = np.searchsorted(times, np.arange(windows + 1))
+    return [scipy.sparse.csr_matrix((data[a:b], (rows[a:b], cols[a:b])), shape=(n, n))
+            for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+
+@contextmanager
+def _gc_paused():
+    # the containers allocated by a batch live as long as the graph, so collecting while they are allocated only
+    # scans them again and again; the cyclic garbage collector is paused for the duration of the batch
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _node_column(nodes):
+    # numpy would turn a list of numbers and strings into strings, and a list of tuples into a 2-d array, so lists
+    # of nodes are only converted as such if all of them are ints, floats or strings of a single type
+    if isinstance(nodes, np.ndarray):
+        return nodes
+    nodes = list(nodes)
+    types = set(map(type, nodes))
+    if len(types) == 1 and types <= {int, float, str}:
+        return np.asarray(nodes)
+    return np.fromiter(nodes, dtype=object, count=len(nodes))
+
+
+def _edge_columns(name, u, v, times, attr):
+    # checks the columns of a batch of edges given as arrays, and returns them as arrays with the attribute dict of
+    # every row. times holds the timestamp column t of impulse graphs, or the columns begin and end.
+    u, v, times = _node_column(u), _node_column(v), [np.asarray(column) for column in times]
+    rows = len(u) if u.ndim == 1 else -1
+    if any(column.ndim != 1 or len(column) != rows for column in [v] + times):
+        raise NetworkXError("{0}: edge columns must be one-dimensional arrays of the same length.".format(name))
+    if any(column.dtype.kind not in 'iuf' for column in times) or len({column.dtype for column in times}) > 1:
+        raise NetworkXError("{0}: timestamp columns must be numeric arrays of the same dtype, got {1}."
+                            .format(name, ", ".join(str(column.dtype) for column in times)))
+    if times[0].dtype.kind == 'f':
+        for column in times:
+            invalid = np.flatnonzero(np.isnan(column))
+            if len(invalid) > 0:
+                raise NetworkXError("{0}: timestamps must not be NaN, got one in row {1}.".format(name, invalid[0]))
+    if len(times) == 2:
+        invalid = np.flatnonzero(times[1] < times[0])
+        if len(invalid) > 0:
+            raise NetworkXError("{0}: interval end must be bigger than or equal to begin, got ({1}, {2}) in row {3}."
+                                .format(name, times[0][invalid[0]], times[1][invalid[0]], invalid[0]))
+
+    # attributes are given either as a column or as a single value shared by all rows
+    columns = {}
+    for key, value in attr.items():
+        if np.ndim(value) == 0:
+            columns[key] = [value] * rows
+            continue
+        column = value.tolist() if isinstance(value, np.ndarray) else list(value)
+        if len(column) != rows:
+            raise NetworkXError("{0}: attribute column {1} must have one value per edge.".format(name, key))
+        columns[key] = column
+    if len(columns) == 0:
+        datadicts = [{} for _ in range(rows)]
+    else:
+        datadicts = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    return u, v, times, datadicts
+
+
+def _node_codes(u, v):
+    # list of the nodes of the columns u and v in order of first appearance, and the position in it of every node of
+    # u and of v. Columns of the same non-object dtype are coded at once, others node by node.
+    if u.dtype == v.dtype and u.dtype.kind != 'O':
+        nodes, first, codes = np.unique(np.column_stack((u, v)).ravel(), return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        positions = np.empty(len(order), dtype=np.intp)
+        positions[order] = np.arange(len(order))
+        codes = positions[codes.ravel()]
+        return nodes[order].tolist(), codes[0::2], codes[1::2]
+
+    index = {}
+    codes = np.fromiter((index.setdefault(n, len(index)) for pair in zip(u.tolist(), v.tolist()) for n in pair),
+                        dtype=np.intp, count=2 * len(u))
+    return list(index), codes[0::2], codes[1::2]
+
+
+def _add_edge_rows(node, out_adj, in_adj, directed, u, v, iedges, datadicts):
+    # adds the edges of a batch, the rows of the columns u and v, to an adjacency laid out as out_adj[u][v][edge]
+    # and in_adj[v][u][edge], with in_adj = out_adj for undirected graphs. Rows repeating an edge, or naming an
+    # edge already in the graph, update its data. Returns the new edges, their rows, the list of nodes of the batch
+    # and the positions in it of the sources and targets of the new edges.
+    rows = dict(zip(iedges, range(len(iedges))))
+    if len(rows) < len(iedges):
+        rows = {}
+        for i, iedge in enumerate(iedges):
+            first = rows.setdefault(iedge, i)
+            if first != i:
+                datadicts[first].update(datadicts[i])
+    if len(node) > 0:
+        for iedge, i in list(rows.items()):
+            edges = out_adj.get(iedge[0], {}).get(iedge[1], {})
+            if iedge in edges:
+                edges[iedge].update(datadicts[i])
+                del rows[iedge]
+    if len(rows) < len(iedges):
+        iedges = list(rows)
+        datadicts = [datadicts[i] for i in rows.values()]
+    rows = np.fromiter(rows.values(), dtype=np.intp, count=len(iedges))
+
+    nodes, sources, targets = _node_codes(u, v)
+    sources, targets = sources[rows], targets[rows]
+    # nodes are added in the order adding the edges one by one would add them
+    for n in nodes:
+        node.setdefault(n, {})
+    for adj, ends in ((out_adj, sources), (in_adj, targets)) if directed else ((out_adj, None),):
+        if ends is None:
+            added = nodes
+        else:
+            codes, first = np.unique(ends, return_index=True)
+            added = [nodes[code] for code in codes[np.argsort(first)].tolist()]
+        for n in added:
+            adj.setdefault(n, {})
+
+    # edges are grouped by pair of nodes, whatever their orientation in undirected graphs, so that every pair gets
+    # its new edges with a single dict update. Pairs are added in order of their first edge, which keeps neighbours
+    # in the order adding the edges one by one would give them.
+    if directed:
+        pairs = sources * len(nodes) + targets
+    else:
+        pairs = np.minimum(sources, targets) * len(nodes) + np.maximum(sources, targets)
+    order = np.argsort(pairs, kind='stable')
+    starts = np.flatnonzero(np.diff(pairs[order], prepend=-1))
+    stops = np.append(starts[1:], len(order))
+    groups = np.argsort(order[starts])
+    order = order.tolist()
+    ordered = [iedges[i] for i in order]
+    data = [datadicts[i] for i in order]
+    for a, b in zip(starts[groups].tolist(), stops[groups].tolist()):
+        group = dict(zip(ordered[a:b], data[a:b]))
+        x, y = ordered[a][0], ordered[a][1]
+        out_adj[x].setdefault(y, {}).update(group)
+        if directed or x != y:
+            in_adj[y].setdefault(x, {}).update(group)
+    return iedges, rows, nodes, sources, targets
 
 
 class IntervalGraph(object):
@@ -106,11 +395,12 @@ class IntervalGraph(object):
     5
 
     **Subclasses (Advanced):**
-    Edges in interval graphs are represented by Interval Objects and are kept
-    in an IntervalTree. Both are based on
-    intervaltree available in pypi (https://pypi.org/project/intervaltree).
-    IntervalTree allows for fast interval based search through edges,
-    which makes interval graph analysis possible.
+    Edges in interval graphs are represented by (u, v, begin, end) tuples and are kept
+    in an interval index, by default an AVL interval tree. The index allows for
+    fast interval based search through edges, which makes interval graph analysis
+    possible. The engine is chosen with the `index` argument of the constructor;
+    see `dynetworkx.classes.intervalindex` for the available engines and the
+    protocol a custom engine must implement.
 
     The Graph class uses a dict-of-dict-of-dict data structure.
     The outer dict (node_dict) holds adjacency information keyed by nodes.
@@ -119,11 +409,19 @@ class IntervalGraph(object):
     the edge data and holds edge attribute values keyed by attribute names.
     """
 
-    def __init__(self, **attr):
+    def __init__(self, index='avl', **attr):
         """Initialize an interval graph with edges, name, or graph attributes.
 
         Parameters
         ----------
+        index : string, class or interval index, optional (default='avl')
+            Interval index used to store the edges: the name of a registered engine ('avl', 'static',
+            'centered', 'sorted' or 'intervaltree'), or a class or empty instance implementing the
+            interval index protocol. 'avl' is a balanced interval tree that is cheap to update one edge
+            at a time. 'static' keeps the intervals in sorted NumPy arrays, which is much faster to query
+            but is rebuilt lazily after the graph is mutated; use it for graphs that are built once and
+            queried many times. See `dynetworkx.classes.intervalindex` for the protocol and all engines.
+
         attr : keyword arguments, optional (default= no attributes)
             Attributes to add to graph as key=value pairs.
 
@@ -133,12 +431,17 @@ class IntervalGraph(object):
         >>> G = dnx.IntervalGraph(name='my graph')
         >>> G.graph
         {'name': 'my graph'}
+        >>> G = dnx.IntervalGraph(index='static')
         """
-        self.tree = IntervalTree()
+        self.tree = interval_index(index)
         self.graph = {}  # dictionary for graph attributes
         self._node = {}
         self._adj = {}
+        self._incidence = IncidenceIndex()  # interval trees over the edges of nodes with many edges
+        self._lifespans = LifespanIndex()  # sorted activity of nodes, to tell whether they are present in an interval
+        self._planner = QueryPlanner()  # cardinality statistics used to plan compound edge queries
         self._model = None
+        self._versions = weakref.WeakSet()  # versions whose adjacency is not built yet
 
         self.graph.update(attr)
 
@@ -205,6 +508,27 @@ class IntervalGraph(object):
         except TypeError:
             return False
 
+    def is_directed(self):
+        """Return False, the IntervalGraph is undirected."""
+        return False
+
+    def _incident_iedges(self, n):
+        # every edge with node n at either end
+        return (iedge for iedges in self._adj.get(n, {}).values() for iedge in iedges)
+
+    def _active_nodes(self, begin, end):
+        # nodes with an edge in the interval. When the interval is expected to hold more edges than the graph has
+        # nodes, every node is looked up in the lifespan index, in O(log d), instead of reading all of those edges
+        # to collect their ends
+        if self._planner.numeric and self._planner.estimate(begin, end) > len(self._node):
+            return [n for n in self._node if self._lifespans.active(n, self._incident_iedges, begin, end)]
+
+        inodes = set()
+        for u, v, _, _ in self._iedges(begin, end):
+            inodes.add(u)
+            inodes.add(v)
+        return inodes
+
     def interval(self):
         """Return a 2-tuple as (begin, end) interval of the entire
          interval graph.
@@ -220,7 +544,7 @@ class IntervalGraph(object):
         """
         return self.tree.begin, self.tree.end
 
-    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True)):
+    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
         """Return all time events within the given interval.
 
         Parameters
@@ -233,6 +557,14 @@ class IntervalGraph(object):
         inclusive: 2-tuple, optional (default= (True, True))
             First element is true if beginning of interval should be inclusive.
             Second element is true if end of interval should be inclusive
+        as_array: bool, optional (default= False)
+            If True, return a NumPy array instead of a list.
+
+        Notes
+        -----
+        Timestamps are read from sorted indexes maintained by the interval index,
+        so the cost grows with the number of timestamps returned, not with the
+        number of edges.
 
         Examples
         --------
@@ -241,9 +573,9 @@ class IntervalGraph(object):
         >>> G.unique_timestamps()
         [0, 9, 10, 16]
         """
-        return self.tree.unique_timestamps(begin=begin, end=end, inclusive=inclusive)
+        return self.tree.unique_timestamps(begin=begin, end=end, inclusive=inclusive, as_array=as_array)
 
-    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True)):
+    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
         """Return all begin time events within the given interval.
 
         Parameters
@@ -256,17 +588,25 @@ class IntervalGraph(object):
         inclusive: 2-tuple, optional (default= (True, True))
             First element is true if beginning of interval should be inclusive.
             Second element is true if end of interval should be inclusive
+        as_array: bool, optional (default= False)
+            If True, return a NumPy array instead of a list.
+
+        Notes
+        -----
+        Timestamps are read from sorted indexes maintained by the interval index,
+        so the cost grows with the number of timestamps returned, not with the
+        number of edges.
 
         Examples
         --------
         >>> G = dnx.IntervalGraph()
         >>> G.add_edges_from([(1, 2, 0, 10), (3, 7, 9, 16)])
-        >>> G.unique_timestamps()
+        >>> G.unique_begin_timestamps()
         [0, 9]
         """
-        return self.tree.unique_begin_timestamps(begin=begin, end=end, inclusive=inclusive)
+        return self.tree.unique_begin_timestamps(begin=begin, end=end, inclusive=inclusive, as_array=as_array)
 
-    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True)):
+    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
         """Return all end time events within the given interval.
 
         Parameters
@@ -279,15 +619,278 @@ class IntervalGraph(object):
         inclusive: 2-tuple, optional (default= (True, True))
             First element is true if beginning of interval should be inclusive.
             Second element is true if end of interval should be inclusive
+        as_array: bool, optional (default= False)
+            If True, return a NumPy array instead of a list.
+
+        Notes
+        -----
+        Timestamps are read from sorted indexes maintained by the interval index,
+        so the cost grows with the number of timestamps returned, not with the
+        number of edges.
 
         Examples
         --------
         >>> G = dnx.IntervalGraph()
         >>> G.add_edges_from([(1, 2, 0, 10), (3, 7, 9, 16)])
-        >>> G.unique_timestamps()
+        >>> G.unique_end_timestamps()
         [10, 16]
         """
-        return self.tree.unique_end_timestamps(begin=begin, end=end, inclusive=inclusive)
+        return self.tree.unique_end_timestamps(begin=begin, end=end, inclusive=inclusive, as_array=as_array)
+
+    def _iedges(self, begin, end):
+        # interval edges overlapping [begin, end), using the point query when the interval is a single instant
+        if begin is not None and begin == end:
+            return self.tree.at(begin)
+        return self.tree[begin:end]
+
+    def at(self, t):
+        """Return the list of edges active at time t.
+
+        An edge is active at t if its interval contains t, that is begin <= t < end,
+        or if it is an impulse edge at t, that is begin == end == t.
+
+        Parameters
+        ----------
+        t : int or float
+            Point in time.
+
+        Returns
+        -------
+        List of interval edges (u, v, begin, end), ordered by interval.
+
+        See Also
+        --------
+        at_many
+        nodes_at
+        number_of_edges_at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 10, 10)])
+        >>> G.at(3)
+        [(2, 4, 1, 11), (1, 2, 3, 10)]
+        >>> G.at(10) # end is non-inclusive
+        [(2, 4, 1, 11), (6, 4, 10, 10)]
+        """
+        return self.tree.at(t)
+
+    def at_many(self, timestamps):
+        """Return the edges active at each of the given points in time, in compressed sparse row format.
+
+        Parameters
+        ----------
+        timestamps : array_like
+            Points in time.
+
+        Returns
+        -------
+        offsets : numpy array of length len(timestamps) + 1
+            The edges active at timestamps[i] are given by edge_ids[offsets[i]:offsets[i + 1]].
+        edge_ids : numpy array
+            Indices into `edges`.
+        edges : list
+            Interval edges (u, v, begin, end) active at any of the given timestamps.
+
+        Notes
+        -----
+        With `index='static'` all timestamps are answered with a handful of vectorized
+        NumPy operations; other interval indexes answer one timestamp at a time.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> offsets, edge_ids, edges = G.at_many([0, 2, 5])
+        >>> offsets
+        array([0, 0, 1, 3])
+        >>> [edges[i] for i in edge_ids[offsets[2]:offsets[3]]]
+        [(2, 4, 1, 11), (1, 2, 3, 10)]
+        """
+        if hasattr(self.tree, 'at_many'):
+            return self.tree.at_many(timestamps)
+
+        ids = {}
+        offsets = [0]
+        edge_ids = []
+        for t in timestamps:
+            for edge in self.tree.at(t):
+                edge_ids.append(ids.setdefault(edge, len(ids)))
+            offsets.append(len(edge_ids))
+
+        return np.array(offsets, dtype=np.intp), np.array(edge_ids, dtype=np.intp), list(ids)
+
+    def _interval_arrays(self):
+        # every edge ordered by interval, as (edges, order, lows, highs, maxends) where the i-th edge in that order
+        # is edges[order[i]], and lows, highs and maxends, the running max of highs, are in that order as well
+        if isinstance(self.tree, StaticIntervalIndex):
+            self.tree._build()
+            return self.tree.edges, self.tree.ids, self.tree.begins, self.tree.ends, self.tree.maxends
+
+        # the slice of every interval lists all edges in interval order
+        edges = self.tree.slice(float("-inf"), float("inf"))
+        lows = np.array([edge[2] for edge in edges])
+        highs = np.array([edge[3] for edge in edges])
+        maxends = np.maximum.accumulate(highs) if len(highs) > 0 else highs
+        return edges, np.arange(len(edges)), lows, highs, maxends
+
+    def edges_many(self, windows):
+        """Return the edges in each of the given intervals, in compressed sparse row format.
+
+        An edge is in the interval [begin, end) under the same rule as in `edges`, so
+        the edges in windows[i] are the edges of `G.edges(begin=begin, end=end)`.
+
+        Parameters
+        ----------
+        windows : array_like of shape (k, 2)
+            Intervals (begin, end), with numeric timestamps. An unbounded side is given as -inf or inf.
+
+        Returns
+        -------
+        offsets : numpy array of length k + 1
+            The edges in windows[i] are given by edge_ids[offsets[i]:offsets[i + 1]], ordered by interval.
+        edge_ids : numpy array
+            Indices into `edges`.
+        edges : list
+            Interval edges (u, v, begin, end) in any of the given windows.
+
+        Notes
+        -----
+        The edges are ordered by interval once, with their running max end, and every window
+        is located in that order with binary searches done for all windows at once. Only the
+        edges between the first edge that may still be active at begin and the last edge
+        beginning before end are then checked, in a single vectorized pass over all windows.
+
+        See Also
+        --------
+        degree_many
+        at_many
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+        >>> offsets, edge_ids, edges = G.edges_many([(0, 2), (10, 12), (11, 20)])
+        >>> offsets
+        array([0, 1, 2, 3])
+        >>> [edges[i] for i in edge_ids[offsets[1]:offsets[2]]]
+        [(2, 4, 1, 11)]
+        """
+        windows = np.asarray(windows).reshape(-1, 2)
+        begins, ends = windows[:, 0], windows[:, 1]
+        if np.any(begins > ends):
+            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
+                                "windows: {}.".format(windows[begins > ends].tolist()))
+
+        edges, order, lows, highs, maxends = self._interval_arrays()
+
+        # edges from `first` on begin at or after begin and match if they begin before end, or at begin for windows
+        # of a single instant; edges from `lo` to `first` begin before begin and match if they end after it
+        first = np.searchsorted(lows, begins, side='left')
+        hi = np.where(ends > begins, np.searchsorted(lows, ends, side='left'),
+                      np.searchsorted(lows, begins, side='right'))
+        lo = np.minimum(np.searchsorted(maxends, begins, side='right'), first)
+        counts = np.maximum(hi - lo, 0)
+
+        owners = np.repeat(np.arange(len(windows)), counts)
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts - lo, counts)
+        mask = (positions >= first[owners]) | (highs[positions] > begins[owners])
+
+        offsets = np.zeros(len(windows) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(owners[mask], minlength=len(windows)), out=offsets[1:])
+
+        ids, edge_ids = np.unique(np.asarray(order)[positions[mask]], return_inverse=True)
+        return offsets, edge_ids.astype(np.intp), list(map(edges.__getitem__, ids.tolist()))
+
+    def degree_many(self, nodes, windows):
+        """Return the degree of each of the given nodes in each of the given intervals.
+
+        Parameters
+        ----------
+        nodes : list of nodes
+        windows : array_like of shape (k, 2)
+            Intervals (begin, end), as in `edges_many`.
+
+        Returns
+        -------
+        degrees : numpy array of shape (len(nodes), k)
+            degrees[i, j] is the number of edges of nodes[i] in windows[j], as given by
+            `G.degree(nodes[i], begin, end)`.
+
+        See Also
+        --------
+        edges_many
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+        >>> G.degree_many([2, 4], [(0, 2), (10, 12), (0, 20)])
+        array([[1, 1, 2],
+               [1, 1, 2]])
+        """
+        offsets, edge_ids, edges = self.edges_many(windows)
+        return _window_degrees(nodes, offsets, edge_ids, edges, self.is_directed())
+
+    def nodes_at(self, t, data=False, default=None):
+        """A NodeDataView of the nodes with an edge active at time t.
+
+        Parameters
+        ----------
+        t : int or float
+            Point in time.
+        data : string or bool, optional (default=False)
+            The node attribute returned in 2-tuple (n, dict[data]).
+            If False, return just the nodes n.
+        default : value, optional (default=None)
+            Value used for nodes that don't have the requested attribute.
+            Only relevant if data is not True or False.
+
+        Returns
+        -------
+        NodeDataView
+
+        See Also
+        --------
+        at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> G.nodes_at(2)
+        [2, 4]
+        """
+        inodes = {}
+        for u, v, _, _ in self.tree.at(t):
+            inodes[u] = self._node[u]
+            inodes[v] = self._node[v]
+        return NodeDataView(inodes, data=data, default=default)
+
+    def number_of_edges_at(self, t):
+        """Return the number of edges active at time t.
+
+        Parameters
+        ----------
+        t : int or float
+            Point in time.
+
+        Returns
+        -------
+        int
+
+        See Also
+        --------
+        at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> G.number_of_edges_at(10)
+        1
+        """
+        return self.tree.count(t, t)
 
     def add_node(self, node_for_adding, **attr):
         """Add a single node `node_for_adding` and update node attributes.
@@ -432,19 +1035,57 @@ class IntervalGraph(object):
         if begin is None and end is None:
             return len(self._node)
 
-        iedges = self.tree[begin:end]
+        return len(self._active_nodes(begin, end))
 
-        inodes = set()
-        for u, v, _, _ in iedges:
-            inodes.add(u)
-            inodes.add(v)
+    def number_of_edges(self, begin=None, end=None):
+        """Return the number of edges in the interval graph between the given interval.
+
+        Edges are counted by the interval index without collecting them, which is
+        much faster than `len(G.edges(begin=begin, end=end))` for wide intervals.
+
+        Parameters
+        ----------
+        begin: int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges appearing in the interval graph.
+        end: int or float, optional  (default= end of the entire interval graph)
+            Non-inclusive ending time of the edges appearing in the interval graph.
+            Must be bigger than or equal to begin.
+
+        Returns
+        -------
+        nedges : int
+            The number of edges in the interval graph.
+
+        See Also
+        --------
+        number_of_edges_at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (3, 4, 8, 11), (1, 3, 4, 9)])
+        >>> G.number_of_edges()
+        3
+        >>> G.number_of_edges(begin=5)
+        2
+        >>> G.number_of_edges(begin=5, end=8) # end in non-inclusive
+        1
+        """
+        if begin is None and end is None:
+            return self.tree.number_of_edges
+
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
 
-        return len(inodes)
+        return self.tree.count(begin, end)
 
     def has_node(self, n, begin=None, end=None):
         """Return True if the interval graph contains the node n, during the given interval.
 
-        Identical to `n in G` when 'begin' and 'end' are not defined.
+        Identical to `n in G` when 'begin' and 'end' are not defined. Otherwise the sorted begin
+        times of the edges of n are searched, in O(log d) for a node with d edges, instead of the
+        edges in the interval.
 
         Parameters
         ----------
@@ -485,20 +1126,10 @@ class IntervalGraph(object):
         if begin is None and end is None:
             return True
 
-        if begin is None and end < self.tree.begin:
-            return False
-
         if begin is not None and end is not None and end < begin:
             return False
 
-        if begin and end and begin > end:
-            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
-                                "begin: {}, end: {}.".format(begin, end))
-
-        for edge in self.tree[begin:end]:
-            if n == edge[0] or n == edge[1]:
-                return True
-        return False
+        return self._lifespans.active(n, self._incident_iedges, begin, end)
 
     def nodes(self, begin=None, end=None, data=False, default=None):
         """A NodeDataView of the IntervalGraph nodes.
@@ -559,14 +1190,7 @@ class IntervalGraph(object):
         if begin is None and end is None:
             return NodeDataView(self._node, data=data, default=default)
 
-        iedges = self.tree[begin:end]
-
-        inodes = set()
-        for u, v, _, _ in iedges:
-            inodes.add(u)
-            inodes.add(v)
-
-        node_dict = {n: self._node[n] for n in inodes}
+        node_dict = {n: self._node[n] for n in self._active_nodes(begin, end)}
 
         return NodeDataView(node_dict, data=data, default=default)
 
@@ -609,7 +1233,10 @@ class IntervalGraph(object):
         if n not in self._node:
             return
 
+        self._materialize_versions()
         if begin is None and end is None:
+            for iedge in [iedge for v in self._adj.get(n, {}) for iedge in self._adj[n][v]]:
+                self.__remove_iedge(iedge)
             self._adj.pop(n, None)
             for v in self._adj:
                 if n in self._adj[v]:
@@ -699,6 +1326,9 @@ class IntervalGraph(object):
             raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}.".format(iedge))
 
         self._adj[u][v][iedge] = self._adj[v][u][iedge] = attr
+        self._incidence.add(iedge)
+        self._lifespans.add(iedge)
+        self._planner.add(iedge)
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add all the edges in ebunch_to_add.
@@ -707,7 +1337,8 @@ class IntervalGraph(object):
         ----------
         ebunch_to_add : container of edges
             Each edge given in the container will be added to the
-            interval graph. The edges must be given as as 4-tuples (u, v, being, end).
+            interval graph. The edges must be given as as 4-tuples (u, v, being, end)
+            or 5-tuples (u, v, begin, end, d) where d is a dictionary containing edge data.
             Both begin and end must be orderable and the same type across all edges.
         attr : keyword arguments, optional
             Edge data (or labels or objects) can be assigned using
@@ -722,6 +1353,10 @@ class IntervalGraph(object):
         Adding the same edge (with the same interval) twice has no effect
         but any edge data will be updated when each duplicate edge is added.
 
+        New edges are handed to the interval tree in a single batch, which builds
+        a balanced tree bottom-up instead of inserting edges one by one
+        when the batch is large compared to the existing tree.
+
         Examples
         --------
         >>> G = dnx.IntervalGraph()
@@ -731,13 +1366,93 @@ class IntervalGraph(object):
 
         >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)], weight=3)
         >>> G.add_edges_from([(3, 4, 2, 19), (1, 4, 1, 3)], label='WN2898')
+        >>> G.add_edges_from([(3, 4, 2, 19, {'weight': 2})])
         """
 
+        iedges = []
         for e in ebunch_to_add:
-            if len(e) != 4:
-                raise NetworkXError("Edge tuple {0} must be a 4-tuple.".format(e))
+            if len(e) == 4:
+                u, v, begin, end = e
+                dd = {}
+            elif len(e) == 5:
+                u, v, begin, end, dd = e
+            else:
+                raise NetworkXError("Edge tuple {0} must be a 4-tuple or 5-tuple.".format(e))
+
+            iedge = (u, v, begin, end)
+            datadict = dict(attr)
+            datadict.update(dd)
+
+            if u in self._adj and v in self._adj[u] and iedge in self._adj[u][v]:
+                self._adj[u][v][iedge].update(datadict)
+                continue
+
+            self._adj.setdefault(u, {}).setdefault(v, {})
+            self._adj.setdefault(v, {}).setdefault(u, {})
+            self._node.setdefault(u, {})
+            self._node.setdefault(v, {})
+
+            self._adj[u][v][iedge] = self._adj[v][u][iedge] = datadict
+            iedges.append(iedge)
+
+        self.tree.add_from(iedges)
+        self._incidence.add_from(iedges)
+        self._lifespans.add_from(iedges)
+        self._planner.add_from(iedges)
+
+    def add_edges_from_arrays(self, u, v, begin, end, **attr):
+        """Add the edges given as columns, the i-th edge being (u[i], v[i], begin[i], end[i]).
 
-            self.add_edge(e[0], e[1], e[2], e[3], **attr)
+        Parameters
+        ----------
+        u, v : array_like
+            Nodes of the edges. Nodes must be hashable (and not None) Python objects;
+            numpy scalars are converted to Python ones.
+        begin, end : array_like
+            Numeric timestamps of the edges, of the same dtype.
+            Every end must be bigger than or equal to its begin.
+        attr : keyword arguments, optional
+            Edge data, either as an array_like with one value per edge
+            or as a single value given to every edge.
+
+        Raises
+        ------
+        NetworkXError
+            If the columns do not have the same length, if the timestamps are not numeric,
+            NaN or of different dtypes, or if an edge ends before it begins.
+
+        See Also
+        --------
+        add_edges_from : add edges given as tuples
+
+        Notes
+        -----
+        The result is the same as add_edges_from with the same edges, including
+        for edges given twice or already in the graph, whose data is updated.
+
+        The columns are checked at once, the adjacency is updated once per pair of
+        nodes and the interval tree and query statistics are built from the whole
+        batch, which makes large batches several times faster to add than with
+        add_edges_from.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from_arrays(np.array([1, 2]), np.array([2, 4]), np.array([3, 1]), np.array([10, 11]))
+        >>> G.add_edges_from_arrays([3, 1], [4, 4], [2, 1], [19, 3], weight=[2, 5], label='WN2898')
+        """
+
+        with _gc_paused():
+            u, v, (begin, end), datadicts = _edge_columns("IntervalGraph", u, v, (begin, end), attr)
+            iedges = list(zip(u.tolist(), v.tolist(), begin.tolist(), end.tolist()))
+            iedges, rows, nodes, sources, targets = _add_edge_rows(self._node, self._adj, self._adj, False, u, v,
+                                                                   iedges, datadicts)
+
+            self.tree.add_from(iedges)
+            self._incidence.add_from(iedges)
+            self._lifespans.add_from(iedges)
+            self._planner.add_many(nodes, sources, targets, begin[rows], end[rows])
 
     def has_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Return True if there exists an edge between u and v
@@ -805,47 +1520,41 @@ class IntervalGraph(object):
                                 "begin: {}, end: {}.".format(begin, end))
 
         for iv in self._adj[u][v]:
-            if self.__overlaps_or_contains(iv, begin, end):
+            if overlaps(iv, begin, end):
                 return True
         return False
 
     def __edges_node_first(self, u_list, v_list, begin, end):
-        # Node filtering
-        iedges = set()
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
+
+        # Node filtering; the edges of a node or of a pair of nodes are filtered by interval by the incidence
+        # index, which only scans them linearly when there are few of them
+        iedges = []
         for u, v in product(u_list, v_list):
             if u is None and v is None:
-                iedges.update([iv for u in self._adj for v in self._adj[u] for iv in self._adj[u][v]])
+                all_iedges = set(iv for u in self._adj for v in self._adj[u] for iv in self._adj[u][v])
+                iedges.extend(iv for iv in all_iedges if overlaps(iv, begin, end))
             elif u is not None and v is not None:
-                if u not in self._adj:
-                    continue
-                if v not in self._adj[u]:
+                if u not in self._adj or v not in self._adj[u]:
                     continue
-                iedges.update(self._adj[u][v])
-            elif u is not None:
-                if u not in self._adj:
-                    continue
-                iedges.update([iv for v in self._adj[u] for iv in self._adj[u][v]])
+                iedges.extend(self._incidence.pair_edges(u, v, self._adj[u][v].keys, begin, end))
             else:
-                if v not in self._adj:
+                n = u if u is not None else v
+                if n not in self._adj:
                     continue
-                iedges.update([iv for u in self._adj[v] for iv in self._adj[v][u]])
-
-            # If interval is none, return
-            if begin is None and end is None:
-                return iedges
-
-            # Interval filtering
-            if begin is not None and end is not None and begin > end:
-                raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
-                                    "begin: {}, end: {}.".format(begin, end))
+                iedges.extend(self._incidence.node_edges(n, lambda: (iv for nbr in self._adj[n].values() for iv in nbr),
+                                                         begin, end))
 
-        return [iv for iv in iedges if IntervalGraph.__overlaps_or_contains(iv, begin, end)]
+        # edges matched by several nodes are only returned once
+        return iedges if len(u_list) * len(v_list) == 1 else list(dict.fromkeys(iedges))
 
     def __edges_interval_first(self, begin, end):
         if begin is not None and end is not None and begin > end:
             raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
                                 "begin: {}, end: {}.".format(begin, end))
-        return self.tree[begin:end]
+        return self._iedges(begin, end)
 
     def edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
         """Returns a list of Interval objects of the IntervalGraph edges.
@@ -858,9 +1567,11 @@ class IntervalGraph(object):
         will be returned, and finally if both nodes are defined then all
         edges between the two nodes are returned.
 
-        Note: If nodes and interval are specified, will attempt to return results faster
-        using pre-trained model generated using: IntervalGraph.generate_predictive_model().
-        If no model is trained, a warning will be displayed, and node-first ordering will occur.
+        Note: If nodes and interval are specified, the edges of every node (or pair of nodes)
+        are filtered by interval, using an interval tree over the edges of the node once it
+        has many of them, so such queries cost O(log d + k) for a node with d edges.
+        When the degrees and timestamp statistics of the graph estimate it to be cheaper,
+        the interval is queried first instead and its edges are filtered by node.
 
 
         Parameters
@@ -959,31 +1670,19 @@ class IntervalGraph(object):
         elif u == [None] and v == [None]:
             iedges = self.__edges_interval_first(begin, end)
 
-        # Compound
-        elif (u != [None] or v != [None]) and (begin is not None or end is not None) and self._model is not None:
-            if u == [None]:
-                nodes = v
-            elif v == [None]:
-                nodes = u
+        # Compound; the planner estimates from the statistics of the graph whether filtering the edges in
+        # the interval by node is cheaper than filtering the edges of the nodes by interval
+        elif begin is not None or end is not None:
+            if self._model is None:
+                interval_first = self._planner.interval_first(u, v, begin, end)
             else:
-                nodes = set(*u).union(set(*v))
-
-            node_percent = len(nodes) / self.number_of_nodes()
-
-            graph_begin, graph_end = self.interval()
-            if begin is None:
-                begin = graph_begin
-            if end is None:
-                end = graph_end
-
-            interval_percent = (end - begin) / (graph_end - graph_begin)
+                interval_first = self.__model_interval_first(u, v, begin, end)
 
-            node_time, interval_time = self._model.predict((node_percent, interval_percent))[0]
-
-            if node_time < interval_time:
-                iedges = self.__edges_node_first(u, v, begin, end)
+            if interval_first:
+                node_filter = self._planner.edge_filter(u, v)
+                iedges = [e for e in self.__edges_interval_first(begin, end) if node_filter(e)]
             else:
-                iedges = [e for e in self.__edges_interval_first(begin, end) if e[0] in nodes or e[1] in nodes]
+                iedges = self.__edges_node_first(u, v, begin, end)
 
         # Node First
         else:
@@ -999,6 +1698,46 @@ class IntervalGraph(object):
         return [(iv, self._adj[iv[0]][iv[1]][iv][data]) if data in self._adj[iv[0]][iv[1]][iv] else (iv, default) for iv
                 in iedges]
 
+    def edge_view(self, begin=None, end=None, u=None, v=None):
+        """Returns a lazy, read-only set-like view of the IntervalGraph edges.
+
+        Unlike `edges`, the view does not collect the edges: it is iterated from the
+        interval index, `len` counts the edges with the interval index, and `in` looks an edge
+        up in the adjacency. Set operations between views, or with other sets, return sets.
+        The view reflects later changes of the interval graph.
+
+        Parameters
+        ----------
+        begin: int or float, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges appearing in the interval graph.
+        end: int or float, optional  (default= end of the entire interval graph)
+            Non-inclusive ending time of the edges appearing in the interval graph.
+            Must be bigger than or equal to begin.
+        u, v : nodes or lists of nodes, optional (default=None)
+            Node constraints, as in `edges`.
+
+        Returns
+        -------
+        IntervalEdgeView
+
+        See Also
+        --------
+        edges
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> view = G.edge_view(begin=10, end=12)
+        >>> len(view)
+        2
+        >>> (2, 4, 8, 15) in view
+        True
+        >>> sorted(view & G.edge_view(u=2))
+        [(2, 4, 1, 11), (2, 4, 8, 15)]
+        """
+        return IntervalEdgeView(self, begin, end, u, v)
+
     def remove_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Remove the edge between u and v in the interval graph,
         during the given interval.
@@ -1061,8 +1800,8 @@ class IntervalGraph(object):
             if begin is None or end is None:
                 raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
 
-            iedge = self.edges(u, v, begin, end)
-            if iedge is not None:
+            iedge = (u, v, begin, end)
+            if iedge in self._adj[u][v]:
                 self.__remove_iedge(iedge)
             return
 
@@ -1079,9 +1818,7 @@ class IntervalGraph(object):
                 raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
                                     "begin: {}, end: {}.".format(begin, end))
 
-            for iv in self._adj[u][v]:
-                if IntervalGraph.__overlaps_or_contains(iv, begin, end):
-                    iedges_to_remove.append(iv)
+            iedges_to_remove = self._incidence.pair_edges(u, v, self._adj[u][v].keys, begin, end)
 
         # removing found iedges
         for iv in iedges_to_remove:
@@ -1097,6 +1834,113 @@ class IntervalGraph(object):
         if len(self._adj[v]) == 0:
             self._adj.pop(v, None)
 
+    def evict_before(self, t):
+        """Remove every edge that is no longer active at time t or after it.
+
+        Removes the edges whose interval ends at or before t, except the ones beginning at t,
+        in bulk, together with the nodes that are left without edges. Useful to bound the memory
+        of long-running processes that keep adding new edges.
+
+        Parameters
+        ----------
+        t : int or float
+            Time before which edges are evicted.
+
+        Returns
+        -------
+        List of the removed edges, as (u, v, begin, end) tuples.
+
+        See Also
+        --------
+        truncate : remove every edge outside of an interval
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.evict_before(11)
+        [(2, 4, 1, 11), (1, 2, 3, 10)]
+        >>> G.edges()
+        [(6, 4, 12, 19), (2, 4, 8, 15)]
+        >>> G.nodes()
+        [2, 4, 6]
+        """
+
+        iedges = self.tree.pop_before(t)
+        self._forget_iedges(iedges)
+        return iedges
+
+    def truncate(self, begin=None, end=None):
+        """Remove every edge that does not overlap the interval [begin, end).
+
+        Keeps exactly the edges returned by `edges(begin=begin, end=end)` and removes the
+        others in bulk, together with the nodes that are left without edges. Kept edges
+        are not clipped to the interval.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the interval to keep.
+        end : int or float, optional (default= end of the entire interval graph)
+            Non-inclusive ending time of the interval to keep.
+            Must be bigger than or equal to begin.
+
+        Returns
+        -------
+        List of the removed edges, as (u, v, begin, end) tuples.
+
+        Raises
+        ------
+        NetworkXError
+            If `end` is smaller than `begin`.
+
+        See Also
+        --------
+        evict_before : remove every edge that ended before a given time
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.truncate(10, 12)
+        [(1, 2, 3, 10), (6, 4, 12, 19)]
+        >>> G.edges()
+        [(2, 4, 1, 11), (2, 4, 8, 15)]
+        """
+
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("IntervalGraph: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(begin, end))
+
+        iedges = self.tree.pop_outside(begin, end)
+        self._forget_iedges(iedges)
+        return iedges
+
+    def _forget_iedges(self, iedges):
+        # removes edges that were already removed from the tree from the adjacency, then drops the emptied
+        # neighbor dicts and the nodes left without any edge
+        self._materialize_versions()
+        pairs = set()
+        for iedge in iedges:
+            u, v = iedge[0], iedge[1]
+            self._adj[u][v].pop(iedge, None)
+            self._adj[v][u].pop(iedge, None)
+            self._incidence.remove(iedge)
+            self._lifespans.remove(iedge)
+            self._planner.remove(iedge)
+            pairs.add((u, v))
+
+        for u, v in pairs:
+            if u in self._adj and v in self._adj[u] and len(self._adj[u][v]) == 0:
+                del self._adj[u][v]
+                self._adj[v].pop(u, None)
+
+        for u, v in pairs:
+            for n in (u, v):
+                if n in self._adj and len(self._adj[n]) == 0:
+                    del self._adj[n]
+                    self._node.pop(n, None)
+
     def degree(self, node=None, begin=None, end=None, delta=False):
         """Return the degree of a specified node between time begin and end.
 
@@ -1135,13 +1979,9 @@ class IntervalGraph(object):
         """
 
         # no specified node, return mean degree
-        if node == None:
-            n = 0
-            l = 0
-            for node in self.nodes(begin=begin, end=end):
-                n += 1
-                l += self.degree(node, begin=begin, end=end)
-            return l / n
+        if node is None:
+            degrees = self.degrees(begin=begin, end=end)
+            return sum(degrees.values()) / len(degrees)
 
         # specified node, no degree_change, return degree
         if delta == False:
@@ -1175,6 +2015,170 @@ class IntervalGraph(object):
 
         return output
 
+    def degrees(self, begin=None, end=None, delta=False):
+        """Return the degree of every node between time begin and end.
+
+        All degrees are computed in a single pass over the edges in the interval, instead of one
+        edge query per node.
+
+        Parameters
+        ----------
+        begin : int or float, optional (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edge appearing in the interval graph.
+        end : int or float, optional (default= end of the entire interval graph)
+            Non-inclusive ending time of the edge appearing in the interval graph.
+        delta : bool, optional (default= False)
+            If True, return the degree changes of every node instead of its degree.
+
+        Returns
+        -------
+        Dict of the degree of every node present in the interval, as given by `degree(node, begin, end)`.
+        If delta is True, dict of the list of degree changes of every node, as given by
+        `degree(node, begin, end, delta=True)`.
+        If neither begin nor end is given, every node of the graph is present.
+
+        See Also
+        --------
+        degree
+        degree_many
+
+        Examples
+        --------
+        >>> G = IntervalGraph()
+        >>> G.add_edge(1, 2, 3, 5)
+        >>> G.add_edge(2, 3, 8, 11)
+        >>> G.degrees()
+        {1: 1, 2: 2, 3: 1}
+        >>> G.degrees(end=8)
+        {1: 1, 2: 1}
+        >>> G.degrees(delta=True)
+        {1: [(3, 1), (5, 0)], 2: [(3, 1), (5, 0), (8, 1)], 3: [(8, 1)]}
+        """
+        nodes = self._node if begin is None and end is None else ()
+        if not delta:
+            return _count_degrees(self.edges(begin=begin, end=end), nodes)
+
+        # the nodes of the interval, some of which may have no edge left once it is bounded by the graph
+        if not nodes:
+            nodes = _count_degrees(self.edges(begin=begin, end=end))
+        if begin is None:
+            begin = self.tree.begin
+        if end is None:
+            end = self.tree.end
+        if begin is None or begin > end:
+            # empty graph, or an interval ending before the first edge
+            return {n: [] for n in nodes}
+        at_begin = _count_degrees(self.edges(begin=begin, end=begin))
+        return _interval_degree_changes(self.edges(begin=begin, end=end), at_begin, begin, end, nodes)
+
+    def memory_usage(self):
+        """Returns an estimate of the memory used by the interval graph, in bytes.
+
+        Returns
+        -------
+        Dictionary with the following keys:
+            'tree' : the interval indexes (`G.tree`, and the trees over the edges of nodes with many
+                edges), excluding the edge tuples they share with the adjacency.
+            'adjacency' : the adjacency dicts, including edge attribute dicts.
+            'edges' : the edge tuples.
+            'nodes' : the node attribute dicts.
+            'total' : the sum of all of the above.
+
+        Notes
+        -----
+        Sizes are computed with `sys.getsizeof` and do not include node objects and timestamps,
+        which are usually shared with the caller.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> G.memory_usage()['total'] > 0
+        True
+        """
+
+        seen = set()
+        adjacency = edges = 0
+        for adj in self._adjacency_dicts():
+            adj_size, edge_size = _adjacency_memory_usage(adj, seen)
+            adjacency += adj_size
+            edges += edge_size
+
+        nodes = sys.getsizeof(self._node) + sum(sys.getsizeof(attr) for attr in self._node.values())
+        tree = self.tree.memory_usage() + self._incidence.memory_usage() + self._lifespans.memory_usage()
+
+        return {'tree': tree, 'adjacency': adjacency, 'edges': edges, 'nodes': nodes,
+                'total': tree + adjacency + edges + nodes}
+
+    def snapshot_version(self):
+        """Returns a read-only version of the interval graph as it is now.
+
+        Taking a version is cheap: the version shares the nodes of the interval tree with
+        the graph, which then copies the tree nodes it updates instead of modifying them
+        (path copying), so the graph can keep changing while the version is being read,
+        for example by other threads. The version supports the whole read API of the graph,
+        such as `edges`, `nodes`, `degree` and `to_subgraph`, and any attempt to modify it
+        raises a NetworkXError. Tree nodes only used by released versions are reclaimed by
+        the garbage collector.
+
+        Returns
+        -------
+        Read-only interval graph of the same class, with `frozen` set to True.
+
+        Raises
+        ------
+        NetworkXError
+            If the interval index of the graph does not support snapshots. Only the default
+            'avl' index does.
+
+        Notes
+        -----
+        The version copies the node attribute dicts mapping, and builds its adjacency from
+        the tree the first time it is needed. Node and edge attribute dicts themselves are
+        shared with the graph, so updating the attributes of an existing node or edge is
+        visible in the version. Call `snapshot_version` from the thread that updates the
+        graph, or while no update is running.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> H = G.snapshot_version()
+        >>> G.add_edge(6, 4, 12, 19)
+        >>> G.remove_edge(1, 2)
+        >>> H.edges()
+        [(1, 2, 3, 10), (2, 4, 1, 11)]
+        >>> H.add_edge(1, 4, 5, 6)
+        Traceback (most recent call last):
+            ...
+        NetworkXError: Frozen graph can't be modified.
+        """
+
+        if not hasattr(self.tree, 'snapshot'):
+            raise NetworkXError("The interval index {} does not support snapshots.".format(type(self.tree).__name__))
+        return IntervalGraphVersion(self)
+
+    def _materialize_versions(self):
+        # versions read the attribute dicts of their edges from the graph when they first need their adjacency, so
+        # they must do it before the graph removes any edge
+        if len(self._versions) > 0:
+            for version in list(self._versions):
+                version._materialize()
+            self._versions.clear()
+
+    def _version_adjacency(self, graph):
+        # adjacency of the edges in the tree of this version, with the attribute dicts of the same edges in graph
+        adj = {n: {} for n in self._node if n in graph._adj}
+        for iedge in self.tree.slice(None, None):
+            u, v = iedge[0], iedge[1]
+            attr = graph._adj[u][v][iedge]
+            adj.setdefault(u, {}).setdefault(v, {})[iedge] = attr
+            adj.setdefault(v, {}).setdefault(u, {})[iedge] = attr
+        return {'_adj': adj}
+
+    def _adjacency_dicts(self):
+        return [self._adj]
+
     def __remove_iedge(self, iedge):
         """Remove the interval edge from the interval graph.
 
@@ -1193,8 +2197,12 @@ class IntervalGraph(object):
         >>> G.__remove_iedge(iedge)
         """
 
+        self._materialize_versions()
         self.tree.remove(iedge)
-        self._adj[iedge[0]][iedge[1]].pop(iedge, None)
+        if self._adj[iedge[0]][iedge[1]].pop(iedge, None) is not None:
+            self._incidence.remove(iedge)
+            self._lifespans.remove(iedge)
+            self._planner.remove(iedge)
         self._adj[iedge[1]][iedge[0]].pop(iedge, None)
 
     def __generate_training_data(self, training_size):
@@ -1246,11 +2254,27 @@ class IntervalGraph(object):
     def generate_predictive_model(self, training_size=250):
         """Trains linear regression model used to predict faster ordering of compound slices.
 
+        .. deprecated::
+            Compound slices are planned from degree and timestamp statistics that the graph keeps
+            up to date, without training. A trained model takes precedence over these statistics.
+
         Parameters
         ----------
         trainingSize : int
             Number of samples to generate.
+
+        Notes
+        -----
+        Requires scikit-learn, which is installed with the `predict` extra: `pip install dynetworkx[predict]`.
         """
+        warnings.warn("generate_predictive_model is deprecated, compound slices are planned from graph "
+                      "statistics without training.", DeprecationWarning, stacklevel=2)
+        try:
+            from sklearn.linear_model import LinearRegression
+        except ImportError:
+            raise ImportError("generate_predictive_model requires scikit-learn, which can be installed with "
+                              "`pip install dynetworkx[predict]`.")
+
         X, y = self.__generate_training_data(training_size)
 
         model = LinearRegression()
@@ -1258,26 +2282,19 @@ class IntervalGraph(object):
 
         self._model = model
 
-    @staticmethod
-    def __overlaps_or_contains(iv, begin, end):
-        """Returns True if interval `iv` overlaps with begin and end.
+    def __model_interval_first(self, u_list, v_list, begin, end):
+        # returns True if the model trained by generate_predictive_model predicts a compound query to be
+        # faster interval first
+        nodes = (set(u_list) | set(v_list)) - {None}
+        node_percent = len(nodes) / self.number_of_nodes()
 
-       Parameters
-       ----------
-       iv: Interval
-       begin: int or float
-            Inclusive beginning time of the node appearing in the interval graph.
-        end: int or float
-            Non-inclusive ending time of the node appearing in the interval graph.
-            Must be bigger than or equal begin.
-       """
-        if begin is None and end is None:
-            return True
-        if begin is None:
-            return iv[2] < end
-        if end is None:
-            return iv[3] > begin
-        return (iv[2] < end and iv[3] > begin) or iv[2] == begin
+        graph_begin, graph_end = self.interval()
+        begin = graph_begin if begin is None else begin
+        end = graph_end if end is None else end
+        interval_percent = (end - begin) / (graph_end - graph_begin)
+
+        node_time, interval_time = self._model.predict([(node_percent, interval_percent)])[0]
+        return interval_time <= node_time
 
     def to_networkx_graph(self, begin, end, multigraph=False, edge_data=False, edge_interval_data=False,
                           node_data=False):
@@ -1345,8 +2362,12 @@ class IntervalGraph(object):
         >>> list(M.edges(data=True))
         [(1, 2, {'end': 10, 'begin': 3}), (2, 4, {'end': 11, 'begin': 1}), (2, 4, {'end': 15, 'begin': 8})]
         """
-        iedges = self.tree[begin:end]
+        return self._subgraph_from_iedges(self.tree[begin:end], multigraph=multigraph, edge_data=edge_data,
+                                          edge_interval_data=edge_interval_data, node_data=node_data)
 
+    def _subgraph_from_iedges(self, iedges, multigraph=False, edge_data=False, edge_interval_data=False,
+                              node_data=False):
+        """Return a networkx Graph or MultiGraph of the given edges, as returned by `to_subgraph`."""
         if multigraph:
             G = MultiGraph()
         else:
@@ -1400,6 +2421,7 @@ class IntervalGraph(object):
         See Also
         --------
         to_subgraph : subgraph based on an interval
+        iter_snapshots : iterator over the snapshots of the interval graph
 
         Notes
         -----
@@ -1438,6 +2460,72 @@ class IntervalGraph(object):
         [(2, 4, {'end': 15, 'begin': 8}), (4, 6, {'end': 19, 'begin': 12})]
         """
 
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        snapshots = list(self.__sweep_snapshots(begin, length_of_snapshots, number_of_snapshots,
+                                                multigraph=multigraph, edge_data=edge_data,
+                                                edge_interval_data=edge_interval_data, node_data=node_data))
+        if return_length:
+            return snapshots, length_of_snapshots
+
+        return snapshots
+
+    def iter_snapshots(self, number_of_snapshots=False, length_of_snapshots=False, multigraph=False, edge_data=False,
+                       edge_interval_data=False, node_data=False):
+        """Return an iterator over networkx Graph or MultiGraph objects as snapshots
+        of the interval graph in consecutive order.
+
+        Yields the same snapshots as `to_snapshots`, one at a time, so that only the snapshot being
+        processed and the edges still active at its end are kept in memory.
+
+        Parameters
+        ----------
+        number_of_snapshots : integer
+            Number of snapshots to divide the interval graph into.
+            Must be bigger than 2.
+        length_of_snapshots : integer or float
+            Length of snapshots to divide the interval graph into.
+            Must be bigger than 1.
+        multigraph : bool, optional (default= False)
+            If True, networkx MultiGraphs will be yielded. If False, networkx Graphs.
+        edge_data: bool, optional (default= False)
+            If True, edges will keep their attributes.
+        edge_interval_data : bool, optional (default= False)
+            If True, each edge's attribute will also include its begin and end interval data.
+            If `edge_data= True` and there already exist edge attributes with names begin and end,
+            they will be overwritten.
+        node_data : bool, optional (default= False)
+            if True, each node's attributes will be included.
+
+        See Also
+        --------
+        to_snapshots : list of snapshots of the interval graph
+
+        Notes
+        -----
+        Edges are visited once in order of their begin time: an edge is added to the edges active in a
+        snapshot when the sweep reaches its begin, and dropped at the first snapshot that begins at or after
+        its end. Every edge is therefore read once, however many snapshots it spans.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> for g in G.iter_snapshots(3):
+        ...     print(g.number_of_edges())
+        2
+        3
+        2
+        """
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        return self.__sweep_snapshots(begin, length_of_snapshots, number_of_snapshots, multigraph=multigraph,
+                                      edge_data=edge_data, edge_interval_data=edge_interval_data,
+                                      node_data=node_data)
+
+    def _snapshot_windows(self, number_of_snapshots, length_of_snapshots):
+        """Validate the arguments of `to_snapshots` and return the beginning, the length and the
+        number of the snapshots."""
         if type(number_of_snapshots) is bool and type(length_of_snapshots) is bool:
             raise NetworkXError("IntervalGraph: either number of snapshots or length of snapshots must be given.")
 
@@ -1461,24 +2549,126 @@ class IntervalGraph(object):
         if length_of_snapshots is False:
             length_of_snapshots = (end - begin) / number_of_snapshots
 
-        snapshots = []
-        end_inclusive_addition = 0
+        return begin, length_of_snapshots, number_of_snapshots
+
+    def __sweep_snapshots(self, begin, length_of_snapshots, number_of_snapshots, **kwargs):
+        # edges in order of their begin time, and the ones that began before the current snapshot and may still
+        # overlap it, kept in the same order so that every snapshot lists its edges as to_subgraph would
+        edges, order = self._interval_arrays()[:2]
+        iedges = iter([edges[i] for i in order.tolist()])
+        iedge = next(iedges, None)
+        active = []
+
         for i in range(number_of_snapshots):
+            snapshot_begin = begin + length_of_snapshots * i
+            snapshot_end = begin + length_of_snapshots * (i + 1)
             # since to_subgraph is end non-inclusive, shift the end up by 1 to include end in the last snapshot.
             if i == number_of_snapshots - 1:
-                end_inclusive_addition = 1
+                snapshot_end += 1
 
-            snapshots.append(
-                self.to_subgraph(begin + length_of_snapshots * i,
-                                 begin + length_of_snapshots * (i + 1) + end_inclusive_addition,
-                                 multigraph=multigraph, edge_data=edge_data, edge_interval_data=edge_interval_data,
-                                 node_data=node_data))
-        if return_length:
-            return snapshots, length_of_snapshots
+            # edges that began before this snapshot overlap it if they end after its beginning, and will overlap
+            # the following snapshots at most as long
+            active = [e for e in active if e[3] > snapshot_begin]
+            snapshot = list(active)
+            while iedge is not None and iedge[2] < snapshot_end:
+                if iedge[3] > snapshot_begin:
+                    active.append(iedge)
+                    snapshot.append(iedge)
+                elif iedge[2] == snapshot_begin:
+                    snapshot.append(iedge)
+                iedge = next(iedges, None)
 
-        return snapshots
+            yield self._subgraph_from_iedges(snapshot, **kwargs)
+
+    def to_sparse_snapshots(self, number_of_snapshots=False, length_of_snapshots=False, weight=None, nodelist=None,
+                            format='csr'):
+        """Return the adjacency matrices of the snapshots of the interval graph in consecutive order.
+
+        The snapshots are the ones of `to_snapshots`, but their scipy sparse adjacency matrices are
+        built directly from the interval index, without creating networkx graphs.
 
-    def to_snapshot_graph(self, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False):
+        Parameters
+        ----------
+        number_of_snapshots : integer
+            Number of snapshots to divide the interval graph into.
+            Must be bigger than 2.
+        length_of_snapshots : integer or float
+            Length of snapshots to divide the interval graph into.
+            Must be bigger than 1.
+        weight : None, 'count' or 'duration', optional (default= None)
+            If None, an entry is 1 if the snapshot has an edge between its two nodes.
+            If 'count', an entry is the number of edges between its two nodes in the snapshot.
+            If 'duration', an entry is the sum of the time during which the edges between its two
+            nodes overlap the snapshot.
+        nodelist : list, optional (default= G.nodes())
+            The rows and columns are ordered according to the nodes in nodelist, the same in every
+            snapshot. Edges of nodes that are not in nodelist are left out.
+        format : 'csr' or 'coo', optional (default= 'csr')
+            If 'csr', a list of scipy CSR matrices is returned, one per snapshot.
+            If 'coo', a single sparse tensor of shape (number of snapshots, n, n) is returned, in
+            coordinate format.
+
+        Returns
+        -------
+        List of scipy.sparse.csr_matrix, or, if format='coo', a 3-tuple (coords, data, shape), where
+        coords is an array of shape (3, nnz) holding the snapshot, row and column of each of the data
+        entries, sorted in that order.
+
+        See Also
+        --------
+        to_snapshots : list of networkx snapshots of the interval graph
+        edges_many : edges in each of a list of intervals
+
+        Notes
+        -----
+        Undirected edges are entered on both sides of the diagonal, and self-loops once on the
+        diagonal, as in `networkx.to_scipy_sparse_array`. Edges of length zero overlap a snapshot
+        for no time, so with weight='duration' their entries are 0.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> S = G.to_sparse_snapshots(2, weight='count')
+        >>> S[0].toarray()
+        array([[0, 1, 0, 0],
+               [1, 0, 2, 0],
+               [0, 2, 0, 0],
+               [0, 0, 0, 0]])
+        >>> coords, data, shape = G.to_sparse_snapshots(2, weight='duration', format='coo')
+        >>> shape
+        (2, 4, 4)
+        """
+        if weight not in (None, 'count', 'duration'):
+            raise NetworkXError("IntervalGraph: weight must be None, 'count' or 'duration'. "
+                                "{0} was passed.".format(weight))
+        if format not in ('csr', 'coo'):
+            raise NetworkXError("IntervalGraph: format must be 'csr' or 'coo'. {0} was passed.".format(format))
+
+        begin, length_of_snapshots, number_of_snapshots = self._snapshot_windows(number_of_snapshots,
+                                                                                 length_of_snapshots)
+        # same windows as the snapshot sweep, the end of the last one being shifted up by 1 to include the end
+        begins = begin + length_of_snapshots * np.arange(number_of_snapshots)
+        ends = begin + length_of_snapshots * np.arange(1, number_of_snapshots + 1)
+        windows = np.column_stack((begins, ends))
+        windows[-1, 1] += 1
+        offsets, edge_ids, edges = self.edges_many(windows)
+
+        values = None
+        if weight == 'count':
+            values = np.ones(len(edge_ids), dtype=np.intp)
+        elif weight == 'duration':
+            owners = np.repeat(np.arange(number_of_snapshots), np.diff(offsets))
+            lows = np.array([edge[2] for edge in edges])[edge_ids] if len(edges) > 0 else begins[:0]
+            highs = np.array([edge[3] for edge in edges])[edge_ids] if len(edges) > 0 else ends[:0]
+            values = np.maximum(np.minimum(highs, ends[owners]) - np.maximum(lows, begins[owners]), 0)
+
+        if nodelist is None:
+            nodelist = list(self._node)
+        return _sparse_snapshots(offsets, edge_ids, edges, nodelist, self.is_directed(), values, format)
+
+    def to_snapshot_graph(self, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False,
+                          share_structure=False):
         """
         Return a dnx.SnapshotGraph of the interval graph.
 
@@ -1494,6 +2684,11 @@ class IntervalGraph(object):
             it will be overwritten.
         node_data : bool, optional (default= False)
             if True, each node's attributes will be included.
+        share_structure : bool, optional (default= False)
+            If True, consecutive snapshots share the adjacency of the nodes whose edges do not change
+            between them, instead of each snapshot being a copy of all of its edges. Such snapshots are
+            frozen: they cannot be modified.
+
         See Also
         --------
         to_snapshots : divide the interval graph to snapshots
@@ -1505,6 +2700,13 @@ class IntervalGraph(object):
         If multigraph= False, and edge_data=True or edge_timestamp_data=True,
         in case there are multiple edges, only one will show with one of the edge's attributes.
 
+        The snapshots are built in a single sweep over the begin and end times of the edges, which
+        keeps the set of active edges and applies to it only the edges that begin and end between
+        consecutive snapshots. Each snapshot is a copy of the active edges, so the sweep costs
+        O(m log m + s * a) for m edges, s snapshots and at most a active edges. With
+        `share_structure=True` only the nodes whose edges change are copied, and it costs
+        O(m log m + s * n) for n nodes instead.
+
         Examples
         --------
         Interval timestamps
@@ -1534,69 +2736,69 @@ class IntervalGraph(object):
 
         """
 
-        G = dnx.SnapshotGraph()
-
-        # This algorithm slices the interval graph into different non-overlapped, consecutive snapshots and insert them
-        # into a snapshot graph. Snapshots' lengths are variable and each snapshot represents a change in a series edges
-        # E.g: 2 edges with time intervals [(2,5), (3,7)] will be split into 3 snapshots [(2,3), (3,5), (5, 7)]
-
-        time = SortedList()  # this contains a list of sorted unique time stamp which will be used as "end" timestamp
-        # for each slice in following iterations
-        # We use a moving window specified by "begin" and "end" to slice each snapshots.
-        begin = None
-        for node in self.tree.inOrder(self.tree.root):
-            if node.low == node.high:  # this handles the case when someone uses interval graph as impulse graph
-                G.insert(graph=self.to_subgraph(begin=node.low, end=node.low, multigraph=multigraph, edge_data=edge_data
-                                                , edge_interval_data=edge_interval_data, node_data=node_data),
-                         time=node.low)
-            else:
-                if begin is None:
-                    begin = node.low
-                    time.add(node.high)
-                    continue
-
-                if node.low == begin:
-                    time.add(node.high)
-                elif len(time) == 0 or node.low < time[0]:
-                    end = node.low
-                    time.add(node.high)
-                    G.insert(graph=self.to_subgraph(begin=begin, end=end, multigraph=multigraph, edge_data=edge_data,
-                                                    edge_interval_data=edge_interval_data, node_data=node_data),
-                             start=begin, end=end)
-                    begin = end
-                elif node.low > time[0]:
-                    while node.low > time[0]:
-                        end = time.pop(0)
-                        G.insert(
-                            graph=self.to_subgraph(begin=begin, end=end, multigraph=multigraph, edge_data=edge_data,
-                                                   edge_interval_data=edge_interval_data, node_data=node_data),
-                            start=begin, end=end)
-                        begin = end
-
-                        if len(time) == 0:
-                            break
-
-                    end = node.low
-                    time.add(node.high)
-                    G.insert(graph=self.to_subgraph(begin=begin, end=end, multigraph=multigraph, edge_data=edge_data,
-                                                    edge_interval_data=edge_interval_data, node_data=node_data),
-                             start=begin, end=end)
-                    begin = end
-                else:  # if node.low == time[0]
-                    end = time.pop(0)  # can use either "node.low" or "time[0]"
-                    time.add(node.high)
-                    G.insert(graph=self.to_subgraph(begin=begin, end=end, multigraph=multigraph, edge_data=edge_data,
-                                                    edge_interval_data=edge_interval_data, node_data=node_data),
-                             start=begin, end=end)
-                    begin = end
-
-        # after finish iterating through all edges in the interval graph, which means all "start" timestamp has been
-        # iterated through, iterate through the remaining timestamps stored in "time"
-        for end in time:
-            G.insert(graph=self.to_subgraph(begin=begin, end=end, multigraph=multigraph, edge_data=edge_data,
-                                            edge_interval_data=edge_interval_data, node_data=node_data),
-                     start=begin, end=end)
-            begin = end
+        G = dnx.SnapshotDiGraph() if self.is_directed() else dnx.SnapshotGraph()
+        adj = self._pred if self.is_directed() else self._adj
+
+        def attributes(iedge):
+            if edge_data and edge_interval_data:
+                return dict(adj[iedge[0]][iedge[1]][iedge], begin=iedge[2], end=iedge[3])
+            elif edge_data:
+                return adj[iedge[0]][iedge[1]][iedge].copy()
+            elif edge_interval_data:
+                return {'begin': iedge[2], 'end': iedge[3]}
+            return None
+
+        builder = SnapshotBuilder(multigraph=multigraph, directed=self.is_directed(), share_structure=share_structure,
+                                  node_attr=(lambda n: self._node[n].copy()) if node_data else None)
+
+        # The interval graph is sliced into non-overlapping, consecutive snapshots, one between every two consecutive
+        # begin or end times of the edges. E.g: 2 edges with time intervals [(2,5), (3,7)] will be split into 3
+        # snapshots [(2,3), (3,5), (5, 7)]. Edges of zero length (impulses) do not split snapshots: each of them is in
+        # the snapshot it falls in, and in a snapshot of its own time with the edges active at that time.
+        edges, order = self._interval_arrays()[:2]
+        iedges = [edges[i] for i in order.tolist()]  # in order of begin time
+        times = sorted({t for iedge in iedges if iedge[2] != iedge[3] for t in iedge[2:4]})
+
+        def insert_impulses(impulses):
+            for time, group in groupby(impulses, key=lambda item: item[0][2]):
+                group = list(group)
+                for iedge, data in group:
+                    builder.add(iedge, iedge[0], iedge[1], data)
+                G.insert(graph=builder.snapshot(), time=time)
+                for iedge, data in group:
+                    builder.remove(iedge)
+
+        # impulses before the first change
+        i = 0
+        impulses = []
+        while i < len(iedges) and (not times or iedges[i][2] < times[0]):
+            impulses.append((iedges[i], attributes(iedges[i])))
+            i += 1
+        insert_impulses(impulses)
+
+        ends = []  # heap of (end, position, edge) of the active edges
+        for k, begin in enumerate(times):
+            end = times[k + 1] if k + 1 < len(times) else None
+            while ends and ends[0][0] <= begin:
+                builder.remove(heapq.heappop(ends)[2])
+
+            impulses = []
+            while i < len(iedges) and (end is None or iedges[i][2] < end):
+                iedge = iedges[i]
+                if iedge[2] == iedge[3]:
+                    impulses.append((iedge, attributes(iedge)))
+                else:
+                    builder.add(iedge, iedge[0], iedge[1], attributes(iedge))
+                    heapq.heappush(ends, (iedge[3], i, iedge))
+                i += 1
+            insert_impulses(impulses)
+
+            if end is not None:
+                for iedge, data in impulses:
+                    builder.add(iedge, iedge[0], iedge[1], data)
+                G.insert(graph=builder.snapshot(), start=begin, end=end)
+                for iedge, data in impulses:
+                    builder.remove(iedge)
 
         return G
 
@@ -1684,6 +2886,7 @@ class IntervalGraph(object):
 
         G = IntervalGraph()
 
+        edges = []
         for edge in graph.edges(data=True):
             attr = {}
 
@@ -1691,13 +2894,15 @@ class IntervalGraph(object):
                 if key != begin and key != end:
                     attr[key] = edge[2][key]
 
-            G.add_edge(edge[0], edge[1], edge[2][begin], edge[2][end], **attr)
+            edges.append((edge[0], edge[1], edge[2][begin], edge[2][end], attr))
+
+        G.add_edges_from(edges)
 
         return G
 
     @staticmethod
     def load_from_txt(path, delimiter=" ", nodetype=int, intervaltype=float, order=('u', 'v', 'begin', 'end'),
-                      merge=(False, 0), predict=False, comments="#"):
+                      merge=(False, 0), predict=False, comments="#", processes=1):
         """Read interval graph in from path.
            Both interval times must be integers or floats.
            Nodes can be any hashable objects.
@@ -1723,7 +2928,8 @@ class IntervalGraph(object):
 
         merge : 2-tuple, optional (default= (False, 0))
         Attempt to merge discrete edge timestamps into continuous edges with specified grace period.
-        Note: grace period is offset by +-1 to provide inclusive ends. See IntervalGraph.edges for more information.
+        Lines of the same pair of nodes with the same edge data are merged if they overlap or if the gap
+        between them is at most the grace period. See coalesce_intervals for more information.
 
         predict : bool, optional (default= False)
         If true, calls generate_predictive_model, after graph is created.
@@ -1734,6 +2940,14 @@ class IntervalGraph(object):
         delimiter : string, optional
            Separator for node labels.  The default is whitespace. Cannot be =.
 
+        processes : int or None, optional (default= 1)
+           Number of processes parsing the file. None uses a process per CPU.
+           The file is split into chunks at line boundaries, which are parsed
+           in parallel and loaded into the graph in bulk. The graph is the same
+           whatever the number of processes. `nodetype` and `intervaltype` are sent
+           to the processes by pickling, so lambdas and local functions make
+           the file parse in a single process.
+
         Returns
         -------
         G: IntervalGraph
@@ -1764,69 +2978,8 @@ class IntervalGraph(object):
             raise ValueError("Order must be a 4-tuple containing strings 'u', 'v', 'begin', and 'end' OR 'u', 'v', "
                              "'begin' or 'end', and duration.")
 
-        with open(path, 'r') as file:
-            for line in file:
-                p = line.find(comments)
-                if p >= 0:
-                    line = line[:p]
-                if not len(line):
-                    continue
-
-                line = line.rstrip().split(delimiter)
-                u = line[order.index('u')]
-                v = line[order.index('v')]
-                if 'begin' in order and 'end' in order:
-                    begin = line[order.index('begin')]
-                    end = line[order.index('end')]
-                elif 'begin' in order:
-                    begin = intervaltype(line[order.index('begin')])
-                    end = begin + order[3]
-                elif 'end' in order:
-                    end = intervaltype(line[order.index('end')])
-                    begin = end - order[3]
-
-                edgedata = {}
-                try:
-                    for data in line[4:]:
-                        key, value = data.split('=')
-                        try:
-                            value = float(value)
-                        except:
-                            pass
-                        edgedata[key] = value
-                except:
-                    pass
-
-                if nodetype is not int:
-                    try:
-                        u = nodetype(u)
-                        v = nodetype(v)
-                    except:
-                        raise TypeError("Failed to convert node to {0}".format(nodetype))
-                else:
-                    try:
-                        u = int(u)
-                        v = int(v)
-                    except:
-                        pass
-
-                try:
-                    begin = intervaltype(begin)
-                    end = intervaltype(end)
-                except:
-                    raise TypeError("Failed to convert interval time to {}".format(intervaltype))
-
-                if merge[0]:
-                    for edge, edge_data in G.edges(u, v, begin - merge[1] - 1, end + merge[1] + 1, data=True):
-                        if edge_data != edgedata:
-                            G.add_edge(u, v, begin, end ** edgedata)
-                        else:
-                            begin = min(begin, edge[0])
-                            end = max(end, edge[1])
-                            G.remove_edge(u, v, edge[0], edge[1])
-                            G.add_edge(u, v, begin, end, **edgedata)
-
-                G.add_edge(u, v, begin, end, **edgedata)
+        from dynetworkx.readwrite.text import _read_interval_txt  # readwrite imports the classes
+        _read_interval_txt(G, path, delimiter, nodetype, intervaltype, order, merge, comments, processes)
 
         if predict is True:
             G.generate_predictive_model()
@@ -1866,3 +3019,92 @@ class IntervalGraph(object):
                 line += '\n'
 
                 file.write(line)
+
+    def save(self, path, index=True):
+        """Write interval graph to the directory path in a columnar binary format, to be read with `load`.
+           Nodes are stored once in a node table, and edges as columns of node positions,
+           timestamps and attribute values, in NumPy .npy files.
+
+        Parameters
+        ----------
+        path : string
+           Directory to write to. It is created if it does not exist.
+
+        index : bool, optional (default= True)
+           If True, also write the index layout: the edges of every node as arrays, and for
+           interval graphs the running max of the interval ends, so that the saved graph can be
+           queried by binary search without being loaded.
+
+        Raises
+        ------
+        NetworkXError
+            If the graph attributes or the attribute names are not JSON serializable.
+
+        See Also
+        --------
+        load : read a graph saved with save
+        save_to_txt : write the graph to a text edge list
+
+        Examples
+        --------
+        >>> G.save("my_dygraph")
+        >>> H = dnx.load("my_dygraph")
+        """
+        from dynetworkx.readwrite.binary import _save  # readwrite imports the classes
+        _save(self, path, index)
+
+
+class GraphVersion:
+    """Mixin for the read-only graph versions returned by `snapshot_version`.
+
+    The version holds a snapshot of the interval tree and a copy of the node attribute mapping
+    of the graph. Its adjacency is built from the tree the first time it is needed, under a lock,
+    since versions are meant to be read from other threads.
+    """
+
+    frozen = True
+
+    def __init__(self, graph):
+        self.tree = graph.tree.snapshot()
+        self.graph = dict(graph.graph)
+        self._node = dict(graph._node)
+        self._incidence = IncidenceIndex(directed=graph._incidence.directed)
+        self._lifespans = LifespanIndex()
+        self._planner = graph._planner.copy()
+        self._model = None
+        self._source = graph
+        self._lock = threading.Lock()
+        self._adjacency = None
+        graph._versions.add(self)
+
+    def _materialize(self):
+        with self._lock:
+            if self._adjacency is None:
+                self._adjacency = self._version_adjacency(self._source)
+                self._source = None
+        return self._adjacency
+
+    @property
+    def _adj(self):
+        return self._materialize()['_adj']
+
+    @property
+    def _pred(self):
+        return self._materialize()['_pred']
+
+    @property
+    def _succ(self):
+        return self._materialize()['_succ']
+
+    def _frozen(self, *args, **kwargs):
+        raise NetworkXError("Frozen graph can't be modified.")
+
+    add_node = add_nodes_from = remove_node = add_edge = add_edges_from = add_edges_from_arrays = remove_edge = \
+        evict_before = truncate = _frozen
+
+    def snapshot_version(self):
+        return self
+
+
+class IntervalGraphVersion(GraphVersion, IntervalGraph):
+    """Read-only version of an interval graph, returned by `IntervalGraph.snapshot_version`."""
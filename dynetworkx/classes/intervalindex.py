@@ -0,0 +1,534 @@
+"""Interval indexes used by IntervalGraph and IntervalDiGraph to store their edges.
+
+An interval index stores edges of the form (u, v, begin, end) and answers interval queries over them.
+IntervalGraph and IntervalDiGraph accept any object implementing the following protocol:
+
+add(edge)
+    Add an edge.
+add_from(edges)
+    Add every edge in an iterable of edges.
+remove(edge)
+    Remove an edge. Quiet if the edge is not in the index.
+slice(begin, end), index[begin:end]
+    List of edges whose interval [low, high) satisfies `(low < end and high > begin) or low == begin`,
+    ordered by (low, high), and by insertion order for edges sharing an interval. A begin of None only
+    matches the edges beginning before end, and an end of None every edge ending after begin, including
+    edges of zero length at the end of the index. Engines built on `IntervalIndex` get these rules from
+    its `slice` and `count`; others apply them with `dynetworkx.classes.intervaltree.open_bounds`.
+unique_timestamps(begin=None, end=None, inclusive=(True, True), as_array=False)
+unique_begin_timestamps(begin=None, end=None, inclusive=(True, True), as_array=False)
+unique_end_timestamps(begin=None, end=None, inclusive=(True, True), as_array=False)
+    Sorted list, or NumPy array if `as_array`, of the distinct begin and/or end timestamps within
+    [begin, end], with the bounds included as given by `inclusive`. A begin or end of None leaves that
+    side unbounded.
+count(begin=None, end=None)
+    Number of edges `slice(begin, end)` would return, without collecting them.
+at(t)
+    List of edges active at t, that is with `low <= t < high`, or `low == high == t`. Equivalent to
+    `slice(t, t)`, ordered the same way, but t is never replaced by the beginning of the index.
+at_many(timestamps) (optional)
+    Vectorized `at`, returning `(offsets, edge_ids, edges)` such that the edges active at
+    `timestamps[i]` are `edges[j] for j in edge_ids[offsets[i]:offsets[i + 1]]`.
+pop_before(t)
+    Remove and return the edges of every interval ending at or before t, except intervals beginning at t,
+    that is the edges that are not active at t or after it.
+pop_outside(begin=None, end=None)
+    Remove and return the edges `slice(begin, end)` would not return. A begin or end of None leaves that
+    side unbounded. Both pop methods return the edges ordered like `slice`.
+intervals()
+    Sorted list of the distinct (begin, end) intervals in the index.
+begin, end
+    Smallest begin and largest end over all intervals; inf and -inf if the index is empty.
+number_of_edges
+    Number of edges in the index.
+memory_usage() (optional)
+    Approximate number of bytes used by the index, excluding the edge tuples.
+snapshot() (optional)
+    Read-only version of the index, implementing the read part of the protocol, that is not affected by
+    later updates. Required by `IntervalGraph.snapshot_version`; only `IntervalTree` implements it, in O(1),
+    by switching to path copying.
+
+The bundled engines can be selected by name, as in `IntervalGraph(index='static')`:
+
+'avl'
+    `IntervalTree`, a balanced interval tree augmented with the max end of every subtree (default).
+    Cheap single-edge updates and a good all-round choice.
+'static'
+    `StaticIntervalIndex`, sorted NumPy arrays that are rebuilt lazily after mutations. By far the fastest
+    to query, for graphs that are built once and queried many times. Requires numeric timestamps.
+'centered'
+    `CenteredIntervalTree`, a centered interval tree that keeps the intervals of every node sorted by begin
+    and by end. Built balanced by `add_from`.
+'sorted'
+    `SortedIntervalIndex`, a sorted list of intervals searched between `begin - longest duration` and `end`.
+    Cheapest updates; fast when all intervals are short. Requires numeric timestamps.
+'intervaltree'
+    `PyIntervalTreeIndex`, an adapter around the intervaltree package (https://pypi.org/project/intervaltree).
+
+Other engines can be passed as an instance or a class, or registered by name with `register_interval_index`.
+"""
+import sys
+from sortedcontainers import SortedList, SortedDict
+from networkx.exception import NetworkXError
+from dynetworkx.classes.intervaltree import IntervalTree, open_bounds, unique_in_range
+from dynetworkx.classes.staticintervalindex import StaticIntervalIndex
+
+__all__ = ['IntervalIndex', 'CenteredIntervalTree', 'SortedIntervalIndex', 'PyIntervalTreeIndex',
+           'register_interval_index', 'interval_index']
+
+
+def _sortedlist_memory_usage(sorted_list):
+    return sys.getsizeof(sorted_list) + sum(sys.getsizeof(sublist) for sublist in sorted_list._lists)
+
+
+def _sorteddict_memory_usage(sorted_dict):
+    return sys.getsizeof(sorted_dict) + _sortedlist_memory_usage(sorted_dict._list)
+
+
+class IntervalIndex:
+    """Base class for interval indexes that group edges by their distinct interval.
+
+    Edges sharing an interval are kept together, so subclasses only index the distinct (begin, end)
+    intervals by implementing `_insert(interval)`, `_discard(interval)` and `_overlap(begin, end)`, which
+    returns the matching intervals in any order. `_build(intervals)` may be overridden to bulk load new
+    intervals in `add_from`.
+    """
+
+    def __init__(self):
+        self._edges = {}  # (begin, end) -> list of edges with that interval
+        self._intervals = SortedList()
+        # number of intervals beginning and ending at every timestamp
+        self._lows = SortedDict()
+        self._highs = SortedDict()
+        self.number_of_edges = 0
+
+    def __getitem__(self, item):
+        return self.slice(item.start, item.stop)
+
+    @property
+    def begin(self):
+        return self._lows.peekitem(0)[0] if len(self._lows) > 0 else float("inf")
+
+    @property
+    def end(self):
+        return self._highs.peekitem(-1)[0] if len(self._highs) > 0 else float("-inf")
+
+    def _insert(self, interval):
+        raise NotImplementedError
+
+    def _discard(self, interval):
+        raise NotImplementedError
+
+    def _overlap(self, begin, end):
+        raise NotImplementedError
+
+    def _build(self, intervals):
+        for interval in intervals:
+            self._insert(interval)
+
+    def _add_edge(self, edge):
+        # returns the interval of the edge if it is a new one
+        interval = (edge[2], edge[3])
+        self.number_of_edges += 1
+        if interval in self._edges:
+            self._edges[interval].append(edge)
+            return None
+
+        self._edges[interval] = [edge]
+        self._intervals.add(interval)
+        self._lows[interval[0]] = self._lows.get(interval[0], 0) + 1
+        self._highs[interval[1]] = self._highs.get(interval[1], 0) + 1
+        return interval
+
+    def add(self, edge):
+        interval = self._add_edge(edge)
+        if interval is not None:
+            self._insert(interval)
+
+    def add_from(self, edges):
+        new_intervals = [interval for interval in map(self._add_edge, edges) if interval is not None]
+        if len(new_intervals) > 0:
+            self._build(new_intervals)
+
+    def _remove_interval(self, interval):
+        # removes the interval with all of its edges and returns them
+        edges = self._edges.pop(interval)
+        self.number_of_edges -= len(edges)
+        self._intervals.remove(interval)
+        for counts, t in ((self._lows, interval[0]), (self._highs, interval[1])):
+            if counts[t] == 1:
+                del counts[t]
+            else:
+                counts[t] -= 1
+        self._discard(interval)
+        return edges
+
+    def remove(self, edge):
+        interval = (edge[2], edge[3])
+        edges = self._edges.get(interval)
+        if edges is None or edge not in edges:
+            return
+
+        if len(edges) == 1:
+            self._remove_interval(interval)
+        else:
+            edges.remove(edge)
+            self.number_of_edges -= 1
+
+    def pop_before(self, t):
+        # only intervals beginning before t can end before it
+        candidates = self._intervals.islice(stop=self._intervals.bisect_left((t,)))
+        edges = []
+        for interval in [(low, high) for low, high in candidates if high < t or (high == t and low < t)]:
+            edges.extend(self._remove_interval(interval))
+        return edges
+
+    def pop_outside(self, begin=None, end=None):
+        # intervals outside [begin, end) either begin at or before begin and end at or before it,
+        # or begin at or after end
+        outside = []
+        if begin is not None:
+            stop = self._intervals.bisect_right((begin, float("inf")))
+            outside.extend(interval for interval in self._intervals.islice(stop=stop)
+                           if interval[1] <= begin and interval[0] != begin)
+        if end is not None:
+            start = self._intervals.bisect_left((end,))
+            outside.extend(interval for interval in self._intervals.islice(start=start)
+                           if interval[0] != begin)
+
+        edges = []
+        for interval in outside:
+            edges.extend(self._remove_interval(interval))
+        return edges
+
+    def slice(self, interval_start, interval_end):
+        bounds = open_bounds(interval_start, interval_end, self.begin) if len(self._edges) > 0 else None
+        if bounds is None:
+            return []
+
+        edges = []
+        for interval in sorted(self._overlap(*bounds)):
+            edges.extend(self._edges[interval])
+        return edges
+
+    def count(self, begin=None, end=None):
+        bounds = open_bounds(begin, end, self.begin) if len(self._edges) > 0 else None
+        if bounds is None:
+            return 0
+        return sum(len(self._edges[interval]) for interval in self._overlap(*bounds))
+
+    def at(self, t):
+        if len(self._edges) == 0:
+            return []
+
+        edges = []
+        for interval in sorted(self._overlap(t, t)):
+            edges.extend(self._edges[interval])
+        return edges
+
+    def intervals(self):
+        return list(self._intervals)
+
+    def memory_usage(self):
+        size = (sys.getsizeof(self) + sys.getsizeof(self._edges) + _sortedlist_memory_usage(self._intervals) +
+                _sorteddict_memory_usage(self._lows) + _sorteddict_memory_usage(self._highs))
+        for interval, edges in self._edges.items():
+            size += sys.getsizeof(interval) + sys.getsizeof(edges)
+        return size
+
+    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self._lows, self._highs), begin, end, inclusive, as_array)
+
+    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self._lows,), begin, end, inclusive, as_array)
+
+    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self._highs,), begin, end, inclusive, as_array)
+
+
+class _CenteredNode:
+    __slots__ = ('center', 'by_begin', 'by_end', 'left', 'right')
+
+    def __init__(self, center):
+        self.center = center
+        self.by_begin = SortedList()  # (begin, end) of the intervals containing the center
+        self.by_end = SortedList()  # (end, begin) of the same intervals
+        self.left = None
+        self.right = None
+
+
+class CenteredIntervalTree(IntervalIndex):
+    """Centered interval tree.
+
+    Every node holds the intervals that contain its center, sorted by begin and by end. Intervals that
+    end before the center go to the left subtree and intervals that begin after it go to the right subtree.
+    A query only scans the sorted lists up to the first interval that cannot match. `add_from` rebuilds
+    the whole tree around median endpoints, while `add` descends to the first node whose center the new
+    interval contains, creating a new leaf centered on the interval's begin if there is none.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.root = None
+
+    def _insert(self, interval):
+        low, high = interval
+        if self.root is None:
+            self.root = _CenteredNode(low)
+
+        node = self.root
+        while True:
+            if high < node.center:
+                if node.left is None:
+                    node.left = _CenteredNode(low)
+                node = node.left
+            elif low > node.center:
+                if node.right is None:
+                    node.right = _CenteredNode(low)
+                node = node.right
+            else:
+                node.by_begin.add(interval)
+                node.by_end.add((high, low))
+                return
+
+    def _discard(self, interval):
+        low, high = interval
+        node = self.root
+        while node is not None:
+            if high < node.center:
+                node = node.left
+            elif low > node.center:
+                node = node.right
+            else:
+                node.by_begin.remove(interval)
+                node.by_end.remove((high, low))
+                return
+
+    def _build(self, intervals):
+        # rebuilding is O(n log n) in the size of the whole index, so small batches are inserted one by one
+        if len(intervals) < len(self._intervals) // 8:
+            super()._build(intervals)
+        else:
+            self.root = self.__build_subtree(list(self._intervals))
+
+    def __build_subtree(self, intervals):
+        if len(intervals) == 0:
+            return None
+
+        # the median endpoint is an endpoint of at least one interval, so every node keeps at least one interval
+        endpoints = sorted([low for low, high in intervals] + [high for low, high in intervals])
+        node = _CenteredNode(endpoints[len(endpoints) // 2])
+
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < node.center:
+                left.append(interval)
+            elif interval[0] > node.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        node.by_begin = SortedList(here)
+        node.by_end = SortedList((high, low) for low, high in here)
+        node.left = self.__build_subtree(left)
+        node.right = self.__build_subtree(right)
+        return node
+
+    def _overlap(self, begin, end):
+        result = []
+        limit = max(begin, end)
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+
+            # every interval of this node contains its center
+            if begin < node.center:
+                # all intervals here end after begin, so they match if they begin before end or at begin
+                for low, high in node.by_begin:
+                    if low > limit:
+                        break
+                    if low < end or low == begin:
+                        result.append((low, high))
+            else:
+                # all intervals here begin at or before begin, so they match if they end after it,
+                # or if they begin exactly at it
+                for high, low in reversed(node.by_end):
+                    if high < begin:
+                        break
+                    if (low < end and high > begin) or low == begin:
+                        result.append((low, high))
+
+            # intervals on the left end before the center and intervals on the right begin after it
+            if node.left is not None and begin < node.center:
+                stack.append(node.left)
+            if node.right is not None and (end > node.center or begin > node.center):
+                stack.append(node.right)
+
+        return result
+
+    def memory_usage(self):
+        size = super().memory_usage()
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            size += (sys.getsizeof(node) + _sortedlist_memory_usage(node.by_begin) +
+                     _sortedlist_memory_usage(node.by_end) + sys.getsizeof((node.center, node.center)) * len(node.by_end))
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+        return size
+
+
+class SortedIntervalIndex(IntervalIndex):
+    """Sorted list of intervals, bounded by the longest interval duration.
+
+    Any interval matching [begin, end) begins within [begin - longest duration, max(begin, end)], so a query
+    is a range scan of the sorted intervals followed by an exact filter. Updates are a single sorted list
+    insertion or removal. Queries get slower as the longest duration grows relative to the query length.
+    Requires numeric timestamps.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._durations = SortedList()
+
+    def _insert(self, interval):
+        self._durations.add(interval[1] - interval[0])
+
+    def _discard(self, interval):
+        self._durations.remove(interval[1] - interval[0])
+
+    def _build(self, intervals):
+        self._durations.update(high - low for low, high in intervals)
+
+    def _overlap(self, begin, end):
+        result = []
+        limit = max(begin, end)
+        for low, high in self._intervals.irange(minimum=(begin - self._durations[-1],)):
+            if low > limit:
+                break
+            if (low < end and high > begin) or low == begin:
+                result.append((low, high))
+        return result
+
+    def memory_usage(self):
+        return super().memory_usage() + _sortedlist_memory_usage(self._durations)
+
+
+class PyIntervalTreeIndex(IntervalIndex):
+    """Adapter around the IntervalTree of the intervaltree package (https://pypi.org/project/intervaltree).
+
+    The intervaltree package does not store zero-length intervals, so those are kept in a separate
+    sorted list of timestamps.
+    """
+
+    def __init__(self):
+        try:
+            import intervaltree
+        except ImportError:
+            raise ImportError("The 'intervaltree' interval index requires the intervaltree package "
+                              "(https://pypi.org/project/intervaltree).")
+
+        super().__init__()
+        self._Interval = intervaltree.Interval
+        self.tree = intervaltree.IntervalTree()
+        self._points = SortedList()
+
+    def _insert(self, interval):
+        if interval[0] == interval[1]:
+            self._points.add(interval[0])
+        else:
+            self.tree.add(self._Interval(interval[0], interval[1]))
+
+    def _discard(self, interval):
+        if interval[0] == interval[1]:
+            self._points.remove(interval[0])
+        else:
+            self.tree.discard(self._Interval(interval[0], interval[1]))
+
+    def _build(self, intervals):
+        if len(self.tree) == 0:
+            self.tree = self.tree.from_tuples(interval for interval in intervals if interval[0] != interval[1])
+            self._points.update(interval[0] for interval in intervals if interval[0] == interval[1])
+        else:
+            super()._build(intervals)
+
+    def _overlap(self, begin, end):
+        # intervals beginning at begin always overlap [begin, end) when begin < end, and when begin == end the
+        # matching intervals are exactly the ones containing begin
+        if begin < end:
+            result = set((iv.begin, iv.end) for iv in self.tree.overlap(begin, end))
+        else:
+            result = set((iv.begin, iv.end) for iv in self.tree.at(begin) if iv.begin < end or iv.begin == begin)
+
+        result.update((t, t) for t in self._points.irange(begin, end, inclusive=(False, False)))
+        if begin in self._points:
+            result.add((begin, begin))
+        return result
+
+    def memory_usage(self):
+        # the intervaltree package does not expose its node structure, so only its intervals are counted
+        return (super().memory_usage() + _sortedlist_memory_usage(self._points) +
+                sum(sys.getsizeof(iv) for iv in self.tree))
+
+
+INTERVAL_INDEXES = {
+    'avl': IntervalTree,
+    'static': StaticIntervalIndex,
+    'centered': CenteredIntervalTree,
+    'sorted': SortedIntervalIndex,
+    'intervaltree': PyIntervalTreeIndex,
+}
+
+_PROTOCOL = ('add', 'add_from', 'remove', 'slice', '__getitem__', 'count', 'at', 'pop_before', 'pop_outside',
+             'unique_timestamps', 'unique_begin_timestamps', 'unique_end_timestamps', 'intervals', 'begin', 'end',
+             'number_of_edges')
+
+
+def register_interval_index(name, factory):
+    """Register an interval index engine, so it can be selected by name.
+
+    Parameters
+    ----------
+    name : string
+        Name used to select the engine, as in `IntervalGraph(index=name)`.
+    factory : callable
+        Class or function called without arguments to create an empty index implementing the
+        interval index protocol described in `dynetworkx.classes.intervalindex`.
+
+    Examples
+    --------
+    >>> dnx.register_interval_index('my_index', MyIntervalIndex)
+    >>> G = dnx.IntervalGraph(index='my_index')
+    """
+    INTERVAL_INDEXES[name] = factory
+
+
+def interval_index(index='avl'):
+    """Returns a new, empty interval index.
+
+    Parameters
+    ----------
+    index : string, class or interval index (default='avl')
+        Name of a registered engine, a class to instantiate without arguments, or an empty index
+        instance implementing the interval index protocol.
+
+    Returns
+    -------
+    Interval index implementing the interval index protocol.
+
+    Examples
+    --------
+    >>> tree = interval_index('static')
+    """
+    if isinstance(index, str):
+        if index not in INTERVAL_INDEXES:
+            raise NetworkXError("Unknown interval index '{0}'; must be one of {1}."
+                                .format(index, ", ".join(sorted(INTERVAL_INDEXES))))
+        index = INTERVAL_INDEXES[index]()
+    elif isinstance(index, type):
+        index = index()
+
+    missing = [name for name in _PROTOCOL if not hasattr(index, name)]
+    if missing:
+        raise NetworkXError("Interval index {0} does not implement {1}.".format(index, ", ".join(missing)))
+
+    return index
@@ -1,56 +1,251 @@
-import operator
+import sys
+from collections import Counter
+from heapq import merge
+from math import log2
+import numpy as np
+from networkx.exception import NetworkXError
+from sortedcontainers import SortedDict
+
+def unique_in_range(timestamps, begin, end, inclusive, as_array):
+    # sorted distinct keys within [begin, end] over one or more SortedDicts keyed by timestamp
+    if len(timestamps) == 1:
+        result = list(timestamps[0].irange(begin, end, inclusive=inclusive))
+    else:
+        result = []
+        for t in merge(*(counts.irange(begin, end, inclusive=inclusive) for counts in timestamps)):
+            if len(result) == 0 or result[-1] != t:
+                result.append(t)
+
+    return np.array(result) if as_array else result
+
+
+def open_bounds(begin, end, first):
+    # bounds of a slice or count query over an index whose smallest begin is first, or None if no interval can
+    # match. Only None leaves a side open. An open begin only matches the intervals beginning before end, even
+    # those of zero length at first, and an open end matches every interval ending after begin, even those of
+    # zero length at the end of the index.
+    if begin is None:
+        begin = first
+        if end is not None and end <= begin:
+            return None
+    if end is None:
+        end = float("inf")
+    return begin, end
+
+
+def overlaps(edge, begin, end):
+    # whether the interval of edge (u, v, begin, end) matches [begin, end), with the same open-bound rules as
+    # open_bounds: an open begin matches the edges beginning before end, and an open end the edges ending after
+    # begin and the zero-length edges at begin
+    if begin is None:
+        return end is None or edge[2] < end
+    if end is None:
+        return edge[3] > begin or edge[2] == begin
+    return (edge[2] < end and edge[3] > begin) or edge[2] == begin
+
 
 class Node:
+    # slots instead of a per-instance __dict__, since a tree holds one node per distinct interval
+    __slots__ = ('low', 'high', 'max', 'minhigh', 'size', 'edges', 'left', 'right', 'height')
 
     def __init__(self, low, high):
         self.low = low
         self.high = high
+        # augmentation over the subtree rooted at this node: largest and smallest high, and number of edges
         self.max = high
-        self.edges = []
+        self.minhigh = high
+        self.size = 0
+        # most intervals carry a single edge, so edges is None, the edge tuple itself, or a list of edges
+        self.edges = None
 
         self.left = None
         self.right = None
-        self.height = 0
+        self.height = 1
 
     def inInterval(self, begin, end):
         return (self.low < end and self.high > begin) or self.low == begin
 
+    def addEdge(self, edge):
+        if self.edges is None:
+            self.edges = edge
+        elif type(self.edges) is list:
+            self.edges.append(edge)
+        else:
+            self.edges = [self.edges, edge]
+
+    def removeEdge(self, edge):
+        # returns whether the edge was stored in this node
+        if type(self.edges) is list:
+            if edge not in self.edges:
+                return False
+            self.edges.remove(edge)
+            if len(self.edges) == 1:
+                self.edges = self.edges[0]
+            return True
+
+        if self.edges is not None and self.edges == edge:
+            self.edges = None
+            return True
+        return False
+
+    def getEdges(self):
+        if self.edges is None:
+            return []
+        if type(self.edges) is list:
+            return list(self.edges)
+        return [self.edges]
+
+    def hasEdge(self, edge):
+        if type(self.edges) is list:
+            return edge in self.edges
+        return self.edges is not None and self.edges == edge
+
+    def isEmpty(self):
+        return self.edges is None
+
+    def numberOfEdges(self):
+        if self.edges is None:
+            return 0
+        if type(self.edges) is list:
+            return len(self.edges)
+        return 1
+
+
+class VersionedNode(Node):
+    # node of a persistent tree, tagged with the generation of the tree it was created or copied in
+    __slots__ = ('generation',)
+
+
 class IntervalTree:
 
     def __init__(self):
         self.nodes = {}
         self.root = None
         self.number_of_edges = 0
-        self.begin = float("inf")
-        self.end = float("-inf")
+        # number of intervals beginning and ending at every timestamp
+        self.lows = SortedDict()
+        self.highs = SortedDict()
+        # once a snapshot has been taken, the tree is persistent: nodes created before the latest snapshot may be
+        # shared with a version, so they are copied instead of modified in place
+        self.persistent = False
+        self.generation = 0
 
     def __getitem__(self, item):
         return self.slice(item.start, item.stop, self.root)
 
+    @property
+    def begin(self):
+        return self.lows.peekitem(0)[0] if len(self.lows) > 0 else float("inf")
+
+    @property
+    def end(self):
+        return self.highs.peekitem(-1)[0] if len(self.highs) > 0 else float("-inf")
+
+    def addTimestamps(self, node):
+        self.lows[node.low] = self.lows.get(node.low, 0) + 1
+        self.highs[node.high] = self.highs.get(node.high, 0) + 1
+
+    def removeTimestamps(self, node):
+        for counts, t in ((self.lows, node.low), (self.highs, node.high)):
+            if counts[t] == 1:
+                del counts[t]
+            else:
+                counts[t] -= 1
+
     def updateMax(self, node):
+        # recomputes the augmentation of node from its children
+        node.max = node.high
+        node.minhigh = node.high
+        node.size = node.numberOfEdges()
+        for child in (node.left, node.right):
+            if child is not None:
+                if child.max > node.max:
+                    node.max = child.max
+                if child.minhigh < node.minhigh:
+                    node.minhigh = child.minhigh
+                node.size += child.size
+
+    def newNode(self, low, high):
+        if not self.persistent:
+            return Node(low, high)
+        node = VersionedNode(low, high)
+        node.generation = self.generation
+        return node
+
+    def own(self, node):
+        # returns node if the tree may modify it in place, and otherwise a copy of it that replaces node in the
+        # current version of the tree. The caller must link the copy into the tree.
+        if not self.persistent or getattr(node, 'generation', None) == self.generation:
+            return node
 
-        if node.right and node.left:
-            node.max = max(node.high, node.right.max, node.left.max)
-        elif node.left:
-            node.max = max(node.high, node.left.max)
-        elif node.right:
-            node.max = max(node.high, node.right.max)
-        else:
-            node.max = node.high
+        copy = self.newNode(node.low, node.high)
+        copy.max = node.max
+        copy.minhigh = node.minhigh
+        copy.size = node.size
+        copy.edges = list(node.edges) if type(node.edges) is list else node.edges
+        copy.left = node.left
+        copy.right = node.right
+        copy.height = node.height
+        self.nodes[(node.low, node.high)] = copy
+        return copy
+
+    def adjustSize(self, node, delta):
+        # adds delta to the edge count of node and of all of its ancestors, and returns node, or the copy of it that
+        # is now in the tree
+        current = self.root = self.own(self.root)
+        while True:
+            current.size += delta
+            if current.low == node.low and current.high == node.high:
+                return current
+            if node.low < current.low or (node.low == current.low and node.high < current.high):
+                current.left = self.own(current.left)
+                current = current.left
+            else:
+                current.right = self.own(current.right)
+                current = current.right
 
     def inOrder(self, root):
+        # explicit stack instead of recursive generators, so that yielding a node does not
+        # have to pass through one generator frame per level of the tree
+        stack = []
+        node = root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            yield node
+            node = node.right
 
-        if not root:
-            return
+    def intervals(self):
+        return [(node.low, node.high) for node in self.inOrder(self.root)]
+
+    @staticmethod
+    def nodeKey(node):
+        return node.low, node.high
+
+    def build(self, nodes, lo, hi):
+        # builds a balanced subtree out of nodes[lo:hi], which must already be sorted by (low, high) and owned
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        root = nodes[mid]
+        root.left = self.build(nodes, lo, mid)
+        root.right = self.build(nodes, mid + 1, hi)
+
+        root.height = 1 + max(self.getHeight(root.left), self.getHeight(root.right))
+        self.updateMax(root)
 
-        yield from self.inOrder(root.left)
-        yield root
-        yield from self.inOrder(root.right)
+        return root
 
     def insert(self, root, node):
         if root is None:
             return node
 
+        if self.persistent:
+            root = self.own(root)
         if node.low < root.low or (node.low == root.low and node.high < root.high):
             root.left = self.insert(root.left, node)
         else:
@@ -61,12 +256,12 @@ class IntervalTree:
         balance = self.getBalance(root)
 
         if balance > 1:
-            if root.left.right == node:
+            if self.getBalance(root.left) < 0:
                 root.left = self.leftRotate(root.left)
             return self.rightRotate(root)
 
         elif balance < -1:
-            if root.right.left == node:
+            if self.getBalance(root.right) > 0:
                 root.right = self.rightRotate(root.right)
             return self.leftRotate(root)
 
@@ -75,29 +270,44 @@ class IntervalTree:
         return root
 
     def discard(self, root, node):
-        if root is node:
-            if root.left:
-                return root.left
-            if root.right:
-                return root.right
+        if root is None:
             return None
 
-        if node.low < root.low or (node.low == root.low and node.high < root.high):
-            root.left = self.discard(root.left, node)
+        # nodes are compared by interval, since node may have been replaced by a copy in a persistent tree
+        if root.low == node.low and root.high == node.high:
+            if root.left is None:
+                return root.right
+            if root.right is None:
+                return root.left
+
+            # replace the node by its in-order successor, the leftmost node of its right subtree
+            successor = root.right
+            while successor.left is not None:
+                successor = successor.left
+            right = self.discard(root.right, successor)
+            successor = self.own(successor)
+            successor.right = right
+            successor.left = root.left
+            root = successor
         else:
-            root.right = self.discard(root.right, node)
+            if self.persistent:
+                root = self.own(root)
+            if node.low < root.low or (node.low == root.low and node.high < root.high):
+                root.left = self.discard(root.left, node)
+            else:
+                root.right = self.discard(root.right, node)
 
         root.height = 1 + max(self.getHeight(root.left), self.getHeight(root.right))
 
         balance = self.getBalance(root)
 
         if balance > 1:
-            if root.left.right == node:
+            if self.getBalance(root.left) < 0:
                 root.left = self.leftRotate(root.left)
             return self.rightRotate(root)
 
         elif balance < -1:
-            if root.right.left == node:
+            if self.getBalance(root.right) > 0:
                 root.right = self.rightRotate(root.right)
             return self.leftRotate(root)
 
@@ -106,7 +316,9 @@ class IntervalTree:
         return root
 
     def leftRotate(self, x):
-
+        if self.persistent:
+            x = self.own(x)
+            x.right = self.own(x.right)
         y = x.right
         t = y.left
 
@@ -122,6 +334,9 @@ class IntervalTree:
         return y
 
     def rightRotate(self, x):
+        if self.persistent:
+            x = self.own(x)
+            x.left = self.own(x.left)
         y = x.left
         t = y.right
 
@@ -149,14 +364,20 @@ class IntervalTree:
         return self.getHeight(node.left) - self.getHeight(node.right)
 
     def query(self, node, begin, end):
-        if node.left and node.left.max >= begin:
-            yield from self.query(node.left, begin, end)
+        # in-order traversal with an explicit stack, pruning subtrees using the max augmentation
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                left = node.left
+                node = left if left is not None and left.max >= begin else None
 
-        if node.inInterval(begin, end):
-            yield node
+            node = stack.pop()
+            if (node.low < end and node.high > begin) or node.low == begin:
+                yield node
 
-        if node.right and node.low <= end and node.right.max >= begin:
-            yield from self.query(node.right, begin, end)
+            right = node.right
+            node = right if right is not None and node.low <= end and right.max >= begin else None
 
     def add(self, edge):
         # edge = (u, v, begin, end)
@@ -164,24 +385,67 @@ class IntervalTree:
         end = edge[3]
 
         if (start, end) in self.nodes:
-            node = self.nodes[(start, end)]
-            node.edges.append(edge)
+            node = self.adjustSize(self.nodes[(start, end)], 1)
+            node.addEdge(edge)
             self.number_of_edges += 1
             return
 
-        node = Node(start, end)
-        node.edges.append(edge)
+        node = self.newNode(start, end)
+        node.addEdge(edge)
+        node.size = 1
         self.nodes[(start, end)] = node
 
         self.root = self.insert(self.root, node)
+        self.addTimestamps(node)
         self.number_of_edges += 1
-        self.begin = min(self.begin, start)
-        self.end = max(self.end, end)
         return
 
     def add_from(self, edges):
+        # group the incoming edges by interval, so every distinct interval gets exactly one new node
+        new_nodes = {}
+        grown = {}  # edges added to every node that was already in the tree
         for edge in edges:
-            self.add(edge)
+            key = (edge[2], edge[3])
+            node = self.nodes.get(key)
+            if node is None:
+                node = self.newNode(edge[2], edge[3])
+                self.nodes[key] = node
+                new_nodes[key] = node
+            elif key not in new_nodes:
+                grown.setdefault(node, []).append(edge)
+                continue
+            node.addEdge(edge)
+
+        new_nodes = sorted(new_nodes.values(), key=self.nodeKey)
+        for node in new_nodes:
+            node.size = node.numberOfEdges()
+        # counting the timestamps of the batch first updates every distinct timestamp once
+        for counts, timestamps in ((self.lows, [node.low for node in new_nodes]),
+                                   (self.highs, [node.high for node in new_nodes])):
+            added = Counter(timestamps)
+            for t, count in added.items():
+                if t in counts:
+                    added[t] += counts[t]
+            counts.update(added)
+
+        # inserting k nodes one by one costs about k * log(n + k) steps, while rebuilding the whole tree from the
+        # sorted nodes costs n + k, so only rebuild when the batch is large compared to the existing tree.
+        n = len(self.nodes) - len(new_nodes)
+        if len(new_nodes) > 0 and len(new_nodes) * log2(n + len(new_nodes) + 1) >= n:
+            ordered = [self.own(node) for node in merge(self.inOrder(self.root), new_nodes, key=self.nodeKey)]
+            for node, added in grown.items():
+                node = self.nodes[(node.low, node.high)]
+                for edge in added:
+                    node.addEdge(edge)
+            self.root = self.build(ordered, 0, len(ordered))
+        else:
+            for node, added in grown.items():
+                node = self.adjustSize(node, len(added))
+                for edge in added:
+                    node.addEdge(edge)
+            for node in new_nodes:
+                self.root = self.insert(self.root, node)
+        self.number_of_edges += sum(node.numberOfEdges() for node in new_nodes) + sum(map(len, grown.values()))
         return
 
     def remove(self, edge):
@@ -189,107 +453,250 @@ class IntervalTree:
         start = edge[2]
         end = edge[3]
 
-        node = self.nodes[(start, end)]
-        if edge not in node.edges:
+        node = self.nodes.get((start, end))
+        if node is None or not node.hasEdge(edge):
             return
 
-        node.edges.remove(edge)
         self.number_of_edges -= 1
-        if len(node.edges) == 0:
-            self.discard(self.root, node)
-        if self.begin == start:
-            traversal_node = self.root
-            while traversal_node.left != None:
-                self.begin = traversal_node.left.low
-                traversal_node = traversal_node.left
-        if self.end == end:
-            traversal_node = self.root
-            while traversal_node.right != None:
-                self.end = traversal_node.right.high
-                traversal_node = traversal_node.right
+        if node.numberOfEdges() > 1:
+            self.adjustSize(node, -1).removeEdge(edge)
+            return
 
+        self.root = self.discard(self.root, node)
+        self.removeTimestamps(node)
+        del self.nodes[(start, end)]
         return
 
+    def removeNodes(self, nodes):
+        # removes whole nodes at once and returns their edges. Like add_from, the tree is rebuilt from the remaining
+        # nodes instead of discarding the nodes one by one when they are many compared to the tree.
+        nodes = sorted(nodes, key=lambda node: (node.low, node.high))
+        edges = []
+        for node in nodes:
+            edges.extend(node.getEdges())
+            self.number_of_edges -= node.numberOfEdges()
+            self.removeTimestamps(node)
+            del self.nodes[(node.low, node.high)]
+
+        if len(nodes) * log2(len(self.nodes) + len(nodes) + 1) >= len(self.nodes):
+            remaining = [self.own(node) for node in self.inOrder(self.root) if (node.low, node.high) in self.nodes]
+            self.root = self.build(remaining, 0, len(remaining))
+        else:
+            for node in nodes:
+                self.root = self.discard(self.root, node)
+
+        return edges
+
+    def pop_before(self, t):
+        # removes and returns the edges of every interval ending at or before t, except zero-length intervals at t,
+        # so that no remaining edge is active only before t. Subtrees whose min high is after t are skipped.
+        nodes = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.minhigh > t:
+                continue
+            if node.high < t or (node.high == t and node.low < t):
+                nodes.append(node)
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+
+        return self.removeNodes(nodes)
+
+    def pop_outside(self, begin=None, end=None):
+        # removes and returns the edges of every interval that slice(begin, end) would not return. A begin or end
+        # of None leaves that side unbounded. Subtrees whose intervals all overlap [begin, end) are skipped.
+        if begin is None:
+            begin = float("-inf")
+        if end is None:
+            end = float("inf")
+
+        nodes = []
+        # lows in a subtree are bounded by the low of the closest ancestor it is a left descendant of
+        stack = [(self.root, float("inf"))] if self.root is not None else []
+        while stack:
+            node, lowbound = stack.pop()
+            if lowbound < end and node.minhigh > begin:
+                continue
+
+            if not ((node.low < end and node.high > begin) or node.low == begin):
+                nodes.append(node)
+            if node.left is not None:
+                stack.append((node.left, node.low))
+            if node.right is not None:
+                stack.append((node.right, lowbound))
+
+        return self.removeNodes(nodes)
+
+    def snapshot(self):
+        # returns a read-only version of the tree in O(1). The version shares all of its nodes with the tree, which
+        # becomes persistent: from then on, updates copy the nodes on their path instead of modifying them, so the
+        # version can be read while the tree keeps changing. Nodes only referenced by released versions are
+        # reclaimed by the garbage collector.
+        self.persistent = True
+        self.generation += 1
+        return IntervalTreeVersion(self.root, self.number_of_edges)
+
     def slice(self, interval_start, interval_end, root=None):
         if not root:
             root = self.root
             if not root:
                 return []
-        if not interval_start:
-            interval_start = self.begin
-        if not interval_end:
-            interval_end = self.end
-
-        for node in self.query(root, interval_start, interval_end):
-            yield from node.edges
-
-    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True)):
-        timestamps = set()
-
-        if not begin:
-            begin = self.begin
-        if not end:
-            end = self.end
-
-        if inclusive[0]:
-            begin_operator = operator.__le__
-        else:
-            begin_operator = operator.__lt__
-        if inclusive[1]:
-            end_operator = operator.__le__
-        else:
-            end_operator = operator.__lt__
-
-        for n in self.query(self.root, begin, end):
-            if n.low not in timestamps and begin_operator(begin, n.low) and end_operator(n.low, end):
-                timestamps.add(n.low)
-            if n.high not in timestamps and begin_operator(begin, n.high) and end_operator(n.high, end):
-                timestamps.add(n.high)
-
-        return sorted(timestamps)
-
-    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True)):
-        timestamps = set()
-
-        if not begin:
-            begin = self.begin
-        if not end:
-            end = self.end
-
-        if inclusive[0]:
-            begin_operator = operator.__le__
-        else:
-            begin_operator = operator.__lt__
-        if inclusive[1]:
-            end_operator = operator.__le__
-        else:
-            end_operator = operator.__lt__
-
-        for n in self.query(self.root, begin, end):
-            if n.low not in timestamps and begin_operator(begin, n.low) and end_operator(n.low, end):
-                timestamps.add(n.low)
-
-        return sorted(timestamps)
-
-    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True)):
-        timestamps = set()
-
-        if not begin:
-            begin = self.begin
-        if not end:
-            end = self.end
-
-        if inclusive[0]:
-            begin_operator = operator.__le__
-        else:
-            begin_operator = operator.__lt__
-        if inclusive[1]:
-            end_operator = operator.__le__
-        else:
-            end_operator = operator.__lt__
-
-        for n in self.query(self.root, begin, end):
-            if n.high not in timestamps and begin_operator(begin, n.high) and end_operator(n.high, end):
-                timestamps.add(n.high)
-
-        return sorted(timestamps)
+        bounds = open_bounds(interval_start, interval_end, self.begin)
+        if bounds is None:
+            return []
+        interval_start, interval_end = bounds
+
+        # same traversal as query, inlined so that the edges are collected into the result in a single pass
+        edges = []
+        stack = []
+        node = root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                left = node.left
+                node = left if left is not None and left.max >= interval_start else None
+
+            node = stack.pop()
+            if (node.low < interval_end and node.high > interval_start) or node.low == interval_start:
+                if type(node.edges) is list:
+                    edges.extend(node.edges)
+                else:
+                    edges.append(node.edges)
+
+            right = node.right
+            node = right if right is not None and node.low <= interval_end and right.max >= interval_start else None
+
+        return edges
+
+    def count(self, begin=None, end=None):
+        # number of edges that slice(begin, end) would return, without collecting them. Every subtree whose
+        # intervals all begin before end and all end after begin is counted as a whole from its size.
+        bounds = open_bounds(begin, end, self.begin) if self.root is not None else None
+        if bounds is None:
+            return 0
+        begin, end = bounds
+
+        total = 0
+        # lows in a subtree are bounded by the low of the closest ancestor it is a left descendant of
+        stack = [(self.root, float("inf"))] if self.root is not None else []
+        while stack:
+            node, lowbound = stack.pop()
+            if node.max < begin:
+                continue
+            if lowbound < end and node.minhigh > begin:
+                total += node.size
+                continue
+
+            if (node.low < end and node.high > begin) or node.low == begin:
+                total += node.numberOfEdges()
+            if node.left is not None:
+                stack.append((node.left, node.low))
+            if node.right is not None and (node.low < end or node.low <= begin):
+                stack.append((node.right, lowbound))
+
+        return total
+
+    def at(self, t):
+        # edges active at t: low <= t < high, or zero-length intervals at t. Subtrees whose max end is before t and
+        # right subtrees of nodes beginning after t cannot contain any, so they are never visited.
+        edges = []
+        stack = []
+        node = self.root if self.root is not None and self.root.max >= t else None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                left = node.left
+                node = left if left is not None and left.max >= t else None
+
+            node = stack.pop()
+            if node.low > t:
+                break
+            if node.high > t or node.low == t:
+                if type(node.edges) is list:
+                    edges.extend(node.edges)
+                else:
+                    edges.append(node.edges)
+
+            right = node.right
+            node = right if right is not None and right.max >= t else None
+
+        return edges
+
+    def memory_usage(self):
+        # approximate number of bytes used by the tree itself; the edge tuples are shared with the graph, so they
+        # are not included
+        size = sys.getsizeof(self) + sys.getsizeof(self.nodes)
+        for counts in (self.lows, self.highs):
+            size += sys.getsizeof(counts) + sum(sys.getsizeof(sublist) for sublist in counts._list._lists)
+        for key, node in self.nodes.items():
+            size += sys.getsizeof(key) + sys.getsizeof(node)
+            if type(node.edges) is list:
+                size += sys.getsizeof(node.edges)
+        return size
+
+    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self.lows, self.highs), begin, end, inclusive, as_array)
+
+    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self.lows,), begin, end, inclusive, as_array)
+
+    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return unique_in_range((self.highs,), begin, end, inclusive, as_array)
+
+
+class IntervalTreeVersion(IntervalTree):
+    # read-only version of an IntervalTree, returned by IntervalTree.snapshot. Its nodes are never modified, and the
+    # timestamp counts that the tree keeps up to date are rebuilt from them the first time they are needed.
+
+    def __init__(self, root, number_of_edges):
+        self.root = root
+        self.number_of_edges = number_of_edges
+        self.persistent = True
+        self.generation = None
+        self._nodes = None
+        self._timestamps = None
+
+    @property
+    def nodes(self):
+        if self._nodes is None:
+            self._nodes = {(node.low, node.high): node for node in self.inOrder(self.root)}
+        return self._nodes
+
+    @property
+    def lows(self):
+        return self.timestamps()[0]
+
+    @property
+    def highs(self):
+        return self.timestamps()[1]
+
+    def timestamps(self):
+        if self._timestamps is None:
+            lows = SortedDict()
+            highs = SortedDict()
+            for node in self.inOrder(self.root):
+                lows[node.low] = lows.get(node.low, 0) + 1
+                highs[node.high] = highs.get(node.high, 0) + 1
+            self._timestamps = (lows, highs)
+        return self._timestamps
+
+    @property
+    def begin(self):
+        node = self.root
+        if node is None:
+            return float("inf")
+        while node.left is not None:
+            node = node.left
+        return node.low
+
+    @property
+    def end(self):
+        return self.root.max if self.root is not None else float("-inf")
+
+    def readOnly(self, *args, **kwargs):
+        raise NetworkXError("Interval tree versions can't be modified.")
+
+    add = add_from = remove = pop_before = pop_outside = readOnly
+
+    def snapshot(self):
+        return self
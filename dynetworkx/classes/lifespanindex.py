@@ -0,0 +1,96 @@
+"""Per-node activity index kept next to the adjacency of interval graphs.
+
+A node is present in an interval if one of its edges matches it. Answering `G.has_node(n, b, e)`
+from the interval index means scanning the edges of the interval until one of n is found.
+`LifespanIndex` keeps, for every node, the begin times of its edges in sorted order together with
+the running max of their end times, so that whether a node is present in an interval is decided
+with two binary searches, in O(log d) for a node with d edges. The first and last activity of a
+node are the first begin and the last running max end.
+
+The lists of a node are built from its edges the first time it is queried. Edges added later are
+inserted in place; removing an edge drops the lists of its nodes, which are built again when next
+queried.
+"""
+import sys
+from bisect import bisect_left, bisect_right
+
+__all__ = ['LifespanIndex']
+
+
+class LifespanIndex:
+    """Sorted begin times and running max end times of the edges of every node.
+
+    Only the nodes queried since their edges last changed have lists; the others are built from
+    their edges when needed.
+    """
+
+    def __init__(self):
+        self.nodes = {}  # node -> (sorted begins, running max of the ends in that order)
+
+    def _insert(self, n, low, high):
+        lows, maxends = self.nodes[n]
+        i = bisect_right(lows, low)
+        lows.insert(i, low)
+        maxends.insert(i, high if i == 0 else max(maxends[i - 1], high))
+        # the running max only changes up to the first later edge ending at or after high
+        for j in range(i + 1, len(maxends)):
+            if not maxends[j] < high:
+                break
+            maxends[j] = high
+
+    def add(self, edge):
+        for n in {edge[0], edge[1]}:
+            if n in self.nodes:
+                self._insert(n, edge[2], edge[3])
+
+    def add_from(self, edges):
+        if len(self.nodes) > 0:
+            for edge in edges:
+                self.add(edge)
+
+    def remove(self, edge):
+        self.nodes.pop(edge[0], None)
+        self.nodes.pop(edge[1], None)
+
+    def _lists(self, n, edges):
+        # edges is a function returning all the edges of a node, only called when n has no lists
+        lists = self.nodes.get(n)
+        if lists is None:
+            intervals = sorted((edge[2], edge[3]) for edge in edges(n))
+            lows = [low for low, _ in intervals]
+            maxends = []
+            for _, high in intervals:
+                maxends.append(high if not maxends or maxends[-1] < high else maxends[-1])
+            lists = self.nodes[n] = (lows, maxends)
+        return lists
+
+    def span(self, n, edges):
+        """First begin and last end of the edges of node n, or None if it has no edges."""
+        lows, maxends = self._lists(n, edges)
+        if len(lows) == 0:
+            return None
+        return lows[0], maxends[-1]
+
+    def active(self, n, edges, begin=None, end=None):
+        """True if node n has an edge matching the interval, under the rule of the edge queries:
+        the edge begins before end and ends after begin, or it begins at begin."""
+        lows, maxends = self._lists(n, edges)
+        if len(lows) == 0:
+            return False
+        if begin is None:
+            return end is None or lows[0] < end
+
+        # edges beginning before end are a prefix of the sorted begins, and the last running max end of that
+        # prefix is the latest end among them
+        i = len(lows) if end is None else bisect_left(lows, end)
+        if i > 0 and maxends[i - 1] > begin:
+            return True
+        j = bisect_left(lows, begin)
+        return j < len(lows) and lows[j] == begin
+
+    def memory_usage(self):
+        # approximate number of bytes used by the lists; the timestamps are shared with the edges
+        size = sys.getsizeof(self) + sys.getsizeof(self.nodes)
+        for lows, maxends in self.nodes.values():
+            size += sys.getsizeof(lows) + sys.getsizeof(maxends)
+        return size
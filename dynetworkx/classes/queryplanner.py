@@ -0,0 +1,316 @@
+"""Cost-based choice between the plans of compound edge queries.
+
+A query such as `G.edges(u=n, begin=b, end=e)` can be answered node first, by filtering the edges of n
+by interval, or interval first, by querying the interval index and keeping the edges of n. `QueryPlanner`
+keeps a few cardinality statistics up to date as edges are added and removed: the degree of every node,
+a histogram of the begin and end timestamps of the edges, and the span of time in which every node has
+edges. From these it estimates the cost of both plans for every query, without any training.
+"""
+import math
+import numpy as np
+from itertools import product
+from numbers import Real
+
+__all__ = ['QueryPlanner']
+
+
+class TimeHistogram:
+    """Equi-width histogram of numeric timestamps with a bounded number of buckets.
+
+    Buckets are numbered by their distance to the first timestamp added. Whenever the buckets in use would
+    span more than `size` widths, the width is doubled and neighbouring buckets are merged, so the histogram
+    adapts to the range of the timestamps and stays small.
+    """
+
+    def __init__(self, size=128):
+        self.size = size
+        self.origin = None
+        self.width = 2.0 ** -20
+        self.counts = {}
+        self.low = self.high = 0  # smallest and largest bucket used so far
+
+    def __len__(self):
+        return sum(self.counts.values())
+
+    def copy(self):
+        histogram = TimeHistogram(self.size)
+        histogram.origin, histogram.width, histogram.low, histogram.high = \
+            self.origin, self.width, self.low, self.high
+        histogram.counts = dict(self.counts)
+        return histogram
+
+    def _bucket(self, t):
+        return math.floor((t - self.origin) / self.width)
+
+    def add(self, t, count=1):
+        if self.origin is None:
+            self.origin = t
+
+        bucket = self._bucket(t)
+        self.low, self.high = min(self.low, bucket), max(self.high, bucket)
+        while self.high - self.low >= self.size:
+            self._widen()
+            bucket = self._bucket(t)
+
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def _widen(self):
+        # floor division keeps buckets aligned: bucket k of width 2w holds buckets 2k and 2k + 1 of width w
+        counts = {}
+        for key, value in self.counts.items():
+            counts[key // 2] = counts.get(key // 2, 0) + value
+        self.counts = counts
+        self.width *= 2
+        self.low, self.high = self.low // 2, self.high // 2
+
+    def add_many(self, ts):
+        # same as adding the timestamps of the numeric array ts one by one, with the buckets computed at once
+        if len(ts) == 0:
+            return
+        if self.origin is None:
+            self.origin = ts[0].item()
+
+        buckets = np.floor((ts - self.origin) / self.width).astype(np.int64)
+        self.low, self.high = min(self.low, int(buckets.min())), max(self.high, int(buckets.max()))
+        while self.high - self.low >= self.size:
+            self._widen()
+            buckets //= 2
+
+        keys, counts = np.unique(buckets, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self.counts[key] = self.counts.get(key, 0) + count
+
+    def remove(self, t):
+        bucket = self._bucket(t)
+        count = self.counts.get(bucket, 0) - 1
+        if count > 0:
+            self.counts[bucket] = count
+        else:
+            self.counts.pop(bucket, None)
+
+    def rank(self, t):
+        """Estimated number of timestamps smaller than t, assuming they are uniform within every bucket."""
+        if self.origin is None:
+            return 0
+        position = (t - self.origin) / self.width
+        if math.isinf(position):
+            return 0 if position < 0 else len(self)
+
+        bucket = math.floor(position)
+        smaller = sum(value for key, value in self.counts.items() if key < bucket)
+        return smaller + (position - bucket) * self.counts.get(bucket, 0)
+
+
+class QueryPlanner:
+    """Cardinality statistics of a graph, used to pick the cheaper plan of compound edge queries.
+
+    Parameters
+    ----------
+    directed : bool, optional (default=False)
+        If True, node constraints on `u` select out edges and constraints on `v` select in edges,
+        as in the directed graphs.
+    impulse : bool, optional (default=False)
+        If True, edges are tuples (u, v, t) instead of (u, v, begin, end).
+    threshold : int or None, optional (default=128)
+        Number of edges from which the edges of a node are kept in an interval tree by the incidence
+        index of the graph, so that filtering them by interval costs O(log d + k) instead of O(d).
+        None if the graph has no such index.
+
+    Notes
+    -----
+    Degrees are exact. The histograms estimate the number of edges matching an interval, and spans
+    only grow while a node has edges, so both only steer the choice of plan and never its result.
+    Statistics over time are dropped the first time a timestamp is not a number, after which every
+    compound query is answered node first.
+    """
+
+    def __init__(self, directed=False, impulse=False, threshold=128):
+        self.directed = directed
+        self.impulse = impulse
+        self.threshold = threshold
+        self.numeric = True
+        self.number_of_edges = 0
+        self.out_degree = {}
+        self.in_degree = self.out_degree if not directed else {}
+        self.spans = {}
+        self.begins = TimeHistogram()
+        self.ends = self.begins if impulse else TimeHistogram()
+
+    def copy(self):
+        planner = QueryPlanner(self.directed, self.impulse, self.threshold)
+        planner.numeric = self.numeric
+        planner.number_of_edges = self.number_of_edges
+        planner.out_degree = dict(self.out_degree)
+        planner.in_degree = planner.out_degree if not self.directed else dict(self.in_degree)
+        planner.spans = {n: list(span) for n, span in self.spans.items()}
+        planner.begins = self.begins.copy()
+        planner.ends = planner.begins if self.impulse else self.ends.copy()
+        return planner
+
+    def _interval(self, edge):
+        return (edge[2], edge[2]) if self.impulse else (edge[2], edge[3])
+
+    def add(self, edge):
+        u, v = edge[0], edge[1]
+        self.number_of_edges += 1
+        self.out_degree[u] = self.out_degree.get(u, 0) + 1
+        if self.directed or v != u:
+            self.in_degree[v] = self.in_degree.get(v, 0) + 1
+
+        if not self.numeric:
+            return
+        low, high = self._interval(edge)
+        if not isinstance(low, Real) or not isinstance(high, Real):
+            self.numeric = False
+            self.spans, self.begins, self.ends = {}, TimeHistogram(), TimeHistogram()
+            return
+
+        self.begins.add(low)
+        if not self.impulse:
+            self.ends.add(high)
+        for n in (u, v):
+            span = self.spans.get(n)
+            if span is None:
+                self.spans[n] = [low, high]
+            else:
+                span[0], span[1] = min(span[0], low), max(span[1], high)
+
+    def add_from(self, edges):
+        for edge in edges:
+            self.add(edge)
+
+    def add_many(self, nodes, sources, targets, lows, highs=None):
+        """Adds a batch of edges given as arrays: the positions of their sources and targets in the list
+        `nodes`, and their numeric begin and end timestamps (only begins for impulse graphs)."""
+        self.number_of_edges += len(sources)
+        for degrees, ends in ((self.out_degree, sources),
+                              (self.in_degree, targets if self.directed else targets[targets != sources])):
+            counts = np.bincount(ends, minlength=len(nodes))
+            for i in np.flatnonzero(counts).tolist():
+                degrees[nodes[i]] = degrees.get(nodes[i], 0) + int(counts[i])
+
+        if not self.numeric or len(sources) == 0:
+            return
+        highs = lows if self.impulse else highs
+        self.begins.add_many(lows)
+        if not self.impulse:
+            self.ends.add_many(highs)
+
+        # first begin and last end of the edges of every node in the batch, merged into the spans
+        ends = np.concatenate((sources, targets))
+        first = np.full(len(nodes), lows.max(), dtype=lows.dtype)
+        last = np.full(len(nodes), highs.min(), dtype=highs.dtype)
+        np.minimum.at(first, ends, np.concatenate((lows, lows)))
+        np.maximum.at(last, ends, np.concatenate((highs, highs)))
+        first, last = first.tolist(), last.tolist()
+        for i in np.flatnonzero(np.bincount(ends, minlength=len(nodes))).tolist():
+            span = self.spans.get(nodes[i])
+            if span is None:
+                self.spans[nodes[i]] = [first[i], last[i]]
+            else:
+                span[0], span[1] = min(span[0], first[i]), max(span[1], last[i])
+
+    def remove(self, edge):
+        u, v = edge[0], edge[1]
+        self.number_of_edges -= 1
+        self.out_degree[u] -= 1
+        if self.out_degree[u] == 0:
+            del self.out_degree[u]
+        if self.directed or v != u:
+            self.in_degree[v] -= 1
+            if self.in_degree[v] == 0:
+                del self.in_degree[v]
+
+        if not self.numeric:
+            return
+        low, high = self._interval(edge)
+        self.begins.remove(low)
+        if not self.impulse:
+            self.ends.remove(high)
+        for n in (u, v):
+            if n not in self.out_degree and n not in self.in_degree:
+                self.spans.pop(n, None)
+
+    def remove_from(self, edges):
+        for edge in edges:
+            self.remove(edge)
+
+    def estimate(self, begin=None, end=None):
+        """Estimated number of edges matching the interval [begin, end)."""
+        if begin is None and end is None:
+            return self.number_of_edges
+
+        # an interval matches if it begins before `end`, unless it ends at or before `begin`
+        matching = self.number_of_edges if end is None else self.begins.rank(end)
+        if begin is not None:
+            matching -= self.ends.rank(begin)
+        return min(max(matching, 0), self.number_of_edges)
+
+    def _filter_cost(self, n, degree, begin, end):
+        # cost of filtering the `degree` edges of node n (or of a pair including n) by interval
+        if self.threshold is None or degree < self.threshold:
+            return degree
+
+        # the edges are in an interval tree: only the ones overlapping the query are visited, which are
+        # assumed to be spread uniformly over the span of the node
+        low, high = self.spans[n]
+        if (end is not None and end < low) or (begin is not None and begin > high):
+            return math.log2(degree)
+        if high == low:
+            return math.log2(degree) + degree
+        overlap = min(high, high if end is None else end) - max(low, low if begin is None else begin)
+        return math.log2(degree) + degree * min(max(overlap, 0) / (high - low), 1)
+
+    def node_first_cost(self, u_list, v_list, begin=None, end=None):
+        cost = 0
+        for u, v in product(u_list, v_list):
+            if u is None and v is None:
+                cost += self.number_of_edges
+            elif u is None or v is None:
+                n, degrees = (u, self.out_degree) if u is not None else (v, self.in_degree)
+                if n in degrees:
+                    cost += self._filter_cost(n, degrees[n], begin, end)
+            elif u in self.out_degree and v in self.in_degree:
+                # the edges between u and v are at most the edges of the node with the smaller degree
+                n, degree = min((u, self.out_degree[u]), (v, self.in_degree[v]), key=lambda item: item[1])
+                cost += self._filter_cost(n, degree, begin, end)
+        return cost
+
+    def interval_first_cost(self, begin=None, end=None):
+        return math.log2(self.number_of_edges + 1) + self.estimate(begin, end)
+
+    def interval_first(self, u_list, v_list, begin=None, end=None):
+        """Returns True if the query is expected to be cheaper interval first than node first."""
+        if not self.numeric:
+            return False
+
+        node_cost = self.node_first_cost(u_list, v_list, begin, end)
+        # querying the interval index costs at least a search, whatever the number of matching edges
+        if node_cost <= math.log2(self.number_of_edges + 1):
+            return False
+        return self.interval_first_cost(begin, end) < node_cost
+
+    def edge_filter(self, u_list, v_list):
+        """Returns a function selecting the edges that match the node constraints of a query.
+
+        An edge matches if it has u at one end and v at the other end for any pair (u, v) of
+        nodes in the product of `u_list` and `v_list`, where None matches any node.
+        """
+        sources, targets, pairs = set(), set(), set()
+        for u, v in product(u_list, v_list):
+            if u is None and v is None:
+                return lambda edge: True
+            elif v is None:
+                sources.add(u)
+            elif u is None:
+                targets.add(v)
+            else:
+                pairs.add((u, v))
+                if not self.directed:
+                    pairs.add((v, u))
+
+        if self.directed:
+            return lambda edge: edge[0] in sources or edge[1] in targets or (edge[0], edge[1]) in pairs
+
+        ends = sources | targets
+        return lambda edge: edge[0] in ends or edge[1] in ends or (edge[0], edge[1]) in pairs
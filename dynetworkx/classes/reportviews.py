@@ -0,0 +1,171 @@
+"""Lazy views of the edges of interval and impulse graphs.
+
+`G.edges()` returns a new list every time it is called. The views returned by `G.edge_view()`
+hold no edges: they iterate over the interval index or the adjacency of the graph on demand,
+count edges with the index instead of collecting them, and check membership with a dict lookup.
+They are read-only sets, so they also support set operations, which return Python sets.
+Views reflect later changes of the graph, but like dict views they must not be iterated
+while the graph is being modified.
+"""
+from collections.abc import Set
+from networkx.exception import NetworkXError
+from dynetworkx.classes.intervaltree import overlaps
+
+__all__ = ['IntervalEdgeView', 'ImpulseEdgeView']
+
+
+class TemporalEdgeView(Set):
+    """Base class of the edge views of temporal graphs.
+
+    Parameters
+    ----------
+    graph : IntervalGraph, IntervalDiGraph, ImpulseGraph or ImpulseDiGraph
+        Graph whose edges are viewed.
+    begin, end : timestamps, optional (default=None)
+        Interval the edges must appear in. None leaves that side of the interval open.
+    u, v : node or list of nodes, optional (default=None)
+        Node constraints, as in `edges`: edges with u at one end and v at the other end.
+    directed : bool, optional (default=False)
+        True for the views of directed graphs, in which u is the source and v the target.
+    """
+
+    def __init__(self, graph, begin=None, end=None, u=None, v=None, directed=False):
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("{}: interval end must be bigger than or equal to begin: "
+                                "begin: {}, end: {}.".format(type(graph).__name__, begin, end))
+
+        self._graph = graph
+        self._begin = begin
+        self._end = end
+        self._u = self._node_list(u)
+        self._v = self._node_list(v)
+        self._directed = directed
+
+    @staticmethod
+    def _node_list(nodes):
+        # a node or an iterable of nodes, as accepted by `edges`
+        try:
+            return list(nodes)
+        except TypeError:
+            return [nodes]
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # set operations return plain sets
+        return set(it)
+
+    @property
+    def _adj(self):
+        return self._graph._pred if self._directed else self._graph._adj
+
+    def _has_nodes(self):
+        return self._u != [None] or self._v != [None]
+
+    def _has_interval(self):
+        return self._begin is not None or self._end is not None
+
+    def _all_edges(self):
+        # streams every edge of the graph from the adjacency; an undirected edge (u, v, ...) is stored under both
+        # of its nodes and is only yielded under u
+        for u, nbrs in self._adj.items():
+            for iedges in nbrs.values():
+                for iedge in iedges:
+                    if self._directed or iedge[0] == u:
+                        yield iedge
+
+    def _matches_nodes(self, edge):
+        return self._graph._planner.edge_filter(self._u, self._v)(edge)
+
+    def __iter__(self):
+        if self._has_nodes():
+            return iter(self._graph.edges(u=self._u, v=self._v, begin=self._begin, end=self._end))
+        if self._has_interval():
+            return self._window_edges()
+        return self._all_edges()
+
+    def __len__(self):
+        if self._has_nodes():
+            return sum(1 for _ in self)
+        return self._window_count()
+
+    def __contains__(self, edge):
+        try:
+            present = edge in self._adj[edge[0]][edge[1]]
+        except (KeyError, IndexError, TypeError):
+            return False
+        return present and self._overlaps(edge) and (not self._has_nodes() or self._matches_nodes(edge))
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, list(self))
+
+
+class IntervalEdgeView(TemporalEdgeView):
+    """Lazy view of the edges (u, v, begin, end) of an interval graph that overlap an interval.
+
+    An edge matches the interval [begin, end) with the same rule as `IntervalGraph.edges`: it begins
+    before `end` and ends after `begin`, or it begins at `begin`.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    >>> view = G.edge_view(begin=10, end=12)
+    >>> len(view)
+    2
+    >>> (2, 4, 8, 15) in view
+    True
+    >>> view - G.edge_view(u=4)
+    set()
+    >>> sorted(G.edge_view(end=12) & G.edge_view(u=2))
+    [(1, 2, 3, 10), (2, 4, 1, 11), (2, 4, 8, 15)]
+    """
+
+    def _overlaps(self, edge):
+        return overlaps(edge, self._begin, self._end)
+
+    def _window_edges(self):
+        return iter(self._graph._iedges(self._begin, self._end))
+
+    def _window_count(self):
+        # the count and the slice of the index normalize the bounds with the same helper, open_bounds, so the
+        # length of the view is the number of edges it iterates over
+        return self._graph.number_of_edges(self._begin, self._end)
+
+
+class ImpulseEdgeView(TemporalEdgeView):
+    """Lazy view of the edges (u, v, t) of an impulse graph that appear in an interval.
+
+    An edge matches the interval [begin, end) if begin <= t < end, or if t == begin == end.
+
+    Examples
+    --------
+    >>> G = dnx.ImpulseGraph()
+    >>> G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15)])
+    >>> view = G.edge_view(begin=11, end=19)
+    >>> len(view)
+    2
+    >>> (1, 2, 10) in view
+    False
+    >>> sorted(view | G.edge_view(u=1))
+    [(1, 2, 10), (2, 4, 11), (2, 4, 15)]
+    """
+
+    def _overlaps(self, edge):
+        begin, end = self._begin, self._end
+        return (begin is None or edge[2] >= begin) and (end is None or edge[2] < end or edge[2] == begin)
+
+    def _timestamps(self):
+        # the timestamps of the interval, from the sorted timestamp index of the graph
+        return self._graph.tree.irange(self._begin, self._end, inclusive=(True, self._begin == self._end))
+
+    def _window_edges(self):
+        tree = self._graph.tree
+        for t in self._timestamps():
+            for u, v in tree[t]:
+                yield (u, v, t)
+
+    def _window_count(self):
+        if not self._has_interval():
+            return self._graph._planner.number_of_edges
+        tree = self._graph.tree
+        return sum(len(tree[t]) for t in self._timestamps())
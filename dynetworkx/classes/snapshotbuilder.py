@@ -0,0 +1,188 @@
+"""Networkx snapshots of the edges active during a sweep over a temporal graph.
+
+Consecutive snapshots of a temporal graph usually differ by a few edges. `SnapshotBuilder` keeps the
+edges active at the current point of a sweep, is told which edges begin and end as the sweep moves on,
+and emits a networkx graph of the active edges whenever asked, without querying the graph again.
+
+Emitted snapshots are independent graphs by default. With `share_structure=True`, a snapshot only copies
+the adjacency of the nodes whose edges changed since the previous snapshot and shares everything else
+with it, so that a snapshot costs O(n + c) for n nodes and c changed edges instead of O(n + m) for m
+active edges. Such snapshots are frozen, since modifying one would modify the others.
+"""
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.multidigraph import MultiDiGraph
+
+__all__ = ['SnapshotBuilder']
+
+
+class SnapshotBuilder:
+    """Active edges of a sweep, and the networkx snapshots of them.
+
+    Parameters
+    ----------
+    multigraph : bool, optional (default=False)
+        If True, snapshots are networkx MultiGraphs or MultiDiGraphs with an edge for every active
+        edge. If False, Graphs or DiGraphs with an edge for every pair of nodes with active edges.
+    directed : bool, optional (default=False)
+        If True, snapshots are directed.
+    share_structure : bool, optional (default=False)
+        If True, consecutive snapshots share the adjacency of the nodes whose edges did not change
+        between them, and are frozen.
+    node_attr : callable, optional (default=None)
+        Returns the attributes of a node in the snapshots, called once when the node gets its first
+        active edge. If None, nodes have no attributes.
+
+    Notes
+    -----
+    Edge and node attribute dicts handed to the builder are never modified, and are shared by all the
+    snapshots of a builder which share structure. If multigraph=False and several active edges join
+    the same pair of nodes, the snapshot edge has the attributes of the one that became active last.
+    """
+
+    def __init__(self, multigraph=False, directed=False, share_structure=False, node_attr=None):
+        self.multigraph = multigraph
+        self.directed = directed
+        self.share_structure = share_structure
+        self.node_attr = node_attr
+        if directed:
+            self.graph_class = MultiDiGraph if multigraph else DiGraph
+        else:
+            self.graph_class = MultiGraph if multigraph else Graph
+
+        # same layout as networkx graphs. Values of the adjacency, edge attribute dicts for graphs and key
+        # dicts for multigraphs, are replaced instead of modified so that snapshots can share them.
+        self._node = {}
+        self._succ = {}
+        self._pred = {} if directed else self._succ
+        self._edges = {}  # edge -> (u, v, key), key being None for graphs
+        self._pairs = {}  # pair of nodes -> {edge: attribute dict} of the active edges between them, for graphs
+        self._changed = set()  # nodes whose adjacency changed since the last snapshot
+        self._last = None
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __contains__(self, edge):
+        return edge in self._edges
+
+    def _pair(self, u, v):
+        return (u, v) if self.directed or u == v else frozenset((u, v))
+
+    def _add_node(self, n):
+        if n not in self._succ:
+            self._node[n] = self.node_attr(n) if self.node_attr is not None else {}
+            self._succ[n] = {}
+            if self.directed:
+                self._pred[n] = {}
+
+    def _remove_node_if_isolated(self, n):
+        if n in self._succ and not self._succ[n] and not self._pred[n]:
+            del self._node[n], self._succ[n]
+            if self.directed:
+                del self._pred[n]
+
+    def _set(self, u, v, value):
+        # sets the adjacency value of u and v, or removes it if value is None
+        for adj, a, b in ((self._succ, u, v), (self._pred, v, u)):
+            if value is None:
+                adj[a].pop(b, None)
+            else:
+                adj[a][b] = value
+        self._changed.update((u, v))
+
+    def add(self, edge, u, v, data=None):
+        """Make an edge between u and v active, with the given attribute dict. `edge` identifies the
+        edge, to remove it later, and must be hashable."""
+        data = {} if data is None else data
+        self._add_node(u)
+        self._add_node(v)
+        if self.multigraph:
+            keydict = dict(self._succ[u].get(v, {}))
+            key = len(keydict)
+            while key in keydict:
+                key += 1
+            keydict[key] = data
+            self._set(u, v, keydict)
+        else:
+            key = None
+            self._pairs.setdefault(self._pair(u, v), {})[edge] = data
+            self._set(u, v, data)
+        self._edges[edge] = (u, v, key)
+
+    def remove(self, edge):
+        """Make an active edge inactive."""
+        u, v, key = self._edges.pop(edge)
+        if self.multigraph:
+            keydict = dict(self._succ[u][v])
+            del keydict[key]
+            self._set(u, v, keydict if keydict else None)
+        else:
+            pair = self._pair(u, v)
+            edges = self._pairs[pair]
+            del edges[edge]
+            if edges:
+                # the pair keeps the attributes of the edge that became active last
+                self._set(u, v, edges[next(reversed(list(edges)))])
+            else:
+                del self._pairs[pair]
+                self._set(u, v, None)
+
+        self._remove_node_if_isolated(u)
+        self._remove_node_if_isolated(v)
+
+    def snapshot(self):
+        """Return a networkx graph of the active edges."""
+        G = self.graph_class()
+        if not self.share_structure:
+            G._node = {n: dict(attr) for n, attr in self._node.items()}
+            succ, pred = self._copy()
+            G._adj = succ
+            if self.directed:
+                G._succ = succ
+                G._pred = pred
+            return G
+
+        if self._last is None:
+            succ = {n: dict(nbrs) for n, nbrs in self._succ.items()}
+            pred = {n: dict(nbrs) for n, nbrs in self._pred.items()} if self.directed else succ
+        else:
+            succ = self._share(self._last._adj, self._succ)
+            pred = self._share(self._last._pred, self._pred) if self.directed else succ
+
+        G._node = dict(self._node)
+        G._adj = succ
+        if self.directed:
+            G._succ = succ
+            G._pred = pred
+        self._changed = set()
+        self._last = G
+        return nx.freeze(G)
+
+    def _copy(self):
+        # copy of the adjacency in which every edge gets its own attribute dicts, each of them shared by the two
+        # nodes of the edge as in networkx graphs
+        succ = {n: {} for n in self._succ}
+        pred = {n: {} for n in self._pred} if self.directed else succ
+        for u, nbrs in self._succ.items():
+            copies = succ[u]
+            for v, value in nbrs.items():
+                if v not in copies:
+                    if self.multigraph:
+                        value = {key: dict(data) for key, data in value.items()}
+                    else:
+                        value = dict(value)
+                    copies[v] = pred[v][u] = value
+        return succ, pred
+
+    def _share(self, last, adj):
+        # adjacency of the last snapshot, in which only the nodes that changed since are copied
+        shared = dict(last)
+        for n in self._changed:
+            if n in adj:
+                shared[n] = dict(adj[n])
+            else:
+                shared.pop(n, None)
+        return shared
@@ -0,0 +1,220 @@
+import sys
+import numpy as np
+from dynetworkx.classes.intervaltree import open_bounds
+
+
+class StaticIntervalIndex:
+    """Read-optimized interval index backed by contiguous NumPy arrays.
+
+    Intervals are kept sorted by (begin, end) in the arrays `begins` and `ends`, together with `maxends`,
+    the running maximum of `ends`, and `ids`, the position of every interval's edge in `edges`. This is an
+    implicit interval tree: the running maximum is non-decreasing, so a single `searchsorted` skips every
+    interval that ends before a query starts, and another skips every interval that begins after it ends.
+    The remaining candidates are filtered with a vectorized mask.
+
+    Mutations only update the set of edges and mark the arrays as stale; they are rebuilt in O(n log n)
+    on the next query. This makes the index a good fit for graphs that are built once and queried many
+    times, and a poor fit for workloads that interleave single edge insertions with queries. Timestamps
+    must be numeric.
+
+    Edges are tuples of the form (u, v, begin, end), and the index exposes the same interface as
+    `IntervalTree`, with the same overlap semantics: an interval [low, high) matches a query [begin, end)
+    if low < end and high > begin, or if low == begin.
+    """
+
+    def __init__(self):
+        self._edge_set = {}  # insertion-ordered set of edges
+        self._stale = False
+
+        self.edges = []
+        self.begins = np.empty(0)
+        self.ends = np.empty(0)
+        self.maxends = np.empty(0)
+        self.ids = np.empty(0, dtype=np.intp)
+        self.unique_begins = np.empty(0)
+        self.unique_ends = np.empty(0)
+
+    def __getitem__(self, item):
+        return self.slice(item.start, item.stop)
+
+    def __len__(self):
+        return len(self._edge_set)
+
+    @property
+    def number_of_edges(self):
+        return len(self._edge_set)
+
+    @property
+    def begin(self):
+        self._build()
+        return self.begins[0].item() if len(self.begins) > 0 else float("inf")
+
+    @property
+    def end(self):
+        self._build()
+        return self.maxends[-1].item() if len(self.maxends) > 0 else float("-inf")
+
+    def _build(self):
+        if not self._stale:
+            return
+
+        self.edges = list(self._edge_set)
+        begins = np.array([edge[2] for edge in self.edges])
+        ends = np.array([edge[3] for edge in self.edges])
+
+        # lexsort is stable, so edges sharing an interval keep their insertion order
+        self.ids = np.lexsort((ends, begins))
+        self.begins = begins[self.ids]
+        self.ends = ends[self.ids]
+        self.maxends = np.maximum.accumulate(self.ends) if len(self.ends) > 0 else self.ends
+        self.unique_begins = np.unique(begins)
+        self.unique_ends = np.unique(ends)
+        self._stale = False
+
+    def add(self, edge):
+        self._edge_set[edge] = None
+        self._stale = True
+
+    def add_from(self, edges):
+        self._edge_set.update(dict.fromkeys(edges))
+        self._stale = True
+
+    def remove(self, edge):
+        if edge in self._edge_set:
+            del self._edge_set[edge]
+            self._stale = True
+
+    def memory_usage(self):
+        # approximate number of bytes used by the index itself; the edge tuples are shared with the graph, so they
+        # are not included
+        self._build()
+        return (sys.getsizeof(self) + sys.getsizeof(self._edge_set) + sys.getsizeof(self.edges) +
+                sum(array.nbytes for array in (self.begins, self.ends, self.maxends, self.ids)))
+
+    def _pop(self, mask):
+        # removes and returns the edges at the sorted positions selected by mask
+        edges = list(map(self.edges.__getitem__, self.ids[mask].tolist()))
+        for edge in edges:
+            del self._edge_set[edge]
+        if len(edges) > 0:
+            self._stale = True
+        return edges
+
+    def pop_before(self, t):
+        self._build()
+        return self._pop((self.ends < t) | ((self.ends == t) & (self.begins < t)))
+
+    def pop_outside(self, begin=None, end=None):
+        self._build()
+        inside = np.ones(len(self.begins), dtype=bool)
+        if begin is not None:
+            inside &= self.ends > begin
+        if end is not None:
+            inside &= self.begins < end
+        if begin is not None:
+            inside |= self.begins == begin
+        return self._pop(~inside)
+
+    def _overlapping(self, begin, end):
+        # returns the sorted positions of all intervals matching [begin, end)
+        self._build()
+
+        # intervals before `lo` all end at or before `begin`, and intervals from `hi` on all begin at or after `end`.
+        # Intervals beginning exactly at `begin` always match, so their range is added to the candidates as well.
+        lo = np.searchsorted(self.maxends, begin, side='right')
+        hi = np.searchsorted(self.begins, end, side='left')
+        eq_lo = np.searchsorted(self.begins, begin, side='left')
+        eq_hi = np.searchsorted(self.begins, begin, side='right')
+        if eq_lo < eq_hi:
+            lo, hi = min(lo, eq_lo), max(hi, eq_hi)
+        if lo >= hi:
+            return np.empty(0, dtype=np.intp)
+
+        begins = self.begins[lo:hi]
+        ends = self.ends[lo:hi]
+        mask = ((begins < end) & (ends > begin)) | (begins == begin)
+        return np.flatnonzero(mask) + lo
+
+    def slice(self, interval_start, interval_end):
+        if len(self._edge_set) == 0:
+            return []
+        bounds = open_bounds(interval_start, interval_end, self.begin)
+        if bounds is None:
+            return []
+
+        positions = self._overlapping(*bounds)
+        return list(map(self.edges.__getitem__, self.ids[positions].tolist()))
+
+    def count(self, begin=None, end=None):
+        if len(self._edge_set) == 0:
+            return 0
+        bounds = open_bounds(begin, end, self.begin)
+        if bounds is None:
+            return 0
+        return len(self._overlapping(*bounds))
+
+    def at(self, t):
+        # only intervals from the first one whose running max end reaches t up to the last one beginning at or
+        # before t can be active at t
+        self._build()
+        lo = np.searchsorted(self.maxends, t, side='left')
+        hi = np.searchsorted(self.begins, t, side='right')
+        if lo >= hi:
+            return []
+
+        mask = (self.ends[lo:hi] > t) | (self.begins[lo:hi] == t)
+        return list(map(self.edges.__getitem__, self.ids[lo:hi][mask].tolist()))
+
+    def at_many(self, timestamps):
+        # the candidates for every timestamp t are the intervals between the first one whose running max end
+        # reaches t and the last one beginning at or before t; all candidate ranges are filtered in one pass
+        timestamps = np.asarray(timestamps)
+        self._build()
+
+        lo = np.searchsorted(self.maxends, timestamps, side='left')
+        hi = np.searchsorted(self.begins, timestamps, side='right')
+        counts = np.maximum(hi - lo, 0)
+        group_starts = np.cumsum(counts) - counts
+
+        positions = np.arange(counts.sum()) - np.repeat(group_starts - lo, counts)
+        owners = np.repeat(np.arange(len(timestamps)), counts)
+        mask = (self.ends[positions] > timestamps[owners]) | (self.begins[positions] == timestamps[owners])
+
+        offsets = np.zeros(len(timestamps) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(owners[mask], minlength=len(timestamps)), out=offsets[1:])
+
+        ids, edge_ids = np.unique(self.ids[positions[mask]], return_inverse=True)
+        return offsets, edge_ids.astype(np.intp), list(map(self.edges.__getitem__, ids.tolist()))
+
+    def intervals(self):
+        # distinct (begin, end) pairs in sorted order
+        self._build()
+        if len(self.begins) == 0:
+            return []
+
+        first = np.ones(len(self.begins), dtype=bool)
+        first[1:] = (self.begins[1:] != self.begins[:-1]) | (self.ends[1:] != self.ends[:-1])
+        return list(zip(self.begins[first].tolist(), self.ends[first].tolist()))
+
+    def _unique(self, begin, end, inclusive, lows, highs, as_array):
+        # range reads of the sorted distinct begins and/or ends
+        self._build()
+        parts = []
+        for values, selected in ((self.unique_begins, lows), (self.unique_ends, highs)):
+            if not selected:
+                continue
+            lo = 0 if begin is None else np.searchsorted(values, begin, side='left' if inclusive[0] else 'right')
+            hi = len(values) if end is None else np.searchsorted(values, end, side='right' if inclusive[1] else 'left')
+            parts.append(values[lo:hi])
+
+        timestamps = parts[0] if len(parts) == 1 else np.union1d(*parts)
+        return timestamps if as_array else timestamps.tolist()
+
+    def unique_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return self._unique(begin, end, inclusive, True, True, as_array)
+
+    def unique_begin_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return self._unique(begin, end, inclusive, True, False, as_array)
+
+    def unique_end_timestamps(self, begin=None, end=None, inclusive=(True, True), as_array=False):
+        return self._unique(begin, end, inclusive, False, True, as_array)
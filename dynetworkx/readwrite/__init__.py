@@ -0,0 +1,3 @@
+from dynetworkx.readwrite.text import *
+from dynetworkx.readwrite.binary import *
+from dynetworkx.readwrite.mmapgraph import *
@@ -0,0 +1,247 @@
+"""Saving temporal graphs to, and loading them from, a columnar binary format.
+
+A graph is saved to a directory holding a JSON header and one NumPy `.npy` file per column:
+
+header.json
+    Format name and version, kind of graph ('interval' or 'impulse'), whether it is directed, numbers of
+    nodes and edges, graph attributes, and the name of every node and edge attribute with whether it has a
+    mask.
+nodes.npy
+    Node table: every node once, in the order of the graph. Edges refer to nodes by their position in it.
+u.npy, v.npy
+    Positions of the nodes of every edge in the node table.
+begin.npy, end.npy or t.npy
+    Timestamps of the edges, which are sorted by (begin, end) or by t.
+node_attr_<i>.npy, edge_attr_<i>.npy
+    Values of the i-th node or edge attribute, with node_attr_<i>_mask.npy or edge_attr_<i>_mask.npy telling
+    which nodes or edges have it when not all of them do.
+maxends.npy, source_offsets.npy, source_edges.npy, target_offsets.npy, target_edges.npy (optional)
+    Index layout: running max of the interval ends in edge order, and for every node, the edges leaving it
+    and the edges reaching it, in compressed sparse row format.
+
+Columns of numbers, booleans or strings are stored as such; columns of other objects, such as nodes of mixed
+types, are pickled. Loading a graph reads the columns at the speed of the disk and builds the graph with
+`add_edges_from_arrays`.
+"""
+import json
+import os
+import numpy as np
+from networkx.exception import NetworkXError
+import dynetworkx as dnx
+from dynetworkx.readwrite.text import _add_columns
+
+__all__ = ['load']
+
+# version of the format written by save; files of later versions can not be read
+_VERSION = 1
+
+
+def _value_column(values):
+    # values of a single Python type that numpy stores natively are saved as such, anything else as objects
+    types = set(map(type, values))
+    if len(types) == 1 and types <= {bool, int, float, str}:
+        try:
+            return np.asarray(values)
+        except OverflowError:
+            pass
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _attribute_columns(dicts):
+    # (key, values, mask) of every attribute of a list of attribute dicts, in order of first appearance. values
+    # holds the values of the dicts having the key, which mask selects, or is None if all of them have it.
+    keys = {}
+    for data in dicts:
+        for key in data:
+            keys.setdefault(key, None)
+    columns = []
+    for key in keys:
+        mask = np.fromiter((key in data for data in dicts), dtype=bool, count=len(dicts))
+        values = [data[key] for data in dicts if key in data]
+        columns.append((key, _value_column(values), None if mask.all() else mask))
+    return columns
+
+
+def _attribute_dicts(columns, rows):
+    # inverse of _attribute_columns
+    dicts = [{} for _ in range(rows)]
+    for key, values, mask in columns:
+        positions = range(rows) if mask is None else np.flatnonzero(mask).tolist()
+        for i, value in zip(positions, values.tolist()):
+            dicts[i][key] = value
+    return dicts
+
+
+def _csr(codes, nodes):
+    # offsets and edge positions such that the edges of the i-th node are edges[offsets[i]:offsets[i + 1]], in
+    # edge order
+    edges = np.argsort(codes, kind='stable')
+    offsets = np.zeros(nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=nodes), out=offsets[1:])
+    return offsets, edges.astype(np.int64)
+
+
+def _save(G, path, index):
+    impulse = isinstance(G, dnx.ImpulseGraph)
+    directed = G.is_directed()
+    adj = G._pred if directed else G._adj
+
+    if impulse:
+        edges = [(u, v, t) for t, pairs in G.tree.items() for u, v in pairs]
+        times = {'t': _value_column([edge[2] for edge in edges])}
+    else:
+        edges, order, _, _, maxends = G._interval_arrays()
+        edges = [edges[i] for i in order.tolist()]
+        times = {'begin': _value_column([edge[2] for edge in edges]),
+                 'end': _value_column([edge[3] for edge in edges])}
+
+    positions = {n: i for i, n in enumerate(G._node)}
+    dtype = np.int32 if len(positions) < 2 ** 31 else np.int64
+    u = np.fromiter((positions[edge[0]] for edge in edges), dtype=dtype, count=len(edges))
+    v = np.fromiter((positions[edge[1]] for edge in edges), dtype=dtype, count=len(edges))
+
+    try:
+        graph = json.loads(json.dumps(G.graph))
+    except (TypeError, ValueError):
+        raise NetworkXError("Graph attributes must be JSON serializable to be saved, got {0}.".format(G.graph))
+
+    columns = {'nodes': _value_column(list(G._node)), 'u': u, 'v': v}
+    columns.update(times)
+    attributes = {}
+    for prefix, dicts in (('node', list(G._node.values())), ('edge', [adj[e[0]][e[1]][e] for e in edges])):
+        attributes[prefix] = []
+        for i, (key, values, mask) in enumerate(_attribute_columns(dicts)):
+            attributes[prefix].append([key, mask is not None])
+            columns['{0}_attr_{1}'.format(prefix, i)] = values
+            if mask is not None:
+                columns['{0}_attr_{1}_mask'.format(prefix, i)] = mask
+    if index:
+        if not impulse:
+            columns['maxends'] = np.asarray(maxends)
+        columns['source_offsets'], columns['source_edges'] = _csr(u, len(positions))
+        columns['target_offsets'], columns['target_edges'] = _csr(v, len(positions))
+
+    header = {'format': 'dynetworkx', 'version': _VERSION, 'kind': 'impulse' if impulse else 'interval',
+              'directed': directed, 'number_of_nodes': len(positions), 'number_of_edges': len(edges),
+              'graph': graph, 'node_attributes': attributes['node'], 'edge_attributes': attributes['edge'],
+              'index': bool(index)}
+    try:
+        header = json.dumps(header)
+    except (TypeError, ValueError):
+        raise NetworkXError("Attribute names must be JSON serializable to be saved.")
+
+    os.makedirs(path, exist_ok=True)
+    for name, column in columns.items():
+        np.save(os.path.join(path, name + '.npy'), column, allow_pickle=column.dtype.kind == 'O')
+    # the header is written last, so that an interrupted save does not leave a readable graph
+    with open(os.path.join(path, 'header.json'), 'w') as file:
+        file.write(header)
+
+
+def _read_header(path):
+    try:
+        with open(os.path.join(path, 'header.json')) as file:
+            header = json.load(file)
+    except (OSError, ValueError):
+        raise NetworkXError("{0} is not a graph saved with save.".format(path))
+    if header.get('format') != 'dynetworkx':
+        raise NetworkXError("{0} is not a graph saved with save.".format(path))
+    if header['version'] > _VERSION:
+        raise NetworkXError("{0} was saved in version {1} of the format, which is newer than the supported "
+                            "version {2}.".format(path, header['version'], _VERSION))
+    return header
+
+
+def _load_column(path, name, mmap_mode=None):
+    # columns of objects are pickled, and can not be memory-mapped, so they are always read into memory
+    filename = os.path.join(path, name + '.npy')
+    if mmap_mode is not None:
+        try:
+            return np.load(filename, mmap_mode=mmap_mode)
+        except ValueError:
+            pass
+    return np.load(filename, allow_pickle=True)
+
+
+def _read_attributes(path, prefix, keys, mmap_mode=None):
+    # (key, values, mask) of the node or edge attributes listed in the header, as returned by _attribute_columns
+    columns = []
+    for i, (key, masked) in enumerate(keys):
+        name = '{0}_attr_{1}'.format(prefix, i)
+        values = _load_column(path, name, mmap_mode)
+        mask = _load_column(path, name + '_mask', mmap_mode) if masked else None
+        columns.append((key, values, mask))
+    return columns
+
+
+def load(path, index='avl'):
+    """Load a graph saved with `save`.
+
+    Parameters
+    ----------
+    path : string
+        Directory the graph was saved to.
+
+    index : string, class or interval index, optional (default='avl')
+        Interval index of an interval graph, as in `IntervalGraph`. Ignored for impulse graphs.
+
+    Returns
+    -------
+    G : IntervalGraph, IntervalDiGraph, ImpulseGraph or ImpulseDiGraph
+        The saved graph, of the class it was saved from.
+
+    Raises
+    ------
+    NetworkXError
+        If path is not a saved graph, or was saved by a later version of the format.
+
+    See Also
+    --------
+    IntervalGraph.save, ImpulseGraph.save : save a graph
+    open_mmap : query a saved graph without reading it into memory
+
+    Notes
+    -----
+    Columns of objects that numpy can not store natively, such as nodes of mixed types, are
+    unpickled, so only load graphs from trusted sources.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edge(1, 2, 3, 10, weight=2)
+    >>> G.save("my_dygraph")
+    >>> H = dnx.load("my_dygraph")
+    >>> H.edges(data=True)
+    [((1, 2, 3, 10), {'weight': 2})]
+    """
+
+    header = _read_header(path)
+    if header['kind'] == 'impulse':
+        G = dnx.ImpulseDiGraph() if header['directed'] else dnx.ImpulseGraph()
+        names = ['t']
+    else:
+        G = dnx.IntervalDiGraph(index=index) if header['directed'] else dnx.IntervalGraph(index=index)
+        names = ['begin', 'end']
+    G.graph.update(header['graph'])
+
+    nodes = _load_column(path, 'nodes')
+    if header['number_of_edges'] > 0:
+        us = nodes[_load_column(path, 'u')]
+        vs = nodes[_load_column(path, 'v')]
+        times = [_load_column(path, name) for name in names]
+        columns = _read_attributes(path, 'edge', header['edge_attributes'])
+        if all(mask is None for _, _, mask in columns):
+            attributes = (tuple(key for key, _, _ in columns), [values for _, values, _ in columns])
+        else:
+            attributes = (None, _attribute_dicts(columns, len(us)))
+        _add_columns(G, us, vs, times, attributes)
+
+    # the edges are added to the empty graph first, which spares looking every one of them up in the graph, and the
+    # nodes are then put back in the order of the node table
+    dicts = _attribute_dicts(_read_attributes(path, 'node', header['node_attributes']), len(nodes))
+    G.add_nodes_from(zip(nodes.tolist(), dicts))
+    G._node = {n: G._node[n] for n in nodes.tolist()}
+    for name in ('_pred', '_succ') if header['directed'] else ('_adj',):
+        adj = getattr(G, name)
+        setattr(G, name, {n: adj[n] for n in G._node})
+    return G
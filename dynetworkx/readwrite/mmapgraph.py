@@ -0,0 +1,539 @@
+"""Read-only temporal graphs over the memory-mapped columns of a graph saved with `save`.
+
+`open_mmap` opens a saved graph without reading its edges: the columns are memory-mapped, so the operating system
+only reads the pages that a query touches and keeps them in its page cache, where they are shared by every process
+that opens the same graph. Graphs bigger than memory can thus be queried.
+
+Edges are saved sorted by time, so the edges in an interval are found by binary search: over the begin timestamps
+and the running max of the end timestamps for interval graphs, and over the timestamps for impulse graphs. The edges
+of a node are read from the index layout of the saved graph, which lists them in compressed sparse row format. A
+graph saved without the index layout can be opened as well, but the layout is then built in memory when first
+needed.
+
+Only the node table, the node attributes and columns of objects, which numpy can not memory-map, are read into
+memory.
+"""
+from itertools import product
+import numpy as np
+from networkx import Graph, DiGraph, MultiGraph, MultiDiGraph
+from networkx.classes.reportviews import NodeDataView
+from networkx.exception import NetworkXError
+from dynetworkx.readwrite.binary import _attribute_dicts, _csr, _load_column, _read_attributes, _read_header
+
+__all__ = ['open_mmap']
+
+
+def open_mmap(path):
+    """Open a graph saved with `save` as a read-only graph over its memory-mapped columns.
+
+    Parameters
+    ----------
+    path : string
+        Directory the graph was saved to.
+
+    Returns
+    -------
+    G : MmapIntervalGraph, MmapIntervalDiGraph, MmapImpulseGraph or MmapImpulseDiGraph
+        Read-only graph answering `edges`, `nodes`, `has_node`, `number_of_nodes`, `number_of_edges`,
+        `degree`, `degrees` and `to_subgraph` as the class the graph was saved from does.
+
+    Raises
+    ------
+    NetworkXError
+        If path is not a saved graph, or was saved by a later version of the format.
+
+    See Also
+    --------
+    load : read a saved graph into memory
+
+    Notes
+    -----
+    The graph reads the files in path for as long as it is used, so they must not be changed meanwhile.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    >>> G.save("my_dygraph")
+    >>> H = dnx.open_mmap("my_dygraph")
+    >>> H.edges(begin=10)
+    [(2, 4, 1, 11), (2, 4, 8, 15), (6, 4, 12, 19)]
+    >>> H.degree(4)
+    3
+    """
+    header = _read_header(path)
+    if header['kind'] == 'impulse':
+        cls = MmapImpulseDiGraph if header['directed'] else MmapImpulseGraph
+    else:
+        cls = MmapIntervalDiGraph if header['directed'] else MmapIntervalGraph
+    return cls(path, header)
+
+
+def _pack(nodes):
+    # a single node, or None, as a list of nodes, as in the edges method of the graphs
+    try:
+        _ = (n for n in nodes)
+    except TypeError:
+        nodes = [nodes]
+    return nodes
+
+
+class MmapGraph:
+    """Base of the read-only graphs returned by `open_mmap`.
+
+    A window is the (begin, end) or (begin, end, inclusive) tuple that the edge queries of the graph take.
+    Subclasses find the edges in a window with `_window` and keep the given edges in a window with `_mask`.
+    """
+
+    frozen = True
+    directed = False
+    time_columns = ()  # names of the timestamp columns
+    time_keys = ()  # edge attributes the timestamps are given as by to_subgraph
+
+    def __init__(self, path, header):
+        self.path = path
+        self.graph = header['graph']
+        self._header = header
+        self._nodes = _load_column(path, 'nodes', 'r')
+        self._u = _load_column(path, 'u', 'r')
+        self._v = _load_column(path, 'v', 'r')
+        self._times = [_load_column(path, name, 'r') for name in self.time_columns]
+        self._edge_attributes = _read_attributes(path, 'edge', header['edge_attributes'], 'r')
+        self._ranks = {}  # position of every edge in the values of a masked attribute, by attribute
+        if header['index']:
+            self._sources = (_load_column(path, 'source_offsets', 'r'), _load_column(path, 'source_edges', 'r'))
+            self._targets = (_load_column(path, 'target_offsets', 'r'), _load_column(path, 'target_edges', 'r'))
+        else:
+            self._sources = self._targets = None
+        self._codes = None  # position of every node in the node table
+        self._node_data = None
+
+    @property
+    def name(self):
+        """String identifier of the graph, as the "name" graph attribute."""
+        return self.graph.get('name', '')
+
+    def __str__(self):
+        return self.name
+
+    def __len__(self):
+        return self._header['number_of_nodes']
+
+    def __contains__(self, n):
+        try:
+            return self._code(n) is not None
+        except TypeError:
+            return False
+
+    def is_directed(self):
+        return self.directed
+
+    @property
+    def _node(self):
+        # attribute dict of every node, read when node attributes are first asked for
+        if self._node_data is None:
+            columns = _read_attributes(self.path, 'node', self._header['node_attributes'])
+            dicts = _attribute_dicts(columns, len(self._nodes))
+            self._node_data = dict(zip(self._nodes.tolist(), dicts))
+        return self._node_data
+
+    def _code(self, n):
+        if self._codes is None:
+            self._codes = {node: i for i, node in enumerate(self._nodes.tolist())}
+        return self._codes.get(n)
+
+    def _frozen(self, *args, **kwargs):
+        raise NetworkXError("Frozen graph can't be modified.")
+
+    add_node = add_nodes_from = remove_node = add_edge = add_edges_from = add_edges_from_arrays = remove_edge = \
+        evict_before = truncate = _frozen
+
+    def _validate(self, begin, end):
+        if begin is not None and end is not None and begin > end:
+            raise NetworkXError("{0}: interval end must be bigger than or equal to begin: "
+                                "begin: {1}, end: {2}.".format(self._kind, begin, end))
+
+    def _select(self, positions, window):
+        # the given edge positions of the edges in the window
+        if all(bound is None for bound in window[:2]):
+            return positions
+        return positions[self._mask([column[positions] for column in self._times], *window)]
+
+    def _csr(self, targets):
+        if self._sources is None:
+            codes = [np.asarray(self._u), np.asarray(self._v)]
+            self._sources, self._targets = [_csr(c, len(self._nodes)) for c in codes]
+        return self._targets if targets else self._sources
+
+    def _node_edges(self, n, sources=True, targets=True):
+        # positions of the edges leaving and/or reaching node n, in edge order. Both for undirected graphs.
+        code = self._code(n)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        parts = []
+        for use, layout in ((sources, self._csr(False)), (targets, self._csr(True))):
+            if use:
+                offsets, edges = layout
+                parts.append(np.asarray(edges[offsets[code]:offsets[code + 1]]))
+        return parts[0] if len(parts) == 1 else np.union1d(*parts)
+
+    def _pair_edges(self, u, v):
+        if v is None:
+            return self._node_edges(u, targets=not self.directed)
+        if u is None:
+            return self._node_edges(v, sources=not self.directed)
+
+        positions = self._node_edges(u, targets=not self.directed)
+        cu, cv = self._code(u), self._code(v)
+        if cv is None:
+            return positions[:0]
+        us, vs = self._u[positions], self._v[positions]
+        if self.directed:
+            return positions[vs == cv]
+        return positions[((us == cu) & (vs == cv)) | ((us == cv) & (vs == cu))]
+
+    def _positions(self, u, v, window):
+        # positions of the edges matching the nodes u and v and in the window, in edge order
+        self._validate(*window[:2])
+        u, v = _pack(u), _pack(v)
+        if u == [None] and v == [None]:
+            return self._window(*window)
+
+        parts = [self._pair_edges(a, b) for a, b in product(u, v)]
+        # edges matched by several nodes are only returned once
+        positions = parts[0] if len(parts) == 1 else np.unique(np.concatenate(parts))
+        return self._select(positions, window)
+
+    def _edge_list(self, positions):
+        columns = [self._nodes[self._u[positions]].tolist(), self._nodes[self._v[positions]].tolist()]
+        columns.extend(column[positions].tolist() for column in self._times)
+        return list(zip(*columns))
+
+    def _rank(self, i, mask):
+        # position of every edge in the values of the i-th edge attribute, for the edges having it
+        if i not in self._ranks:
+            self._ranks[i] = np.cumsum(mask, dtype=np.int64) - 1
+        return self._ranks[i]
+
+    def _edge_data(self, positions, key=None):
+        # attribute dicts of the given edges, with only the given attribute if key is not None
+        dicts = [{} for _ in range(len(positions))]
+        for i, (name, values, mask) in enumerate(self._edge_attributes):
+            if key is not None and name != key:
+                continue
+            if mask is None:
+                rows, taken = range(len(positions)), values[positions]
+            else:
+                having = mask[positions]
+                rows, taken = np.flatnonzero(having).tolist(), values[self._rank(i, mask)[positions[having]]]
+            for row, value in zip(rows, taken.tolist()):
+                dicts[row][name] = value
+        return dicts
+
+    def _edges(self, u, v, window, data, default):
+        positions = self._positions(u, v, window)
+        edges = self._edge_list(positions)
+        if data is False:
+            return edges
+        if data is True:
+            return list(zip(edges, self._edge_data(positions)))
+        return [(edge, datadict.get(data, default)) for edge, datadict in zip(edges, self._edge_data(positions, data))]
+
+    def _nodes_in(self, window):
+        # nodes with an edge in the window, in the order of the node table
+        positions = self._positions(None, None, window)
+        codes = np.unique(np.concatenate([self._u[positions], self._v[positions]]))
+        return self._nodes[codes].tolist()
+
+    def _node_view(self, window, data, default):
+        if all(bound is None for bound in window[:2]):
+            nodes = self._node if data is not False else dict.fromkeys(self._nodes.tolist())
+        elif data is False:
+            nodes = dict.fromkeys(self._nodes_in(window))
+        else:
+            nodes = {n: self._node[n] for n in self._nodes_in(window)}
+        return NodeDataView(nodes, data=data, default=default)
+
+    def _has_node(self, n, window):
+        if all(bound is None for bound in window[:2]):
+            return n in self
+        self._validate(*window[:2])
+        return n in self and len(self._select(self._node_edges(n), window)) > 0
+
+    def _number_of_nodes(self, window):
+        if all(bound is None for bound in window[:2]):
+            return len(self)
+        return len(self._nodes_in(window))
+
+    def _number_of_edges(self, window):
+        if all(bound is None for bound in window[:2]):
+            return self._header['number_of_edges']
+        return len(self._positions(None, None, window))
+
+    def _degree(self, node, window):
+        if node is None:
+            degrees = self._degrees(window)
+            return sum(degrees.values()) / len(degrees)
+        if not self.directed:
+            return len(self._positions(node, None, window))
+        # a self-loop counts twice in a directed graph, as an in and an out edge
+        self._validate(*window[:2])
+        return sum(len(self._select(self._node_edges(node, sources, not sources), window)) for sources in (True, False))
+
+    def _degrees(self, window):
+        positions = self._positions(None, None, window)
+        us, vs = self._u[positions], self._v[positions]
+        # a self-loop counts once in an undirected graph
+        targets = vs if self.directed else vs[us != vs]
+        counts = np.bincount(us, minlength=len(self._nodes)) + np.bincount(targets, minlength=len(self._nodes))
+        if all(bound is None for bound in window[:2]):
+            codes = np.arange(len(self._nodes))
+        else:
+            codes = np.unique(np.concatenate([us, vs]))
+        return dict(zip(self._nodes[codes].tolist(), counts[codes].tolist()))
+
+    def _to_subgraph(self, window, multigraph, edge_data, time_data, node_data):
+        if self.directed:
+            G = MultiDiGraph() if multigraph else DiGraph()
+        else:
+            G = MultiGraph() if multigraph else Graph()
+
+        positions = self._positions(None, None, window)
+        edges = self._edge_list(positions)
+        datas = self._edge_data(positions) if edge_data else [{} for _ in edges]
+        if time_data:
+            for edge, datadict in zip(edges, datas):
+                datadict.update(zip(self.time_keys, edge[2:]))
+        G.add_edges_from((edge[0], edge[1], datadict) for edge, datadict in zip(edges, datas))
+
+        if node_data:
+            G.add_nodes_from((n, self._node[n].copy()) for n in G.nodes)
+
+        return G
+
+
+class MmapIntervalGraph(MmapGraph):
+    """Read-only interval graph over memory-mapped columns, returned by `open_mmap`.
+
+    Its methods take the same parameters, and return the same results, as those of `IntervalGraph`.
+    Edges are returned in order of their intervals.
+    """
+
+    time_columns = ('begin', 'end')
+    time_keys = ('begin', 'end')
+    _kind = 'IntervalGraph'
+
+    def __init__(self, path, header):
+        super().__init__(path, header)
+        if header['index']:
+            self._maxends = _load_column(path, 'maxends', 'r')
+        else:
+            ends = np.asarray(self._times[1])
+            self._maxends = np.maximum.accumulate(ends) if len(ends) > 0 else ends
+
+    def _window(self, begin, end):
+        # the edges overlapping [begin, end) are those beginning before end, and after the running max of the ends
+        # reaches begin, and those beginning at begin
+        begins, ends = self._times
+        lo, hi = 0, len(begins)
+        if end is not None:
+            hi = np.searchsorted(begins, end, 'left')
+        if begin is not None:
+            lo = min(np.searchsorted(self._maxends, begin, 'right'), np.searchsorted(begins, begin, 'left'))
+            hi = max(hi, np.searchsorted(begins, begin, 'right')) if end is not None else hi
+        if lo >= hi:
+            return np.zeros(0, dtype=np.int64)
+        return lo + np.flatnonzero(self._mask([begins[lo:hi], ends[lo:hi]], begin, end))
+
+    @staticmethod
+    def _mask(columns, begin, end):
+        # which of the edges of the given begin and end timestamps overlap [begin, end), as in IntervalGraph.edges
+        begins, ends = columns
+        if begin is None and end is None:
+            return np.ones(len(begins), dtype=bool)
+        if begin is None:
+            return begins < end
+        if end is None:
+            return (ends > begin) | (begins == begin)
+        return ((begins < end) & (ends > begin)) | (begins == begin)
+
+    def interval(self):
+        """Return a 2-tuple as (begin, end) interval of the entire interval graph, as `IntervalGraph.interval`."""
+        if len(self._maxends) == 0:
+            return float("inf"), float("-inf")
+        return self._times[0][0].item(), self._maxends[-1].item()
+
+    def edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
+        """Return the edges of the nodes u and v in the interval [begin, end).
+
+        Refer to `IntervalGraph.edges` for full description.
+        """
+        return self._edges(u, v, (begin, end), data, default)
+
+    def nodes(self, begin=None, end=None, data=False, default=None):
+        """A NodeDataView of the nodes with an edge in the interval [begin, end).
+
+        Refer to `IntervalGraph.nodes` for full description.
+        """
+        return self._node_view((begin, end), data, default)
+
+    def has_node(self, n, begin=None, end=None):
+        """Return True if the graph contains the node n, during the given interval.
+
+        Refer to `IntervalGraph.has_node` for full description.
+        """
+        return self._has_node(n, (begin, end))
+
+    def number_of_nodes(self, begin=None, end=None):
+        """Return the number of nodes in the interval [begin, end).
+
+        Refer to `IntervalGraph.number_of_nodes` for full description.
+        """
+        return self._number_of_nodes((begin, end))
+
+    def number_of_edges(self, begin=None, end=None):
+        """Return the number of edges in the interval [begin, end).
+
+        Refer to `IntervalGraph.number_of_edges` for full description.
+        """
+        return self._number_of_edges((begin, end))
+
+    def degree(self, node=None, begin=None, end=None):
+        """Return the degree of node between time begin and end, or the mean degree if node is None.
+
+        Refer to `IntervalGraph.degree` for full description. Degree changes (delta) are not supported.
+        """
+        return self._degree(node, (begin, end))
+
+    def degrees(self, begin=None, end=None):
+        """Return the degree of every node between time begin and end.
+
+        Refer to `IntervalGraph.degrees` for full description. Degree changes (delta) are not supported.
+        """
+        return self._degrees((begin, end))
+
+    def to_subgraph(self, begin, end, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False):
+        """Return a networkx graph of the edges in the interval [begin, end).
+
+        Refer to `IntervalGraph.to_subgraph` for full description.
+        """
+        return self._to_subgraph((begin, end), multigraph, edge_data, edge_interval_data, node_data)
+
+
+class MmapIntervalDiGraph(MmapIntervalGraph):
+    """Read-only directed interval graph over memory-mapped columns, returned by `open_mmap`.
+
+    Its methods take the same parameters, and return the same results, as those of `IntervalDiGraph`.
+    """
+
+    directed = True
+    _kind = 'IntervalDiGraph'
+
+
+class MmapImpulseGraph(MmapGraph):
+    """Read-only impulse graph over memory-mapped columns, returned by `open_mmap`.
+
+    Its methods take the same parameters, and return the same results, as those of `ImpulseGraph`.
+    Edges are returned in order of their timestamps. As in `ImpulseGraph`, `edges`, `number_of_edges`,
+    `degree` and `degrees` do not use `inclusive`: they select the edges at timestamps t with
+    begin <= t < end, or t == begin == end. `nodes`, `has_node`, `number_of_nodes` and `to_subgraph` take
+    `inclusive` into account, and an interval with begin equal to end is the single timestamp begin.
+    """
+
+    time_columns = ('t',)
+    time_keys = ('timestamp',)
+    _kind = 'ImpulseGraph'
+
+    def _window(self, begin, end, inclusive):
+        times = self._times[0]
+        if begin is not None and begin == end:
+            # a single timestamp
+            lo, hi = np.searchsorted(times, begin, 'left'), np.searchsorted(times, begin, 'right')
+        else:
+            lo = 0 if begin is None else np.searchsorted(times, begin, 'left' if inclusive[0] else 'right')
+            hi = len(times) if end is None else np.searchsorted(times, end, 'right' if inclusive[1] else 'left')
+        return np.arange(lo, max(lo, hi), dtype=np.int64)
+
+    @staticmethod
+    def _mask(columns, begin, end, inclusive):
+        # which of the edges of the given timestamps are in the interval, as in ImpulseGraph.edges
+        times, = columns
+        if begin is not None and begin == end:
+            return times == begin
+        mask = np.ones(len(times), dtype=bool)
+        if begin is not None:
+            mask &= times >= begin if inclusive[0] else times > begin
+        if end is not None:
+            mask &= times <= end if inclusive[1] else times < end
+        return mask
+
+    def interval(self):
+        """Return a 2-tuple as (begin, end) interval of the entire impulse graph, as `ImpulseGraph.interval`."""
+        if len(self._times[0]) == 0:
+            raise IndexError("ImpulseGraph is empty.")
+        return self._times[0][0].item(), self._times[0][-1].item()
+
+    def edges(self, u=None, v=None, begin=None, end=None, inclusive=(True, False), data=False, default=None):
+        """Return the edges of the nodes u and v between time begin and end.
+
+        Refer to `ImpulseGraph.edges` for full description.
+        """
+        return self._edges(u, v, (begin, end, (True, False)), data, default)
+
+    def nodes(self, begin=None, end=None, inclusive=(True, False), data=False, default=None):
+        """A NodeDataView of the nodes with an edge between time begin and end.
+
+        Refer to `ImpulseGraph.nodes` for full description.
+        """
+        return self._node_view((begin, end, inclusive), data, default)
+
+    def has_node(self, n, begin=None, end=None, inclusive=(True, False)):
+        """Return True if the graph contains the node n, during the given interval.
+
+        Refer to `ImpulseGraph.has_node` for full description.
+        """
+        return self._has_node(n, (begin, end, inclusive))
+
+    def number_of_nodes(self, begin=None, end=None, inclusive=(True, False)):
+        """Return the number of nodes between time begin and end.
+
+        Refer to `ImpulseGraph.number_of_nodes` for full description.
+        """
+        return self._number_of_nodes((begin, end, inclusive))
+
+    def number_of_edges(self, begin=None, end=None, inclusive=(True, False)):
+        """Return the number of edges between time begin and end."""
+        return self._number_of_edges((begin, end, (True, False)))
+
+    def degree(self, node=None, begin=None, end=None, inclusive=(True, False)):
+        """Return the degree of node between time begin and end, or the mean degree if node is None.
+
+        Refer to `ImpulseGraph.degree` for full description. Degree changes (delta) are not supported.
+        """
+        return self._degree(node, (begin, end, (True, False)))
+
+    def degrees(self, begin=None, end=None, inclusive=(True, False)):
+        """Return the degree of every node between time begin and end.
+
+        Refer to `ImpulseGraph.degrees` for full description. Degree changes (delta) are not supported.
+        """
+        return self._degrees((begin, end, (True, False)))
+
+    def to_subgraph(self, begin, end, inclusive=(True, False), multigraph=False, edge_data=False,
+                    edge_timestamp_data=False, node_data=False):
+        """Return a networkx graph of the edges between time begin and end.
+
+        Refer to `ImpulseGraph.to_subgraph` for full description.
+        """
+        return self._to_subgraph((begin, end, inclusive), multigraph, edge_data, edge_timestamp_data, node_data)
+
+
+class MmapImpulseDiGraph(MmapImpulseGraph):
+    """Read-only directed impulse graph over memory-mapped columns, returned by `open_mmap`.
+
+    Its methods take the same parameters, and return the same results, as those of `ImpulseDiGraph`, and use
+    `inclusive` as those of `MmapImpulseGraph` do.
+    """
+
+    directed = True
+    _kind = 'ImpulseDiGraph'
@@ -0,0 +1,279 @@
+"""Reading temporal graphs from text edge lists, optionally in parallel.
+
+Reading an edge list is dominated by parsing its lines: splitting them, stripping comments, converting nodes
+and timestamps and parsing `key=value` attributes. The file is split at newline-aligned byte offsets into
+chunks, which are parsed by a pool of processes into columns: nodes, timestamps and attributes. The columns
+of all the chunks are concatenated in file order and loaded into the graph in bulk, with
+`add_edges_from_arrays` when the timestamps are valid numbers and every line has the same attributes, and line
+by line as the sequential loaders did otherwise. Reading with one process goes through the same steps with a
+single chunk, so the graph does not depend on the number of processes.
+"""
+import io
+import locale
+import os
+import pickle
+import re
+import numpy as np
+from itertools import chain
+from networkx.exception import NetworkXError
+from dynetworkx.classes.coalesce import coalesce_intervals
+
+__all__ = []
+
+# smallest number of bytes parsed by a process, below which starting processes costs more than it saves
+_MIN_CHUNK_SIZE = 2 ** 20
+
+
+def _chunks(path, processes):
+    # (start, end) byte offsets of chunks of the file, every chunk but the last ending right after a newline
+    size = os.path.getsize(path)
+    number = max(min(4 * processes, size // _MIN_CHUNK_SIZE), 1)
+    offsets = [0]
+    with open(path, 'rb') as file:
+        for i in range(1, number):
+            file.seek(max(size * i // number, offsets[-1]))
+            file.readline()
+            offsets.append(min(file.tell(), size))
+    offsets.append(size)
+    return [(start, end) for start, end in zip(offsets[:-1], offsets[1:]) if end > start]
+
+
+def _lines(path, start, end):
+    # lines of a chunk, decoded and with universal newlines as when reading the file in text mode
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return io.StringIO(data.decode(locale.getpreferredencoding(False)), newline=None)
+
+
+def _columns(us, vs, times, datas):
+    # timestamp columns are arrays if numpy can hold them as numbers; attributes are columns if every line has the
+    # same keys in the same order, and a dict per line otherwise
+    for i, column in enumerate(times):
+        array = np.array(column)
+        if array.dtype.kind in 'iuf':
+            times[i] = array
+
+    keys = tuple(datas[0]) if datas else ()
+    if all(len(data) == len(keys) and tuple(data) == keys for data in datas):
+        attributes = (keys, [[data[key] for data in datas] for key in keys])
+    else:
+        attributes = (None, datas)
+    return us, vs, times, attributes
+
+
+def _parse_interval_lines(lines, delimiter, nodetype, intervaltype, order, comments):
+    us, vs, begins, ends, datas = [], [], [], [], []
+    for line in lines:
+        p = line.find(comments)
+        if p >= 0:
+            line = line[:p]
+        if not len(line):
+            continue
+
+        line = line.rstrip().split(delimiter)
+        u = line[order.index('u')]
+        v = line[order.index('v')]
+        if 'begin' in order and 'end' in order:
+            begin = line[order.index('begin')]
+            end = line[order.index('end')]
+        elif 'begin' in order:
+            begin = intervaltype(line[order.index('begin')])
+            end = begin + order[3]
+        elif 'end' in order:
+            end = intervaltype(line[order.index('end')])
+            begin = end - order[3]
+
+        edgedata = {}
+        try:
+            for data in line[4:]:
+                key, value = data.split('=')
+                try:
+                    value = float(value)
+                except:
+                    pass
+                edgedata[key] = value
+        except:
+            pass
+
+        if nodetype is not int:
+            try:
+                u = nodetype(u)
+                v = nodetype(v)
+            except:
+                raise TypeError("Failed to convert node to {0}".format(nodetype))
+        else:
+            try:
+                u = int(u)
+                v = int(v)
+            except:
+                pass
+
+        try:
+            begin = intervaltype(begin)
+            end = intervaltype(end)
+        except:
+            raise TypeError("Failed to convert interval time to {}".format(intervaltype))
+
+        us.append(u)
+        vs.append(v)
+        begins.append(begin)
+        ends.append(end)
+        datas.append(edgedata)
+    return _columns(us, vs, [begins, ends], datas)
+
+
+def _parse_impulse_lines(lines, delimiter, nodetype, timestamptype, order, comments, collapse=False):
+    # collapse splits lines at runs of the delimiter, and strips both ends of them, as ImpulseDiGraph does
+    us, vs, ts, datas = [], [], [], []
+    for line in lines:
+        p = line.find(comments)
+        if p >= 0:
+            line = line[:p]
+        if not len(line):
+            continue
+
+        if collapse:
+            line = re.split(delimiter + '+', line.strip())
+        else:
+            line = line.rstrip().split(delimiter)
+
+        u = line[order.index('u')]
+        v = line[order.index('v')]
+        t = line[order.index('t')]
+
+        edgedata = {}
+        for data in line[3:]:
+            key, value = data.split('=')
+
+            try:
+                value = float(value)
+            except:
+                pass
+            edgedata[key] = value
+
+        if nodetype is not int:
+            try:
+                u = nodetype(u)
+                v = nodetype(v)
+            except:
+                raise TypeError("Failed to convert node to {0}".format(nodetype))
+        else:
+            try:
+                u = int(u)
+                v = int(v)
+            except:
+                pass
+
+        try:
+            t = timestamptype(t)
+        except:
+            raise TypeError("Failed to convert interval time to {}".format(timestamptype))
+
+        us.append(u)
+        vs.append(v)
+        ts.append(t)
+        datas.append(edgedata)
+    return _columns(us, vs, [ts], datas)
+
+
+def _parse_chunk(task):
+    parse, path, start, end, options = task
+    return parse(_lines(path, start, end), *options)
+
+
+def _picklable(options):
+    # the options are pickled to be sent to the processes, which fails for lambdas and local functions
+    try:
+        pickle.dumps(options)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _parse(path, parse, options, processes):
+    # columns of the whole file, parsed in chunks by a pool of processes if there is more than one chunk; more
+    # processes than CPUs would only compete for them, and options that cannot be pickled are parsed in this one
+    cpus = os.cpu_count() or 1
+    processes = cpus if processes is None else min(processes, cpus)
+    if processes > 1 and not _picklable(options):
+        processes = 1
+    chunks = _chunks(path, processes) if processes > 1 else []
+    tasks = [(parse, path, start, end, options) for start, end in chunks or [(0, os.path.getsize(path))]]
+    if len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor # only needed for parallel reads
+        with ProcessPoolExecutor(min(processes, len(tasks))) as executor:
+            parsed = list(executor.map(_parse_chunk, tasks))
+    else:
+        parsed = [_parse_chunk(task) for task in tasks]
+    parsed = [columns for columns in parsed if len(columns[0]) > 0] or parsed[:1]
+
+    us = list(chain.from_iterable(columns[0] for columns in parsed))
+    vs = list(chain.from_iterable(columns[1] for columns in parsed))
+    times = [_concatenate([columns[2][i] for columns in parsed]) for i in range(len(parsed[0][2]))]
+    # attribute columns of the chunks are concatenated if all of them have the same keys
+    keys = parsed[0][3][0]
+    if keys is not None and all(columns[3][0] == keys for columns in parsed):
+        attributes = (keys, [list(chain.from_iterable(columns[3][1][i] for columns in parsed))
+                             for i in range(len(keys))])
+    else:
+        attributes = (None, list(chain.from_iterable(_dicts(columns[3], len(columns[0])) for columns in parsed)))
+    return us, vs, times, attributes
+
+
+def _concatenate(columns):
+    if all(isinstance(column, np.ndarray) and column.dtype == columns[0].dtype for column in columns):
+        return np.concatenate(columns)
+    return list(chain.from_iterable(column.tolist() if isinstance(column, np.ndarray) else column
+                                    for column in columns))
+
+
+def _dicts(attributes, rows):
+    # attribute dict of every line
+    keys, values = attributes
+    if keys is None:
+        return values
+    if len(keys) == 0:
+        return [{} for _ in range(rows)]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def _add_columns(G, us, vs, times, attributes):
+    # adds the edges in bulk when the columns allow it, and line by line as the sequential loaders did otherwise
+    keys, values = attributes
+    # attributes named like the parameters of add_edges_from_arrays can only be given as dicts
+    if keys is not None and not set(keys) & {'u', 'v', 'begin', 'end', 't'} and \
+            all(isinstance(column, np.ndarray) for column in times):
+        try:
+            G.add_edges_from_arrays(us, vs, *times, **dict(zip(keys, values)))
+            return
+        except NetworkXError:
+            # NaN timestamps or intervals ending before they begin are loaded as they are, one by one; columns
+            # are checked before the graph is modified
+            pass
+
+    us, vs = [column.tolist() if isinstance(column, np.ndarray) else column for column in (us, vs)]
+    times = [column.tolist() if isinstance(column, np.ndarray) else column for column in times]
+    datas = _dicts(attributes, len(us))
+    if len(times) == 2:
+        G.add_edges_from(zip(us, vs, times[0], times[1], datas))
+    else:
+        for u, v, t, data in zip(us, vs, times[0], datas):
+            G.add_edge(u, v, t, **data)
+
+
+def _read_interval_txt(G, path, delimiter, nodetype, intervaltype, order, merge, comments, processes):
+    us, vs, times, attributes = _parse(path, _parse_interval_lines,
+                                       (delimiter, nodetype, intervaltype, order, comments), processes)
+    if merge[0]:
+        times = [column.tolist() if isinstance(column, np.ndarray) else column for column in times]
+        records = zip(us, vs, times[0], times[1], _dicts(attributes, len(us)))
+        G.add_edges_from(coalesce_intervals(records, merge[1], directed=G.is_directed()))
+    else:
+        _add_columns(G, us, vs, times, attributes)
+
+
+def _read_impulse_txt(G, path, delimiter, nodetype, timestamptype, order, comments, processes, collapse=False):
+    us, vs, times, attributes = _parse(path, _parse_impulse_lines,
+                                       (delimiter, nodetype, timestamptype, order, comments, collapse), processes)
+    _add_columns(G, us, vs, times, attributes)
@@ -0,0 +1,41 @@
+import random
+import pytest
+import networkx as nx
+import dynetworkx as dnx
+
+
+def test_coalesce_intervals():
+    records = [(1, 2, 0, 5), (2, 1, 6, 8), (1, 2, 20, 25), (1, 2, 4, 7, {'weight': 2})]
+
+    assert dnx.coalesce_intervals(records) == [(1, 2, 0, 5, {}), (2, 1, 6, 8, {}), (1, 2, 20, 25, {}),
+                                               (1, 2, 4, 7, {'weight': 2})]
+    assert dnx.coalesce_intervals(records, grace=1) == [(1, 2, 0, 8, {}), (1, 2, 20, 25, {}),
+                                                        (1, 2, 4, 7, {'weight': 2})]
+    assert dnx.coalesce_intervals(records, grace=1, directed=True) == dnx.coalesce_intervals(records)
+    assert dnx.coalesce_intervals([]) == []
+
+    with pytest.raises(nx.NetworkXError):
+        dnx.coalesce_intervals([(1, 2, 3)])
+
+
+def test_coalesce_intervals_unordered():
+    # a record bridging two intervals merges them
+    records = [(1, 2, 10, 12), (1, 2, 0, 1), (1, 2, 5, 6), (1, 2, 2, 4), (1, 2, 7, 9)]
+    assert dnx.coalesce_intervals(records, grace=1) == [(1, 2, 0, 12, {})]
+    assert dnx.coalesce_intervals(records, grace=0.5) == [(1, 2, 10, 12, {}), (1, 2, 0, 1, {}), (1, 2, 5, 6, {}),
+                                                          (1, 2, 2, 4, {}), (1, 2, 7, 9, {})]
+
+    rng = random.Random(0)
+    records = [(i % 5, (i + 1) % 5, t, t + rng.randint(0, 4)) for i, t in enumerate(rng.sample(range(2000), 1000))]
+    merged = dnx.coalesce_intervals(records, grace=2)
+    assert dnx.coalesce_intervals(sorted(records, key=lambda record: record[2]), grace=2) == \
+        sorted(merged, key=lambda record: record[2])
+
+    # merged intervals cover the records and are more than grace apart
+    for record in records:
+        assert any({record[0], record[1]} == {u, v} and b <= record[2] and record[3] <= e
+                   for u, v, b, e, _ in merged)
+    for u, v, b, e, _ in merged:
+        for x, y, c, f, _ in merged:
+            if {u, v} == {x, y} and (b, e) < (c, f):
+                assert c - e > 2
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+import dynetworkx as dnx
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(dnx.__file__)))
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_dir, os.environ.get('PYTHONPATH')])))
+    return subprocess.run([sys.executable, *args], env=env, check=True, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, universal_newlines=True)
+
+
+def test_import_does_not_load_optional_dependencies():
+    code = "import sys, dynetworkx; print(sorted(m for m in ('sklearn', 'pandas', 'scipy') if m in sys.modules))"
+    assert run_python('-c', code).stdout.strip() == '[]'
+
+
+def test_import_time():
+    # self time, in microseconds, of every module imported by `import dynetworkx`, as reported by -X importtime
+    output = run_python('-X', 'importtime', '-c', 'import dynetworkx').stderr
+    self_times = {}
+    for line in output.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            self_time, _, name = line[len('import time:'):].split('|')
+            if self_time.strip().isdigit():
+                self_times[name.strip()] = int(self_time)
+
+    assert 'dynetworkx' in self_times
+    # everything but networkx and numpy, which the graph classes need: the package itself, the standard library
+    # modules it uses and any optional dependency it would import eagerly
+    assert sum(t for name, t in self_times.items() if name.split('.')[0] not in ('networkx', 'numpy')) < 500000
@@ -31,6 +31,21 @@ def test_impulsedigraph_add_edges_from():
                                         ((3, 4, 19), {'label': 'WN2898'})]
 
 
+def test_impulsedigraph_add_edges_from_arrays():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from_arrays([1, 2, 3, 1, 4, 1], [2, 4, 4, 4, 3, 2], [10, 11, 19, 3, 19, 10], weight=2)
+
+    assert sorted(G.edges(data=True), key=repr) == [((1, 2, 10), {'weight': 2}),
+                                                    ((1, 4, 3), {'weight': 2}),
+                                                    ((2, 4, 11), {'weight': 2}),
+                                                    ((3, 4, 19), {'weight': 2}),
+                                                    ((4, 3, 19), {'weight': 2})]
+    assert G._planner.out_degree == {1: 2, 2: 1, 3: 1, 4: 1}
+    assert G._planner.in_degree == {2: 1, 3: 1, 4: 3}
+    assert G.has_edge(4, 3, 19, 20)
+    assert not G.has_edge(2, 1)
+
+
 def test_impulsedigraph_has_edge():
     G = dnx.ImpulseDiGraph()
     G.add_edges_from([(1, 2, 10), (2, 4, 11)])
@@ -135,3 +150,110 @@ def test_impulsedigraph_out_degree():
     assert G.out_degree() == 2/3
     assert G.out_degree(2, delta=True) == [(8, 1)]
 
+
+
+def test_impulsedigraph_evict_before_and_truncate():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (4, 2, 12)])
+
+    assert G.evict_before(12) == [(1, 2, 10), (2, 4, 11)]
+    assert 1 not in G._pred and 1 not in G._node
+    assert G._pred[2] == {4: {(2, 4, 15): {}}}
+
+    assert G.truncate(12, 15) == [(6, 4, 19)]
+    assert sorted(G.edges()) == [(2, 4, 15), (4, 2, 12)]
+    assert sorted(G._node) == [2, 4]
+
+
+def test_impulsedigraph_query_planner():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from((i % 50, i % 50 + 50, i) for i in range(2000))
+    G.add_edge(0, 50, 0)
+    nodes = list(range(25)) + [60]
+
+    assert G._planner.number_of_edges == 2000
+    assert G._planner.interval_first(nodes, [None], 100, 120)
+    assert not G._planner.interval_first([3], [None], 0, 2000)
+
+    window = [e for e in G.edges() if 100 <= e[2] < 120]
+    assert sorted(G.edges(u=nodes, begin=100, end=120)) == sorted(e for e in window if e[0] in nodes)
+    assert sorted(G.edges(v=nodes, begin=100, end=120)) == sorted(e for e in window if e[1] in nodes)
+
+    G.truncate(100, 120)
+    assert G._planner.number_of_edges == 21
+    assert G._planner.in_degree == {n: 1 for n in range(50, 71)}
+
+
+def test_impulsedigraph_edge_view():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (4, 2, 15)])
+
+    for begin, end in [(None, None), (11, 19), (None, 15), (12, None), (15, 15)]:
+        for u, v in [(None, None), (2, None), (None, 4), ([2, 6], 4)]:
+            view = G.edge_view(begin, end, u=u, v=v)
+            expected = set(e for e in G.edges(u=u, v=v) if (begin is None or e[2] >= begin) and
+                           (end is None or e[2] < end or e[2] == begin))
+            assert set(view) == expected
+            assert len(view) == len(expected)
+            assert all(e in view for e in expected)
+
+    assert len(G.edge_view()) == 5
+    assert G.edge_view(u=2) - G.edge_view(begin=15) == {(2, 4, 11)}
+
+
+def test_impulsedigraph_degree_many():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (4, 2, 15), (3, 3, 11)])
+    windows = [(0, 10), (10, 12), (11, 11), (float("-inf"), float("inf"))]
+    assert G.is_directed()
+
+    offsets, edge_ids, edges = G.edges_many(windows)
+    for j, (begin, end) in enumerate(windows):
+        assert sorted(edges[i] for i in edge_ids[offsets[j]:offsets[j + 1]]) == sorted(G.edge_view(begin, end))
+
+    degrees = G.degree_many([1, 2, 3, 4], windows)
+    for i, node in enumerate([1, 2, 3, 4]):
+        for j, (begin, end) in enumerate(windows):
+            assert degrees[i, j] == sum((e[0] == node) + (e[1] == node) for e in G.edge_view(begin, end))
+
+
+def test_impulsedigraph_degrees():
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (4, 2, 15), (3, 3, 11), (1, 2, 15)])
+    G.add_node(7)
+
+    assert G.degrees() == {1: 2, 2: 4, 3: 2, 4: 3, 6: 1, 7: 0}
+    assert G.in_degrees() == {1: 0, 2: 3, 3: 1, 4: 2, 6: 0, 7: 0}
+    assert G.out_degrees(end=15) == {1: 1, 2: 1, 3: 1, 4: 0}
+    assert G.in_degree() == 1
+    assert G.in_degrees(delta=True)[2] == [(10, 1), (15, 2)]
+    for name in ('degree', 'in_degree', 'out_degree'):
+        degrees = getattr(G, name + 's')(10, 15, inclusive=(True, False))
+        assert degrees == {n: getattr(G, name)(n, 10, 15) for n in G.nodes(begin=10, end=15, inclusive=(True, False))}
+
+    # like edges, and the degree of a single node, the degrees of all nodes do not depend on inclusive
+    for inclusive in [(True, True), (True, False), (False, True), (False, False)]:
+        for begin, end in [(10, 15), (None, 11), (11, None), (11, 11), (15, 15)]:
+            for name in ('degree', 'in_degree', 'out_degree'):
+                degrees = getattr(G, name + 's')(begin, end, inclusive=inclusive)
+                assert all(getattr(G, name)(n, begin, end, inclusive=inclusive) == degrees.get(n, 0) for n in G.nodes())
+                assert getattr(G, name)(None, begin, end, inclusive=inclusive) == sum(degrees.values()) / len(degrees)
+
+    G = dnx.ImpulseDiGraph()
+    G.add_edges_from([(1, 2, 5), (1, 3, 10), (2, 3, 12)])
+    assert G.degrees(5, 12) == {n: G.degree(n, 5, 12) for n in G.nodes()} == {1: 2, 2: 1, 3: 1}
+    assert G.in_degree(3, 5, 12) == G.in_degrees(5, 12)[3] == 1
+    assert G.degrees(5, 5) == {1: 1, 2: 1}
+
+
+def test_impulsedigraph_save_load(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.ImpulseDiGraph()
+    G.add_edge(1, 2, 3, weight=2)
+    G.add_edge(2, 1, 5)
+    G.save(path)
+
+    H = dnx.load(path)
+
+    assert type(H) is dnx.ImpulseDiGraph
+    assert sorted(H.edges(data=True), key=str) == sorted(G.edges(data=True), key=str)
@@ -1,5 +1,7 @@
 import dynetworkx as dnx
 import networkx as nx
+import pytest
+import numpy as np
 import os
 
 current_dir = os.path.dirname(__file__)
@@ -165,6 +167,26 @@ def test_impulsegraph_add_edges_from():
                                          ((3, 4, 19), {'label': 'WN2898'})]
 
 
+def test_impulsegraph_add_edges_from_arrays():
+    G = dnx.ImpulseGraph()
+    G.add_edge(1, 2, 10, weight=1)
+    G.add_edges_from_arrays(np.array([1, 2, 3, 1, 4]), np.array([2, 4, 4, 4, 3]), np.array([10, 11, 19, 3, 19]),
+                            label=['a', 'b', 'c', 'd', 'e'])
+
+    assert sorted(G.edges(data=True), key=repr) == [((1, 2, 10), {'weight': 1, 'label': 'a'}),
+                                                    ((1, 4, 3), {'label': 'd'}),
+                                                    ((2, 4, 11), {'label': 'b'}),
+                                                    ((3, 4, 19), {'label': 'c'}),
+                                                    ((4, 3, 19), {'label': 'e'})]
+    assert G.tree[19] == {(3, 4), (4, 3)}
+    assert G._planner.number_of_edges == 5
+    assert G._planner.out_degree == {1: 2, 2: 2, 3: 2, 4: 4}
+    assert G.degree(4) == 4
+
+    with pytest.raises(nx.NetworkXError):
+        G.add_edges_from_arrays([1], [2], ['10'])
+
+
 def test_impulsegraph_has_edge():
     G = dnx.ImpulseGraph()
     G.add_edges_from([(1, 2, 10), (2, 4, 11)])
@@ -184,7 +206,8 @@ def test_intervalgraph_generate_predictive_model():
     G.add_edge(1, 4, 10.5)
     G.add_edge(1, 5, 10.6)
     G.add_edge(1, 5, 10.7)
-    G.generate_predictive_model(1)
+    with pytest.deprecated_call():
+        G.generate_predictive_model(1)
 
 
 def test_impulsegraph_edges_default():
@@ -240,7 +263,8 @@ def test_intervalgraph_generate_predictive_model():
     G.add_edge(1, 4, 10.5, 11)
     G.add_edge(1, 5, 10.6, 11)
     G.add_edge(1, 5, 10.7, 11)
-    G.generate_predictive_model(1)
+    with pytest.deprecated_call():
+        G.generate_predictive_model(1)
 
 
 def test_impulsegraph_remove_edge_default():
@@ -542,6 +566,20 @@ def test_impulsegraph_load_from_text_comments():
     assert actual.edges(data=True) == desired.edges(data=True)
 
 
+def test_impulsegraph_load_from_text_processes(monkeypatch):
+    monkeypatch.setattr(dnx.readwrite.text, '_MIN_CHUNK_SIZE', 1)
+    monkeypatch.setattr(dnx.readwrite.text.os, 'cpu_count', lambda: 2)
+    path = os.path.join(current_dir, 'inputoutput_text/impulsegraph_load_from_text_default.txt')
+    for graph in [dnx.ImpulseGraph, dnx.ImpulseDiGraph]:
+        desired = graph.load_from_txt(path)
+
+        actual = graph.load_from_txt(path, processes=2)
+
+        assert type(actual) is graph
+        assert list(actual.edges(data=True)) == list(desired.edges(data=True))
+        assert list(actual._node) == list(desired._node)
+
+
 def test_impulsegraph_save_to_text_default():
     output_path = os.path.join(current_dir, 'inputoutput_text/impulsegraph_save_to_text_default_test.txt')
 
@@ -565,3 +603,160 @@ def test_impulsegraph_save_to_text_delimiter():
     G.add_edge(6, 7, 8.0, weight=2.0)
 
     G.save_to_txt(output_path, delimiter='\t')
+
+
+def test_impulsegraph_save_load(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.ImpulseGraph()
+    G.add_edge(1, 2, 3.0, weight=1.5)
+    G.add_edge(2, 3, 4.0)
+    G.add_edge('a', 1, 4.0)
+    G.save(path)
+
+    H = dnx.load(path)
+
+    assert type(H) is dnx.ImpulseGraph
+    assert list(H._node) == list(G._node)
+    assert sorted(H.edges(data=True), key=str) == sorted(G.edges(data=True), key=str)
+
+
+def test_impulsegraph_evict_before_and_truncate():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (5, 6, 19)])
+
+    assert G.evict_before(15) == [(1, 2, 10), (2, 4, 11)]
+    assert list(G.tree) == [15, 19]
+    assert sorted(G.nodes()) == [2, 4, 5, 6]
+    assert 1 not in G._adj and 1 not in G._node
+
+    assert sorted(G.truncate(15, 19)) == [(5, 6, 19), (6, 4, 19)]
+    assert G.edges() == [(2, 4, 15)]
+    assert sorted(G._adj) == [2, 4]
+
+    G.add_edge(3, 4, 20)
+    assert G.truncate(20, 20) == [(2, 4, 15)]
+    assert G.edges() == [(3, 4, 20)]
+
+    G.remove_edge(3, 4)
+    assert len(G.tree) == 0
+
+
+def test_impulsegraph_query_planner():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from((i % 50, i % 50 + 50, i) for i in range(2000))
+    nodes = list(range(25)) + [60]
+
+    assert G._planner.interval_first(nodes, [None], 100, 120)
+    assert not G._planner.interval_first([3], [None], 0, 2000)
+
+    expected = sorted(e for e in G.edges() if (e[0] in nodes or e[1] in nodes) and 100 <= e[2] < 120)
+    assert sorted(G.edges(u=nodes, begin=100, end=120)) == expected
+    assert sorted(G.edges(u=[51, 52], v=nodes, begin=100, end=120)) == [e for e in expected if e[1] in (51, 52)]
+    assert G.edges(u=nodes, begin=110, end=110) == [(10, 60, 110)]
+
+    G.remove_node(60)
+    assert 60 not in G._planner.out_degree
+    assert G._planner.number_of_edges == 1960
+    assert len(G.edges(begin=0, end=2000)) == 1960
+
+
+def test_impulsegraph_edge_view():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (4, 2, 15), (3, 3, 12)])
+
+    for begin, end in [(None, None), (11, 19), (None, 15), (12, None), (15, 15)]:
+        for u, v in [(None, None), (2, None), (None, 4), ([2, 6], 4), (3, None)]:
+            view = G.edge_view(begin, end, u=u, v=v)
+            expected = set(e for e in G.edges(u=u, v=v) if (begin is None or e[2] >= begin) and
+                           (end is None or e[2] < end or e[2] == begin))
+            assert set(view) == expected
+            assert len(view) == len(expected)
+            assert all(e in view for e in expected)
+            assert all(e not in view for e in set(G.edges()) - expected)
+
+    view = G.edge_view(begin=11, end=19)
+    assert view == {(2, 4, 11), (2, 4, 15), (4, 2, 15), (3, 3, 12)}
+    assert (1, 2, 10) not in view and (4, 2, 11) not in view
+    G.remove_edge(2, 4, 11, 12)
+    assert len(view) == 3
+
+
+def test_impulsegraph_edges_many():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (3, 3, 11), (1, 3, 11)])
+    windows = [(0, 10), (10, 12), (11, 11), (19, 19), (float("-inf"), float("inf")), (20, 30), (11, 16)]
+    assert not G.is_directed()
+
+    offsets, edge_ids, edges = G.edges_many(windows)
+    assert len(offsets) == len(windows) + 1
+    for j, (begin, end) in enumerate(windows):
+        assert sorted(edges[i] for i in edge_ids[offsets[j]:offsets[j + 1]]) == sorted(G.edge_view(begin, end))
+
+    degrees = G.degree_many([1, 2, 3, 4, 5], windows)
+    for i, node in enumerate([1, 2, 3, 4, 5]):
+        for j, (begin, end) in enumerate(windows):
+            expected = sum(1 for e in G.edge_view(begin, end) if node in e[:2])
+            assert degrees[i, j] == expected
+
+    with pytest.raises(nx.NetworkXError):
+        G.edges_many([(5, 1)])
+
+    offsets, edge_ids, edges = dnx.ImpulseGraph().edges_many([(0, 10)])
+    assert list(offsets) == [0, 0] and len(edge_ids) == 0 and edges == []
+
+
+def test_impulsegraph_degrees():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (3, 3, 11), (1, 2, 15)])
+    G.add_node(7)
+
+    assert G.degrees() == {1: 2, 2: 4, 3: 1, 4: 3, 6: 1, 7: 0}
+    assert G.degree() == 11 / 6
+    for begin, end in [(10, 15), (None, 12), (11, None), (11, 11)]:
+        degrees = G.degrees(begin, end)
+        assert degrees == {n: G.degree(n, begin, end) for n in G.nodes(begin=begin, end=end)}
+    for inclusive in [(True, True), (True, False), (False, True), (False, False)]:
+        for begin, end in [(10, 15), (None, 11), (11, None), (11, 11)]:
+            degrees = G.degrees(begin, end, inclusive=inclusive)
+            assert all(G.degree(n, begin, end, inclusive=inclusive) == degrees.get(n, 0) for n in G.nodes())
+    assert G.degrees(11, 15, inclusive=(False, True)) == {2: 1, 3: 1, 4: 1}
+    assert G.degrees(11, 11) == {2: 1, 3: 1, 4: 1} and G.edges(begin=11, end=11) == [(2, 4, 11), (3, 3, 11)]
+    assert G.degrees(delta=True)[2] == [(10, 1), (11, 1), (15, 2)]
+
+
+def test_impulsegraph_iter_snapshots():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (3, 5, 13), (1, 6, 10)])
+
+    snapshots = G.iter_snapshots(3, multigraph=True, edge_timestamp_data=True)
+    assert not isinstance(snapshots, list)
+    assert [list(S.edges(data=True)) for S in snapshots] == \
+           [list(S.edges(data=True)) for S in G.to_snapshots(3, multigraph=True, edge_timestamp_data=True)]
+    assert [S.number_of_edges() for S in G.iter_snapshots(3, multigraph=True)] == [3, 2, 1]
+
+    # the end of the graph is always in the last snapshot, even if rounding puts the end of the last
+    # snapshot just before it
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 0), (2, 3, 0.9)])
+    assert sum(S.number_of_edges() for S in G.iter_snapshots(3)) == 2
+
+    with pytest.raises(nx.NetworkXError):
+        G.iter_snapshots(number_of_snapshots=3, length_of_snapshots=2)
+
+
+def test_impulsegraph_to_sparse_snapshots():
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 10), (2, 4, 11), (6, 4, 19), (2, 4, 15), (4, 2, 12), (3, 3, 19)])
+    nodes = list(G.nodes())
+
+    for A, g in zip(G.to_sparse_snapshots(length_of_snapshots=4), G.to_snapshots(length_of_snapshots=4)):
+        g.add_nodes_from(nodes)
+        assert (A.toarray() == nx.to_numpy_array(g, nodelist=nodes, weight=None)).all()
+
+    coords, data, shape = G.to_sparse_snapshots(2, weight='count', nodelist=[2, 4, 3], format='coo')
+    assert shape == (2, 3, 3)
+    assert coords.tolist() == [[0, 0, 1, 1, 1], [0, 1, 0, 1, 2], [1, 0, 1, 0, 2]]
+    assert data.tolist() == [2, 2, 1, 1, 1]
+
+    with pytest.raises(nx.NetworkXError):
+        G.to_sparse_snapshots(2, weight='duration')
@@ -1,4 +1,10 @@
+import os
 import dynetworkx as dnx
+import networkx as nx
+import pytest
+import numpy as np
+
+current_dir = os.path.dirname(__file__)
 
 
 def test_intervaldigraph_init():
@@ -80,7 +86,8 @@ def test_intervaldigraph_generate_predictive_model():
     G.add_edge(1, 4, 10.5, 11)
     G.add_edge(1, 5, 10.6, 11)
     G.add_edge(1, 5, 10.7, 11)
-    G.generate_predictive_model(1)
+    with pytest.deprecated_call():
+        G.generate_predictive_model(1)
 
 
 def test_intervaldigraph_remove_edge_default():
@@ -133,3 +140,229 @@ def test_intervaldigraph_out_degree():
     assert G.out_degree(2, end=8) == 0
     assert G.out_degree() == 2 / 3
     assert G.out_degree(2, delta=True) == [(8, 1)]
+
+
+def test_intervaldigraph_static_index():
+    G = dnx.IntervalDiGraph(index='static')
+    G.add_edges_from([(1, 2, 10, 11), (2, 4, 11, 12), (6, 4, 19, 20), (2, 4, 15, 16)])
+
+    assert list(G.edges(begin=10)) == [(1, 2, 10, 11), (2, 4, 11, 12), (2, 4, 15, 16), (6, 4, 19, 20)]
+    assert list(G.edges(begin=11, end=15)) == [(2, 4, 11, 12)]
+    assert list(G.edges(u=2, begin=11)) == [(2, 4, 11, 12), (2, 4, 15, 16)]
+    assert G.interval() == (10, 20)
+
+
+def test_intervaldigraph_evict_before_and_truncate():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (4, 2, 2, 5)])
+
+    assert G.evict_before(11) == [(2, 4, 1, 11), (4, 2, 2, 5), (1, 2, 3, 10)]
+    assert sorted(G.edges()) == [(2, 4, 8, 15), (6, 4, 12, 19)]
+    assert 1 not in G._pred and 1 not in G._node
+    assert list(G._pred[2]) == [4] and 2 not in G._succ
+    assert list(G._succ[4]) == [2, 6]
+
+    assert G.truncate(15, 20) == [(2, 4, 8, 15)]
+    assert G.edges() == [(6, 4, 12, 19)]
+    assert sorted(G._node) == [4, 6]
+    assert G._pred == {6: {4: {(6, 4, 12, 19): {}}}}
+
+
+def test_intervaldigraph_snapshot_version():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+    H = G.snapshot_version()
+
+    G.remove_edge(1, 2)
+    G.truncate(12, 20)
+
+    assert G.edges() == [(6, 4, 12, 19)]
+    assert isinstance(H, dnx.IntervalDiGraph)
+    assert sorted(H.edges()) == [(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)]
+    assert H.in_degree(2) == 1 and H.out_degree(2) == 1
+    assert H.edges(begin=4, end=12) == [(2, 4, 1, 11), (1, 2, 3, 10)]
+    with pytest.raises(nx.NetworkXError):
+        H.remove_edge(6, 4)
+
+
+def test_intervaldigraph_incidence_index():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(0, i % 7, i, i + 5) for i in range(300)] + [(i % 5, 0, i, i + 1) for i in range(300)])
+
+    for begin, end in [(100, 120), (50, 50), (None, 10), (290, None)]:
+        out_edges = [e for e in G.edges(begin=begin, end=end) if e[0] == 0]
+        in_edges = [e for e in G.edges(begin=begin, end=end) if e[1] == 0]
+        assert G.edges(u=0, begin=begin, end=end) == sorted(out_edges, key=lambda e: (e[2], e[3]))
+        assert G.edges(v=0, begin=begin, end=end) == sorted(in_edges, key=lambda e: (e[2], e[3]))
+    assert 0 in G._incidence.nodes and 0 in G._incidence.targets
+
+    G.remove_edge(1, 0, begin=100, end=200)
+    G.add_edge(3, 0, 150, 160)
+    assert G.edges(v=0, begin=150, end=155) == [e for e in G.tree[150:155] if e[1] == 0]
+    assert (3, 0, 150, 160) in G.edges(v=0, begin=150, end=155)
+    assert G.edges(u=1, v=0, begin=0, end=300) == [(1, 0, i, i + 1) for i in range(1, 300, 5) if not 100 <= i < 200]
+
+
+def test_intervaldigraph_incidence_index_open_end():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(0, 1, i, i + 5) for i in range(200)] + [(0, 1, 300, 300), (2, 1, 300, 300)])
+
+    assert G.edges(u=0, begin=300) == [(0, 1, 300, 300)]
+    assert G.edges(v=1, begin=300) == [(0, 1, 300, 300), (2, 1, 300, 300)]
+    assert G.edges(u=0, v=1, begin=300) == [(0, 1, 300, 300)]
+    assert G.in_degree(1, begin=300) == 2
+    assert 0 in G._incidence.nodes and 1 in G._incidence.targets and (0, 1) in G._incidence.pairs
+
+
+def test_intervaldigraph_query_planner():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from((i % 50, i % 50 + 50, i, i + 2) for i in range(2000))
+    nodes = list(range(25)) + [60]
+
+    assert G._planner.interval_first(nodes, [None], 100, 120)
+    assert not G._planner.interval_first([3], [None], 0, 2000)
+
+    window = [e for e in G.edges() if e[2] < 120 and e[3] > 100]
+    assert sorted(G.edges(u=nodes, begin=100, end=120)) == sorted(e for e in window if e[0] in nodes)
+    assert sorted(G.edges(v=nodes, begin=100, end=120)) == sorted(e for e in window if e[1] in nodes)
+    assert sorted(G.edges(u=nodes, v=[51, 52], begin=100, end=120)) == \
+        sorted(e for e in window if e[0] in nodes and e[1] in (51, 52))
+
+    G.remove_edge(10, 60)
+    assert 60 not in G._planner.in_degree and 10 not in G._planner.out_degree
+    assert G._planner.number_of_edges == 1960
+
+
+def test_intervaldigraph_edge_view():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (4, 2, 9, 10)])
+
+    for begin, end in [(None, None), (10, 12), (None, 9), (12, None), (9, 9)]:
+        for u, v in [(None, None), (2, None), (None, 4), ([2, 6], 4), (4, 2)]:
+            view = G.edge_view(begin, end, u=u, v=v)
+            expected = set(G.edges(u=u, v=v, begin=begin, end=end))
+            assert set(view) == expected
+            assert len(view) == len(expected)
+            assert all(e in view for e in expected)
+            assert all(e not in view for e in set(G.edges()) - expected)
+
+    assert len(G.edge_view()) == 5
+    assert (4, 2, 1, 11) not in G.edge_view()
+    assert G.edge_view(u=2) & G.edge_view(v=2) == set()
+    assert G.edge_view(u=4) | G.edge_view(v=4) == set(G.edges()) - {(1, 2, 3, 10)}
+
+
+def test_intervaldigraph_degree_many():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (4, 2, 8, 15), (3, 3, 5, 5)])
+    windows = [(0, 2), (10, 12), (5, 5), (float("-inf"), float("inf"))]
+    assert G.is_directed()
+
+    offsets, edge_ids, edges = G.edges_many(windows)
+    for j, (begin, end) in enumerate(windows):
+        assert sorted(edges[i] for i in edge_ids[offsets[j]:offsets[j + 1]]) == sorted(G.edges(begin=begin, end=end))
+
+    degrees = G.degree_many([1, 2, 3, 4], windows)
+    for i, node in enumerate([1, 2, 3, 4]):
+        for j, (begin, end) in enumerate(windows):
+            assert degrees[i, j] == G.degree(node, begin, end)
+
+
+def test_intervaldigraph_degrees():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (4, 2, 8, 15), (3, 3, 5, 5)])
+    G.add_node(7)
+
+    assert G.degrees() == {1: 1, 2: 3, 3: 2, 4: 3, 6: 1, 7: 0}
+    assert G.in_degrees() == {1: 0, 2: 2, 3: 1, 4: 2, 6: 0, 7: 0}
+    assert G.out_degrees() == {1: 1, 2: 1, 3: 1, 4: 1, 6: 1, 7: 0}
+    assert G.in_degree() == G.out_degree() == 5 / 6
+    for name in ('degree', 'in_degree', 'out_degree'):
+        for begin, end in [(2, 12), (None, 8), (10, None), (5, 5)]:
+            degrees = getattr(G, name + 's')(begin, end)
+            assert degrees == {n: getattr(G, name)(n, begin, end) for n in G.nodes(begin=begin, end=end)}
+            changes = getattr(G, name + 's')(begin, end, delta=True)
+            assert changes == {n: getattr(G, name)(n, begin, end, delta=True) for n in degrees}
+
+
+def test_intervaldigraph_nodes_interval():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (4, 2, 8, 15), (3, 3, 5, 5)])
+
+    # targets are present in the intervals of their in edges
+    assert G.has_node(4, 1, 2) and G.has_node(4, 18, 19) and not G.has_node(4, 19, 25)
+    assert G.has_node(3, 5, 5) and not G.has_node(3, 6, 8)
+    assert sorted(G.nodes(begin=11, end=13)) == [2, 4, 6] and G.number_of_nodes(begin=11, end=13) == 3
+    G.remove_edge(6, 4, 12, 19, overlapping=False)
+    assert not G.has_node(4, 16, 19) and G.number_of_nodes(begin=16) == 0
+
+
+def test_intervaldigraph_to_snapshots():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (4, 2, 8, 15)])
+
+    S = G.to_snapshots(2, edge_interval_data=True)
+    assert all(isinstance(g, nx.DiGraph) for g in S)
+    assert sorted(S[0].edges(data='begin')) == [(1, 2, 3), (2, 4, 1), (4, 2, 8)]
+    assert sorted(S[1].edges(data='begin')) == [(2, 4, 1), (4, 2, 8), (6, 4, 12)]
+    assert [list(g.edges) for g in G.iter_snapshots(2)] == [list(g.edges) for g in S]
+
+
+def test_intervaldigraph_to_sparse_snapshots():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (4, 2, 8, 15), (2, 4, 9, 10)])
+
+    S = G.to_sparse_snapshots(2, weight='count', nodelist=[2, 4])
+    assert [A.toarray().tolist() for A in S] == [[[0, 2], [1, 0]], [[0, 1], [1, 0]]]
+
+
+def test_intervaldigraph_to_snapshot_graph():
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (4, 2, 8, 15), (2, 1, 5, 5)])
+
+    for share_structure in (False, True):
+        S = G.to_snapshot_graph(edge_interval_data=True, share_structure=share_structure)
+        assert isinstance(S, dnx.SnapshotDiGraph)
+        assert [(key, sorted(g.edges())) for key, g in S.snapshots.items()] == \
+               [((1, 3), [(2, 4)]), ((3, 8), [(1, 2), (2, 1), (2, 4)]), ((5, 5), [(1, 2), (2, 1), (2, 4)]),
+                ((8, 10), [(1, 2), (2, 4), (4, 2)]), ((10, 11), [(2, 4), (4, 2)]), ((11, 15), [(4, 2)])]
+
+
+def test_intervaldigraph_add_edges_from_arrays():
+    u, v = np.arange(300) % 23, np.arange(300) % 19
+    begin = np.arange(300) % 50
+    G = dnx.IntervalDiGraph()
+    G.add_edges_from_arrays(u, v, begin, begin + 3, weight=2)
+
+    H = dnx.IntervalDiGraph()
+    H.add_edges_from([(int(a), int(b), int(c), int(c) + 3) for a, b, c in zip(u, v, begin)], weight=2)
+
+    assert sorted(G.edges(data=True), key=repr) == sorted(H.edges(data=True), key=repr)
+    assert sorted(G.edges(v=4, begin=10, end=20)) == sorted(H.edges(v=4, begin=10, end=20))
+    assert G.in_degrees() == H.in_degrees()
+    assert G.out_degrees() == H.out_degrees()
+    assert G._planner.in_degree == H._planner.in_degree
+
+
+def test_intervaldigraph_load_from_text_merge():
+    path = os.path.join(current_dir, 'inputoutput_text/intervalgraph_load_from_text_merge.txt')
+
+    actual = dnx.IntervalDiGraph.load_from_txt(path, merge=(True, 1))
+
+    assert isinstance(actual, dnx.IntervalDiGraph)
+    assert sorted(actual.edges()) == [(1, 2, 0.0, 4.0), (1, 2, 9.0, 10.0), (2, 1, 4.0, 5.0),
+                                      (3, 4, 0.0, 1.0), (3, 4, 2.0, 3.0)]
+
+
+def test_intervaldigraph_save_load(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.IntervalDiGraph()
+    G.add_edge(1, 2, 3, 10, weight=2)
+    G.add_edge(2, 1, 1, 4)
+    G.save(path)
+
+    H = dnx.load(path)
+
+    assert type(H) is dnx.IntervalDiGraph
+    assert sorted(H.edges(data=True), key=str) == sorted(G.edges(data=True), key=str)
+    assert H.edges(u=2) == [(2, 1, 1, 4)]
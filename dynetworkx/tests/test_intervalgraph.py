@@ -1,4 +1,7 @@
 import os
+import sys
+import pytest
+import numpy as np
 import networkx as nx
 import dynetworkx as dnx
 
@@ -223,7 +226,17 @@ def test_intervalgraph_generate_predictive_model():
     G.add_edge(1, 4, 10.5, 11)
     G.add_edge(1, 5, 10.6, 11)
     G.add_edge(1, 5, 10.7, 11)
-    G.generate_predictive_model(1)
+    with pytest.deprecated_call():
+        G.generate_predictive_model(1)
+
+
+def test_intervalgraph_generate_predictive_model_without_sklearn(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'sklearn.linear_model', None)
+    G = dnx.IntervalGraph()
+    G.add_edge(1, 2, 10, 11)
+
+    with pytest.deprecated_call(), pytest.raises(ImportError, match=r"dynetworkx\[predict\]"):
+        G.generate_predictive_model(1)
 
 
 def test_intervalgraph_remove_edge_default():
@@ -513,6 +526,61 @@ def test_intervalgraph_load_from_text_comments():
     assert actual.edges(data=True) == desired.edges(data=True)
 
 
+def test_intervalgraph_load_from_text_merge():
+    path = os.path.join(current_dir, 'inputoutput_text/intervalgraph_load_from_text_merge.txt')
+
+    actual = dnx.IntervalGraph.load_from_txt(path, merge=(True, 1))
+    assert sorted(actual.edges(data=True)) == [((1, 2, 0.0, 5.0), {}), ((1, 2, 9.0, 10.0), {}),
+                                               ((3, 4, 0.0, 1.0), {'weight': 1.0}),
+                                               ((3, 4, 2.0, 3.0), {'weight': 2.0})]
+
+    actual = dnx.IntervalGraph.load_from_txt(path, merge=(True, 0))
+    assert sorted(actual.edges()) == [(1, 2, 0.0, 2.0), (1, 2, 9.0, 10.0), (2, 1, 3.0, 5.0),
+                                      (3, 4, 0.0, 1.0), (3, 4, 2.0, 3.0)]
+    assert actual.number_of_edges() == 5
+
+
+def test_intervalgraph_load_from_text_processes(monkeypatch):
+    monkeypatch.setattr(dnx.readwrite.text, '_MIN_CHUNK_SIZE', 1)
+    monkeypatch.setattr(dnx.readwrite.text.os, 'cpu_count', lambda: 2)
+    for name, merge in [('default', (False, 0)), ('comments', (False, 0)), ('merge', (True, 1))]:
+        path = os.path.join(current_dir, 'inputoutput_text/intervalgraph_load_from_text_{}.txt'.format(name))
+        comments = '@' if name == 'comments' else '#'
+        desired = dnx.IntervalGraph.load_from_txt(path, merge=merge, comments=comments)
+
+        actual = dnx.IntervalGraph.load_from_txt(path, merge=merge, comments=comments, processes=2)
+
+        assert list(actual.edges(data=True)) == list(desired.edges(data=True))
+        assert list(actual._node) == list(desired._node)
+        assert actual._adj == desired._adj
+
+
+def test_intervalgraph_load_from_text_processes_unpicklable(monkeypatch):
+    monkeypatch.setattr(dnx.readwrite.text, '_MIN_CHUNK_SIZE', 1)
+    monkeypatch.setattr(dnx.readwrite.text.os, 'cpu_count', lambda: 2)
+    path = os.path.join(current_dir, 'inputoutput_text/intervalgraph_load_from_text_default.txt')
+    desired = dnx.IntervalGraph.load_from_txt(path, nodetype=str, intervaltype=float)
+
+    actual = dnx.IntervalGraph.load_from_txt(path, nodetype=lambda n: str(n), intervaltype=lambda t: float(t),
+                                             processes=2)
+
+    assert list(actual.edges(data=True)) == list(desired.edges(data=True))
+
+
+def test_intervalgraph_load_from_text_mixed_attributes(tmp_path):
+    path = str(tmp_path / 'mixed.txt')
+    with open(path, 'w') as file:
+        file.write('1 2 0 4 weight=1\n2 3 1 3\na b 2 5 color=red\n')
+    desired = dnx.IntervalGraph()
+    desired.add_edge(1, 2, 0.0, 4.0, weight=1.0)
+    desired.add_edge(2, 3, 1.0, 3.0)
+    desired.add_edge('a', 'b', 2.0, 5.0, color='red')
+
+    actual = dnx.IntervalGraph.load_from_txt(path)
+
+    assert list(actual.edges(data=True)) == list(desired.edges(data=True))
+
+
 def test_intervalgraph_save_to_text_default():
     output_path = os.path.join(current_dir, 'inputoutput_text/intervalgraph_save_to_text_default_test.txt')
 
@@ -535,3 +603,532 @@ def test_intervalgraph_save_to_text_delimiter():
     G.add_edge(13, 14, 15, 16.0, weight=2.0)
 
     G.save_to_txt(output_path, delimiter='\t')
+
+
+def test_intervalgraph_save_load(tmp_path):
+    path = str(tmp_path / 'graph')
+    for index in [True, False]:
+        G = dnx.IntervalGraph(name='my graph')
+        G.add_edge(1, 2, 3, 10, weight=2)
+        G.add_edge(2, 'a', 1, 4.5)
+        G.add_edge(1, 2, 5, 8, weight=1, color='red')
+        G.add_node(4, size=3)
+        G.save(path, index=index)
+
+        H = dnx.load(path)
+
+        assert type(H) is dnx.IntervalGraph
+        assert H.graph == {'name': 'my graph'}
+        assert list(H.nodes(data=True)) == list(G.nodes(data=True))
+        assert list(H._node) == list(G._node)
+        assert sorted(H.edges(data=True), key=str) == sorted(G.edges(data=True), key=str)
+        assert sorted(H.edges(begin=6, end=9)) == sorted(G.edges(begin=6, end=9))
+
+
+def test_intervalgraph_save_load_index_layout(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 0, 5), (2, 3, 1, 2), (3, 1, 4, 6)])
+    G.save(path)
+
+    maxends = np.load(os.path.join(path, 'maxends.npy'))
+    offsets = np.load(os.path.join(path, 'source_offsets.npy'))
+
+    assert maxends.tolist() == [5, 5, 6]
+    assert offsets.tolist() == [0, 1, 2, 3]
+
+
+def test_intervalgraph_load_not_saved(tmp_path):
+    with pytest.raises(nx.NetworkXError):
+        dnx.load(str(tmp_path))
+
+
+def test_intervalgraph_add_edges_from_bulk():
+    edges = [(i, i + 1, i % 97, i % 97 + 5) for i in range(500)]
+    G = dnx.IntervalGraph()
+    G.add_edges_from(edges, weight=1)
+    G.add_edges_from([(0, 1, 0, 5, {'weight': 3})])
+
+    H = dnx.IntervalGraph()
+    for e in edges:
+        H.add_edge(*e, weight=1)
+
+    assert G.tree.number_of_edges == 500
+    assert sorted(G.edges(begin=10, end=20)) == sorted(H.edges(begin=10, end=20))
+    assert G.edges(u=0, v=1, data='weight') == [((0, 1, 0, 5), 3)]
+
+
+def test_intervalgraph_add_edges_from_arrays():
+    u, v = np.arange(500), np.arange(1, 501) % 37
+    begin = np.arange(500) % 97
+    weight = np.arange(500)
+    G = dnx.IntervalGraph()
+    G.add_edge(0, 1, 0, 5, weight=-1, color='red')
+    G.add_edges_from_arrays(u, v, begin, begin + 5, weight=weight, label='WN2898')
+    G.add_edges_from_arrays([0, 0], [1, 1], [0, 0], [5, 5], weight=[3, 4])
+
+    H = dnx.IntervalGraph()
+    H.add_edge(0, 1, 0, 5, weight=-1, color='red')
+    H.add_edges_from([(int(a), int(b), int(c), int(c) + 5, {'weight': int(w)})
+                      for a, b, c, w in zip(u, v, begin, weight)], label='WN2898')
+    H.add_edges_from([(0, 1, 0, 5, {'weight': 3}), (0, 1, 0, 5, {'weight': 4})])
+
+    assert sorted(G.edges(data=True), key=repr) == sorted(H.edges(data=True), key=repr)
+    assert G.edges(u=0, v=1, data=True) == [((0, 1, 0, 5), {'weight': 4, 'color': 'red', 'label': 'WN2898'})]
+    assert G.tree.number_of_edges == 500
+    assert sorted(G.nodes(begin=10, end=20)) == sorted(H.nodes(begin=10, end=20))
+    assert sorted(G.edges(u=3, begin=10, end=20)) == sorted(H.edges(u=3, begin=10, end=20))
+    assert G._planner.out_degree == H._planner.out_degree
+    assert G._planner.spans == H._planner.spans
+    assert type(list(G.nodes())[0]) is int
+
+
+def test_intervalgraph_add_edges_from_arrays_invalid():
+    G = dnx.IntervalGraph()
+    with pytest.raises(nx.NetworkXError, match="row 1"):
+        G.add_edges_from_arrays([1, 2], [2, 3], [0, 5], [1, 4])
+    with pytest.raises(nx.NetworkXError, match="same dtype"):
+        G.add_edges_from_arrays([1], [2], np.array([0]), np.array([1.5]))
+    with pytest.raises(nx.NetworkXError, match="NaN"):
+        G.add_edges_from_arrays([1], [2], [np.nan], [1.0])
+    with pytest.raises(nx.NetworkXError, match="same length"):
+        G.add_edges_from_arrays([1, 2], [2], [0, 1], [1, 2])
+    with pytest.raises(nx.NetworkXError, match="one value per edge"):
+        G.add_edges_from_arrays([1, 2], [2, 3], [0, 1], [1, 2], weight=[1])
+    assert G.number_of_edges() == 0
+
+    # zero length edges are allowed, as with add_edge
+    G.add_edges_from_arrays(['a'], ['b'], [3.0], [3.0])
+    assert G.edges() == [('a', 'b', 3.0, 3.0)]
+
+
+def test_intervalgraph_static_index():
+    edges = [(1, 2, 10, 11), (2, 4, 11, 15), (6, 4, 19, 20), (2, 4, 13, 16), (3, 2, 10, 11), (5, 6, 12, 12)]
+    G = dnx.IntervalGraph()
+    G.add_edges_from(edges)
+    H = dnx.IntervalGraph(index='static')
+    H.add_edges_from(edges)
+
+    assert 'index' not in H.graph
+    assert H.interval() == G.interval()
+    assert H.edges(begin=11, end=14) == G.edges(begin=11, end=14)
+    assert H.nodes(begin=12, end=13) == G.nodes(begin=12, end=13)
+    assert H.unique_timestamps() == G.unique_timestamps()
+    assert [list(g.edges()) for g in H.to_snapshot_graph()] == [list(g.edges()) for g in G.to_snapshot_graph()]
+
+    G.remove_edge(2, 4, 11, 15)
+    H.remove_edge(2, 4, 11, 15)
+    assert H.edges(begin=11, end=14) == G.edges(begin=11, end=14)
+
+    with pytest.raises(nx.NetworkXError):
+        dnx.IntervalGraph(index='unknown')
+
+
+def test_intervalgraph_memory_usage():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 10, 11), (2, 4, 11, 15), (6, 4, 19, 20)], weight=1)
+    usage = G.memory_usage()
+
+    assert set(usage) == {'tree', 'adjacency', 'edges', 'nodes', 'total'}
+    assert usage['total'] == usage['tree'] + usage['adjacency'] + usage['edges'] + usage['nodes']
+    assert usage['edges'] == 3 * sys.getsizeof((1, 2, 10, 11))
+
+
+def test_intervalgraph_at():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 10, 10), (0, 7, 0, 2)])
+
+    assert G.at(3) == [(2, 4, 1, 11), (1, 2, 3, 10)]
+    assert G.at(10) == [(2, 4, 1, 11), (6, 4, 10, 10)]
+    assert G.at(0) == [(0, 7, 0, 2)]
+    assert G.at(11) == []
+    assert sorted(G.nodes_at(10)) == [2, 4, 6]
+    assert G.number_of_edges_at(10) == 2
+    assert G.number_of_nodes(begin=10, end=10) == 3
+    assert G.has_node(0, begin=0, end=0)
+    assert not G.has_node(1, begin=0, end=0)
+
+
+def test_intervalgraph_number_of_edges():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 0, 5), (3, 4, 8, 11), (1, 3, 4, 9), (2, 3, 6, 6)])
+
+    assert G.number_of_edges() == 4
+    assert G.number_of_edges(begin=5) == 3
+    assert G.number_of_edges(begin=5, end=8) == 2
+    assert G.number_of_edges(begin=6, end=6) == G.number_of_edges_at(6) == 2
+    assert G.number_of_edges(end=4) == 1
+
+
+def test_intervalgraph_number_of_edges_zero_bound():
+    for index in ['avl', 'static']:
+        G = dnx.IntervalGraph(index=index)
+        G.add_edges_from([(3, 4, -3, -1), (1, 2, 0, 10), (5, 6, 2, 4)])
+
+        assert G.edges(begin=-5, end=0) == [(3, 4, -3, -1)]
+        assert G.number_of_edges(begin=-5, end=0) == 1
+        assert G.edges(begin=0, end=3) == [(1, 2, 0, 10), (5, 6, 2, 4)]
+        assert G.number_of_edges(begin=0, end=3) == 2
+        assert G.number_of_edges(begin=0) == len(G.edges(begin=0)) == 2
+        assert G.number_of_edges(end=0) == len(G.edges(end=0)) == 1
+
+
+def test_intervalgraph_evict_before():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (5, 6, 11, 11)])
+    G.add_node(7)
+
+    assert G.evict_before(11) == [(2, 4, 1, 11), (1, 2, 3, 10)]
+    assert sorted(G.edges()) == [(2, 4, 8, 15), (5, 6, 11, 11), (6, 4, 12, 19)]
+    assert sorted(G.nodes()) == [2, 4, 5, 6, 7]
+    assert 1 not in G._adj and 1 not in G._node
+    assert list(G._adj[2][4]) == [(2, 4, 8, 15)]
+    assert G.interval() == (8, 19)
+    assert G.evict_before(0) == []
+
+
+def test_intervalgraph_truncate():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+
+    assert G.truncate(10, 12) == [(1, 2, 3, 10), (6, 4, 12, 19)]
+    assert sorted(G.edges()) == [(2, 4, 1, 11), (2, 4, 8, 15)]
+    assert sorted(G._adj) == [2, 4]
+    assert sorted(G.nodes()) == [2, 4]
+    assert G.truncate(end=5) == [(2, 4, 8, 15)]
+    assert G.number_of_edges() == 1
+
+    with pytest.raises(nx.NetworkXError):
+        G.truncate(5, 4)
+
+
+def test_intervalgraph_snapshot_version():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)], weight=1)
+    G.add_node(7, color='red')
+    H = G.snapshot_version()
+
+    G.add_edge(1, 4, 5, 6)
+    G.remove_edge(1, 2)
+    G.remove_node(7)
+    G.evict_before(12)
+
+    assert G.edges() == [(6, 4, 12, 19)]
+    assert nx.is_frozen(H) and isinstance(H, dnx.IntervalGraph)
+    assert sorted(H.edges()) == [(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)]
+    assert H.edges(u=1, data='weight') == [((1, 2, 3, 10), 1)]
+    assert sorted(H.nodes()) == [1, 2, 4, 6, 7]
+    assert H._node[7] == {'color': 'red'}
+    assert H.degree(2) == 2
+    assert sorted(tuple(sorted(e)) for e in H.to_subgraph(4, 12).edges()) == [(1, 2), (2, 4)]
+    assert H.interval() == (1, 19)
+
+    with pytest.raises(nx.NetworkXError):
+        H.add_edge(1, 4, 5, 6)
+    with pytest.raises(nx.NetworkXError):
+        dnx.IntervalGraph(index='static').snapshot_version()
+
+
+def test_intervalgraph_snapshot_version_concurrent_reads():
+    import threading
+
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(i, i + 1, i, i + 10) for i in range(1000)])
+    H = G.snapshot_version()
+    expected = H.edges(begin=200, end=300)
+    results = []
+
+    def read():
+        for _ in range(20):
+            results.append(H.edges(begin=200, end=300) == expected and H.number_of_edges() == 1000)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for i in range(1000, 3000):
+        G.add_edge(i, i + 1, i % 500, i % 500 + 5)
+    G.evict_before(400)
+    reader.join()
+
+    assert all(results) and len(results) == 20
+    assert len(H.edges(begin=200, end=300)) == 109
+
+
+def test_intervalgraph_incidence_index():
+    import random
+
+    rng = random.Random(0)
+    G = dnx.IntervalGraph()
+    edges = []
+    for i in range(600):
+        begin = rng.randint(0, 1000)
+        edges.append((0, rng.choice([1, 2, i + 3]), begin, begin + rng.choice([0, rng.randint(1, 30)])))
+    G.add_edges_from(edges[:400])
+    for edge in edges[400:500]:
+        G.add_edge(*edge)
+
+    def expected(u, v, begin, end):
+        return sorted(e for e in set(G.tree[1:2000]) if (u is None or u in e[:2]) and (v is None or v in e[:2]) and
+                      ((begin is None and e[2] < end) or (end is None and (e[3] > begin or e[2] == begin)) or
+                       (begin is not None and end is not None and ((e[2] < end and e[3] > begin) or e[2] == begin))))
+
+    for begin, end in [(100, 200), (500, 500), (None, 300), (700, None)]:
+        assert sorted(G.edges(u=0, begin=begin, end=end)) == expected(0, None, begin, end)
+        assert sorted(G.edges(u=1, v=0, begin=begin, end=end)) == expected(0, 1, begin, end)
+    assert 0 in G._incidence.nodes and (1, 0) in G._incidence.pairs
+
+    # the trees are kept up to date once built
+    for edge in edges[500:]:
+        G.add_edge(*edge)
+    G.remove_edge(0, 1, begin=100, end=200)
+    G.remove_edge(*edges[0][:4], overlapping=False)
+    G.evict_before(50)
+    for begin, end in [(100, 200), (500, 500), (None, 300), (700, None)]:
+        assert sorted(G.edges(u=0, begin=begin, end=end)) == expected(0, None, begin, end)
+        assert sorted(G.edges(u=0, v=1, begin=begin, end=end)) == expected(0, 1, begin, end)
+        assert sorted(G.edges(v=[1, 2], begin=begin, end=end)) == expected(None, 1, begin, end) + \
+            expected(None, 2, begin, end) and len(G.edges(u=[0, 1], begin=begin, end=end)) == \
+            len(expected(0, None, begin, end))
+    assert G.degree(0, begin=100, end=200) == len(expected(0, None, 100, 200))
+    assert G.memory_usage()['tree'] > G.tree.memory_usage()
+
+    G.remove_node(0)
+    assert G.edges(u=1, begin=0, end=2000) == [] and G._incidence.nodes == {}
+
+
+def test_intervalgraph_incidence_index_open_end():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(0, 1, i, i + 5) for i in range(200)] + [(0, 1, 300, 300), (0, 2, 300, 300)])
+
+    assert (0, 1, 300, 300) in G.edges(begin=300)
+    assert G.edges(u=0, begin=300) == [(0, 1, 300, 300), (0, 2, 300, 300)]
+    assert G.edges(u=1, v=0, begin=300) == [(0, 1, 300, 300)]
+    assert G.degree(0, begin=300) == 2
+    assert 0 in G._incidence.nodes and (1, 0) in G._incidence.pairs
+
+
+def test_intervalgraph_lifespan_index():
+    import random
+
+    rng = random.Random(1)
+    G = dnx.IntervalGraph()
+    edges = []
+    for _ in range(300):
+        begin = rng.randint(0, 100)
+        edges.append((rng.randint(0, 20), rng.randint(0, 20), begin, begin + rng.choice([0, 1, 5, 20])))
+    G.add_edges_from(edges[:200])
+    G.add_node(21)
+    windows = [(10, 20), (50, 50), (None, 5), (90, None), (0, 1), (120, 130)]
+
+    def check():
+        for begin, end in windows:
+            present = {n for e in G.edges(begin=begin, end=end) for n in e[:2]}
+            assert set(G.nodes(begin=begin, end=end)) == present
+            assert G.number_of_nodes(begin=begin, end=end) == len(present)
+            assert [n for n in range(23) if G.has_node(n, begin, end)] == sorted(present)
+
+    check()
+    assert 0 in G._lifespans.nodes
+    assert G._lifespans.span(0, G._incident_iedges) == (min(e[2] for e in G.edges(u=0)), max(e[3] for e in G.edges(u=0)))
+
+    # the index is kept up to date as edges are added and removed
+    for edge in edges[200:250]:
+        G.add_edge(*edge)
+    G.add_edges_from(edges[250:])
+    for edge in edges[:50]:
+        G.remove_edge(*edge, overlapping=False)
+    G.evict_before(10)
+    check()
+
+    G.remove_node(0)
+    assert not G.has_node(0, 0, 200) and 0 not in G._lifespans.nodes
+    assert G._lifespans.span(21, G._incident_iedges) is None
+
+
+def test_intervalgraph_query_planner():
+    G = dnx.IntervalGraph()
+    G.add_edges_from((i % 50, i % 50 + 50, i, i + 2) for i in range(2000))
+    nodes = list(range(25)) + [60]
+
+    assert G._planner.interval_first(nodes, [None], 100, 120)
+    assert not G._planner.interval_first([3], [None], 0, 2000)
+
+    expected = sorted(e for e in G.edges() if (e[0] in nodes or e[1] in nodes) and e[2] < 120 and e[3] > 100)
+    assert sorted(G.edges(u=nodes, begin=100, end=120)) == expected
+    assert sorted(G.edges(v=nodes, begin=100, end=120)) == expected
+    assert sorted(G.edges(u=[51, 52], v=nodes, begin=100, end=120)) == [e for e in expected if e[1] in (51, 52)]
+
+    version = G.snapshot_version()
+    G.remove_node(60)
+    assert 60 not in G._planner.out_degree and 60 not in G._planner.spans
+    assert G._planner.number_of_edges == 1960
+    assert version._planner.number_of_edges == 2000
+
+
+def test_intervalgraph_edge_view():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (3, 3, 5, 5)])
+
+    for begin, end in [(None, None), (10, 12), (None, 9), (12, None), (5, 5), (11, 11)]:
+        for u, v in [(None, None), (2, None), (None, 4), ([2, 6], 4), (3, None)]:
+            view = G.edge_view(begin, end, u=u, v=v)
+            expected = set(G.edges(u=u, v=v, begin=begin, end=end))
+            assert set(view) == expected
+            assert len(view) == len(expected)
+            assert all(e in view for e in expected)
+            assert all(e not in view for e in set(G.edges()) - expected)
+
+    view = G.edge_view(begin=10, end=12)
+    assert (4, 2, 1, 11) not in view and (2, 4, 1, 11, 0) not in view and 5 not in view
+    assert view - G.edge_view(u=4) == set()
+    assert view | {(7, 8, 0, 1)} == {(2, 4, 1, 11), (2, 4, 8, 15), (7, 8, 0, 1)}
+    assert view == {(2, 4, 1, 11), (2, 4, 8, 15)}
+
+    # views are not snapshots
+    G.add_edge(5, 6, 11, 13)
+    G.remove_edge(2, 4, 1, 11, overlapping=False)
+    assert view == {(2, 4, 8, 15), (5, 6, 11, 13)}
+
+    with pytest.raises(nx.NetworkXError):
+        G.edge_view(begin=5, end=1)
+
+
+
+def test_intervalgraph_edge_view_len():
+    edges = [(3, 4, -3, -1), (1, 2, 0, 10), (5, 6, 2, 4), (7, 8, 0, 0), (2, 9, 10, 10)]
+    for index in ['avl', 'static', 'centered', 'sorted']:
+        G = dnx.IntervalGraph(index=index)
+        G.add_edges_from(edges)
+        for begin, end in [(-5, 0), (0, 3), (0, None), (None, 0), (0, 0), (None, None), (10, None), (None, -3)]:
+            view = G.edge_view(begin=begin, end=end)
+            assert len(view) == len(list(view)) == G.number_of_edges(begin, end), (index, begin, end)
+            assert all(e in view for e in view)
+
+def test_intervalgraph_edges_many():
+    edges = [(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (3, 3, 5, 5), (1, 3, 5, 5)]
+    windows = [(0, 2), (10, 12), (5, 5), (11, 11), (float("-inf"), float("inf")), (19, 30), (-5, -1)]
+
+    for index in ('avl', 'static'):
+        G = dnx.IntervalGraph(index=index)
+        G.add_edges_from(edges)
+
+        offsets, edge_ids, window_edges = G.edges_many(windows)
+        assert len(offsets) == len(windows) + 1
+        for j, (begin, end) in enumerate(windows):
+            found = [window_edges[i] for i in edge_ids[offsets[j]:offsets[j + 1]]]
+            assert sorted(found) == sorted(G.edges(begin=begin, end=end))
+
+        degrees = G.degree_many([1, 2, 3, 4, 5], windows)
+        assert degrees.shape == (5, len(windows))
+        for i, node in enumerate([1, 2, 3, 4, 5]):
+            for j, (begin, end) in enumerate(windows):
+                assert degrees[i, j] == (G.degree(node, begin, end) if node in G else 0)
+
+        with pytest.raises(nx.NetworkXError):
+            G.edges_many([(0, 2), (5, 1)])
+
+    offsets, edge_ids, window_edges = dnx.IntervalGraph().edges_many([(0, 10), (5, 6)])
+    assert list(offsets) == [0, 0, 0] and len(edge_ids) == 0 and window_edges == []
+
+
+def test_intervalgraph_degrees():
+    edges = [(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (3, 3, 5, 5), (1, 3, 20, 20)]
+    for index in ('avl', 'static'):
+        G = dnx.IntervalGraph(index=index)
+        G.add_edges_from(edges)
+        G.add_node(7)
+
+        assert G.degrees() == {1: 2, 2: 3, 3: 2, 4: 3, 6: 1, 7: 0}
+        assert G.degree() == 11 / 6
+        for begin, end in [(2, 12), (None, 8), (10, None), (5, 5), (12, 20)]:
+            degrees = G.degrees(begin, end)
+            assert sorted(degrees) == sorted(G.nodes(begin=begin, end=end))
+            assert degrees == {n: G.degree(n, begin, end) for n in degrees}
+            changes = G.degrees(begin, end, delta=True)
+            assert changes == {n: G.degree(n, begin, end, delta=True) for n in degrees}
+
+    G = dnx.IntervalGraph()
+    G.add_edge(1, 2, 3, 5)
+    assert G.degrees(end=2) == {} and G.degrees(end=2, delta=True) == {}
+
+
+def test_intervalgraph_open_interval_zero_length_edges():
+    for index in ('avl', 'static'):
+        G = dnx.IntervalGraph(index=index)
+        G.add_edges_from([(1, 2, 3, 10), (2, 3, 30, 30), (3, 4, 1, 1)])
+        # zero-length edges at either end of the graph are found by open intervals, as by node-first queries
+        assert sorted(G.edges(begin=8)) == [(1, 2, 3, 10), (2, 3, 30, 30)] == sorted(G.edges(u=[1, 2], begin=8))
+        assert G.number_of_edges(begin=8) == 2
+        assert G.edges(end=1) == [] == G.edges(u=3, end=1)
+        assert G.number_of_edges(end=1) == 0
+        assert G.edges(begin=1, end=2) == [(3, 4, 1, 1)]
+
+
+def test_intervalgraph_iter_snapshots():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (3, 5, 7, 7), (1, 6, 1, 19)])
+
+    snapshots = G.iter_snapshots(4, multigraph=True, edge_interval_data=True)
+    assert not isinstance(snapshots, list)
+    begin, end = G.interval()
+    length = (end - begin) / 4
+    for i, S in enumerate(snapshots):
+        H = G.to_subgraph(begin + length * i, begin + length * (i + 1) + (i == 3), multigraph=True,
+                          edge_interval_data=True)
+        assert list(S.edges(data=True)) == list(H.edges(data=True))
+    assert i == 3
+
+    assert [list(S.edges) for S in G.iter_snapshots(length_of_snapshots=9)] == \
+           [list(S.edges) for S in G.to_snapshots(length_of_snapshots=9)]
+
+    with pytest.raises(nx.NetworkXError):
+        G.iter_snapshots(1)
+
+
+def test_intervalgraph_to_sparse_snapshots():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15), (3, 3, 19, 19)])
+    nodes = list(G.nodes())
+
+    S = G.to_sparse_snapshots(3)
+    assert len(S) == 3
+    for A, g in zip(S, G.to_snapshots(3)):
+        g.add_nodes_from(nodes)
+        assert (A.toarray() == nx.to_numpy_array(g, nodelist=nodes, weight=None)).all()
+
+    counts = G.to_sparse_snapshots(2, weight='count', nodelist=[4, 2])
+    assert counts[0].toarray().tolist() == [[0, 2], [2, 0]]
+    durations = G.to_sparse_snapshots(2, weight='duration', nodelist=[4, 2, 3])
+    assert durations[0].toarray().tolist() == [[0, 11, 0], [11, 0, 0], [0, 0, 0]]
+    assert durations[1].toarray().tolist() == [[0, 6, 0], [6, 0, 0], [0, 0, 0]]
+    assert durations[1].nnz == 3
+
+    coords, data, shape = G.to_sparse_snapshots(2, weight='count', format='coo')
+    assert shape == (2, 5, 5)
+    tensor = np.zeros(shape, dtype=int)
+    tensor[tuple(coords)] = data
+    assert [(tensor[i] == A.toarray()).all() for i, A in enumerate(G.to_sparse_snapshots(2, weight='count'))] == \
+        [True, True]
+
+    with pytest.raises(nx.NetworkXError):
+        G.to_sparse_snapshots(2, weight='weight')
+
+
+def test_intervalgraph_to_snapshot_graph_share_structure():
+    G = dnx.IntervalGraph()
+    G.add_edges_from([(1, 2, 10, 11), (2, 4, 11, 15), (6, 4, 19, 20), (2, 4, 13, 16), (3, 2, 10, 11), (5, 7, 10, 20),
+                      (1, 5, 12, 12)])
+
+    S = G.to_snapshot_graph(multigraph=True, edge_interval_data=True)
+    T = G.to_snapshot_graph(multigraph=True, edge_interval_data=True, share_structure=True)
+    assert list(S.snapshots) == list(T.snapshots) == [(10, 11), (11, 13), (12, 12), (13, 15), (15, 16), (16, 19),
+                                                        (19, 20)]
+    for s, t in zip(S, T):
+        assert sorted((min(u, v), max(u, v), b) for u, v, b in s.edges(data='begin')) == \
+               sorted((min(u, v), max(u, v), b) for u, v, b in t.edges(data='begin'))
+        assert nx.is_frozen(t) and not nx.is_frozen(s)
+
+    # the edge (5, 7, 10, 20) is in every snapshot. The adjacency of 7 never changes and is shared by all of
+    # them, the adjacency of 5 is copied when the edge (1, 5, 12, 12) comes and goes, and shared otherwise
+    assert all(t._adj[7] is T.snapshots[(10, 11)]._adj[7] for t in T)
+    assert T.snapshots[(11, 13)]._adj[5] is not T.snapshots[(10, 11)]._adj[5]
+    assert T.snapshots[(13, 15)]._adj[5] is T.snapshots[(16, 19)]._adj[5] is T.snapshots[(19, 20)]._adj[5]
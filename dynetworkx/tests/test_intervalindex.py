@@ -0,0 +1,199 @@
+import random
+import pytest
+import networkx as nx
+import dynetworkx as dnx
+from dynetworkx.classes.intervalindex import INTERVAL_INDEXES, IntervalIndex, interval_index
+
+ENGINES = sorted(INTERVAL_INDEXES)
+
+
+def _random_edges(n, seed=0):
+    rng = random.Random(seed)
+    edges = []
+    for i in range(n):
+        begin = rng.randint(0, 1000)
+        edges.append((i, i + 1, begin, begin + rng.choice([0, rng.randint(1, 50)])))
+    return edges
+
+
+def _matches(edge, begin, end):
+    return (edge[2] < end and edge[3] > begin) or edge[2] == begin
+
+
+QUERIES = [(0, 0), (0, 1), (100, 100), (250, 600), (500, 500), (1000, 1100), (1050, 1050), (2000, 3000)]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_matches_brute_force(engine):
+    edges = _random_edges(1500, seed=1)
+    index = interval_index(engine)
+    index.add_from(edges[:1000])
+    for edge in edges[1000:]:
+        index.add(edge)
+
+    removed = edges[::3]
+    for edge in removed:
+        index.remove(edge)
+    index.remove(removed[0])
+    remaining = [edge for edge in edges if edge not in set(removed)]
+
+    order = {edge: i for i, edge in enumerate(edges)}
+    assert index.number_of_edges == len(remaining)
+    assert (index.begin, index.end) == (min(e[2] for e in remaining), max(e[3] for e in remaining))
+    assert index.intervals() == sorted(set((e[2], e[3]) for e in remaining))
+    assert index.unique_end_timestamps() == sorted(set(e[3] for e in remaining))
+    for begin, end in QUERIES:
+        expected = sorted((e for e in remaining if _matches(e, begin, end)), key=lambda e: (e[2], e[3], order[e]))
+        assert index.count(begin, end) == len(expected)
+        if begin == end:
+            assert index.at(begin) == expected
+        assert index[begin:end] == expected
+
+        timestamps = set(e[2] for e in remaining) | set(e[3] for e in remaining)
+        assert index.unique_timestamps(begin, end) == sorted(t for t in timestamps if begin <= t <= end)
+        assert index.unique_begin_timestamps(begin, end, inclusive=(False, False)) == \
+            sorted(set(e[2] for e in remaining if begin < e[2] < end))
+        assert index.unique_end_timestamps(begin, end, inclusive=(True, False)) == \
+            sorted(set(e[3] for e in remaining if begin <= e[3] < end))
+        assert index.unique_timestamps(begin, end, as_array=True).tolist() == index.unique_timestamps(begin, end)
+
+
+
+OPEN_QUERIES = [(None, None), (None, 13), (None, 0), (1, None), (0, None), (None, 25), (23, None), (-5, 0), (0, 3),
+                (13, 13), (23, 23), (30, None), (None, -10)]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_open_bounds(engine):
+    edges = [(5, 4, 29, 30), (6, 4, 25, 27), (3, 6, 23, 23), (1, 2, 0, 10), (3, 4, -3, -1), (7, 8, -3, -3),
+             (5, 6, 2, 4), (2, 9, 30, 30)]
+    index = interval_index(engine)
+    index.add_from(edges)
+    reference = interval_index('avl')
+    reference.add_from(edges)
+
+    for begin, end in OPEN_QUERIES:
+        low = float("-inf") if begin is None else begin
+        high = float("inf") if end is None else end
+        if begin is None:
+            expected = [e for e in edges if e[2] < high]
+        else:
+            expected = [e for e in edges if _matches(e, low, high)]
+        assert sorted(index.slice(begin, end)) == sorted(expected), (begin, end)
+        assert index.slice(begin, end) == reference.slice(begin, end)
+        assert index.count(begin, end) == len(expected)
+
+    G = dnx.IntervalGraph(index=engine)
+    G.add_edges_from(edges)
+    assert G.edges(end=13) == [(7, 8, -3, -3), (3, 4, -3, -1), (1, 2, 0, 10), (5, 6, 2, 4)]
+    assert (3, 6, 23, 23) in G.edges(begin=1) and (2, 9, 30, 30) in G.edges(begin=1)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_empty(engine):
+    index = interval_index(engine)
+    index.add((1, 2, 3, 4))
+    index.remove((1, 2, 3, 4))
+
+    assert index[0:10] == []
+    assert index.at(3) == []
+    assert index.count(3, 3) == 0
+    assert index.intervals() == []
+    assert index.unique_timestamps() == []
+    assert (index.begin, index.end, index.number_of_edges) == (float("inf"), float("-inf"), 0)
+    assert index.memory_usage() > 0
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_empty_intervalgraph(engine):
+    G = dnx.IntervalGraph(index=engine)
+
+    assert G.at(3) == []
+    assert G.number_of_edges_at(3) == 0
+    assert G.edges(begin=3, end=3) == []
+    assert G.at_many([1, 3])[0].tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_intervalgraph(engine):
+    edges = [(1, 2, 10, 11), (2, 4, 11, 15), (6, 4, 19, 20), (2, 4, 13, 16), (3, 2, 10, 11), (5, 6, 12, 12)]
+    G = dnx.IntervalGraph()
+    G.add_edges_from(edges)
+    H = dnx.IntervalGraph(index=engine)
+    H.add_edges_from(edges)
+
+    assert H.edges(begin=11, end=14) == G.edges(begin=11, end=14)
+    assert H.unique_timestamps() == G.unique_timestamps()
+    assert [list(g.edges()) for g in H.to_snapshot_graph()] == [list(g.edges()) for g in G.to_snapshot_graph()]
+
+    D = dnx.IntervalDiGraph(index=engine)
+    D.add_edges_from(edges)
+    D.remove_edge(2, 4, 11, 12)
+    assert D.edges(begin=11, end=14) == [(5, 6, 12, 12), (2, 4, 13, 16)]
+
+
+def test_intervalindex_custom_engine():
+    class ListIndex(IntervalIndex):
+        def __init__(self):
+            super().__init__()
+            self.intervals_list = []
+
+        def _insert(self, interval):
+            self.intervals_list.append(interval)
+
+        def _discard(self, interval):
+            self.intervals_list.remove(interval)
+
+        def _overlap(self, begin, end):
+            return [(low, high) for low, high in self.intervals_list
+                    if (low < end and high > begin) or low == begin]
+
+    G = dnx.IntervalGraph(index=ListIndex)
+    G.add_edges_from([(1, 2, 10, 11), (2, 4, 11, 15)])
+    assert isinstance(G.tree, ListIndex)
+    assert G.edges(begin=11) == [(2, 4, 11, 15)]
+
+    dnx.register_interval_index('list', ListIndex)
+    try:
+        assert isinstance(dnx.IntervalGraph(index='list').tree, ListIndex)
+    finally:
+        del INTERVAL_INDEXES['list']
+
+    with pytest.raises(nx.NetworkXError):
+        dnx.IntervalGraph(index='unknown')
+    with pytest.raises(nx.NetworkXError):
+        dnx.IntervalGraph(index=object())
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_at_many(engine):
+    edges = _random_edges(500, seed=2)
+    G = dnx.IntervalGraph(index=engine)
+    G.add_edges_from(edges)
+
+    timestamps = [0, 5, 17, 17, 300, 999, 1000, 5000]
+    offsets, edge_ids, active = G.at_many(timestamps)
+    assert len(offsets) == len(timestamps) + 1
+    for i, t in enumerate(timestamps):
+        assert [active[j] for j in edge_ids[offsets[i]:offsets[i + 1]]] == G.at(t)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_intervalindex_pop(engine):
+    edges = _random_edges(1000, seed=3)
+    order = {edge: i for i, edge in enumerate(edges)}
+    index = interval_index(engine)
+    index.add_from(edges)
+
+    expected = [e for e in edges if e[3] < 300 or (e[3] == 300 and e[2] < 300)]
+    assert index.pop_before(300) == sorted(expected, key=lambda e: (e[2], e[3], order[e]))
+    remaining = [e for e in edges if e not in set(expected)]
+    assert index.number_of_edges == len(remaining)
+
+    expected = [e for e in remaining if not _matches(e, 500, 700)]
+    assert index.pop_outside(500, 700) == sorted(expected, key=lambda e: (e[2], e[3], order[e]))
+    remaining = [e for e in remaining if e not in set(expected)]
+    assert index.count() == len(remaining)
+    assert index.unique_begin_timestamps() == sorted(set(e[2] for e in remaining))
+    assert index[500:700] == sorted(remaining, key=lambda e: (e[2], e[3], order[e]))
+    assert index.pop_outside() == []
@@ -0,0 +1,258 @@
+import random
+import sys
+import pytest
+import networkx as nx
+from dynetworkx.classes.intervaltree import IntervalTree
+from dynetworkx.classes.staticintervalindex import StaticIntervalIndex
+
+
+def _random_edges(n, seed=0):
+    rng = random.Random(seed)
+    edges = []
+    for i in range(n):
+        begin = rng.randint(0, 1000)
+        edges.append((i, i + 1, begin, begin + rng.randint(0, 50)))
+    return edges
+
+
+def _check_augmentation(node):
+    if node is None:
+        return 0, float("-inf"), float("inf"), 0
+
+    left_height, left_max, left_minhigh, left_size = _check_augmentation(node.left)
+    right_height, right_max, right_minhigh, right_size = _check_augmentation(node.right)
+
+    assert node.max == max(node.high, left_max, right_max)
+    assert node.minhigh == min(node.high, left_minhigh, right_minhigh)
+    assert node.size == node.numberOfEdges() + left_size + right_size
+    assert abs(left_height - right_height) <= 1
+    return 1 + max(left_height, right_height), node.max, node.minhigh, node.size
+
+
+def test_intervaltree_add_from_bulk_build():
+    edges = _random_edges(2000)
+
+    bulk = IntervalTree()
+    bulk.add_from(edges)
+
+    incremental = IntervalTree()
+    for edge in edges:
+        incremental.add(edge)
+
+    _check_augmentation(bulk.root)
+    assert bulk.number_of_edges == incremental.number_of_edges == 2000
+    assert (bulk.begin, bulk.end) == (incremental.begin, incremental.end)
+    assert [(n.low, n.high) for n in bulk.inOrder(bulk.root)] == sorted(bulk.nodes)
+    for begin, end in [(0, 10), (100, 400), (500, 500), (990, 2000)]:
+        assert sorted(bulk[begin:end]) == sorted(incremental[begin:end])
+
+
+def test_intervaltree_add_from_existing_tree():
+    edges = _random_edges(1000, seed=1)
+
+    tree = IntervalTree()
+    tree.add_from(edges[:10])
+    tree.add_from(edges[10:])
+    tree.add_from([(0, 1, 5, 7)])
+
+    _check_augmentation(tree.root)
+    assert tree.number_of_edges == 1001
+    assert sorted(tree[0:2000]) == sorted(edges + [(0, 1, 5, 7)])
+
+
+def test_intervaltree_query_matches_brute_force():
+    edges = _random_edges(3000, seed=2)
+    tree = IntervalTree()
+    tree.add_from(edges)
+
+    for begin, end in [(0, 1), (100, 100), (250, 600), (1000, 1050), (2000, 3000)]:
+        expected = sorted(node for node in tree.nodes
+                          if (node[0] < end and node[1] > begin) or node[0] == begin)
+        assert sorted((node.low, node.high) for node in tree.query(tree.root, begin, end)) == expected
+        assert isinstance(tree[begin:end], list)
+        assert sorted(tree[begin:end]) == sorted(e for e in edges if (e[2], e[3]) in expected)
+
+
+def test_intervaltree_traversal_is_in_order():
+    tree = IntervalTree()
+    tree.add_from(_random_edges(500, seed=3))
+
+    nodes = [(node.low, node.high) for node in tree.query(tree.root, 0, 2000)]
+    assert nodes == sorted(nodes)
+    assert [(node.low, node.high) for node in tree.inOrder(tree.root)] == sorted(tree.nodes)
+    assert list(tree.inOrder(None)) == []
+
+
+def test_staticintervalindex_matches_intervaltree():
+    edges = _random_edges(3000, seed=4) + [(0, 1, 500, 500), (1, 2, 500, 500), (2, 3, 1050, 1050)]
+    tree = IntervalTree()
+    tree.add_from(edges)
+    index = StaticIntervalIndex()
+    index.add_from(edges)
+
+    assert (index.begin, index.end, index.number_of_edges) == (tree.begin, tree.end, tree.number_of_edges)
+    assert index.intervals() == tree.intervals()
+    for begin, end in [(0, 1), (100, 100), (500, 500), (250, 600), (1050, 1050), (1000, 1100), (2000, 3000)]:
+        assert index[begin:end] == tree[begin:end]
+        for inclusive in [(True, True), (False, True), (True, False), (False, False)]:
+            assert index.unique_timestamps(begin, end, inclusive) == tree.unique_timestamps(begin, end, inclusive)
+            assert index.unique_begin_timestamps(begin, end, inclusive) == \
+                tree.unique_begin_timestamps(begin, end, inclusive)
+            assert index.unique_end_timestamps(begin, end, inclusive) == \
+                tree.unique_end_timestamps(begin, end, inclusive)
+
+
+def test_staticintervalindex_rebuilds_after_mutation():
+    index = StaticIntervalIndex()
+    assert index[0:10] == []
+    assert index.intervals() == []
+
+    index.add((1, 2, 3, 10))
+    index.add_from([(2, 3, 5, 6), (3, 4, 20, 25)])
+    assert index[4:8] == [(1, 2, 3, 10), (2, 3, 5, 6)]
+    assert (index.begin, index.end) == (3, 25)
+
+    index.remove((3, 4, 20, 25))
+    index.remove((3, 4, 20, 25))
+    assert index[0:100] == [(1, 2, 3, 10), (2, 3, 5, 6)]
+    assert (index.begin, index.end, index.number_of_edges) == (3, 10, 2)
+
+
+def test_intervaltree_node_edge_storage():
+    tree = IntervalTree()
+    tree.add((1, 2, 3, 10))
+    node = tree.nodes[(3, 10)]
+    assert node.edges == (1, 2, 3, 10)
+    assert not hasattr(node, '__dict__')
+
+    tree.add_from([(2, 3, 3, 10), (4, 5, 3, 10)])
+    assert node.edges == [(1, 2, 3, 10), (2, 3, 3, 10), (4, 5, 3, 10)]
+    assert tree[3:10] == [(1, 2, 3, 10), (2, 3, 3, 10), (4, 5, 3, 10)]
+
+    tree.remove((2, 3, 3, 10))
+    tree.remove((1, 2, 3, 10))
+    tree.remove((1, 2, 3, 10))
+    assert node.edges == (4, 5, 3, 10)
+    assert tree[3:10] == [(4, 5, 3, 10)]
+    assert tree.number_of_edges == 1
+
+
+def test_intervaltree_memory_usage():
+    edges = _random_edges(1000, seed=5)
+    tree = IntervalTree()
+    tree.add_from(edges)
+    index = StaticIntervalIndex()
+    index.add_from(edges)
+
+    assert tree.memory_usage() > sys.getsizeof(tree.nodes)
+    assert index.memory_usage() > index.begins.nbytes
+
+
+def test_intervaltree_remove_discards_empty_nodes():
+    edges = _random_edges(2000, seed=6)
+    tree = IntervalTree()
+    tree.add_from(edges)
+
+    rng = random.Random(6)
+    rng.shuffle(edges)
+    removed, remaining = edges[:1500], edges[1500:]
+    for edge in removed:
+        tree.remove(edge)
+    _check_augmentation(tree.root)
+
+    assert tree.number_of_edges == 500
+    assert sorted(tree.nodes) == sorted(set((e[2], e[3]) for e in remaining))
+    assert [(n.low, n.high) for n in tree.inOrder(tree.root)] == sorted(tree.nodes)
+    assert tree.begin == min(e[2] for e in remaining)
+    assert tree.end == max(e[3] for e in remaining)
+    assert sorted(tree[0:2000]) == sorted(remaining)
+
+    for edge in remaining:
+        tree.remove(edge)
+    assert tree.root is None
+    assert tree.nodes == {}
+    assert tree[0:2000] == []
+
+
+def test_intervaltree_count():
+    edges = _random_edges(3000, seed=7) + [(0, 1, 500, 500), (1, 2, 500, 500)]
+    tree = IntervalTree()
+    tree.add_from(edges[:2000])
+    for edge in edges[2000:]:
+        tree.add(edge)
+    tree.add_from(edges[:10] + [(5, 6, 500, 500)])
+    for edge in edges[::5]:
+        tree.remove(edge)
+    _check_augmentation(tree.root)
+
+    for begin, end in [(1, 2), (100, 100), (500, 500), (250, 600), (1000, 1100), (1, 2000), (2000, 3000)]:
+        assert tree.count(begin, end) == len(tree[begin:end])
+    assert tree.count() == tree.number_of_edges
+    assert IntervalTree().count(0, 10) == 0
+
+
+def test_intervaltree_pop_before_and_outside():
+    edges = _random_edges(3000, seed=8) + [(0, 1, 500, 500), (1, 2, 400, 500)]
+
+    tree = IntervalTree()
+    tree.add_from(edges)
+    popped = tree.pop_before(500)
+    _check_augmentation(tree.root)
+    expected = [e for e in edges if e[3] < 500 or (e[3] == 500 and e[2] < 500)]
+    assert popped == sorted(expected, key=lambda e: (e[2], e[3]))
+    assert sorted(tree[1:2000]) == sorted(set(edges) - set(expected))
+    assert tree.begin == min(e[2] for e in edges if e not in expected)
+    assert tree.number_of_edges == len(edges) - len(expected)
+
+    # a few intervals are discarded one by one instead of rebuilding the tree
+    expected = [e for e in tree[1:2000] if e[3] <= 501 and e[2] < 501]
+    assert tree.pop_before(501) == expected
+    _check_augmentation(tree.root)
+
+    for begin, end in [(300, 700), (500, 500), (None, 600), (800, None)]:
+        tree = IntervalTree()
+        tree.add_from(edges)
+        index = StaticIntervalIndex()
+        index.add_from(edges)
+        kept = tree[begin or 1:end or 2000]
+        assert index.pop_outside(begin, end) == tree.pop_outside(begin, end)
+        _check_augmentation(tree.root)
+        assert tree[1:2000] == index[1:2000] == kept
+        assert tree.count() == len(kept)
+
+
+def test_intervaltree_snapshot():
+    edges = _random_edges(3000, seed=9)
+    tree = IntervalTree()
+    tree.add_from(edges[:1000])
+    version = tree.snapshot()
+    before = [(node, node.left, node.right, node.size, node.getEdges()) for node in version.inOrder(version.root)]
+
+    tree.add_from(edges[1000:1010])
+    for edge in edges[1010:2000]:
+        tree.add(edge)
+    for edge in edges[:500]:
+        tree.remove(edge)
+    second = tree.snapshot()
+    tree.add_from(edges[2000:])
+    tree.pop_before(200)
+    _check_augmentation(tree.root)
+
+    # versions still see their own edges, and none of their nodes was modified
+    assert [(node, node.left, node.right, node.size, node.getEdges())
+            for node in version.inOrder(version.root)] == before
+    _check_augmentation(version.root)
+    assert sorted(version[1:2000]) == sorted(edges[:1000])
+    assert sorted(second[1:2000]) == sorted(edges[500:2000])
+    assert version.count() == version.number_of_edges == 1000
+    assert (version.begin, version.end) == (min(e[2] for e in edges[:1000]), max(e[3] for e in edges[:1000]))
+    assert version.unique_begin_timestamps() == sorted(set(e[2] for e in edges[:1000]))
+    assert version.intervals() == sorted(set((e[2], e[3]) for e in edges[:1000]))
+
+    remaining = [e for e in edges[500:] if not (e[3] < 200 or (e[3] == 200 and e[2] < 200))]
+    assert sorted(tree[1:2000]) == sorted(remaining)
+    assert all(tree.nodes[(node.low, node.high)] is node for node in tree.inOrder(tree.root))
+    assert len(tree.nodes) == len(set((e[2], e[3]) for e in remaining))
+
+    with pytest.raises(nx.NetworkXError):
+        version.add(edges[0])
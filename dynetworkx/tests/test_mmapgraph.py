@@ -0,0 +1,133 @@
+import random
+import numpy as np
+import pytest
+import networkx as nx
+import dynetworkx as dnx
+
+
+def _random_graph(graph_class, seed):
+    rng = random.Random(seed)
+    G = graph_class()
+    for _ in range(60):
+        u, v = rng.randint(0, 8), rng.choice([rng.randint(0, 8), 'a'])
+        data = rng.choice([{}, {'weight': rng.randint(0, 5)}, {'color': 'red'}])
+        t = rng.randint(0, 30)
+        if graph_class in (dnx.IntervalGraph, dnx.IntervalDiGraph):
+            G.add_edge(u, v, t, t + rng.randint(0, 8), **data)
+        else:
+            G.add_edge(u, v, t, **data)
+    G.add_node(99, size=3)
+    return G
+
+
+def test_open_mmap_intervalgraph(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.IntervalGraph(name='my graph')
+    G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    G.add_edge(1, 3, 5, 5, weight=2)
+    G.save(path)
+
+    H = dnx.open_mmap(path)
+
+    assert type(H) is dnx.readwrite.mmapgraph.MmapIntervalGraph
+    assert isinstance(H._u, np.memmap) and isinstance(H._times[0], np.memmap)
+    assert H.name == 'my graph'
+    assert H.interval() == (1, 19)
+    assert H.edges(begin=10) == [(2, 4, 1, 11), (2, 4, 8, 15), (6, 4, 12, 19)]
+    assert H.edges(begin=5, end=5) == [(2, 4, 1, 11), (1, 2, 3, 10), (1, 3, 5, 5)]
+    assert H.edges(u=2, v=4, end=8) == [(2, 4, 1, 11)]
+    assert H.edges(u=1, data='weight', default=0) == [((1, 2, 3, 10), 0), ((1, 3, 5, 5), 2)]
+    assert list(H.nodes(begin=12)) == [2, 4, 6]
+    assert H.has_node(3) and not H.has_node(3, begin=6) and 7 not in H
+    assert H.number_of_edges(end=5) == 2
+    assert H.degree(4) == 3
+    assert H.degrees(end=3) == {2: 1, 4: 1}
+
+    S = H.to_subgraph(4, 12, multigraph=True, edge_interval_data=True)
+    assert sorted(S.edges(data='begin')) == sorted(G.to_subgraph(4, 12, multigraph=True,
+                                                                 edge_interval_data=True).edges(data='begin'))
+    assert S.number_of_edges() == 4
+
+    with pytest.raises(nx.NetworkXError):
+        H.edges(begin=5, end=2)
+    with pytest.raises(nx.NetworkXError):
+        H.add_edge(1, 2, 3, 4)
+
+
+@pytest.mark.parametrize('graph_class', [dnx.IntervalGraph, dnx.IntervalDiGraph, dnx.ImpulseGraph,
+                                         dnx.ImpulseDiGraph])
+@pytest.mark.parametrize('index', [True, False])
+def test_open_mmap_matches_graph(tmp_path, graph_class, index):
+    path = str(tmp_path / 'graph')
+    G = _random_graph(graph_class, 0)
+    G.save(path, index=index)
+
+    H = dnx.open_mmap(path)
+
+    assert H.is_directed() == G.is_directed()
+    assert list(H.nodes(data=True)) == list(G.nodes(data=True))
+    assert sorted(H.edges(data=True), key=str) == sorted(G.edges(data=True), key=str)
+    for begin, end in [(None, 10), (5, None), (5, 12), (20, 30)]:
+        assert sorted(H.edges(begin=begin, end=end), key=str) == sorted(G.edges(begin=begin, end=end), key=str)
+        assert sorted(H.nodes(begin=begin, end=end), key=str) == sorted(G.nodes(begin=begin, end=end), key=str)
+        assert H.degrees(begin=begin, end=end) == G.degrees(begin=begin, end=end)
+        for n in [0, 'a', [1, 2], 50]:
+            assert sorted(H.edges(u=n, begin=begin, end=end, data='weight'), key=str) == \
+                sorted(G.edges(u=n, begin=begin, end=end, data='weight'), key=str)
+            assert sorted(H.edges(v=n, begin=begin, end=end), key=str) == \
+                sorted(G.edges(v=n, begin=begin, end=end), key=str)
+        assert H.degree(2, begin=begin, end=end) == G.degree(2, begin=begin, end=end)
+        assert sorted(H.edges(u=1, v='a', begin=begin, end=end), key=str) == \
+            sorted(G.edges(u=1, v='a', begin=begin, end=end), key=str)
+
+    X = H.to_subgraph(5, 12, multigraph=True, edge_data=True, node_data=True)
+    Y = G.to_subgraph(5, 12, multigraph=True, edge_data=True, node_data=True)
+    assert type(X) is type(Y)
+    assert sorted(X.edges(data='weight'), key=str) == sorted(Y.edges(data='weight'), key=str)
+    assert dict(X.nodes(data=True)) == dict(Y.nodes(data=True))
+
+
+@pytest.mark.parametrize('graph_class', [dnx.ImpulseGraph, dnx.ImpulseDiGraph])
+def test_open_mmap_matches_impulsegraph_inclusive(tmp_path, graph_class):
+    path = str(tmp_path / 'graph')
+    G = _random_graph(graph_class, 1)
+    G.save(path)
+
+    H = dnx.open_mmap(path)
+
+    for inclusive in [(True, True), (True, False), (False, True), (False, False)]:
+        for begin, end in [(None, 10), (5, None), (5, 12), (12, 12)]:
+            window = dict(begin=begin, end=end, inclusive=inclusive)
+            assert sorted(H.edges(**window), key=str) == sorted(G.edges(**window), key=str)
+            assert sorted(H.nodes(**window), key=str) == sorted(G.nodes(**window), key=str)
+            assert H.number_of_nodes(**window) == G.number_of_nodes(**window)
+            assert H.degrees(**window) == G.degrees(**window)
+            assert H.degree(**window) == pytest.approx(G.degree(**window))
+            for n in [0, 2, 'a']:
+                assert H.has_node(n, **window) == G.has_node(n, **window)
+                assert H.degree(n, **window) == G.degree(n, **window)
+            if begin is not None and end is not None:
+                assert sorted(H.to_subgraph(begin, end, inclusive=inclusive).edges(), key=str) == \
+                    sorted(G.to_subgraph(begin, end, inclusive=inclusive).edges(), key=str)
+
+
+def test_open_mmap_impulsegraph_inclusive(tmp_path):
+    path = str(tmp_path / 'graph')
+    G = dnx.ImpulseGraph()
+    G.add_edges_from([(1, 2, 3), (2, 3, 5), (3, 4, 5), (4, 1, 8)])
+    G.save(path)
+
+    H = dnx.open_mmap(path)
+
+    assert H.interval() == (3, 8)
+    assert H.edges(begin=3, end=8) == [(1, 2, 3), (2, 3, 5), (3, 4, 5)]
+    assert H.edges(begin=3, end=8, inclusive=(False, True)) == [(1, 2, 3), (2, 3, 5), (3, 4, 5)]
+    assert H.edges(begin=5, end=5) == [(2, 3, 5), (3, 4, 5)]
+    assert H.edges(u=3, begin=5, end=5) == [(2, 3, 5), (3, 4, 5)]
+    assert list(H.nodes(begin=5, end=8, inclusive=(True, True))) == [1, 2, 3, 4]
+    assert H.number_of_nodes(begin=6) == 2
+
+
+def test_open_mmap_not_saved(tmp_path):
+    with pytest.raises(nx.NetworkXError):
+        dnx.open_mmap(str(tmp_path))
@@ -0,0 +1,105 @@
+import numpy as np
+from dynetworkx.classes.queryplanner import QueryPlanner, TimeHistogram
+
+
+def test_timehistogram_rank():
+    histogram = TimeHistogram(size=16)
+    for t in range(1000):
+        histogram.add(t)
+
+    assert len(histogram.counts) <= 16
+    assert histogram.rank(float("-inf")) == 0
+    assert histogram.rank(float("inf")) == 1000
+    assert abs(histogram.rank(500) - 500) <= 1000 / 16
+
+    for t in range(500):
+        histogram.remove(t)
+    assert len(histogram) == 500
+    assert histogram.rank(500) <= 1000 / 16
+
+
+def test_queryplanner_statistics():
+    planner = QueryPlanner()
+    planner.add_from([(1, 2, 0, 10), (1, 3, 5, 20), (3, 3, 7, 8)])
+    assert planner.number_of_edges == 3
+    assert planner.out_degree == {1: 2, 2: 1, 3: 2}
+    assert planner.spans == {1: [0, 20], 2: [0, 10], 3: [5, 20]}
+
+    planner.remove((1, 2, 0, 10))
+    planner.remove((3, 3, 7, 8))
+    assert planner.out_degree == {1: 1, 3: 1}
+    assert 2 not in planner.spans
+
+    planner = QueryPlanner(directed=True, impulse=True)
+    planner.add_from([(1, 2, 3), (1, 3, 4), (2, 1, 5)])
+    assert planner.out_degree == {1: 2, 2: 1}
+    assert planner.in_degree == {1: 1, 2: 1, 3: 1}
+    assert planner.spans[1] == [3, 5]
+    assert planner.estimate() == 3
+
+
+def test_queryplanner_estimate():
+    planner = QueryPlanner()
+    planner.add_from((i, i + 1, t, t + 10) for i, t in enumerate(range(0, 100000, 10)))
+
+    assert planner.estimate() == 10000
+    assert abs(planner.estimate(50000, 51000) - 100) < 10
+    assert abs(planner.estimate(begin=90000) - 1000) < 10
+    assert abs(planner.estimate(end=10000) - 1000) < 10
+    assert planner.estimate(200000, 300000) == 0
+
+
+def test_queryplanner_interval_first():
+    planner = QueryPlanner(threshold=None)
+    planner.add_from((i % 100, i % 100 + 100, t, t + 1) for i, t in enumerate(range(100000)))
+
+    # every node has 1000 edges and there are 100 edges every 100 units of time
+    assert not planner.interval_first([1], [None], 0, 50000)
+    assert planner.interval_first([1], [None], 500, 600)
+    assert planner.interval_first(list(range(50)), [None], 500, 10000)
+    assert not planner.interval_first(list(range(50)), [None], 0, 100000)
+
+    planner.add((1, 2, 'a', 'b'))
+    assert not planner.numeric
+    assert not planner.interval_first(list(range(50)), [None], 500, 600)
+
+
+def test_queryplanner_edge_filter():
+    edges = [(1, 2, 0, 1), (2, 1, 0, 1), (2, 3, 0, 1), (4, 4, 0, 1)]
+
+    node_filter = QueryPlanner().edge_filter([1, 4], [None])
+    assert [e for e in edges if node_filter(e)] == [(1, 2, 0, 1), (2, 1, 0, 1), (4, 4, 0, 1)]
+    node_filter = QueryPlanner().edge_filter([1], [2])
+    assert [e for e in edges if node_filter(e)] == [(1, 2, 0, 1), (2, 1, 0, 1)]
+    node_filter = QueryPlanner(directed=True).edge_filter([1], [2])
+    assert [e for e in edges if node_filter(e)] == [(1, 2, 0, 1)]
+    node_filter = QueryPlanner(directed=True).edge_filter([None], [1, 3])
+    assert [e for e in edges if node_filter(e)] == [(2, 1, 0, 1), (2, 3, 0, 1)]
+
+
+def test_queryplanner_add_many():
+    edges = [(i % 7, i % 5, t, t + i % 3) for i, t in enumerate(range(0, 5000, 3))]
+    nodes = list(range(7))
+    sources = np.array([edge[0] for edge in edges])
+    targets = np.array([edge[1] for edge in edges])
+    lows = np.array([edge[2] for edge in edges])
+    highs = np.array([edge[3] for edge in edges])
+
+    for directed in (False, True):
+        planner, bulk = QueryPlanner(directed=directed), QueryPlanner(directed=directed)
+        planner.add_from(edges)
+        bulk.add_many(nodes, sources, targets, lows, highs)
+
+        assert bulk.number_of_edges == planner.number_of_edges
+        assert bulk.out_degree == planner.out_degree
+        assert bulk.in_degree == planner.in_degree
+        assert bulk.spans == planner.spans
+        for histogram, expected in ((bulk.begins, planner.begins), (bulk.ends, planner.ends)):
+            assert (histogram.width, histogram.low, histogram.high) == (expected.width, expected.low, expected.high)
+            assert histogram.counts == expected.counts
+
+    planner = QueryPlanner(impulse=True)
+    planner.add_many([1, 2], np.array([0, 1]), np.array([1, 1]), np.array([3, 5]))
+    assert planner.out_degree == {1: 1, 2: 2}
+    assert planner.spans == {1: [3, 3], 2: [3, 5]}
+    assert len(planner.begins) == 2
@@ -0,0 +1,60 @@
+import pytest
+import networkx as nx
+from dynetworkx.classes.snapshotbuilder import SnapshotBuilder
+
+
+def test_snapshotbuilder_graph():
+    builder = SnapshotBuilder()
+    builder.add('a', 1, 2, {'w': 1})
+    builder.add('b', 2, 1, {'w': 2})
+    builder.add('c', 2, 3)
+    G = builder.snapshot()
+    assert type(G) is nx.Graph
+    assert sorted(G.edges(data='w')) == [(1, 2, 2), (2, 3, None)]
+
+    builder.remove('b')
+    builder.remove('c')
+    assert len(builder) == 1 and 'a' in builder and 'b' not in builder
+    H = builder.snapshot()
+    assert list(H.edges(data='w')) == [(1, 2, 1)]
+    assert list(H.nodes) == [1, 2]
+    # snapshots are independent
+    assert G[1][2]['w'] == 2 and G.has_node(3)
+    H[1][2]['w'] = 5
+    assert builder.snapshot()[1][2]['w'] == 1
+
+
+def test_snapshotbuilder_multidigraph():
+    builder = SnapshotBuilder(multigraph=True, directed=True, node_attr=lambda n: {'name': str(n)})
+    builder.add('a', 1, 2, {'w': 1})
+    builder.add('b', 1, 2, {'w': 2})
+    builder.add('c', 2, 1)
+    G = builder.snapshot()
+    assert type(G) is nx.MultiDiGraph
+    assert sorted(G.edges(keys=True)) == [(1, 2, 0), (1, 2, 1), (2, 1, 0)]
+    assert G.nodes[1] == {'name': '1'}
+    assert sorted(G.in_edges(1)) == [(2, 1)]
+
+    builder.remove('a')
+    builder.add('d', 1, 2)
+    assert sorted(builder.snapshot().edges(keys=True, data='w')) == [(1, 2, 1, 2), (1, 2, 2, None), (2, 1, 0, None)]
+
+
+def test_snapshotbuilder_share_structure():
+    builder = SnapshotBuilder(share_structure=True)
+    builder.add('a', 1, 2)
+    builder.add('b', 3, 4)
+    G = builder.snapshot()
+    builder.add('c', 4, 5)
+    builder.remove('a')
+    H = builder.snapshot()
+
+    assert sorted(G.edges()) == [(1, 2), (3, 4)]
+    assert sorted(H.edges()) == [(3, 4), (4, 5)]
+    assert 1 not in H and 5 not in G
+    # the adjacency of the node that did not change is shared, and shared snapshots cannot be modified
+    assert H._adj[3] is G._adj[3]
+    assert H._adj[4] is not G._adj[4]
+    assert nx.is_frozen(H)
+    with pytest.raises(nx.NetworkXError):
+        H.add_edge(1, 3)
@@ -15,6 +15,7 @@ setup(
         "dynetworkx",
         "dynetworkx.algorithms",
         "dynetworkx.classes",
+        "dynetworkx.readwrite",
         "dynetworkx.tests",
     ],
     license="Released under the 3-Clause BSD license.",
@@ -26,7 +27,9 @@ setup(
         "networkx>=2.0",
         "sortedcontainers",
         "numpy",
-        "scikit-learn",
     ],
+    extras_require={
+        "predict": ["scikit-learn"],
+    },
     python_requires=">=3.4",
 )